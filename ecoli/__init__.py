@@ -16,6 +16,7 @@ from ecoli.library.schema import (
 )
 from ecoli.library.serialize import (
     MethodSerializer,
+    NumpyGeneratorSerializer,
     NumpyRandomStateSerializer,
     ParameterSerializer,
     UnumSerializer,
@@ -64,6 +65,7 @@ for serializer_cls in (
     UnumSerializer,
     ParameterSerializer,
     NumpyRandomStateSerializer,
+    NumpyGeneratorSerializer,
     MethodSerializer,
 ):
     serializer = serializer_cls()
@@ -11,8 +11,11 @@ import pprint as pp
 import subprocess
 import time
 
+import duckdb
+
 from ecoli.analysis.causality_network import read_dynamics
 from ecoli.analysis.causality_network.build_network import BuildNetwork
+from ecoli.library.parquet_emitter import get_dataset_sql
 from wholecell.utils import filepath as fp
 from time import monotonic as monotonic_seconds
 from time import process_time as process_time_seconds
@@ -52,7 +55,33 @@ class BuildCausalityNetwork:
             "--id",
             type=str,
             default="",
-            help="If set, a causality network is built using a custom listener dataset.",
+            help="Experiment ID of simulation to read dynamics data for.",
+        )
+        parser.add_argument(
+            "--out_dir",
+            type=str,
+            default="out",
+            help="Output directory of Parquet emitter (local path or Cloud"
+            " Storage URI) containing simulation output.",
+        )
+        parser.add_argument(
+            "--variant", type=int, default=0, help="Variant of simulation."
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Lineage seed of simulation."
+        )
+        parser.add_argument(
+            "--generation",
+            type=int,
+            default=None,
+            help="Generation of simulation. Dynamics for all generations of"
+            " the selected lineage are concatenated if not set.",
+        )
+        parser.add_argument(
+            "--agent_id",
+            type=str,
+            default=None,
+            help="Agent ID of simulation (requires --generation).",
         )
 
     def parse_args(self):
@@ -89,8 +118,29 @@ class BuildCausalityNetwork:
             )
         )
 
+        experiment_id = args.id
+        if not experiment_id:
+            experiment_id = input("Please provide an experiment id: ")
+        history_sql, config_sql, _ = get_dataset_sql(args.out_dir, [experiment_id])
+        filters = [
+            f"experiment_id = '{experiment_id}'",
+            f"variant = {args.variant}",
+            f"lineage_seed = {args.seed}",
+        ]
+        if args.generation is not None:
+            filters.append(f"generation = {args.generation}")
+            if args.agent_id is not None:
+                filters.append(f"agent_id = '{args.agent_id}'")
+        filters = " AND ".join(filters)
+        conn = duckdb.connect()
         read_dynamics.convert_dynamics(
-            DYNAMICS_OUTPUT, causality_network.sim_data, node_list, edge_list, args.id
+            DYNAMICS_OUTPUT,
+            causality_network.sim_data,
+            node_list,
+            edge_list,
+            conn,
+            f"{history_sql} WHERE {filters}",
+            f"{config_sql} WHERE {filters}",
         )
 
         elapsed_real_sec = monotonic_seconds() - start_real_sec
@@ -62,12 +62,13 @@ each node.
 
 read_dynamics.py might require a new function to the dynamics data if it is of
 a new node type, specified in the TYPE_TO_READER_FUNCTION dictionary. When the
-node list is read, nodes of the new type will be passed into the new function,
-which assigns that node dynamics from listener output:
+node list is read, batches of nodes of the new type will be passed into the new
+function, which reads only the listener columns it needs and yields the
+dynamics of each node in the batch:
 
 .. code-block:: python
 
-    node.read_dynamics(dynamics, dynamics_units)
+    yield node_id, dynamics, dynamics_units
 """
 
 from collections import Counter
@@ -1,18 +1,32 @@
 """
 Reads dynamics data for each of the nodes of a causality network from a single
 simulation.
+
+Nodes are processed in batches of the same type. For each batch, only the
+listener columns (and the indices within those columns) that are required to
+build the dynamics of the nodes in that batch are read from the Parquet output
+using DuckDB. The dynamics of each node are then written to ``seriesOut.zip``
+before the next batch is read, keeping memory usage bounded even for long
+multigeneration simulations.
 """
 
-import numpy as np
-import os
-import orjson
+from collections import defaultdict
 import hashlib
-from tqdm import tqdm
+import os
+from typing import Any, Callable, Iterator
 import zipfile
 
-from vivarium.library.dict_utils import get_value_from_path
-from vivarium.core.emitter import data_from_database, get_experiment_database
+import duckdb
+import numpy as np
+import orjson
+import pyarrow as pa
+from tqdm import tqdm
 
+from ecoli.library.parquet_emitter import (
+    get_field_metadata,
+    ndlist_to_ndarray,
+    read_stacked_columns,
+)
 from ecoli.processes.metabolism import (
     COUNTS_UNITS,
     VOLUME_UNITS,
@@ -34,26 +48,19 @@ from wholecell.utils import units
 MIN_TIMESTEPS = (
     41  # Minimum number of timesteps for a working visualization without modification
 )
-# REQUIRED_COLUMNS = [
-# 	("BulkMolecules", "counts"),
-# 	("ComplexationListener", "complexationEvents"),
-# 	("EquilibriumListener", "reactionRates"),
-# 	("FBAResults", "reactionFluxes"),
-# 	("GrowthLimits", "net_charged"),
-# 	("Main", "time"),
-# 	("Mass", "cellMass"),
-# 	("Mass", "dryMass"),
-# 	("RNACounts", "mRNA_counts"),
-#   ("RnaMaturationListener", "unprocessed_rnas_consumed"),
-#   ("RnaSynthProb", "gene_copy_number"),
-#   ("RnaSynthProb", "pPromoterBound"),
-#   ("RnaSynthProb", "actual_rna_synth_prob_per_cistron"),
-#   ("RnaSynthProb", "promoter_copy_number"),
-#   ("RnaSynthProb", "n_bound_TF_per_TU"),
-#   ("RnaSynthProb", "n_bound_TF_per_cistron"),
-#   ("RnapData", "rnaInitEvent"),
-#   ("RibosomeData", "probTranslationPerTranscript"),
-# 	]
+NODE_BATCH_SIZE = 500
+"""Maximum number of nodes of the same type whose dynamics are read at once."""
+
+ColumnReader = Callable[[dict[str, str]], dict[str, np.ndarray]]
+"""
+Takes a mapping from column aliases to DuckDB expressions and returns a mapping
+from those aliases to arrays of values (time on first axis).
+"""
+NodeDynamics = Iterator[tuple[str, dict[str, np.ndarray], dict[str, str]]]
+"""
+Yields node IDs with their dynamics and dynamics units (see
+:py:meth:`~ecoli.analysis.causality_network.network_components.Node.read_dynamics`).
+"""
 
 
 def get_safe_name(s):
@@ -61,80 +68,77 @@ def get_safe_name(s):
     return fname
 
 
-def array_timeseries(data, path, timeseries):
-    """Converts data of the format {time: {path: value}}} to timeseries of the
-    format {path: [value_1, value_2,...]}. Modifies timeseries in place."""
-    path_timeseries = timeseries
-    for key in path[:-1]:
-        path_timeseries = path_timeseries.setdefault(key, {})
-    accumulated_data = []
-    for datum in data.values():
-        path_data = get_value_from_path(datum, path)
-        accumulated_data.append(path_data)
-    path_timeseries[path[-1]] = np.array(accumulated_data)
-
-
-def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id):
-    """Convert the sim's dynamics data to a Causality seriesOut.zip file."""
-
-    if not experiment_id:
-        experiment_id = input("Please provide an experiment id: ")
-
-    # TODO: Convert to use DuckDB
-    raise NotImplementedError("Still need to convert to use DuckDB!")
-    # Retrieve the data directly from database
-    db = get_experiment_database()
-    query = [
-        ("bulk",),
-        ("listeners", "mass", "cell_mass"),
-        ("listeners", "mass", "dry_mass"),
-        ("listeners", "rna_synth_prob", "p_promoter_bound"),
-        ("listeners", "rna_synth_prob", "actual_rna_synth_prob_per_cistron"),
-        ("listeners", "rna_synth_prob", "promoter_copy_number"),
-        ("listeners", "rna_synth_prob", "gene_copy_number"),
-        ("listeners", "rna_synth_prob", "n_bound_TF_per_TU"),
-        ("listeners", "rna_synth_prob", "n_bound_TF_per_cistron"),
-        ("listeners", "rna_counts", "mRNA_counts"),
-        ("listeners", "rna_maturation_listener", "unprocessed_rnas_consumed"),
-        ("listeners", "rnap_data", "rna_init_event"),
-        ("listeners", "ribosome_data", "actual_prob_translation_per_transcript"),
-        ("listeners", "complexation_listener", "complexation_events"),
-        ("listeners", "fba_results", "reaction_fluxes"),
-        ("listeners", "equilibrium_listener", "reaction_rates"),
-        ("listeners", "growth_limits", "net_charged"),
-    ]
-    data, config = data_from_database(experiment_id, db, query=query)
-    del data[0.0]
-
-    timeseries = {}
-    for path in query:
-        array_timeseries(data, path, timeseries)
-    timeseries["time"] = np.array(list(data.keys()))
-
-    # Reshape arrays for number of bound transcription factors
-    n_TU = len(sim_data.process.transcription.rna_data["id"])
-    n_cistron = len(sim_data.process.transcription.cistron_data["id"])
-    n_TF = len(sim_data.process.transcription_regulation.tf_ids)
-
-    timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_cistron"] = np.array(
-        timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_cistron"]
-    ).reshape(-1, n_cistron, n_TF)
-    timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_TU"] = np.array(
-        timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_TU"]
-    ).reshape(-1, n_TU, n_TF)
+def list_select_sql(column: str, idx: list[int]) -> str:
+    """
+    DuckDB expression that selects the given (0-indexed) indices from a list
+    column in the given order.
+    """
+    one_indexed_idx = ", ".join(str(i + 1) for i in idx)
+    return f"list_select({column}, [{one_indexed_idx}])"
 
-    conversion_coeffs = (
-        timeseries["listeners"]["mass"]["dry_mass"]
-        / timeseries["listeners"]["mass"]["cell_mass"]
-        * sim_data.constants.cell_density.asNumber(MASS_UNITS / VOLUME_UNITS)
+
+def split_dynamics(
+    node_ids: list[str],
+    dynamics: dict[str, np.ndarray],
+    dynamics_units: dict[str, str],
+) -> NodeDynamics:
+    """
+    Splits dynamics computed for a batch of nodes (time on first axis, node on
+    second axis) into the dynamics for each node.
+    """
+    for i, node_id in enumerate(node_ids):
+        yield node_id, {k: v[:, i] for k, v in dynamics.items()}, dynamics_units
+
+
+def convert_dynamics(
+    seriesOutDir: str,
+    sim_data: Any,
+    node_list: list[dict[str, Any]],
+    edge_list: list[dict[str, Any]],
+    conn: duckdb.DuckDBPyConnection,
+    history_sql: str,
+    config_sql: str,
+):
+    """
+    Convert the sim's dynamics data to a Causality seriesOut.zip file.
+
+    Args:
+        seriesOutDir: Directory to write ``seriesOut.zip`` to
+        sim_data: Simulation data used to run the simulation
+        node_list: Nodes of the causality network as dictionaries
+        edge_list: Edges of the causality network as dictionaries
+        conn: DuckDB connection
+        history_sql: DuckDB SQL string for the output of a single simulation
+            (see :py:func:`~ecoli.library.parquet_emitter.get_dataset_sql`).
+            If data for multiple generations of a single lineage is included,
+            the dynamics of all generations are concatenated.
+        config_sql: DuckDB SQL string for the configuration of the same
+            simulation(s) as ``history_sql``
+    """
+
+    def read_columns(expressions: dict[str, str]) -> dict[str, np.ndarray]:
+        table = read_stacked_columns(
+            history_sql,
+            [f'{expr} AS "{alias}"' for alias, expr in expressions.items()],
+            remove_first=True,
+            conn=conn,
+        )
+        columns = {}
+        for alias in expressions:
+            column = table[alias].combine_chunks()
+            if pa.types.is_list(column.type):
+                columns[alias] = ndlist_to_ndarray(column)
+            else:
+                columns[alias] = column.to_numpy()
+        return columns
+
+    global_columns = read_columns(
+        {
+            "time": "time",
+            "cell_mass": "listeners__mass__cell_mass",
+            "dry_mass": "listeners__mass__dry_mass",
+        }
     )
-    timeseries["listeners"]["fba_results"]["reaction_fluxes_converted"] = (
-        (COUNTS_UNITS / MASS_UNITS / TIME_UNITS)
-        * (
-            timeseries["listeners"]["fba_results"]["reaction_fluxes"].T
-            / conversion_coeffs
-        ).T
-    ).asNumber(units.mmol / units.g / units.h)
 
     # Construct dictionaries of indexes where needed
     indexes = {}
@@ -142,7 +146,7 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
     def build_index_dict(id_array):
         return {mol: i for i, mol in enumerate(id_array)}
 
-    molecule_ids = config["state"]["bulk"]["_properties"]["metadata"]
+    molecule_ids = get_field_metadata(conn, config_sql, "bulk")
     indexes["BulkMolecules"] = build_index_dict(molecule_ids)
 
     gene_ids = sim_data.process.transcription.cistron_data["gene_id"]
@@ -157,11 +161,6 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
     translated_rna_ids = sim_data.process.translation.monomer_data["cistron_id"]
     indexes["TranslatedRnas"] = build_index_dict(translated_rna_ids)
 
-    # metabolism_rxn_ids = TableReader(
-    # 	os.path.join(simOutDir, "FBAResults")).readAttribute("reactionIDs")
-    metabolism_rxn_ids = config["state"]["listeners"]["fba_results"]["reaction_fluxes"][
-        "_properties"
-    ]["metadata"]
     metabolism_rxn_ids = sim_data.process.metabolism.reaction_stoich.keys()
     indexes["MetabolismReactions"] = build_index_dict(metabolism_rxn_ids)
 
@@ -171,11 +170,11 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
     equilibrium_rxn_ids = sim_data.process.equilibrium.rxn_ids
     indexes["EquilibriumReactions"] = build_index_dict(equilibrium_rxn_ids)
 
-    # unprocessed_rna_ids = TableReader(
-    #     os.path.join(simOutDir, "RnaMaturationListener")).readAttribute("unprocessed_rna_ids")
-    unprocessed_rna_ids = config["state"]["listeners"]["rna_maturation_listener"][
-        "unprocessed_rnas_consumed"
-    ]["_properties"]["metadata"]
+    unprocessed_rna_ids = get_field_metadata(
+        conn,
+        config_sql,
+        "listeners__rna_maturation_listener__unprocessed_rnas_consumed",
+    )
     indexes["UnprocessedRnas"] = build_index_dict(unprocessed_rna_ids)
 
     tf_ids = sim_data.process.transcription_regulation.tf_ids
@@ -185,12 +184,9 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
     indexes["Charging"] = build_index_dict(trna_ids)
 
     # Cache cell volume array (used for calculating concentrations)
-
-    # volume = ((1.0 / sim_data.constants.cell_density) * (
-    # 	units.fg * columns[("Mass", "cellMass")])).asNumber(units.L)
-    volume = (
+    global_columns["volume"] = (
         (1.0 / sim_data.constants.cell_density)
-        * (units.fg * timeseries["listeners"]["mass"]["cell_mass"])
+        * (units.fg * global_columns["cell_mass"])
     ).asNumber(units.L)
 
     def dynamics_mapping(dynamics, safe):
@@ -206,16 +202,6 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
 
     name_mapping = {}
 
-    def build_dynamics(node_dict):
-        node = Node()
-        node.node_id = node_dict["ID"]
-        node.node_type = node_dict["type"]
-        reader = TYPE_TO_READER_FUNCTION.get(node.node_type)
-        if reader:
-            # reader(sim_data, node, node.node_id, columns, indexes, volume)
-            reader(sim_data, node, node.node_id, indexes, volume, timeseries)
-        return node
-
     def save_node(node, name_mapping):
         if node.node_id in name_mapping:
             # Skip duplicates. Why are there duplicates? --check_sanity finds them.
@@ -229,6 +215,11 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
 
         name_mapping[str(node.node_id)] = dynamics_mapping(dynamics, dynamics_path)
 
+    # Group nodes by type so dynamics can be read in vectorized batches
+    node_ids_by_type = defaultdict(list)
+    for node_dict in node_list:
+        node_ids_by_type[node_dict["type"]].append(node_dict["ID"])
+
     # ZIP_BZIP2 saves 14% bytes vs. ZIP_DEFLATED but takes  +70 secs.
     # ZIP_LZMA  saves 19% bytes vs. ZIP_DEFLATED but takes +260 sec.
     # compresslevel=9 saves very little space.
@@ -236,10 +227,33 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
     with zipfile.ZipFile(
         zip_name, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
     ) as zf:
-        for node_dict in tqdm(node_list):
-            node = build_dynamics(node_dict)
-            save_node(node, name_mapping)
-        save_node(time_node(timeseries), name_mapping)
+        with tqdm(total=len(node_list)) as progress:
+            for node_type, node_ids in node_ids_by_type.items():
+                reader = TYPE_TO_READER_FUNCTION.get(node_type)
+                for start in range(0, len(node_ids), NODE_BATCH_SIZE):
+                    batch_ids = node_ids[start : start + NODE_BATCH_SIZE]
+                    node_dynamics = {}
+                    if reader:
+                        node_dynamics = {
+                            node_id: (dynamics, dynamics_units)
+                            for node_id, dynamics, dynamics_units in reader(
+                                sim_data,
+                                batch_ids,
+                                indexes,
+                                global_columns,
+                                read_columns,
+                            )
+                        }
+                    # Nodes without dynamics are saved with empty dynamics
+                    for node_id in batch_ids:
+                        node = Node()
+                        node.node_id = node_id
+                        node.node_type = node_type
+                        if node_id in node_dynamics:
+                            node.read_dynamics(*node_dynamics[node_id])
+                        save_node(node, name_mapping)
+                    progress.update(len(batch_ids))
+        save_node(time_node(global_columns["time"]), name_mapping)
 
         zf.writestr("series.json", orjson.dumps(name_mapping))
         zf.writestr(NODELIST_JSON, orjson.dumps(node_list))
@@ -248,7 +262,7 @@ def convert_dynamics(seriesOutDir, sim_data, node_list, edge_list, experiment_id
         )
 
 
-def time_node(timeseries):
+def time_node(time):
     time_node = Node()
     attr = {
         "node_class": "time",
@@ -256,11 +270,8 @@ def time_node(timeseries):
         "node_id": "time",
     }
     time_node.read_attributes(**attr)
-    if len(timeseries["time"]) < MIN_TIMESTEPS:
+    if len(time) < MIN_TIMESTEPS:
         time = np.array([0.0 + (2 * i) for i in range(MIN_TIMESTEPS)])
-    else:
-        time = timeseries["time"]
-    # time = columns[("Main", "time")]
     dynamics = {
         "time": time,
     }
@@ -272,95 +283,90 @@ def time_node(timeseries):
     return time_node
 
 
-def read_global_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_global_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads global dynamics from simulation output.
     """
-
-    cell_mass = timeseries["listeners"]["mass"]["cell_mass"]
-
-    if node_id == "cell_mass":
-        dynamics = {
-            "mass": cell_mass,
-        }
-        dynamics_units = {
-            "mass": "fg",
-        }
-
-    elif node_id == "cell_volume":
-        cell_volume = (
-            (1.0 / sim_data.constants.cell_density) * (units.fg * cell_mass)
-        ).asNumber(units.L)
-        dynamics = {
-            "volume": cell_volume,
-        }
-        dynamics_units = {
-            "volume": "L",
-        }
-
-    else:
-        return
-
-    node.read_dynamics(dynamics, dynamics_units)
+    if "cell_mass" in node_ids:
+        yield "cell_mass", {"mass": global_columns["cell_mass"]}, {"mass": "fg"}
+    if "cell_volume" in node_ids:
+        yield "cell_volume", {"volume": global_columns["volume"]}, {"volume": "L"}
 
 
-def read_gene_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_gene_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for gene nodes from simulation output.
     """
-    gene_index = indexes["Genes"][node_id]
-    dynamics = {
-        # "transcription probability": columns[("RnaSynthProb", "actual_rna_synth_prob_per_cistron")][:, gene_index],
-        "transcription probability": timeseries["listeners"]["rna_synth_prob"][
-            "actual_rna_synth_prob_per_cistron"
-        ][:, gene_index],
-        # "gene copy number": columns[("RnaSynthProb", "gene_copy_number")][:, gene_index],
-        "gene copy number": timeseries["listeners"]["rna_synth_prob"][
-            "gene_copy_number"
-        ][:, gene_index],
-    }
+    gene_idx = [indexes["Genes"][node_id] for node_id in node_ids]
+    dynamics = read_columns(
+        {
+            "transcription probability": list_select_sql(
+                "listeners__rna_synth_prob__actual_rna_synth_prob_per_cistron",
+                gene_idx,
+            ),
+            "gene copy number": list_select_sql(
+                "listeners__rna_synth_prob__gene_copy_number", gene_idx
+            ),
+        }
+    )
     dynamics_units = {
         "transcription probability": PROB_UNITS,
         "gene copy number": COUNT_UNITS,
     }
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
 
-def read_rna_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_rna_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for transcript (RNA) nodes from simulation output.
     """
     # If RNA is an mRNA, get counts from mRNA counts listener
-    if node_id in indexes["mRNAs"]:
-        # counts = columns[("mRNACounts", "mRNA_counts")][:, indexes["mRNAs"][node_id]]
-        counts = timeseries["listeners"]["rna_counts"]["mRNA_counts"][
-            :, indexes["mRNAs"][node_id]
-        ]
     # If not, get counts from bulk molecules listener
-    else:
-        # counts = columns[("BulkMolecules", "counts")][:, indexes["BulkMolecules"][node_id]]
-        counts = timeseries["bulk"][:, indexes["BulkMolecules"][node_id]]
+    mrna_ids = [node_id for node_id in node_ids if node_id in indexes["mRNAs"]]
+    bulk_rna_ids = [node_id for node_id in node_ids if node_id not in indexes["mRNAs"]]
+    expressions = {}
+    if len(mrna_ids) > 0:
+        expressions["mRNA counts"] = list_select_sql(
+            "listeners__rna_counts__mRNA_counts",
+            [indexes["mRNAs"][node_id] for node_id in mrna_ids],
+        )
+    if len(bulk_rna_ids) > 0:
+        expressions["bulk counts"] = list_select_sql(
+            "bulk", [indexes["BulkMolecules"][node_id] for node_id in bulk_rna_ids]
+        )
+    columns = read_columns(expressions)
 
-    dynamics = {
-        "counts": counts,
-    }
     dynamics_units = {
         "counts": COUNT_UNITS,
     }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    if len(mrna_ids) > 0:
+        yield from split_dynamics(
+            mrna_ids, {"counts": columns["mRNA counts"]}, dynamics_units
+        )
+    if len(bulk_rna_ids) > 0:
+        yield from split_dynamics(
+            bulk_rna_ids, {"counts": columns["bulk counts"]}, dynamics_units
+        )
 
 
-def read_protein_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_protein_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for monomer/complex nodes from a simulation output.
     """
-    count_index = indexes["BulkMolecules"][node_id]
-    # counts = columns[("BulkMolecules", "counts")][:, count_index]
-    counts = timeseries["bulk"][:, count_index]
-    concentration = (
-        ((1 / sim_data.constants.n_avogadro) * counts) / (units.L * volume)
-    ).asNumber(units.mmol / units.L)
+    count_idx = [indexes["BulkMolecules"][node_id] for node_id in node_ids]
+    counts = read_columns({"counts": list_select_sql("bulk", count_idx)})["counts"]
+    counts_to_mmol_per_L = (1 / sim_data.constants.n_avogadro).asNumber(units.mmol) / (
+        global_columns["volume"]
+    )
+    concentration = counts * counts_to_mmol_per_L[:, np.newaxis]
 
     dynamics = {
         "counts": counts,
@@ -370,215 +376,259 @@ def read_protein_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
         "counts": COUNT_UNITS,
         "concentration": "mmol/L",
     }
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
 
-def read_metabolite_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_metabolite_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dyanmics data for metabolite nodes from a simulation output.
     """
-    try:
-        count_index = indexes["BulkMolecules"][node_id]
-    except (KeyError, IndexError):
-        return  # Metabolite not being modeled
-    # counts = columns[("BulkMolecules", "counts")][:, count_index]
-    counts = timeseries["bulk"][:, count_index]
-    concentration = (
-        ((1 / sim_data.constants.n_avogadro) * counts) / (units.L * volume)
-    ).asNumber(units.mmol / units.L)
-
-    dynamics = {
-        "counts": counts,
-        "concentration": concentration,
-    }
-    dynamics_units = {
-        "counts": COUNT_UNITS,
-        "concentration": "mmol/L",
-    }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    # Skip metabolites that are not being modeled
+    modeled_ids = [
+        node_id for node_id in node_ids if node_id in indexes["BulkMolecules"]
+    ]
+    if len(modeled_ids) == 0:
+        return
+    yield from read_protein_dynamics(
+        sim_data, modeled_ids, indexes, global_columns, read_columns
+    )
 
 
-def read_transcription_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_transcription_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for transcription nodes from simulation output.
     """
-    rna_id = node_id.split(NODE_ID_SUFFIX["transcription"])[0]
-    rna_idx = indexes["RNAs"][rna_id + "[c]"]
-    dynamics = {
-        # "transcription initiations": columns[("RnapData", "rnaInitEvent")][:, rna_idx],
-        "transcription initiations": timeseries["listeners"]["rnap_data"][
-            "rna_init_event"
-        ][:, rna_idx],
-        # "promoter copy number": columns[("RnaSynthProb", "promoter_copy_number")][:, rna_idx],
-        "promoter copy number": timeseries["listeners"]["rna_synth_prob"][
-            "promoter_copy_number"
-        ][:, rna_idx],
-    }
+    rna_idx = [
+        indexes["RNAs"][node_id.split(NODE_ID_SUFFIX["transcription"])[0] + "[c]"]
+        for node_id in node_ids
+    ]
+    dynamics = read_columns(
+        {
+            "transcription initiations": list_select_sql(
+                "listeners__rnap_data__rna_init_event", rna_idx
+            ),
+            "promoter copy number": list_select_sql(
+                "listeners__rna_synth_prob__promoter_copy_number", rna_idx
+            ),
+        }
+    )
     dynamics_units = {
         "transcription initiations": COUNT_UNITS,
     }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
 
-def read_translation_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_translation_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for translation nodes from a simulation output.
     """
-    rna_id = node_id.split(NODE_ID_SUFFIX["translation"])[0] + "_RNA"
-    translation_idx = indexes["TranslatedRnas"][rna_id]
-    dynamics = {
-        "translation probability": timeseries["listeners"]["ribosome_data"][
-            "actual_prob_translation_per_transcript"
-        ][:, translation_idx],
-    }
+    translation_idx = [
+        indexes["TranslatedRnas"][
+            node_id.split(NODE_ID_SUFFIX["translation"])[0] + "_RNA"
+        ]
+        for node_id in node_ids
+    ]
+    dynamics = read_columns(
+        {
+            "translation probability": list_select_sql(
+                "listeners__ribosome_data__actual_prob_translation_per_transcript",
+                translation_idx,
+            ),
+        }
+    )
     dynamics_units = {
         "translation probability": PROB_UNITS,
     }
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
-    node.read_dynamics(dynamics, dynamics_units)
 
-
-def read_complexation_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_complexation_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for complexation nodes from a simulation output.
     """
-    reaction_idx = indexes["ComplexationReactions"][node_id]
-    dynamics = {
-        "complexation events": timeseries["listeners"]["complexation_listener"][
-            "complexation_events"
-        ][:, reaction_idx],
-        # 'complexation events': columns[("ComplexationListener", "complexationEvents")][:, reaction_idx],
-    }
+    reaction_idx = [indexes["ComplexationReactions"][node_id] for node_id in node_ids]
+    dynamics = read_columns(
+        {
+            "complexation events": list_select_sql(
+                "listeners__complexation_listener__complexation_events",
+                reaction_idx,
+            ),
+        }
+    )
     dynamics_units = {
         "complexation events": COUNT_UNITS,
     }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
 
-def read_rna_maturation_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_rna_maturation_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for RNA maturation nodes from a simulation output.
     """
-    reaction_idx = indexes["UnprocessedRnas"][node_id[:-4] + "[c]"]
-
-    dynamics = {
-        # 'RNA maturation events': columns[("RnaMaturationListener", "unprocessed_rnas_consumed")][:, reaction_idx],
-        "RNA maturation events": timeseries["listeners"]["rna_maturation_listener"][
-            "unprocessed_rnas_consumed"
-        ][:, reaction_idx],
-    }
+    reaction_idx = [
+        indexes["UnprocessedRnas"][node_id[:-4] + "[c]"] for node_id in node_ids
+    ]
+    dynamics = read_columns(
+        {
+            "RNA maturation events": list_select_sql(
+                "listeners__rna_maturation_listener__unprocessed_rnas_consumed",
+                reaction_idx,
+            ),
+        }
+    )
     dynamics_units = {
         "RNA maturation events": COUNT_UNITS,
     }
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
-    node.read_dynamics(dynamics, dynamics_units)
 
-
-def read_metabolism_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_metabolism_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for metabolism nodes from a simulation output.
     """
-    reaction_idx = indexes["MetabolismReactions"][node_id]
+    reaction_idx = [indexes["MetabolismReactions"][node_id] for node_id in node_ids]
+    fluxes = read_columns(
+        {
+            "flux": list_select_sql(
+                "listeners__fba_results__reaction_fluxes", reaction_idx
+            ),
+        }
+    )["flux"]
+    conversion_coeffs = (
+        global_columns["dry_mass"]
+        / global_columns["cell_mass"]
+        * sim_data.constants.cell_density.asNumber(MASS_UNITS / VOLUME_UNITS)
+    )
+    flux_units = (COUNTS_UNITS / MASS_UNITS / TIME_UNITS).asNumber(
+        units.mmol / units.g / units.h
+    )
     dynamics = {
-        # 'flux': columns[("FBAResults", "reactionFluxesConverted")][:, reaction_idx],
-        "flux": timeseries["listeners"]["fba_results"]["reaction_fluxes_converted"][
-            :, reaction_idx
-        ],
+        "flux": fluxes / conversion_coeffs[:, np.newaxis] * flux_units,
     }
     dynamics_units = {
         "flux": "mmol/gCDW/h",
     }
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
-    node.read_dynamics(dynamics, dynamics_units)
 
-
-def read_equilibrium_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_equilibrium_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for equilibrium nodes from a simulation output.
     """
     # TODO (ggsun): Fluxes for 2CS reactions are not being listened to.
-    try:
-        reaction_idx = indexes["EquilibriumReactions"][node_id]
-    except (KeyError, IndexError):
-        return  # 2CS reaction
-
-    dynamics = {
-        # 'reaction rate': columns[("EquilibriumListener", "reactionRates")][:, reaction_idx],
-        "reaction rate": timeseries["listeners"]["equilibrium_listener"][
-            "reaction_rates"
-        ][:, reaction_idx],
-    }
+    equilibrium_ids = [
+        node_id for node_id in node_ids if node_id in indexes["EquilibriumReactions"]
+    ]
+    if len(equilibrium_ids) == 0:
+        return
+    reaction_idx = [
+        indexes["EquilibriumReactions"][node_id] for node_id in equilibrium_ids
+    ]
+    dynamics = read_columns(
+        {
+            "reaction rate": list_select_sql(
+                "listeners__equilibrium_listener__reaction_rates", reaction_idx
+            ),
+        }
+    )
     dynamics_units = {
         "reaction rate": "rxns/s",
     }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(equilibrium_ids, dynamics, dynamics_units)
 
 
-def read_regulation_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_regulation_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for regulation nodes from a simulation output.
     """
-    tf_id, gene_id, _ = node_id.split("_")
-    gene_idx = indexes["Genes"][gene_id]
-    tf_idx = indexes["TranscriptionFactors"][tf_id]
-
-    bound_tf_array = timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_cistron"]
-
-    dynamics = {
-        # 'bound TFs': columns[("RnaSynthProb", "n_bound_TF_per_TU")][:, gene_idx, tf_idx],
-        "bound TFs": bound_tf_array[:, gene_idx, tf_idx],
-    }
+    # Bound TFs per cistron are emitted as flattened (cistron x TF) arrays
+    n_TF = len(indexes["TranscriptionFactors"])
+    bound_tf_idx = []
+    for node_id in node_ids:
+        tf_id, gene_id, _ = node_id.split("_")
+        gene_idx = indexes["Genes"][gene_id]
+        tf_idx = indexes["TranscriptionFactors"][tf_id]
+        bound_tf_idx.append(gene_idx * n_TF + tf_idx)
+    dynamics = read_columns(
+        {
+            "bound TFs": list_select_sql(
+                "listeners__rna_synth_prob__n_bound_TF_per_cistron", bound_tf_idx
+            ),
+        }
+    )
     dynamics_units = {
         "bound TFs": COUNT_UNITS,
     }
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
-    node.read_dynamics(dynamics, dynamics_units)
 
-
-def read_tf_binding_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_tf_binding_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for TF binding nodes from a simulation output.
     """
-    tf_id, _ = node_id.split("-bound")
-    tf_idx = indexes["TranscriptionFactors"][tf_id]
-
-    dynamics = {
-        # 'bound TFs': columns[("RnaSynthProb", "n_bound_TF_per_TU")][:, :, tf_idx].sum(axis=1),
-        "bound TFs": timeseries["listeners"]["rna_synth_prob"]["n_bound_TF_per_TU"][
-            :, :, tf_idx
-        ].sum(axis=1),
-    }
+    # Bound TFs per TU are emitted as flattened (TU x TF) arrays, so the
+    # total for each TF is a strided sum that DuckDB can compute directly
+    n_TF = len(indexes["TranscriptionFactors"])
+    column = "listeners__rna_synth_prob__n_bound_TF_per_TU"
+    tf_sums = ", ".join(
+        f"list_sum(list_slice({column}, {tf_idx + 1}, len({column}), {n_TF}))::BIGINT"
+        for tf_idx in (
+            indexes["TranscriptionFactors"][node_id.split("-bound")[0]]
+            for node_id in node_ids
+        )
+    )
+    dynamics = read_columns({"bound TFs": f"[{tf_sums}]"})
     dynamics_units = {
         "bound TFs": COUNT_UNITS,
     }
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
-    node.read_dynamics(dynamics, dynamics_units)
 
-
-def read_charging_dynamics(sim_data, node, node_id, indexes, volume, timeseries):
+def read_charging_dynamics(
+    sim_data, node_ids, indexes, global_columns, read_columns
+) -> NodeDynamics:
     """
     Reads dynamics data for charging nodes from a simulation output.
     """
-    rna = "{}[c]".format(node_id.split(" ")[0])
-    rna_idx = indexes["Charging"][rna]
-    dynamics = {
-        # 'reaction rate': columns[("GrowthLimits", "net_charged")][:, rna_idx]
-        "reaction rate": timeseries["listeners"]["growth_limits"]["net_charged"][
-            :, rna_idx
-        ]
-    }
+    rna_idx = [
+        indexes["Charging"]["{}[c]".format(node_id.split(" ")[0])]
+        for node_id in node_ids
+    ]
+    dynamics = read_columns(
+        {
+            "reaction rate": list_select_sql(
+                "listeners__growth_limits__net_charged", rna_idx
+            ),
+        }
+    )
     dynamics_units = {
         "reaction rate": "rxns/s",
     }
-
-    node.read_dynamics(dynamics, dynamics_units)
+    yield from split_dynamics(node_ids, dynamics, dynamics_units)
 
 
-TYPE_TO_READER_FUNCTION = {
+TYPE_TO_READER_FUNCTION: dict[
+    str,
+    Callable[[Any, list[str], dict, dict[str, np.ndarray], ColumnReader], NodeDynamics],
+] = {
     "Global": read_global_dynamics,
     "Gene": read_gene_dynamics,
     "RNA": read_rna_dynamics,
@@ -596,3 +646,10 @@ TYPE_TO_READER_FUNCTION = {
     "TF Binding": read_tf_binding_dynamics,
     "Charging": read_charging_dynamics,
 }
+"""
+Mapping from node types to functions that read the dynamics for a batch of
+nodes of that type. Each function takes sim_data, a list of node IDs, a mapping
+of index dictionaries, global columns (time, cell mass, dry mass, and volume),
+and a :py:data:`~.ColumnReader`. Nodes that are not yielded are saved without
+dynamics.
+"""
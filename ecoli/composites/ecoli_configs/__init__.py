@@ -50,7 +50,7 @@ for process_name in processes + list(add_processes):
     if not process_class:
         raise ValueError(
             f"Unknown process with name {process_name}. "
-            "Did you call process_registry.register() in ecoli/processes/__init__.py?"
+            "Did you add it to PROCESS_MANIFEST in ecoli/processes/__init__.py?"
         )
 
     ECOLI_DEFAULT_PROCESSES[process_name] = process_class
@@ -77,6 +77,7 @@ for process in ECOLI_DEFAULT_PROCESSES:
         else original_processes[process]
     )
 
+    process_registry.access(original_process)
     process_topology = topology_registry.access(original_process)
     if process_topology:
         process_topology = copy.deepcopy(process_topology)
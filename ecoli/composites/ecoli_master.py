@@ -25,6 +25,8 @@ from ecoli.library.sim_data import LoadSimData, RAND_MAX
 
 # logging
 from ecoli.library.logging_tools import make_logging_process
+from ecoli.library.layer_executor import make_threaded_step
+from ecoli.library.lazy_listeners import schedule_lazy_listeners
 
 # vivarium-ecoli processes
 from ecoli.composites.ecoli_configs import (
@@ -269,6 +271,20 @@ class Ecoli(Composer):
                     can be used to visualize how each process changes bulk
                     molecule counts.
 
+                * ``layer_threads``:
+                    If greater than 0, compute the updates of all steps in
+                    ``config['processes']`` (including the
+                    :py:class:`~ecoli.processes.partition.Requester`
+                    and :py:class:`~ecoli.processes.partition.Evolver` created
+                    from each
+                    :py:class:`~ecoli.processes.partition.PartitionedProcess`)
+                    on a pool of this many threads by wrapping them with
+                    :py:func:`~ecoli.library.layer_executor.make_threaded_step`.
+                    Steps in the same execution layer then run concurrently
+                    but their updates are still applied in a fixed order, so
+                    results do not depend on this option. Steps with the
+                    ``_parallel`` key set in their config are not wrapped.
+
                 * ``flow``:
                     Mapping of process names to their dependencies.
                     Note that the only names allowed must correspond to
@@ -332,6 +348,7 @@ class Ecoli(Composer):
                     ) % RAND_MAX
 
         # make the processes
+        layer_threads = config.get("layer_threads", 0)
         processes = {}
         steps = {}
         flow = {}
@@ -345,42 +362,34 @@ class Ecoli(Composer):
                         "creation of unique indices in the process."
                     )
                 process = process_class(process_configs[process_name])
+                evolver_class, requester_class = Evolver, Requester
                 if config["log_updates"]:
-                    steps[f"{process_name}_evolver"] = make_logging_process(Evolver)(
-                        {
-                            "time_step": time_step,
-                            "process": process,
-                            "_parallel": parallel,
-                        }
-                    )
-                    steps[f"{process_name}_requester"] = make_logging_process(
-                        Requester
-                    )(
-                        {
-                            "time_step": time_step,
-                            "process": process,
-                            "_parallel": parallel,
-                        }
-                    )
-                else:
-                    steps[f"{process_name}_evolver"] = Evolver(
-                        {
-                            "time_step": time_step,
-                            "process": process,
-                            "_parallel": parallel,
-                        }
-                    )
-                    steps[f"{process_name}_requester"] = Requester(
-                        {
-                            "time_step": time_step,
-                            "process": process,
-                            "_parallel": parallel,
-                        }
-                    )
+                    evolver_class = make_logging_process(evolver_class)
+                    requester_class = make_logging_process(requester_class)
+                if layer_threads > 0 and not parallel:
+                    evolver_class = make_threaded_step(evolver_class, layer_threads)
+                    requester_class = make_threaded_step(requester_class, layer_threads)
+                steps[f"{process_name}_evolver"] = evolver_class(
+                    {
+                        "time_step": time_step,
+                        "process": process,
+                        "_parallel": parallel,
+                    }
+                )
+                steps[f"{process_name}_requester"] = requester_class(
+                    {
+                        "time_step": time_step,
+                        "process": process,
+                        "_parallel": parallel,
+                    }
+                )
                 self.partitioned_processes.append(process_name)
             elif issubclass(process_class, Step):
                 if config["log_updates"]:
                     process_class = make_logging_process(process_class)
+                parallel = (process_configs[process_name] or {}).get("_parallel")
+                if layer_threads > 0 and not parallel:
+                    process_class = make_threaded_step(process_class, layer_threads)
                 process = process_class(process_configs[process_name])
                 steps[process_name] = process
                 continue
@@ -473,6 +482,7 @@ class Ecoli(Composer):
                 "composer_config": self.config,
                 "dry_mass_inc_dict": self.load_sim_data.sim_data.expectedDryMassIncreaseDict,
                 "seed": config["seed"],
+                "legacy_rng": self.load_sim_data.legacy_rng,
             }
             steps["division"] = Division(division_config)
             if config["d_period"]:
@@ -572,6 +582,13 @@ class Ecoli(Composer):
                         :py:class:`~ecoli.processes.cell_division.MarkDPeriod`
                         when true.
 
+                    * ``lazy_listeners``:
+                        Boolean, only run listeners that are pure functions
+                        of the simulation state when their outputs are
+                        emitted according to ``emit_step``,
+                        ``initial_global_time``, and ``emit_paths`` (see
+                        :py:func:`~ecoli.library.lazy_listeners.schedule_lazy_listeners`).
+
         Returns:
             Full topology for an E. coli simulation.
         """
@@ -654,6 +671,18 @@ class Ecoli(Composer):
             elif "allocator" in step_name:
                 topology[step_name] = allocator_topo.copy()
 
+        # Only run listeners that no other process reads when data is emitted
+        if config.get("lazy_listeners", False):
+            processes, steps, _ = self.processes_and_steps
+            schedule_lazy_listeners(
+                processes,
+                steps,
+                topology,
+                emit_step=config.get("emit_step", 1),
+                initial_global_time=config.get("initial_global_time", 0.0),
+                emit_paths=config.get("emit_paths"),
+            )
+
         # Do not keep an unnecessary reference to these
         del self.processes_and_steps
         return topology
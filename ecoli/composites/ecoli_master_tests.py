@@ -315,12 +315,33 @@ def test_emit_unique():
             assert isinstance(val["agents"]["0"]["unique"][unique_mol], list)
 
 
+def test_layer_threads():
+    """
+    Test that running the Steps of each execution layer on a thread pool
+    gives exactly the same results as running them serially.
+    """
+    data = {}
+    for layer_threads in [0, 4]:
+        sim = EcoliSim.from_file()
+        sim.config["layer_threads"] = layer_threads
+        sim.config["total_time"] = 4
+        sim.build_ecoli()
+        sim.run()
+        data[layer_threads] = sim.query([("agents", "0", "bulk")])
+    assert data[0].keys() == data[4].keys()
+    for t in data[0]:
+        np.testing.assert_array_equal(
+            data[0][t]["agents"]["0"]["bulk"], data[4][t]["agents"]["0"]["bulk"]
+        )
+
+
 test_library = {
     "1": test_division,
     "2": test_division_topology,
     "3": test_ecoli_generate,
     "4": test_lattice_lysis,
     "5": test_emit_unique,
+    "6": test_layer_threads,
 }
 
 # run experiments in test_library from the command line with:
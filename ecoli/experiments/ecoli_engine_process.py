@@ -101,6 +101,9 @@ class EcoliInnerSim(Composer):
                 # with DivisionDetector
                 "divide": True,
                 "spatial_environment": False,
+                # EngineProcess emits and tunnels out inner simulation state
+                # every timestep without going through the inner Engine
+                "lazy_listeners": False,
             }
         )
         ecoli_sim.build_ecoli()
@@ -171,6 +174,7 @@ class EcoliEngineProcess(Composer):
         "lysis_config": {},
         "inner_same_timestep": True,
         "division_threshold": True,
+        "tunnel_update_log": False,
     }
 
     def generate_processes(self, config):
@@ -205,6 +209,7 @@ class EcoliEngineProcess(Composer):
             "start_time": config["start_time"],
             "experiment_id": config["experiment_id"],
             "inner_same_timestep": config["inner_same_timestep"],
+            "tunnel_update_log": config["tunnel_update_log"],
         }
         cell_process = EngineProcess(cell_process_config)
         processes.update({"cell_process": cell_process})
@@ -371,6 +376,7 @@ def run_simulation(config):
         "inner_composer_config": config.to_dict(),
         "lysis_config": config.get("lysis_config", {}),
         "inner_same_timestep": config.get("inner_same_timestep", True),
+        "tunnel_update_log": config.get("tunnel_update_log", False),
     }
     composite = {}
     if "initial_colony_file" in config.keys():
@@ -10,6 +10,7 @@ Interface for configuring and running **single-cell** E. coli simulations.
 # mypy: disable-error-code=attr-defined
 
 import argparse
+import atexit
 import copy
 import os
 import pstats
@@ -29,11 +30,9 @@ from vivarium.library.dict_utils import deep_merge, deep_merge_check
 from vivarium.library.topology import inverse_topology
 from vivarium.library.topology import assoc_path
 from ecoli.library.logging_tools import write_json
+from ecoli.library.lazy_listeners import reset_emit_schedules
 import ecoli.composites.ecoli_master
 
-# Environment composer for spatial environment sim
-import ecoli.composites.environment.lattice
-
 from ecoli.processes import process_registry
 from ecoli.processes.cell_division import DivisionDetected
 from ecoli.processes.registries import topology_registry
@@ -254,6 +253,25 @@ class SimConfig:
                     "e.g. for use with blame plot."
                 ),
             )
+            self.parser.add_argument(
+                "--emit_step",
+                action="store",
+                type=float,
+                help=(
+                    "Interval in seconds at which to emit data. Listeners whose "
+                    "outputs are not read by other processes only run when "
+                    "data is emitted."
+                ),
+            )
+            self.parser.add_argument(
+                "--layer_threads",
+                action="store",
+                type=int,
+                help=(
+                    "Number of threads used to run Steps in the same execution "
+                    "layer concurrently (0 to run serially)."
+                ),
+            )
             self.parser.add_argument(
                 "--raw_output",
                 action=argparse.BooleanOptionalAction,
@@ -311,6 +329,27 @@ class SimConfig:
                 action=argparse.BooleanOptionalAction,
                 help="Simulation will raise TimeLimitException upon reaching total_time.",
             )
+            self.parser.add_argument(
+                "--in_process_generations",
+                type=int,
+                action="store",
+                help="Number of consecutive generations to simulate in this process.",
+            )
+            self.parser.add_argument(
+                "--in_process_daughter",
+                type=int,
+                choices=[0, 1],
+                action="store",
+                help="Index of daughter cell to continue simulating after division.",
+            )
+            self.parser.add_argument(
+                "--checkpoint_daughters",
+                action=argparse.BooleanOptionalAction,
+                help=(
+                    "Save daughter cell states at every division when"
+                    " simulating multiple generations in this process."
+                ),
+            )
 
     @staticmethod
     def merge_config_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> None:
@@ -500,8 +539,9 @@ class EcoliSim:
     ) -> dict[str, Process]:
         """
         Retrieve process classes from
-        :py:data:`~vivarium.core.registry.process_registry` (processes are
-        registered in ``ecoli/processes/__init__.py``).
+        :py:data:`~ecoli.processes.registries.process_registry` (processes are
+        listed in ``ecoli/processes/__init__.py``). Only the modules of the
+        requested processes are imported.
 
         Args:
             processes: Base list of process names to retrieve classes for
@@ -524,7 +564,7 @@ class EcoliSim:
             if not process_class:
                 raise ValueError(
                     f"Unknown process with name {process_name}. "
-                    "Did you call process_registry.register() in "
+                    "Did you add it to PROCESS_MANIFEST in "
                     "ecoli/processes/__init__.py?"
                 )
             result[process_name] = process_class
@@ -567,6 +607,8 @@ class EcoliSim:
                 if process not in swap_processes.values()
                 else original_processes[process]
             )
+            # Topologies are registered when process modules are imported
+            process_registry.access(original_process)
             process_topology = topology_registry.access(original_process)
             if process_topology:
                 process_topology = copy.deepcopy(process_topology)
@@ -614,7 +656,7 @@ class EcoliSim:
         For all processes in ``config['processes']``:
 
         1. Retrieves process class from
-        :py:data:`~vivarium.core.registry.process_registry`, which is
+        :py:data:`~ecoli.processes.registries.process_registry`, which is
         populated in ``ecoli/processes/__init__.py``.
 
         2. Retrieves process topology from
@@ -670,12 +712,13 @@ class EcoliSim:
 
         # merge a lattice composite for the spatial environment
         if self.spatial_environment:
+            # Environment composer for spatial environment sim
+            from ecoli.composites.environment.lattice import Lattice
+
             initial_state_config = self.spatial_environment_config.get(
                 "initial_state_config"
             )
-            environment_composite = ecoli.composites.environment.lattice.Lattice(
-                self.spatial_environment_config
-            ).generate()
+            environment_composite = Lattice(self.spatial_environment_config).generate()
             initial_environment = environment_composite.initial_state(
                 initial_state_config
             )
@@ -714,14 +757,7 @@ class EcoliSim:
             try:
                 self.ecoli_experiment.update(time_to_next_save)
             except DivisionDetected:
-                state = self.ecoli_experiment.state.get_value(condition=not_a_process)
-                assert len(state["agents"]) == 2
-                for i, agent_state in enumerate(state["agents"].values()):
-                    prepare_save_state(agent_state)
-                    daughter_path = os.path.join(
-                        daughter_outdir, f"daughter_state_{i}.json"
-                    )
-                    write_json(daughter_path, agent_state)
+                self._save_daughter_states(daughter_outdir)
                 print(
                     f"Divided at t = {self.ecoli_experiment.global_time} after"
                     f"{self.ecoli_experiment.global_time - self.initial_global_time} sec."
@@ -742,6 +778,91 @@ class EcoliSim:
         if time_remaining:
             self.ecoli_experiment.update(time_remaining)
 
+    def _apply_emit_paths(self):
+        """Only emit the stores in ``config['emit_paths']``, if specified."""
+        if self.config["emit_paths"]:
+            self.ecoli_experiment.state.set_emit_values([tuple()], False)
+            self.ecoli_experiment.state.set_emit_values(
+                self.config["emit_paths"],
+                True,
+            )
+
+    def _save_daughter_states(self, daughter_outdir: str):
+        """
+        Saves the states of the two daughter cells in the current
+        :py:class:`~vivarium.core.engine.Engine` to ``daughter_state_0.json``
+        and ``daughter_state_1.json`` in ``daughter_outdir``.
+        """
+        state = self.ecoli_experiment.state.get_value(condition=not_a_process)
+        assert len(state["agents"]) == 2
+        os.makedirs(daughter_outdir, exist_ok=True)
+        for i, agent_state in enumerate(state["agents"].values()):
+            prepare_save_state(agent_state)
+            daughter_path = os.path.join(daughter_outdir, f"daughter_state_{i}.json")
+            write_json(daughter_path, agent_state)
+
+    def _continue_with_daughter(self, engine_config: dict[str, Any]):
+        """
+        Replaces the current :py:class:`~vivarium.core.engine.Engine`, which
+        has just divided, with a new one that simulates the daughter cell at
+        index ``config['in_process_daughter']``. The daughter keeps the process
+        instances and state created for it by
+        :py:class:`~ecoli.processes.cell_division.Division`, so no simulation
+        data has to be reloaded. The new Engine gets its own emitter, which
+        for the Parquet emitter means a new Hive partition for the daughter's
+        generation and agent ID.
+
+        Args:
+            engine_config: Keyword arguments for the Engine of the first
+                generation, excluding processes, steps, flow, topology, and
+                initial state.
+        """
+        mother_experiment = self.ecoli_experiment
+        agents_store = mother_experiment.state.get_path(("agents",))
+        daughter_id = sorted(agents_store.inner)[self.in_process_daughter]
+        daughter_store = agents_store.inner[daughter_id]
+        path = ("agents", daughter_id)
+        steps = daughter_store.get_steps()
+        division_time = mother_experiment.global_time
+
+        # Finish up output for the mother cell
+        if isinstance(mother_experiment.emitter, ParquetEmitter):
+            mother_experiment.emitter.success = True
+            atexit.unregister(mother_experiment.emitter._finalize)
+            mother_experiment.emitter._finalize()
+        mother_experiment.end()
+
+        self.agent_id = daughter_id
+        self.seed = steps["division"].parameters["seed"]
+        self.initial_global_time = division_time
+        metadata = dict(engine_config["metadata"])
+        metadata.update(
+            {
+                "agent_id": self.agent_id,
+                "seed": self.seed,
+                "initial_global_time": self.initial_global_time,
+                "time": datetime.now(),
+            }
+        )
+        # Lazy listeners must follow the emits of the new Engine
+        reset_emit_schedules(steps, self.initial_global_time)
+        self.ecoli_experiment = Engine(
+            **{
+                **engine_config,
+                "metadata": metadata,
+                "processes": assoc_path({}, path, daughter_store.get_processes()),
+                "steps": assoc_path({}, path, steps),
+                "flow": assoc_path({}, path, daughter_store.get_flow()),
+                "topology": assoc_path({}, path, daughter_store.get_topology()),
+                "initial_state": assoc_path(
+                    {}, path, daughter_store.get_value(condition=not_a_process)
+                ),
+                "initial_global_time": self.initial_global_time,
+            }
+        )
+        self._apply_emit_paths()
+        self.ecoli_experiment.initial_state = None
+
     def run(self):
         """Create and run an EcoliSim experiment.
 
@@ -791,6 +912,7 @@ class EcoliSim:
             "emit_config": self.emit_config,
             "emitter": self.emitter_config,
             "initial_global_time": self.initial_global_time,
+            "emit_step": self.emit_step,
         }
         if self.experiment_id:
             # Store backup of base experiment ID,
@@ -822,14 +944,15 @@ class EcoliSim:
             r"has the value <bound method UniqueNumpyUpdater\.updater",
         )
         self.ecoli_experiment = Engine(**experiment_config)
+        self._apply_emit_paths()
 
-        # Only emit designated stores if specified
-        if self.config["emit_paths"]:
-            self.ecoli_experiment.state.set_emit_values([tuple()], False)
-            self.ecoli_experiment.state.set_emit_values(
-                self.config["emit_paths"],
-                True,
-            )
+        # Keep Engine options that are shared by all generations simulated
+        # in this process (see _continue_with_daughter)
+        lineage_engine_config = {
+            key: value
+            for key, value in experiment_config.items()
+            if key not in ("processes", "steps", "flow", "topology", "initial_state")
+        }
 
         # Clean up unnecessary references
         self.generated_initial_state = None
@@ -841,27 +964,33 @@ class EcoliSim:
         if self.save:
             self.save_states(self.daughter_outdir)
         else:
-            try:
-                self.ecoli_experiment.update(self.total_time)
-            except DivisionDetected:
-                state = self.ecoli_experiment.state.get_value(condition=not_a_process)
-                assert len(state["agents"]) == 2
-                for i, agent_state in enumerate(state["agents"].values()):
-                    prepare_save_state(agent_state)
-                    daughter_path = os.path.join(
-                        self.daughter_outdir, f"daughter_state_{i}.json"
+            for generation in range(self.in_process_generations):
+                try:
+                    self.ecoli_experiment.update(self.total_time)
+                    break
+                except DivisionDetected:
+                    print(
+                        f"Divided at t = {self.ecoli_experiment.global_time} after"
+                        f"{self.ecoli_experiment.global_time - self.initial_global_time} sec."
                     )
-                    write_json(daughter_path, agent_state)
-                print(
-                    f"Divided at t = {self.ecoli_experiment.global_time} after"
-                    f"{self.ecoli_experiment.global_time - self.initial_global_time} sec."
-                )
-                with open("division_time.sh", "w") as f:
-                    f.write(f"export division_time={self.ecoli_experiment.global_time}")
-                # Tell Parquet emitter that simulation was successful
-                if isinstance(self.ecoli_experiment.emitter, ParquetEmitter):
-                    self.ecoli_experiment.emitter.success = True
-                sys.exit()
+                    if generation < self.in_process_generations - 1:
+                        if self.checkpoint_daughters:
+                            self._save_daughter_states(
+                                os.path.join(
+                                    self.daughter_outdir, f"agent_id={self.agent_id}"
+                                )
+                            )
+                        self._continue_with_daughter(lineage_engine_config)
+                        continue
+                    self._save_daughter_states(self.daughter_outdir)
+                    with open("division_time.sh", "w") as f:
+                        f.write(
+                            f"export division_time={self.ecoli_experiment.global_time}"
+                        )
+                    # Tell Parquet emitter that simulation was successful
+                    if isinstance(self.ecoli_experiment.emitter, ParquetEmitter):
+                        self.ecoli_experiment.emitter.success = True
+                    sys.exit()
         self.ecoli_experiment.end()
         if self.profile:
             report_profiling(self.ecoli_experiment.stats)
@@ -1,12 +1,14 @@
 import os
 from collections.abc import MutableMapping
-from functools import reduce
+from functools import partial, reduce
 from operator import __or__
 from time import perf_counter
+from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+from numba import njit
 from skimage import measure
 
 
@@ -273,6 +275,269 @@ def detect_holes_skimage(lattice, on_cylinder=True):
     return hole_sizes, hole_view
 
 
+@njit
+def _find_root(parent, i):
+    # Path halving keeps the trees shallow without recursion
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+@njit
+def _union(parent, size, i, j):
+    i = _find_root(parent, i)
+    j = _find_root(parent, j)
+    if i != j:
+        if size[i] < size[j]:
+            i, j = j, i
+        parent[j] = i
+        size[i] += size[j]
+    return size[i]
+
+
+@njit
+def _union_find_holes(lattice, on_cylinder, critical_size):
+    rows, cols = lattice.shape
+    # Flat index of parent position for holes, -1 for murein
+    # (and for holes that were not visited due to early stopping)
+    parent = np.full(rows * cols, -1, dtype=np.int64)
+    size = np.zeros(rows * cols, dtype=np.int64)
+    largest = 0
+    for r in range(rows):
+        for c in range(cols):
+            if lattice[r, c] != 0:
+                continue
+            i = r * cols + c
+            parent[i] = i
+            size[i] = 1
+            largest = max(largest, 1)
+            # Same neighbors as detect_holes: N N N
+            #                                 N X
+            if c > 0 and lattice[r, c - 1] == 0:
+                largest = max(largest, _union(parent, size, i, i - 1))
+            if r > 0:
+                for n_c in range(max(c - 1, 0), min(c + 2, cols)):
+                    if lattice[r - 1, n_c] == 0:
+                        largest = max(
+                            largest, _union(parent, size, i, i - cols + n_c - c)
+                        )
+            if critical_size > 0 and largest >= critical_size:
+                return parent, size
+
+    if on_cylinder:
+        # Merge holes bordering the top edge with holes bordering the bottom edge
+        last_row = (rows - 1) * cols
+        for c in range(cols):
+            if lattice[0, c] != 0:
+                continue
+            for n_c in range(max(c - 1, 0), min(c + 2, cols)):
+                if lattice[rows - 1, n_c] == 0:
+                    largest = max(largest, _union(parent, size, c, last_row + n_c))
+                    if critical_size > 0 and largest >= critical_size:
+                        return parent, size
+    return parent, size
+
+
+@njit
+def _label_holes(parent, size):
+    # Number holes in order of their first position (like skimage)
+    labels = np.zeros(parent.size, dtype=np.int64)
+    label_of_root = np.zeros(parent.size, dtype=np.int64)
+    hole_sizes = np.zeros(parent.size, dtype=np.int64)
+    n_holes = 0
+    for i in range(parent.size):
+        if parent[i] < 0:
+            continue
+        root = _find_root(parent, i)
+        if label_of_root[root] == 0:
+            n_holes += 1
+            label_of_root[root] = n_holes
+            hole_sizes[n_holes - 1] = size[root]
+        labels[i] = label_of_root[root]
+    return hole_sizes[:n_holes], labels
+
+
+def detect_holes_union_find(
+    lattice: np.ndarray,
+    on_cylinder: bool = True,
+    critical_size: Optional[int] = None,
+    return_labels: bool = False,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Find holes (8-connected regions of zeros) in a murein lattice with a
+    compiled union-find over the positions of the lattice. Gives the same
+    holes as :py:func:`~.detect_holes_skimage` in a single pass.
+
+    Args:
+        lattice: 2D array where 1 is murein and 0 is a hole
+        on_cylinder: Whether the first and last rows of the lattice are
+            adjacent (i.e. the lattice wraps around the cell)
+        critical_size: If given, stop as soon as a hole of at least this
+            size is found. ``hole_sizes`` then only covers the part of the
+            lattice that was scanned, but its maximum is at least
+            ``critical_size``.
+        return_labels: Whether to also return the label of each position
+
+    Returns:
+        Tuple of the sizes of all holes and, if ``return_labels`` is true, an
+        array of the same shape as ``lattice`` containing the 1-indexed hole
+        each position belongs to (0 for murein), else None.
+    """
+    lattice = np.ascontiguousarray(lattice)
+    parent, size = _union_find_holes(lattice, on_cylinder, critical_size or 0)
+    hole_sizes, labels = _label_holes(parent, size)
+    if return_labels:
+        return hole_sizes, labels.reshape(lattice.shape)
+    return hole_sizes, None
+
+
+@njit
+def _relabel_dirty_holes(lattice, labels, is_dirty, inserted, next_label, on_cylinder):
+    rows, cols = lattice.shape
+    # Holes in inserted columns and holes with labels that are no longer valid
+    n = 0
+    for r in range(rows):
+        for c in range(cols):
+            if (inserted[c] and lattice[r, c] == 0) or is_dirty[labels[r, c]]:
+                n += 1
+    dirty_idx = np.empty(n, dtype=np.int64)
+    # Position of each dirty lattice position in dirty_idx (-1 if clean)
+    position = np.full(rows * cols, -1, dtype=np.int64)
+    k = 0
+    for r in range(rows):
+        for c in range(cols):
+            if (inserted[c] and lattice[r, c] == 0) or is_dirty[labels[r, c]]:
+                dirty_idx[k] = r * cols + c
+                position[r * cols + c] = k
+                k += 1
+
+    parent = np.arange(n)
+    size = np.ones(n, dtype=np.int64)
+    for k in range(n):
+        r, c = divmod(dirty_idx[k], cols)
+        if c > 0 and position[dirty_idx[k] - 1] >= 0:
+            _union(parent, size, k, position[dirty_idx[k] - 1])
+        if r > 0:
+            neighbor_row = r - 1
+        elif on_cylinder:
+            neighbor_row = rows - 1
+        else:
+            continue
+        for n_c in range(max(c - 1, 0), min(c + 2, cols)):
+            j = position[neighbor_row * cols + n_c]
+            if j >= 0:
+                _union(parent, size, k, j)
+
+    label_of_root = np.zeros(n, dtype=np.int64)
+    hole_sizes = np.zeros(n, dtype=np.int64)
+    n_holes = 0
+    for k in range(n):
+        root = _find_root(parent, k)
+        if label_of_root[root] == 0:
+            n_holes += 1
+            label_of_root[root] = n_holes
+            hole_sizes[n_holes - 1] = size[root]
+        r, c = divmod(dirty_idx[k], cols)
+        labels[r, c] = next_label + label_of_root[root] - 1
+    return hole_sizes[:n_holes]
+
+
+class HoleTracker:
+    """
+    Labels and sizes of the holes in a lattice (see
+    :py:func:`~.detect_holes_union_find`) that are updated when columns are
+    inserted into the lattice instead of scanning the whole lattice again.
+    Inserting columns can only split or merge holes in the columns right next
+    to an insertion, so only those holes and the inserted columns are
+    relabeled.
+
+    Args:
+        lattice: 2D array where 1 is murein and 0 is a hole
+        on_cylinder: Whether the first and last rows of the lattice are
+            adjacent (i.e. the lattice wraps around the cell)
+    """
+
+    def __init__(self, lattice: np.ndarray, on_cylinder: bool = True):
+        hole_sizes, labels = detect_holes_union_find(
+            lattice, on_cylinder, return_labels=True
+        )
+        self.lattice = lattice
+        self.on_cylinder = on_cylinder
+        self.labels = labels.astype(np.int32)
+        # Size of the hole with each label (0 for murein and unused labels)
+        self.sizes = np.concatenate([[0], hole_sizes])
+
+    def hole_sizes(self) -> np.ndarray:
+        """Sizes of all holes in the lattice (in no particular order)."""
+        return self.sizes[self.sizes > 0]
+
+    def max_hole_size(self) -> int:
+        return int(self.sizes.max())
+
+    def insert_columns(
+        self, new_lattice: np.ndarray, old_columns: np.ndarray
+    ) -> "HoleTracker":
+        """
+        Get the holes of a lattice made by inserting columns into the lattice
+        of this tracker. This tracker is left unchanged.
+
+        Args:
+            new_lattice: Lattice after inserting columns
+            old_columns: Index in ``new_lattice`` of every column of the
+                old lattice (in increasing order)
+
+        Returns:
+            Tracker for the holes of ``new_lattice``
+        """
+        new_cols = new_lattice.shape[1]
+        labels = np.zeros(new_lattice.shape, dtype=self.labels.dtype)
+        # Copy labels of runs of consecutive old columns
+        run_starts = np.flatnonzero(np.diff(old_columns, prepend=-2) != 1)
+        run_ends = np.append(run_starts[1:], len(old_columns))
+        for start, end in zip(run_starts, run_ends):
+            new_start = old_columns[start]
+            labels[:, new_start : new_start + end - start] = self.labels[:, start:end]
+        inserted = np.ones(new_cols, dtype=np.bool_)
+        inserted[old_columns] = False
+
+        # Holes in old columns next to an inserted column may have been split
+        # (or merged with holes in the inserted columns)
+        next_to_insertion = (
+            inserted[np.maximum(old_columns - 1, 0)]
+            | inserted[np.minimum(old_columns + 1, new_cols - 1)]
+        )
+        is_dirty = np.zeros(len(self.sizes), dtype=np.bool_)
+        is_dirty[self.labels[:, next_to_insertion]] = True
+        is_dirty[0] = False
+
+        new_hole_sizes = _relabel_dirty_holes(
+            np.ascontiguousarray(new_lattice),
+            labels,
+            is_dirty,
+            inserted,
+            len(self.sizes),
+            self.on_cylinder,
+        )
+        sizes = np.concatenate([self.sizes, new_hole_sizes])
+        sizes[: len(self.sizes)][is_dirty] = 0
+
+        # Renumber holes once most labels are no longer used
+        n_holes = np.count_nonzero(sizes)
+        if len(sizes) > 2 * n_holes + 1024:
+            in_use = sizes > 0
+            in_use[0] = True
+            labels = (np.cumsum(in_use, dtype=labels.dtype) - 1)[labels]
+            sizes = sizes[in_use]
+
+        tracker = object.__new__(HoleTracker)
+        tracker.lattice = new_lattice
+        tracker.on_cylinder = self.on_cylinder
+        tracker.labels = labels
+        tracker.sizes = sizes
+        return tracker
+
+
 def test_hole_size_dict():
     hsd = HoleSizeDict({frozenset([1]): 1, frozenset([2]): 2})
 
@@ -319,6 +584,9 @@ def test_detect_holes():
         for method_name, detection_method in {
             "detect_holes": detect_holes,
             "detect_holes_skimage": detect_holes_skimage,
+            "detect_holes_union_find": partial(
+                detect_holes_union_find, return_labels=True
+            ),
         }.items():
             print(f"Detection method: {method_name}")
 
@@ -348,7 +616,7 @@ def test_detect_holes():
                             va="center",
                             color="w",
                         )
-                    elif method_name == "detect_holes_skimage":
+                    else:
                         ax.text(
                             c,
                             r,
@@ -365,10 +633,89 @@ def test_detect_holes():
             plt.close()
 
     print("===============================================")
-    print(f"Passed {n_passed}/{2 * len(test_files)} tests.")
+    print(f"Passed {n_passed}/{3 * len(test_files)} tests.")
     print()
 
 
+def test_detect_holes_union_find():
+    rng = np.random.default_rng(0)
+    for shape in [(1, 1), (1, 7), (7, 1), (4, 4), (30, 20), (101, 57)]:
+        for density in [0, 0.3, 0.5, 0.6, 1]:
+            lattice = rng.binomial(1, 1 - density, size=shape)
+            for on_cylinder in [True, False]:
+                expected_sizes, expected_view = detect_holes_skimage(
+                    lattice.copy(), on_cylinder
+                )
+                hole_sizes, hole_view = detect_holes_union_find(
+                    lattice, on_cylinder, return_labels=True
+                )
+                assert sorted(hole_sizes) == sorted(expected_sizes)
+                assert np.array_equal(hole_view == 0, expected_view == 0)
+                # Same partition of the lattice into holes, up to numbering
+                pairs = np.stack([hole_view.ravel(), expected_view.ravel()])
+                n_pairs = np.unique(pairs, axis=1).shape[1]
+                assert n_pairs == len(np.unique(hole_view))
+                assert n_pairs == len(np.unique(expected_view))
+                assert np.array_equal(np.bincount(hole_view.ravel())[1:], hole_sizes)
+
+                # Early stopping once a hole of critical size is found
+                if hole_sizes.size > 0:
+                    largest = hole_sizes.max()
+                    early_sizes, labels = detect_holes_union_find(
+                        lattice, on_cylinder, critical_size=largest
+                    )
+                    assert labels is None
+                    assert early_sizes.max() == largest
+                    early_sizes, _ = detect_holes_union_find(
+                        lattice, on_cylinder, critical_size=largest + 1
+                    )
+                    assert sorted(early_sizes) == sorted(hole_sizes)
+
+    # Holes touching the top and bottom edges (diagonally) are merged
+    lattice = np.ones((4, 4), dtype=int)
+    lattice[0, 1] = 0
+    lattice[3, 2] = 0
+    assert list(detect_holes_union_find(lattice)[0]) == [2]
+    assert list(detect_holes_union_find(lattice, on_cylinder=False)[0]) == [1, 1]
+
+
+def test_hole_tracker():
+    rng = np.random.default_rng(0)
+    for trial in range(40):
+        density = rng.uniform()
+        on_cylinder = trial % 2 == 0
+        lattice = rng.binomial(1, 1 - density, size=rng.integers(1, 40, size=2))
+        tracker = HoleTracker(lattice, on_cylinder)
+        for _ in range(20):
+            # Insert a few columns at random positions
+            rows, cols = lattice.shape
+            n_inserted = rng.integers(1, 6)
+            inserted = rng.choice(cols + n_inserted, n_inserted, replace=False)
+            old_columns = np.setdiff1d(np.arange(cols + n_inserted), inserted)
+            new_lattice = np.empty((rows, cols + n_inserted), dtype=lattice.dtype)
+            new_lattice[:, old_columns] = lattice
+            new_lattice[:, inserted] = rng.binomial(
+                1, 1 - density, size=(rows, n_inserted)
+            )
+            new_tracker = tracker.insert_columns(new_lattice, old_columns)
+            assert tracker.lattice is lattice
+            lattice, tracker = new_lattice, new_tracker
+
+            hole_sizes, hole_view = detect_holes_union_find(
+                lattice, on_cylinder, return_labels=True
+            )
+            assert sorted(tracker.hole_sizes()) == sorted(hole_sizes)
+            assert tracker.max_hole_size() == hole_sizes.max(initial=0)
+            pairs = np.stack([hole_view.ravel(), tracker.labels.ravel()])
+            n_pairs = np.unique(pairs, axis=1).shape[1]
+            assert n_pairs == len(np.unique(hole_view))
+            assert n_pairs == len(np.unique(tracker.labels))
+            assert np.array_equal(
+                np.bincount(tracker.labels.ravel(), minlength=len(tracker.sizes)),
+                np.append(np.count_nonzero(lattice), tracker.sizes[1:]),
+            )
+
+
 @pytest.mark.skip(reason="Used locally to compare skimage and hand-rolled algo.")
 def test_runtime():
     # Runtime plot
@@ -379,8 +726,11 @@ def test_runtime():
 
     detection_methods = {
         "detect_holes_skimage": detect_holes_skimage,
+        "detect_holes_union_find": detect_holes_union_find,
         "detect_holes": detect_holes,
     }
+    # Compile before timing
+    detect_holes_union_find(np.zeros((2, 2), dtype=int))
 
     for method_name, detection_method in detection_methods.items():
         rng = np.random.default_rng(0)
@@ -2,10 +2,13 @@
 Functions to initialize molecule states from sim_data.
 """
 
+import os
+import pickle
+
 import numpy as np
 import numpy.typing as npt
 from numpy.lib import recfunctions as rfn
-from typing import Any
+from typing import Any, Optional
 from unum import Unum
 
 from ecoli.library.schema import (
@@ -36,6 +39,683 @@ from wholecell.utils.polymerize import computeMassIncrease
 from wholecell.utils.random import stochasticRound
 
 RAND_MAX = 2**31
+INITIAL_STATE_CACHE_VERSION = 1
+
+
+class InitialStateCache:
+    """
+    Holds everything the functions in this module derive from sim_data that
+    does not depend on the random seed (expression vectors, bulk indices,
+    dense regulation matrices, motif coordinates on a given chromosome
+    layout, etc.). Passing the same instance to the initialization functions
+    for many seeds means this work is only done once. Values are computed
+    lazily the first time they are needed and are invalidated if
+    ``sim_data.condition`` changes.
+
+    Every random draw is made in the same order as without a cache, so the
+    states generated for a given seed do not depend on whether (or how often)
+    the cache was reused.
+
+    Instances can be written to disk with :py:meth:`~.save` after calling
+    :py:meth:`~.precompute` and reattached to a freshly loaded sim_data with
+    :py:meth:`~.load`.
+
+    Args:
+        sim_data: Simulation data loaded from pickle generated by ParCa
+    """
+
+    def __init__(self, sim_data):
+        self.sim_data = sim_data
+        self.condition = sim_data.condition
+        self._values: dict[Any, Any] = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["sim_data"]
+        return state
+
+    def get(self, key, compute):
+        """
+        Get the value stored under ``key``, calling ``compute()`` to
+        calculate it if it is not cached yet.
+        """
+        if self.sim_data.condition != self.condition:
+            self._values.clear()
+            self.condition = self.sim_data.condition
+        if key not in self._values:
+            self._values[key] = compute()
+        return self._values[key]
+
+    def precompute(
+        self, media_id, import_molecules, ppgpp_regulation, trna_attenuation
+    ):
+        """
+        Calculate all seed-independent values used by
+        :py:meth:`~ecoli.library.sim_data.LoadSimData.generate_initial_state`
+        (except those that depend on the chromosome layout, which are
+        filled in as seeds are generated). Protein monomer expression is
+        computed before RNA expression to match the order in
+        :py:func:`~.initialize_bulk_counts`.
+        """
+        self.bulk_template()
+        self.protein_monomer_inputs(ppgpp_regulation, trna_attenuation)
+        self.rna_inputs(ppgpp_regulation, trna_attenuation)
+        self.mature_rna_inputs()
+        self.small_molecule_inputs(media_id, import_molecules)
+        self.complexation_inputs()
+        self.replication_inputs()
+        self.tf_inputs()
+        self.transcription_inputs(ppgpp_regulation, trna_attenuation)
+        self.translation_inputs()
+        self.trna_charging_inputs()
+
+    def save(self, path):
+        """Pickle the cached values (without sim_data) to ``path``."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                (INITIAL_STATE_CACHE_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, sim_data) -> "InitialStateCache":
+        """
+        Load a cache saved with :py:meth:`~.save` and attach it to
+        ``sim_data``, which must be the same simulation data (and condition)
+        that the cache was built from.
+        """
+        with open(path, "rb") as f:
+            version, cache = pickle.load(f)
+        if version != INITIAL_STATE_CACHE_VERSION:
+            raise ValueError(
+                f"Initial state cache at {path} has version {version}, "
+                f"expected {INITIAL_STATE_CACHE_VERSION}."
+            )
+        if cache.condition != sim_data.condition:
+            raise ValueError(
+                f"Initial state cache at {path} was built for condition "
+                f"{cache.condition}, not {sim_data.condition}."
+            )
+        cache.sim_data = sim_data
+        return cache
+
+    def bulk_ids(self):
+        return self.sim_data.internal_state.bulk_molecules.bulk_data["id"]
+
+    def bulk_template(self):
+        """
+        Bulk structured array with all counts set to zero. Copy before use.
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            bulk_masses = sim_data.internal_state.bulk_molecules.bulk_data[
+                "mass"
+            ].asNumber(units.fg / units.mol) / sim_data.constants.n_avogadro.asNumber(
+                1 / units.mol
+            )
+            bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data.struct_array[
+                "id"
+            ]
+            dtype = [("id", bulk_ids.dtype), ("count", int)] + [
+                (f"{submass}_submass", np.float64)
+                for submass in sim_data.submass_name_to_index
+            ]
+            template = np.zeros(len(bulk_ids), dtype=dtype)
+            template["id"] = bulk_ids
+            for submass, idx in sim_data.submass_name_to_index.items():
+                template[f"{submass}_submass"] = bulk_masses[:, idx]
+            return template
+
+        return self.get("bulk_template", compute)
+
+    def protein_monomer_inputs(self, ppgpp_regulation, trna_attenuation):
+        """
+        Returns:
+            Tuple of bulk indices of monomers, average protein mass at the
+            start of the cell cycle (before multiplying by ``mass_coeff``),
+            conversion factor from average to initial cell mass, monomer
+            molecular weights (g/mol), monomer expression, and Avogadro's
+            number (1/mol)
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription = sim_data.process.transcription
+            if ppgpp_regulation:
+                rna_expression = sim_data.calculate_ppgpp_expression(sim_data.condition)
+            else:
+                rna_expression = transcription.rna_expression[sim_data.condition]
+
+            if trna_attenuation:
+                # Need to adjust expression (calculated without attenuation) by
+                # basal_adjustment to get the expected expression without any
+                # attenuation and then multiply by the condition readthrough
+                # probability to get the condition specific expression
+                readthrough = transcription.attenuation_readthrough[sim_data.condition]
+                basal_adjustment = transcription.attenuation_readthrough["basal"]
+                rna_expression[transcription.attenuated_rna_indices] *= (
+                    readthrough / basal_adjustment
+                )
+
+            monomer_expression = normalize(
+                transcription.cistron_tu_mapping_matrix.dot(rna_expression)[
+                    sim_data.relation.cistron_to_monomer_mapping
+                ]
+                * sim_data.process.translation.translation_efficiencies_by_monomer
+                / (
+                    np.log(2)
+                    / sim_data.condition_to_doubling_time[sim_data.condition].asNumber(
+                        units.s
+                    )
+                    + sim_data.process.translation.monomer_data["deg_rate"].asNumber(
+                        1 / units.s
+                    )
+                )
+            )
+            monomer_ids = sim_data.process.translation.monomer_data["id"]
+            return (
+                bulk_name_to_idx(monomer_ids, self.bulk_ids()),
+                sim_data.mass.get_component_masses(
+                    sim_data.condition_to_doubling_time[sim_data.condition]
+                )["proteinMass"],
+                sim_data.mass.avg_cell_to_initial_cell_conversion_factor,
+                sim_data.process.translation.monomer_data["mw"].asNumber(
+                    units.g / units.mol
+                ),
+                monomer_expression,
+                sim_data.constants.n_avogadro.asNumber(1 / units.mol),
+            )
+
+        return self.get(
+            ("protein_monomers", ppgpp_regulation, trna_attenuation), compute
+        )
+
+    def rna_inputs(self, ppgpp_regulation, trna_attenuation):
+        """
+        Returns:
+            Same as :py:meth:`~.protein_monomer_inputs` but for RNAs
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription = sim_data.process.transcription
+            if ppgpp_regulation:
+                rna_expression = sim_data.calculate_ppgpp_expression(sim_data.condition)
+            else:
+                rna_expression = normalize(
+                    transcription.rna_expression[sim_data.condition]
+                )
+
+            if trna_attenuation:
+                # See protein_monomer_inputs
+                readthrough = transcription.attenuation_readthrough[sim_data.condition]
+                basal_adjustment = transcription.attenuation_readthrough["basal"]
+                rna_expression[transcription.attenuated_rna_indices] *= (
+                    readthrough / basal_adjustment
+                )
+                rna_expression /= rna_expression.sum()
+
+            return (
+                bulk_name_to_idx(transcription.rna_data["id"], self.bulk_ids()),
+                sim_data.mass.get_component_masses(
+                    sim_data.condition_to_doubling_time[sim_data.condition]
+                )["rnaMass"],
+                sim_data.mass.avg_cell_to_initial_cell_conversion_factor,
+                transcription.rna_data["mw"].asNumber(units.g / units.mol),
+                rna_expression,
+                sim_data.constants.n_avogadro.asNumber(1 / units.mol),
+            )
+
+        return self.get(("rna", ppgpp_regulation, trna_attenuation), compute)
+
+    def mature_rna_inputs(self):
+        """
+        Returns:
+            Dictionary of bulk indices of unprocessed and mature RNAs, the
+            RNA maturation stoichiometry matrix, and bulk indices of the main
+            and variant 23S, 16S, and 5S rRNAs
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription = sim_data.process.transcription
+            rna_data = transcription.rna_data
+            bulk_ids = self.bulk_ids()
+            unprocessed_rna_ids = rna_data["id"][rna_data["is_unprocessed"]]
+            inputs = {
+                "unprocessed_rna_idx": bulk_name_to_idx(unprocessed_rna_ids, bulk_ids),
+                "mature_rna_idx": None,
+                "maturation_stoich_matrix": None,
+            }
+            if len(unprocessed_rna_ids) > 0:
+                inputs["mature_rna_idx"] = bulk_name_to_idx(
+                    transcription.mature_rna_data["id"], bulk_ids
+                )
+                inputs["maturation_stoich_matrix"] = (
+                    transcription.rna_maturation_stoich_matrix
+                )
+            for rrna, rrna_ids in (
+                ("23s", sim_data.molecule_groups.s50_23s_rRNA),
+                ("16s", sim_data.molecule_groups.s30_16s_rRNA),
+                ("5s", sim_data.molecule_groups.s50_5s_rRNA),
+            ):
+                inputs[f"main_{rrna}_rRNA_idx"] = bulk_name_to_idx(
+                    rrna_ids[0], bulk_ids
+                )
+                inputs[f"variant_{rrna}_rRNA_idx"] = bulk_name_to_idx(
+                    rrna_ids[1:], bulk_ids
+                )
+            return inputs
+
+        return self.get("mature_rna", compute)
+
+    def small_molecule_inputs(self, media_id, import_molecules):
+        """
+        Returns:
+            Dictionary of IDs, bulk indices, target concentrations
+            (mol/L), and masses of small molecules, as well as the average
+            mass of protein, RNA, and DNA at the start of the cell cycle
+            (before multiplying by ``mass_coeff``)
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            doubling_time = sim_data.condition_to_doubling_time[sim_data.condition]
+            conc_dict = sim_data.process.metabolism.concentration_updates.concentrations_based_on_nutrients(
+                media_id=media_id, imports=import_molecules
+            )
+            conc_dict.update(sim_data.mass.getBiomassAsConcentrations(doubling_time))
+            conc_dict[sim_data.molecule_ids.ppGpp] = (
+                sim_data.growth_rate_parameters.get_ppGpp_conc(doubling_time)
+            )
+            molecule_ids = sorted(conc_dict)
+            avg_cell_fraction_mass = sim_data.mass.get_component_masses(doubling_time)
+            masses = sim_data.getter.get_masses(molecule_ids)
+            return {
+                "molecule_ids": molecule_ids,
+                "molecule_idx": bulk_name_to_idx(molecule_ids, self.bulk_ids()),
+                "molecule_concentrations": (units.mol / units.L)
+                * np.array(
+                    [
+                        conc_dict[key].asNumber(units.mol / units.L)
+                        for key in molecule_ids
+                    ]
+                ),
+                "molecule_masses": masses,
+                "molecule_masses_fg": masses.asNumber(units.fg / units.mol)
+                / sim_data.constants.n_avogadro.asNumber(1 / units.mol),
+                "other_dry_mass": avg_cell_fraction_mass["proteinMass"]
+                + avg_cell_fraction_mass["rnaMass"]
+                + avg_cell_fraction_mass["dnaMass"],
+            }
+
+        return self.get(
+            ("small_molecules", media_id, frozenset(import_molecules)), compute
+        )
+
+    def complexation_inputs(self):
+        """
+        Returns:
+            Tuple of bulk indices of complexation molecules, Fortran-ordered
+            stoichiometry matrix, and prebuilt matrices for
+            :py:func:`~wholecell.utils.mc_complexation.mccFormComplexesWithPrebuiltMatrices`
+        """
+
+        def compute():
+            complexation = self.sim_data.process.complexation
+            return (
+                bulk_name_to_idx(complexation.molecule_names, self.bulk_ids()),
+                complexation.stoich_matrix().astype(np.int64, order="F"),
+                complexation.prebuilt_matrices,
+            )
+
+        return self.get("complexation", compute)
+
+    def replication_inputs(self):
+        """
+        Returns:
+            Dictionary of growth and replication constants, bulk indices and
+            total mass of replisome subunits, and coordinates of genes,
+            promoters, and DnaA boxes
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            replication = sim_data.process.replication
+            tau = sim_data.condition_to_doubling_time[sim_data.condition].asUnit(
+                units.min
+            )
+
+            def subunit_masses(subunits):
+                return np.vstack(
+                    [
+                        sim_data.getter.get_submass_array(x).asNumber(
+                            units.fg / units.count
+                        )
+                        for x in subunits
+                    ]
+                )
+
+            replisome_mass_array = 3 * subunit_masses(
+                sim_data.molecule_groups.replisome_trimer_subunits
+            ).sum(axis=0) + subunit_masses(
+                sim_data.molecule_groups.replisome_monomer_subunits
+            ).sum(axis=0)
+            return {
+                "tau": tau,
+                "critical_mass": sim_data.mass.get_dna_critical_mass(tau),
+                "replication_rate": replication.basal_elongation_rate,
+                "replichore_length": np.ceil(0.5 * replication.genome_length)
+                * units.nt,
+                "replisome_trimer_idx": bulk_name_to_idx(
+                    sim_data.molecule_groups.replisome_trimer_subunits,
+                    self.bulk_ids(),
+                ),
+                "replisome_monomer_idx": bulk_name_to_idx(
+                    sim_data.molecule_groups.replisome_monomer_subunits,
+                    self.bulk_ids(),
+                ),
+                "replisome_protein_mass": replisome_mass_array.sum(),
+                "gene_coordinates": sim_data.process.transcription.cistron_data[
+                    "replication_coordinate"
+                ],
+                "promoter_coordinates": sim_data.process.transcription.rna_data[
+                    "replication_coordinate"
+                ],
+                "DnaA_box_coordinates": replication.motif_coordinates["DnaA_box"],
+            }
+
+        return self.get("replication", compute)
+
+    def chromosome_layout(self, oric_state, replisome_state, domain_state, compute):
+        """
+        Attributes of unique molecules that only depend on the initial
+        positions of replication forks (DNA mass added by replisomes and
+        motif attributes), computed by ``compute()`` once per layout.
+        """
+        key = (
+            "chromosome_layout",
+            oric_state["domain_index"].tobytes(),
+            replisome_state["coordinates"].tobytes(),
+            replisome_state["domain_index"].tobytes(),
+            domain_state["child_domains"].tobytes(),
+        )
+        return self.get(key, compute)
+
+    def tf_inputs(self):
+        """
+        Returns:
+            Dictionary of TF IDs and types, the TUs each TF regulates, bulk
+            indices of active and inactive forms of each TF, and masses of
+            active TFs
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription_regulation = sim_data.process.transcription_regulation
+            tf_ids = transcription_regulation.tf_ids
+            tf_to_tf_type = transcription_regulation.tf_to_tf_type
+            delta_prob = transcription_regulation.delta_prob
+            bulk_ids = self.bulk_ids()
+
+            # Build dict that maps TFs to transcription units they regulate
+            TF_to_TU_idx = {}
+            for i, tf in enumerate(tf_ids):
+                TF_to_TU_idx[tf] = delta_prob["deltaI"][delta_prob["deltaJ"] == i]
+
+            active_tf_idx = {}
+            inactive_tf_idx = {}
+            for tf in tf_ids:
+                active_tf_idx[tf] = bulk_name_to_idx(tf + "[c]", bulk_ids)
+                if tf_to_tf_type[tf] == "1CS":
+                    if tf == transcription_regulation.active_to_bound[tf]:
+                        inactive_tf_idx[tf] = bulk_name_to_idx(
+                            sim_data.process.equilibrium.get_unbound(tf + "[c]"),
+                            bulk_ids,
+                        )
+                    else:
+                        inactive_tf_idx[tf] = bulk_name_to_idx(
+                            transcription_regulation.active_to_bound[tf] + "[c]",
+                            bulk_ids,
+                        )
+                elif tf_to_tf_type[tf] == "2CS":
+                    inactive_tf_idx[tf] = bulk_name_to_idx(
+                        sim_data.process.two_component_system.active_to_inactive_tf[
+                            tf + "[c]"
+                        ],
+                        bulk_ids,
+                    )
+
+            # Get masses of active transcription factors
+            tf_indexes = [np.where(bulk_ids == tf_id + "[c]")[0][0] for tf_id in tf_ids]
+            active_tf_masses = (
+                sim_data.internal_state.bulk_molecules.bulk_data["mass"][tf_indexes]
+                / sim_data.constants.n_avogadro
+            ).asNumber(units.fg)
+            return {
+                "tf_ids": tf_ids,
+                "tf_to_tf_type": tf_to_tf_type,
+                "TF_to_TU_idx": TF_to_TU_idx,
+                "active_tf_idx": active_tf_idx,
+                "inactive_tf_idx": inactive_tf_idx,
+                "active_tf_masses": active_tf_masses,
+            }
+
+        return self.get("tf", compute)
+
+    def transcription_inputs(self, ppgpp_regulation, trna_attenuation):
+        """
+        Returns:
+            Dictionary of TU attributes (indexed by TU), basal and
+            regulated synthesis probabilities, and the environment-dependent
+            synthesis probabilities and fractions of each RNA category
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription = sim_data.process.transcription
+            rna_data = transcription.rna_data
+            current_media_id = sim_data.conditions[sim_data.condition]["nutrients"]
+
+            if ppgpp_regulation:
+                doubling_time = sim_data.condition_to_doubling_time[sim_data.condition]
+                ppgpp_conc = sim_data.growth_rate_parameters.get_ppGpp_conc(
+                    doubling_time
+                )
+                basal_prob, _ = transcription.synth_prob_from_ppgpp(
+                    ppgpp_conc, sim_data.process.replication.get_average_copy_number
+                )
+                ppgpp_scale = basal_prob.copy()
+                # Use original delta prob if no ppGpp basal prob
+                ppgpp_scale[ppgpp_scale == 0] = 1
+            else:
+                basal_prob = sim_data.process.transcription_regulation.basal_prob.copy()
+                ppgpp_scale = None
+
+            if trna_attenuation:
+                basal_prob[transcription.attenuated_rna_indices] += (
+                    transcription.attenuation_basal_prob_adjustments
+                )
+            n_TUs = len(basal_prob)
+
+            # Determine changes from genetic perturbations
+            genetic_perturbations = {}
+            perturbations = getattr(sim_data, "genetic_perturbations", {})
+            if len(perturbations) > 0:
+                probability_indexes = [
+                    (index, sim_data.genetic_perturbations[rna["id"]])
+                    for index, rna in enumerate(rna_data)
+                    if rna["id"] in sim_data.genetic_perturbations
+                ]
+                genetic_perturbations = {
+                    "fixedRnaIdxs": [pair[0] for pair in probability_indexes],
+                    "fixedSynthProbs": [pair[1] for pair in probability_indexes],
+                }
+
+            # Probability that transcription of each TU is not stopped by
+            # attenuation after initiation
+            readthrough_adjustment = None
+            if trna_attenuation:
+                readthrough_adjustment = np.ones(n_TUs)
+                for idx, prob in zip(
+                    transcription.attenuated_rna_indices,
+                    transcription.attenuation_readthrough[sim_data.condition],
+                ):
+                    readthrough_adjustment[idx] = prob
+
+            idx_rprotein = np.where(rna_data["includes_ribosomal_protein"])[0]
+            idx_rnap = np.where(rna_data["includes_RNAP"])[0]
+            return {
+                "rna_lengths": rna_data["length"].asNumber(),
+                "rna_masses": (rna_data["mw"] / sim_data.constants.n_avogadro).asNumber(
+                    units.fg
+                ),
+                "frac_active_rnap": transcription.rnapFractionActiveDict[
+                    current_media_id
+                ],
+                "inactive_rnap_idx": bulk_name_to_idx(
+                    sim_data.molecule_ids.full_RNAP, self.bulk_ids()
+                ),
+                "basal_prob": basal_prob,
+                "ppgpp_scale": ppgpp_scale,
+                "delta_prob_matrix": sim_data.process.transcription_regulation.get_delta_prob_matrix(
+                    dense=True, ppgpp=ppgpp_regulation
+                ),
+                "genetic_perturbations": genetic_perturbations,
+                "readthrough_adjustment": readthrough_adjustment,
+                "synth_prob_fractions": transcription.rnaSynthProbFraction[
+                    current_media_id
+                ],
+                "fixed_synth_probs": np.concatenate(
+                    (
+                        transcription.rnaSynthProbRProtein[current_media_id],
+                        transcription.rnaSynthProbRnaPolymerase[current_media_id],
+                    )
+                ),
+                "fixed_TU_indexes": np.concatenate((idx_rprotein, idx_rnap)),
+                "is_rRNA": rna_data["is_rRNA"].astype(bool),
+                "is_mRNA": rna_data["is_mRNA"].astype(bool),
+                "is_tRNA": rna_data["is_tRNA"].astype(bool),
+                "is_fixed": (
+                    rna_data["is_tRNA"]
+                    | rna_data["is_rRNA"]
+                    | rna_data["includes_ribosomal_protein"]
+                    | rna_data["includes_RNAP"]
+                ).astype(bool),
+                "idx_mRNA": np.where(rna_data["is_mRNA"])[0],
+                "mRNA_idx": bulk_name_to_idx(
+                    rna_data["id"][rna_data["is_mRNA"]], self.bulk_ids()
+                ),
+                "replication_coordinate": rna_data["replication_coordinate"],
+                "is_forward": rna_data["is_forward"],
+            }
+
+        return self.get(("transcription", ppgpp_regulation, trna_attenuation), compute)
+
+    def translation_inputs(self):
+        """
+        Returns:
+            Dictionary of monomer and cistron attributes, the cistron that
+            encodes each monomer, the start positions of each cistron in each
+            TU, and bulk indices of full 30S and 50S ribosomal subunits
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            translation = sim_data.process.translation
+            transcription = sim_data.process.transcription
+            current_nutrients = sim_data.conditions[sim_data.condition]["nutrients"]
+            TU_ids = transcription.rna_data["id"]
+
+            # Cistron indexes and start positions of cistrons for each TU
+            cistron_tu_mapping = transcription.cistron_tu_mapping_matrix.tocsc()
+            cistron_tu_mapping.eliminate_zeros()
+            cistron_tu_mapping.sort_indices()
+            TU_cistron_starts = []
+            for TU_index in range(len(TU_ids)):
+                cistron_indexes = cistron_tu_mapping.indices[
+                    cistron_tu_mapping.indptr[TU_index] : cistron_tu_mapping.indptr[
+                        TU_index + 1
+                    ]
+                ]
+                TU_cistron_starts.append(
+                    (
+                        cistron_indexes,
+                        np.array(
+                            [
+                                transcription.cistron_start_end_pos_in_tu[
+                                    (cistron_index, TU_index)
+                                ][0]
+                                for cistron_index in cistron_indexes
+                            ]
+                        ),
+                    )
+                )
+
+            return {
+                "frac_active_ribosome": translation.ribosomeFractionActiveDict[
+                    current_nutrients
+                ],
+                "protein_lengths": translation.monomer_data["length"].asNumber(),
+                "translation_efficiencies": normalize(
+                    translation.translation_efficiencies_by_monomer
+                ),
+                "cistron_lengths": transcription.cistron_data["length"].asNumber(
+                    units.nt
+                ),
+                "monomer_index_to_cistron_index": np.array(
+                    [
+                        transcription._cistron_id_to_index[monomer["cistron_id"]]
+                        for monomer in translation.monomer_data
+                    ]
+                ),
+                "TU_cistron_starts": TU_cistron_starts,
+                "ribosome30S_idx": bulk_name_to_idx(
+                    sim_data.molecule_ids.s30_full_complex, self.bulk_ids()
+                ),
+                "ribosome50S_idx": bulk_name_to_idx(
+                    sim_data.molecule_ids.s50_full_complex, self.bulk_ids()
+                ),
+            }
+
+        return self.get("translation", compute)
+
+    def trna_charging_inputs(self):
+        """
+        Returns:
+            Dictionary of bulk indices of synthetases, tRNAs, and amino acids
+            and the fraction of each amino acid in all protein sequences
+        """
+
+        def compute():
+            sim_data = self.sim_data
+            transcription = sim_data.process.transcription
+            bulk_ids = self.bulk_ids()
+            # Estimate fraction of amino acids from sequences, excluding
+            # first index for padding of -1
+            _, aas_in_sequences = np.unique(
+                sim_data.process.translation.translation_sequences,
+                return_counts=True,
+            )
+            return {
+                "synthetase_idx": bulk_name_to_idx(
+                    transcription.synthetase_names, bulk_ids
+                ),
+                "uncharged_trna_idx": bulk_name_to_idx(
+                    transcription.uncharged_trna_names, bulk_ids
+                ),
+                "charged_trna_idx": bulk_name_to_idx(
+                    transcription.charged_trna_names, bulk_ids
+                ),
+                "aa_idx": bulk_name_to_idx(
+                    sim_data.molecule_groups.amino_acids, bulk_ids
+                ),
+                "aa_fractions": aas_in_sequences[1:] / np.sum(aas_in_sequences[1:]),
+            }
+
+        return self.get("trna_charging", compute)
 
 
 def create_bulk_container(
@@ -59,6 +739,7 @@ def create_bulk_container(
         ) | set(exchange_data["importConstrainedExchangeMolecules"])
 
         random_state = np.random.RandomState(seed=seed)
+        cache = InitialStateCache(sim_data)
 
         # Construct bulk container
         ids_molecules = sim_data.internal_state.bulk_molecules.bulk_data["id"]
@@ -78,6 +759,7 @@ def create_bulk_container(
                 ppgpp_regulation,
                 trna_attenuation,
                 form_complexes=form_complexes,
+                cache=cache,
             )["count"]
     except Exception:
         raise RuntimeError(
@@ -100,11 +782,14 @@ def initialize_bulk_counts(
     ppgpp_regulation,
     trna_attenuation,
     form_complexes=True,
+    cache: Optional[InitialStateCache] = None,
 ):
-    # Allocate count array to populate
-    bulk_counts = np.zeros(
-        len(sim_data.internal_state.bulk_molecules.bulk_data["id"]), dtype=int
-    )
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+
+    # Allocate bulk array to populate (bulk_counts is a view of its counts)
+    bulk_array = cache.bulk_template().copy()
+    bulk_counts = bulk_array["count"]
 
     # Set protein counts from expression
     initialize_protein_monomers(
@@ -114,6 +799,7 @@ def initialize_bulk_counts(
         mass_coeff,
         ppgpp_regulation,
         trna_attenuation,
+        cache=cache,
     )
 
     # Set RNA counts from expression
@@ -124,33 +810,20 @@ def initialize_bulk_counts(
         mass_coeff,
         ppgpp_regulation,
         trna_attenuation,
+        cache=cache,
     )
 
     # Set mature RNA counts
-    initialize_mature_RNA(bulk_counts, sim_data)
+    initialize_mature_RNA(bulk_counts, sim_data, cache=cache)
 
     # Set other biomass components
     set_small_molecule_counts(
-        bulk_counts, sim_data, media_id, import_molecules, mass_coeff
+        bulk_counts, sim_data, media_id, import_molecules, mass_coeff, cache=cache
     )
 
     # Form complexes
     if form_complexes:
-        initialize_complexation(bulk_counts, sim_data, random_state)
-
-    bulk_masses = sim_data.internal_state.bulk_molecules.bulk_data["mass"].asNumber(
-        units.fg / units.mol
-    ) / sim_data.constants.n_avogadro.asNumber(1 / units.mol)
-    bulk_submasses = []
-    bulk_submass_dtypes = []
-    for submass, idx in sim_data.submass_name_to_index.items():
-        bulk_submasses.append(bulk_masses[:, idx])
-        bulk_submass_dtypes.append((f"{submass}_submass", np.float64))
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data.struct_array["id"]
-    bulk_array = np.array(
-        [mol_data for mol_data in zip(bulk_ids, bulk_counts, *bulk_submasses)],
-        dtype=[("id", bulk_ids.dtype), ("count", int)] + bulk_submass_dtypes,
-    )
+        initialize_complexation(bulk_counts, sim_data, random_state, cache=cache)
 
     return bulk_array
 
@@ -165,7 +838,10 @@ def initialize_unique_molecules(
     ppgpp_regulation,
     trna_attenuation,
     mechanistic_replisome,
+    cache: Optional[InitialStateCache] = None,
 ):
+    if cache is None:
+        cache = InitialStateCache(sim_data)
     unique_molecules = {}
 
     # Initialize counts of full chromosomes
@@ -179,11 +855,12 @@ def initialize_unique_molecules(
         cell_mass,
         mechanistic_replisome,
         unique_id_rng,
+        cache=cache,
     )
 
     # Initialize bound transcription factors
     initialize_transcription_factors(
-        bulk_state, unique_molecules, sim_data, random_state
+        bulk_state, unique_molecules, sim_data, random_state, cache=cache
     )
 
     # Initialize active RNAPs and unique molecule representations of RNAs
@@ -195,6 +872,7 @@ def initialize_unique_molecules(
         unique_id_rng,
         ppgpp_regulation,
         trna_attenuation,
+        cache=cache,
     )
 
     # Initialize linking numbers of chromosomal segments
@@ -207,7 +885,7 @@ def initialize_unique_molecules(
 
     # Initialize active ribosomes
     initialize_translation(
-        bulk_state, unique_molecules, sim_data, random_state, unique_id_rng
+        bulk_state, unique_molecules, sim_data, random_state, unique_id_rng, cache=cache
     )
 
     return unique_molecules
@@ -242,65 +920,47 @@ def create_new_unique_molecules(name, n_mols, sim_data, random_state, **attrs):
 
 
 def initialize_protein_monomers(
-    bulk_counts, sim_data, random_state, mass_coeff, ppgpp_regulation, trna_attenuation
+    bulk_counts,
+    sim_data,
+    random_state,
+    mass_coeff,
+    ppgpp_regulation,
+    trna_attenuation,
+    cache: Optional[InitialStateCache] = None,
 ):
-    monomer_mass = (
-        mass_coeff
-        * sim_data.mass.get_component_masses(
-            sim_data.condition_to_doubling_time[sim_data.condition]
-        )["proteinMass"]
-        / sim_data.mass.avg_cell_to_initial_cell_conversion_factor
-    )
     # TODO: unify this logic with the parca so it doesn]t fall out of step
     # again (look at teh calProteinCounts function)
-
-    transcription = sim_data.process.transcription
-    if ppgpp_regulation:
-        rna_expression = sim_data.calculate_ppgpp_expression(sim_data.condition)
-    else:
-        rna_expression = transcription.rna_expression[sim_data.condition]
-
-    if trna_attenuation:
-        # Need to adjust expression (calculated without attenuation) by basal_adjustment
-        # to get the expected expression without any attenuation and then multiply
-        # by the condition readthrough probability to get the condition specific expression
-        readthrough = transcription.attenuation_readthrough[sim_data.condition]
-        basal_adjustment = transcription.attenuation_readthrough["basal"]
-        rna_expression[transcription.attenuated_rna_indices] *= (
-            readthrough / basal_adjustment
-        )
-
-    monomer_expression = normalize(
-        sim_data.process.transcription.cistron_tu_mapping_matrix.dot(rna_expression)[
-            sim_data.relation.cistron_to_monomer_mapping
-        ]
-        * sim_data.process.translation.translation_efficiencies_by_monomer
-        / (
-            np.log(2)
-            / sim_data.condition_to_doubling_time[sim_data.condition].asNumber(units.s)
-            + sim_data.process.translation.monomer_data["deg_rate"].asNumber(
-                1 / units.s
-            )
-        )
-    )
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    (
+        monomer_idx,
+        avg_protein_mass,
+        initial_mass_factor,
+        monomer_mws,
+        monomer_expression,
+        n_avogadro,
+    ) = cache.protein_monomer_inputs(ppgpp_regulation, trna_attenuation)
+    monomer_mass = mass_coeff * avg_protein_mass / initial_mass_factor
 
     n_monomers = countsFromMassAndExpression(
         monomer_mass.asNumber(units.g),
-        sim_data.process.translation.monomer_data["mw"].asNumber(units.g / units.mol),
+        monomer_mws,
         monomer_expression,
-        sim_data.constants.n_avogadro.asNumber(1 / units.mol),
+        n_avogadro,
     )
 
-    # Get indices for monomers in bulk counts array
-    monomer_ids = sim_data.process.translation.monomer_data["id"]
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data["id"]
-    monomer_idx = bulk_name_to_idx(monomer_ids, bulk_ids)
     # Calculate initial counts of each monomer from mutinomial distribution
     bulk_counts[monomer_idx] = random_state.multinomial(n_monomers, monomer_expression)
 
 
 def initialize_rna(
-    bulk_counts, sim_data, random_state, mass_coeff, ppgpp_regulation, trna_attenuation
+    bulk_counts,
+    sim_data,
+    random_state,
+    mass_coeff,
+    ppgpp_regulation,
+    trna_attenuation,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Initializes counts of RNAs in the bulk molecule container using RNA
@@ -308,65 +968,46 @@ def initialize_rna(
     to zero when the representations for mRNAs are moved to the unique molecule
     container.
     """
-
-    transcription = sim_data.process.transcription
-
-    rna_mass = (
-        mass_coeff
-        * sim_data.mass.get_component_masses(
-            sim_data.condition_to_doubling_time[sim_data.condition]
-        )["rnaMass"]
-        / sim_data.mass.avg_cell_to_initial_cell_conversion_factor
-    )
-
-    if ppgpp_regulation:
-        rna_expression = sim_data.calculate_ppgpp_expression(sim_data.condition)
-    else:
-        rna_expression = normalize(transcription.rna_expression[sim_data.condition])
-
-    if trna_attenuation:
-        # Need to adjust expression (calculated without attenuation) by basal_adjustment
-        # to get the expected expression without any attenuation and then multiply
-        # by the condition readthrough probability to get the condition specific expression
-        readthrough = transcription.attenuation_readthrough[sim_data.condition]
-        basal_adjustment = transcription.attenuation_readthrough["basal"]
-        rna_expression[transcription.attenuated_rna_indices] *= (
-            readthrough / basal_adjustment
-        )
-        rna_expression /= rna_expression.sum()
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    (
+        rna_idx,
+        avg_rna_mass,
+        initial_mass_factor,
+        rna_mws,
+        rna_expression,
+        n_avogadro,
+    ) = cache.rna_inputs(ppgpp_regulation, trna_attenuation)
+    rna_mass = mass_coeff * avg_rna_mass / initial_mass_factor
 
     n_rnas = countsFromMassAndExpression(
         rna_mass.asNumber(units.g),
-        transcription.rna_data["mw"].asNumber(units.g / units.mol),
+        rna_mws,
         rna_expression,
-        sim_data.constants.n_avogadro.asNumber(1 / units.mol),
+        n_avogadro,
     )
 
-    # Get indices for monomers in bulk counts array
-    rna_ids = transcription.rna_data["id"]
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data["id"]
-    rna_idx = bulk_name_to_idx(rna_ids, bulk_ids)
     # Calculate initial counts of each RNA from mutinomial distribution
     bulk_counts[rna_idx] = random_state.multinomial(n_rnas, rna_expression)
 
 
-def initialize_mature_RNA(bulk_counts, sim_data):
+def initialize_mature_RNA(
+    bulk_counts, sim_data, cache: Optional[InitialStateCache] = None
+):
     """
     Initializes counts of mature RNAs in the bulk molecule container using the
     counts of unprocessed RNAs. Also consolidates the different variants of each
     rRNA molecule into the main type.
     """
-    transcription = sim_data.process.transcription
-    rna_data = transcription.rna_data
-    unprocessed_rna_ids = rna_data["id"][rna_data["is_unprocessed"]]
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data["id"]
-    unprocessed_rna_idx = bulk_name_to_idx(unprocessed_rna_ids, bulk_ids)
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.mature_rna_inputs()
+    unprocessed_rna_idx = inputs["unprocessed_rna_idx"]
 
     # Skip if there are no unprocessed RNAs represented
-    if len(unprocessed_rna_ids) > 0:
-        mature_rna_ids = transcription.mature_rna_data["id"]
-        maturation_stoich_matrix = transcription.rna_maturation_stoich_matrix
-        mature_rna_idx = bulk_name_to_idx(mature_rna_ids, bulk_ids)
+    if len(unprocessed_rna_idx) > 0:
+        mature_rna_idx = inputs["mature_rna_idx"]
+        maturation_stoich_matrix = inputs["maturation_stoich_matrix"]
 
         # Get counts of unprocessed RNAs
         unprocessed_rna_counts = bulk_counts[unprocessed_rna_idx]
@@ -377,21 +1018,13 @@ def initialize_mature_RNA(bulk_counts, sim_data):
             unprocessed_rna_counts
         )
 
-    # Get IDs of rRNAs
-    main_23s_rRNA_id = sim_data.molecule_groups.s50_23s_rRNA[0]
-    main_16s_rRNA_id = sim_data.molecule_groups.s30_16s_rRNA[0]
-    main_5s_rRNA_id = sim_data.molecule_groups.s50_5s_rRNA[0]
-    variant_23s_rRNA_ids = sim_data.molecule_groups.s50_23s_rRNA[1:]
-    variant_16s_rRNA_ids = sim_data.molecule_groups.s30_16s_rRNA[1:]
-    variant_5s_rRNA_ids = sim_data.molecule_groups.s50_5s_rRNA[1:]
-
     # Get indices of main and variant rRNAs
-    main_23s_rRNA_idx = bulk_name_to_idx(main_23s_rRNA_id, bulk_ids)
-    main_16s_rRNA_idx = bulk_name_to_idx(main_16s_rRNA_id, bulk_ids)
-    main_5s_rRNA_idx = bulk_name_to_idx(main_5s_rRNA_id, bulk_ids)
-    variant_23s_rRNA_idx = bulk_name_to_idx(variant_23s_rRNA_ids, bulk_ids)
-    variant_16s_rRNA_idx = bulk_name_to_idx(variant_16s_rRNA_ids, bulk_ids)
-    variant_5s_rRNA_idx = bulk_name_to_idx(variant_5s_rRNA_ids, bulk_ids)
+    main_23s_rRNA_idx = inputs["main_23s_rRNA_idx"]
+    main_16s_rRNA_idx = inputs["main_16s_rRNA_idx"]
+    main_5s_rRNA_idx = inputs["main_5s_rRNA_idx"]
+    variant_23s_rRNA_idx = inputs["variant_23s_rRNA_idx"]
+    variant_16s_rRNA_idx = inputs["variant_16s_rRNA_idx"]
+    variant_5s_rRNA_idx = inputs["variant_5s_rRNA_idx"]
 
     # Evolve states
     bulk_counts[main_23s_rRNA_idx] += bulk_counts[variant_23s_rRNA_idx].sum()
@@ -405,72 +1038,55 @@ def initialize_mature_RNA(bulk_counts, sim_data):
 # TODO: remove checks for zero concentrations (change to assertion)
 # TODO: move any rescaling logic to KB/fitting
 def set_small_molecule_counts(
-    bulk_counts, sim_data, media_id, import_molecules, mass_coeff, cell_mass=None
+    bulk_counts,
+    sim_data,
+    media_id,
+    import_molecules,
+    mass_coeff,
+    cell_mass=None,
+    cache: Optional[InitialStateCache] = None,
 ):
-    doubling_time = sim_data.condition_to_doubling_time[sim_data.condition]
-
-    conc_dict = sim_data.process.metabolism.concentration_updates.concentrations_based_on_nutrients(
-        media_id=media_id, imports=import_molecules
-    )
-    conc_dict.update(sim_data.mass.getBiomassAsConcentrations(doubling_time))
-    conc_dict[sim_data.molecule_ids.ppGpp] = (
-        sim_data.growth_rate_parameters.get_ppGpp_conc(doubling_time)
-    )
-    molecule_ids = sorted(conc_dict)
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data["id"]
-    molecule_concentrations = (units.mol / units.L) * np.array(
-        [conc_dict[key].asNumber(units.mol / units.L) for key in molecule_ids]
-    )
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.small_molecule_inputs(media_id, import_molecules)
+    molecule_idx = inputs["molecule_idx"]
 
     if cell_mass is None:
-        avg_cell_fraction_mass = sim_data.mass.get_component_masses(doubling_time)
         other_dry_mass = (
             mass_coeff
-            * (
-                avg_cell_fraction_mass["proteinMass"]
-                + avg_cell_fraction_mass["rnaMass"]
-                + avg_cell_fraction_mass["dnaMass"]
-            )
+            * inputs["other_dry_mass"]
             / sim_data.mass.avg_cell_to_initial_cell_conversion_factor
         )
     else:
-        small_molecule_mass = 0 * units.fg
-        for mol in conc_dict:
-            mol_idx = bulk_name_to_idx(mol, bulk_ids)
-            small_molecule_mass += (
-                bulk_counts[mol_idx]
-                * sim_data.getter.get_mass(mol)
-                / sim_data.constants.n_avogadro
-            )
+        small_molecule_mass = units.fg * np.dot(
+            bulk_counts[molecule_idx], inputs["molecule_masses_fg"]
+        )
         other_dry_mass = cell_mass - small_molecule_mass
 
     masses_to_add, counts_to_add = masses_and_counts_for_homeostatic_target(
         other_dry_mass,
-        molecule_concentrations,
-        sim_data.getter.get_masses(molecule_ids),
+        inputs["molecule_concentrations"],
+        inputs["molecule_masses"],
         sim_data.constants.cell_density,
         sim_data.constants.n_avogadro,
     )
 
-    molecule_idx = bulk_name_to_idx(molecule_ids, bulk_ids)
     bulk_counts[molecule_idx] = counts_to_add
 
 
-def initialize_complexation(bulk_counts, sim_data, random_state):
-    molecule_names = sim_data.process.complexation.molecule_names
-    bulk_ids = sim_data.internal_state.bulk_molecules.bulk_data["id"]
-    molecule_idx = bulk_name_to_idx(molecule_names, bulk_ids)
-
-    stoich_matrix = sim_data.process.complexation.stoich_matrix().astype(
-        np.int64, order="F"
-    )
+def initialize_complexation(
+    bulk_counts, sim_data, random_state, cache: Optional[InitialStateCache] = None
+):
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    molecule_idx, stoich_matrix, prebuilt_matrices = cache.complexation_inputs()
 
     molecule_counts = bulk_counts[molecule_idx]
     updated_molecule_counts, complexation_events = mccFormComplexesWithPrebuiltMatrices(
         molecule_counts,
         random_state.randint(1000),
         stoich_matrix,
-        *sim_data.process.complexation.prebuilt_matrices,
+        *prebuilt_matrices,
     )
 
     bulk_counts[molecule_idx] = updated_molecule_counts
@@ -502,32 +1118,32 @@ def initialize_replication(
     cell_mass,
     mechanistic_replisome,
     unique_id_rng,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Initializes replication by creating an appropriate number of replication
     forks given the cell growth rate. This also initializes the gene dosage
     bulk counts using the initial locations of the forks.
     """
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.replication_inputs()
+
     # Determine the number and location of replication forks at the start of
     # the cell cycle
     # Get growth rate constants
-    tau = sim_data.condition_to_doubling_time[sim_data.condition].asUnit(units.min)
-    critical_mass = sim_data.mass.get_dna_critical_mass(tau)
-    replication_rate = sim_data.process.replication.basal_elongation_rate
+    tau = inputs["tau"]
+    critical_mass = inputs["critical_mass"]
+    replication_rate = inputs["replication_rate"]
 
     # Calculate length of replichore
-    genome_length = sim_data.process.replication.genome_length
-    replichore_length = np.ceil(0.5 * genome_length) * units.nt
+    replichore_length = inputs["replichore_length"]
 
     # Calculate the maximum number of replisomes that could be formed with
     # the existing counts of replisome subunits. If mechanistic_replisome option
     # is off, set to an arbitrary high number.
-    replisome_trimer_idx = bulk_name_to_idx(
-        sim_data.molecule_groups.replisome_trimer_subunits, bulk_state["id"]
-    )
-    replisome_monomer_idx = bulk_name_to_idx(
-        sim_data.molecule_groups.replisome_monomer_subunits, bulk_state["id"]
-    )
+    replisome_trimer_idx = inputs["replisome_trimer_idx"]
+    replisome_monomer_idx = inputs["replisome_monomer_idx"]
     if mechanistic_replisome:
         n_max_replisomes = np.min(
             np.concatenate(
@@ -555,94 +1171,6 @@ def initialize_replication(
     n_replisome = replisome_state["domain_index"].size
     n_domain = domain_state["domain_index"].size
 
-    # Add OriC molecules with the proposed attributes
-    unique_molecules["oriC"] = create_new_unique_molecules(
-        "oriC", n_oric, sim_data, unique_id_rng, domain_index=oric_state["domain_index"]
-    )
-
-    # Add chromosome domain molecules with the proposed attributes
-    unique_molecules["chromosome_domain"] = create_new_unique_molecules(
-        "chromosome_domain",
-        n_domain,
-        sim_data,
-        unique_id_rng,
-        domain_index=domain_state["domain_index"],
-        child_domains=domain_state["child_domains"],
-    )
-
-    if n_replisome != 0:
-        # Update mass of replisomes if the mechanistic replisome option is set
-        if mechanistic_replisome:
-            replisome_trimer_subunit_masses = np.vstack(
-                [
-                    sim_data.getter.get_submass_array(x).asNumber(
-                        units.fg / units.count
-                    )
-                    for x in sim_data.molecule_groups.replisome_trimer_subunits
-                ]
-            )
-            replisome_monomer_subunit_masses = np.vstack(
-                [
-                    sim_data.getter.get_submass_array(x).asNumber(
-                        units.fg / units.count
-                    )
-                    for x in sim_data.molecule_groups.replisome_monomer_subunits
-                ]
-            )
-            replisome_mass_array = 3 * replisome_trimer_subunit_masses.sum(
-                axis=0
-            ) + replisome_monomer_subunit_masses.sum(axis=0)
-            replisome_protein_mass = replisome_mass_array.sum()
-        else:
-            replisome_protein_mass = 0.0
-
-        # Update mass to account for DNA strands that have already been
-        # elongated.
-        sequences = sim_data.process.replication.replication_sequences
-        fork_coordinates = replisome_state["coordinates"]
-        sequence_elongations = np.abs(np.repeat(fork_coordinates, 2))
-
-        mass_increase_dna = computeMassIncrease(
-            np.tile(sequences, (n_replisome // 2, 1)),
-            sequence_elongations,
-            sim_data.process.replication.replication_monomer_weights.asNumber(units.fg),
-        )
-
-        # Add active replisomes as unique molecules and set attributes
-        unique_molecules["active_replisome"] = create_new_unique_molecules(
-            "active_replisome",
-            n_replisome,
-            sim_data,
-            unique_id_rng,
-            domain_index=replisome_state["domain_index"],
-            coordinates=replisome_state["coordinates"],
-            right_replichore=replisome_state["right_replichore"],
-            massDiff_DNA=mass_increase_dna[0::2] + mass_increase_dna[1::2],
-            massDiff_protein=replisome_protein_mass,
-        )
-
-        if mechanistic_replisome:
-            # Remove replisome subunits from bulk molecules
-            bulk_state["count"][replisome_trimer_idx] -= 3 * n_replisome
-            bulk_state["count"][replisome_monomer_idx] -= n_replisome
-    else:
-        # For n_replisome = 0, still create an empty structured array with
-        # the expected fields
-        unique_molecules["active_replisome"] = create_new_unique_molecules(
-            "active_replisome", n_replisome, sim_data, unique_id_rng
-        )
-
-    # Get coordinates of all genes, promoters and DnaA boxes
-    all_gene_coordinates = sim_data.process.transcription.cistron_data[
-        "replication_coordinate"
-    ]
-    all_promoter_coordinates = sim_data.process.transcription.rna_data[
-        "replication_coordinate"
-    ]
-    all_DnaA_box_coordinates = sim_data.process.replication.motif_coordinates[
-        "DnaA_box"
-    ]
-
     # Define function that initializes attributes of sequence motifs given the
     # initial state of the chromosome
     def get_motif_attributes(all_motif_coordinates):
@@ -744,17 +1272,90 @@ def initialize_replication(
 
         return motif_index, motif_coordinates, motif_domain_index
 
-    # Use function to get attributes for promoters and DnaA boxes
-    TU_index, promoter_coordinates, promoter_domain_index = get_motif_attributes(
-        all_promoter_coordinates
+    def get_layout():
+        """
+        Calculate the attributes of unique molecules that only depend on the
+        initial positions of the replication forks.
+        """
+        layout = {}
+        if n_replisome != 0:
+            # Update mass to account for DNA strands that have already been
+            # elongated.
+            sequences = sim_data.process.replication.replication_sequences
+            fork_coordinates = replisome_state["coordinates"]
+            sequence_elongations = np.abs(np.repeat(fork_coordinates, 2))
+
+            mass_increase_dna = computeMassIncrease(
+                np.tile(sequences, (n_replisome // 2, 1)),
+                sequence_elongations,
+                sim_data.process.replication.replication_monomer_weights.asNumber(
+                    units.fg
+                ),
+            )
+            layout["massDiff_DNA"] = mass_increase_dna[0::2] + mass_increase_dna[1::2]
+
+        # Use function to get attributes for promoters, genes and DnaA boxes
+        layout["promoter"] = get_motif_attributes(inputs["promoter_coordinates"])
+        layout["gene"] = get_motif_attributes(inputs["gene_coordinates"])
+        layout["DnaA_box"] = get_motif_attributes(inputs["DnaA_box_coordinates"])
+        return layout
+
+    # Add OriC molecules with the proposed attributes
+    unique_molecules["oriC"] = create_new_unique_molecules(
+        "oriC", n_oric, sim_data, unique_id_rng, domain_index=oric_state["domain_index"]
     )
-    cistron_index, gene_coordinates, gene_domain_index = get_motif_attributes(
-        all_gene_coordinates
+
+    # Add chromosome domain molecules with the proposed attributes
+    unique_molecules["chromosome_domain"] = create_new_unique_molecules(
+        "chromosome_domain",
+        n_domain,
+        sim_data,
+        unique_id_rng,
+        domain_index=domain_state["domain_index"],
+        child_domains=domain_state["child_domains"],
     )
-    _, DnaA_box_coordinates, DnaA_box_domain_index = get_motif_attributes(
-        all_DnaA_box_coordinates
+
+    # Only calculated once for each initial position of the replication forks
+    layout = cache.chromosome_layout(
+        oric_state, replisome_state, domain_state, get_layout
     )
 
+    if n_replisome != 0:
+        # Update mass of replisomes if the mechanistic replisome option is set
+        if mechanistic_replisome:
+            replisome_protein_mass = inputs["replisome_protein_mass"]
+        else:
+            replisome_protein_mass = 0.0
+
+        # Add active replisomes as unique molecules and set attributes
+        unique_molecules["active_replisome"] = create_new_unique_molecules(
+            "active_replisome",
+            n_replisome,
+            sim_data,
+            unique_id_rng,
+            domain_index=replisome_state["domain_index"],
+            coordinates=replisome_state["coordinates"],
+            right_replichore=replisome_state["right_replichore"],
+            massDiff_DNA=layout["massDiff_DNA"],
+            massDiff_protein=replisome_protein_mass,
+        )
+
+        if mechanistic_replisome:
+            # Remove replisome subunits from bulk molecules
+            bulk_state["count"][replisome_trimer_idx] -= 3 * n_replisome
+            bulk_state["count"][replisome_monomer_idx] -= n_replisome
+    else:
+        # For n_replisome = 0, still create an empty structured array with
+        # the expected fields
+        unique_molecules["active_replisome"] = create_new_unique_molecules(
+            "active_replisome", n_replisome, sim_data, unique_id_rng
+        )
+
+    # Get attributes of promoters, genes and DnaA boxes on this chromosome
+    TU_index, promoter_coordinates, promoter_domain_index = layout["promoter"]
+    cistron_index, gene_coordinates, gene_domain_index = layout["gene"]
+    _, DnaA_box_coordinates, DnaA_box_domain_index = layout["DnaA_box"]
+
     # Add promoters as unique molecules and set attributes
     # Note: the bound_TF attribute is properly initialized in the function
     # initialize_transcription_factors
@@ -800,7 +1401,11 @@ def initialize_replication(
 
 
 def initialize_transcription_factors(
-    bulk_state, unique_molecules, sim_data, random_state
+    bulk_state,
+    unique_molecules,
+    sim_data,
+    random_state,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Initialize transcription factors that are bound to the chromosome. For each
@@ -811,57 +1416,25 @@ def initialize_transcription_factors(
     are then distributed randomly to promoters, whose bound_TF attributes and
     submasses are updated correspondingly.
     """
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.tf_inputs()
+
     # Get transcription factor properties from sim_data
-    tf_ids = sim_data.process.transcription_regulation.tf_ids
-    tf_to_tf_type = sim_data.process.transcription_regulation.tf_to_tf_type
+    tf_ids = inputs["tf_ids"]
+    tf_to_tf_type = inputs["tf_to_tf_type"]
     p_promoter_bound_TF = sim_data.process.transcription_regulation.p_promoter_bound_tf
-
-    # Build dict that maps TFs to transcription units they regulate
-    delta_prob = sim_data.process.transcription_regulation.delta_prob
-    TF_to_TU_idx = {}
-
-    for i, tf in enumerate(tf_ids):
-        TF_to_TU_idx[tf] = delta_prob["deltaI"][delta_prob["deltaJ"] == i]
+    TF_to_TU_idx = inputs["TF_to_TU_idx"]
+    active_tf_view_idx = inputs["active_tf_idx"]
+    active_tf_masses = inputs["active_tf_masses"]
 
     # Get views into bulk molecule representations of transcription factors
     active_tf_view = {}
     inactive_tf_view = {}
-    active_tf_view_idx = {}
-    inactive_tf_view_idx = {}
-
     for tf in tf_ids:
-        tf_idx = bulk_name_to_idx(tf + "[c]", bulk_state["id"])
-        active_tf_view[tf] = bulk_state["count"][tf_idx]
-        active_tf_view_idx[tf] = tf_idx
-
-        if tf_to_tf_type[tf] == "1CS":
-            if tf == sim_data.process.transcription_regulation.active_to_bound[tf]:
-                inactive_tf_idx = bulk_name_to_idx(
-                    sim_data.process.equilibrium.get_unbound(tf + "[c]"),
-                    bulk_state["id"],
-                )
-                inactive_tf_view[tf] = bulk_state["count"][inactive_tf_idx]
-            else:
-                inactive_tf_idx = bulk_name_to_idx(
-                    sim_data.process.transcription_regulation.active_to_bound[tf]
-                    + "[c]",
-                    bulk_state["id"],
-                )
-                inactive_tf_view[tf] = bulk_state["count"][inactive_tf_idx]
-        elif tf_to_tf_type[tf] == "2CS":
-            inactive_tf_idx = bulk_name_to_idx(
-                sim_data.process.two_component_system.active_to_inactive_tf[tf + "[c]"],
-                bulk_state["id"],
-            )
-            inactive_tf_view[tf] = bulk_state["count"][inactive_tf_idx]
-        inactive_tf_view_idx[tf] = inactive_tf_idx
-
-    # Get masses of active transcription factors
-    tf_indexes = [np.where(bulk_state["id"] == tf_id + "[c]")[0][0] for tf_id in tf_ids]
-    active_tf_masses = (
-        sim_data.internal_state.bulk_molecules.bulk_data["mass"][tf_indexes]
-        / sim_data.constants.n_avogadro
-    ).asNumber(units.fg)
+        active_tf_view[tf] = bulk_state["count"][active_tf_view_idx[tf]]
+        if tf in inputs["inactive_tf_idx"]:
+            inactive_tf_view[tf] = bulk_state["count"][inputs["inactive_tf_idx"][tf]]
 
     # Get TU indices of promoters
     TU_index = unique_molecules["promoter"]["TU_index"]
@@ -935,6 +1508,7 @@ def initialize_transcription(
     unique_id_rng,
     ppgpp_regulation,
     trna_attenuation,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Activate RNA polymerases as unique molecules, and distribute them along
@@ -949,18 +1523,15 @@ def initialize_transcription(
     unit, with the synthesis probabilities for each TU determining the number of
     RNA polymerases placed at each gene.
     """
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.transcription_inputs(ppgpp_regulation, trna_attenuation)
+
     # Load parameters
-    rna_lengths = sim_data.process.transcription.rna_data["length"].asNumber()
-    rna_masses = (
-        sim_data.process.transcription.rna_data["mw"] / sim_data.constants.n_avogadro
-    ).asNumber(units.fg)
-    current_media_id = sim_data.conditions[sim_data.condition]["nutrients"]
-    frac_active_rnap = sim_data.process.transcription.rnapFractionActiveDict[
-        current_media_id
-    ]
-    inactive_rnap_idx = bulk_name_to_idx(
-        sim_data.molecule_ids.full_RNAP, bulk_state["id"]
-    )
+    rna_lengths = inputs["rna_lengths"]
+    rna_masses = inputs["rna_masses"]
+    frac_active_rnap = inputs["frac_active_rnap"]
+    inactive_rnap_idx = inputs["inactive_rnap_idx"]
     inactive_RNAP_counts = bulk_state["count"][inactive_rnap_idx]
     rna_sequences = sim_data.process.transcription.transcription_sequences
     nt_weights = sim_data.process.transcription.transcription_monomer_weights
@@ -977,65 +1548,23 @@ def initialize_transcription(
     )
 
     # Parameters for rnaSynthProb
+    basal_prob = inputs["basal_prob"]
     if ppgpp_regulation:
-        doubling_time = sim_data.condition_to_doubling_time[sim_data.condition]
-        ppgpp_conc = sim_data.growth_rate_parameters.get_ppGpp_conc(doubling_time)
-        basal_prob, _ = sim_data.process.transcription.synth_prob_from_ppgpp(
-            ppgpp_conc, sim_data.process.replication.get_average_copy_number
-        )
-        ppgpp_scale = basal_prob[TU_index]
-        # Use original delta prob if no ppGpp basal prob
-        ppgpp_scale[ppgpp_scale == 0] = 1
+        ppgpp_scale = inputs["ppgpp_scale"][TU_index]
     else:
-        basal_prob = sim_data.process.transcription_regulation.basal_prob.copy()
         ppgpp_scale = 1
-
-    if trna_attenuation:
-        basal_prob[sim_data.process.transcription.attenuated_rna_indices] += (
-            sim_data.process.transcription.attenuation_basal_prob_adjustments
-        )
     n_TUs = len(basal_prob)
-    delta_prob_matrix = sim_data.process.transcription_regulation.get_delta_prob_matrix(
-        dense=True, ppgpp=ppgpp_regulation
-    )
-
-    # Synthesis probabilities for different categories of genes
-    rna_synth_prob_fractions = sim_data.process.transcription.rnaSynthProbFraction
-    rna_synth_prob_R_protein = sim_data.process.transcription.rnaSynthProbRProtein
-    rna_synth_prob_rna_polymerase = (
-        sim_data.process.transcription.rnaSynthProbRnaPolymerase
-    )
+    delta_prob_matrix = inputs["delta_prob_matrix"]
 
     # Get coordinates and transcription directions of transcription units
-    replication_coordinate = sim_data.process.transcription.rna_data[
-        "replication_coordinate"
-    ]
-    transcription_direction = sim_data.process.transcription.rna_data["is_forward"]
+    replication_coordinate = inputs["replication_coordinate"]
+    transcription_direction = inputs["is_forward"]
 
     # Determine changes from genetic perturbations
-    genetic_perturbations = {}
-    perturbations = getattr(sim_data, "genetic_perturbations", {})
-
-    if len(perturbations) > 0:
-        probability_indexes = [
-            (index, sim_data.genetic_perturbations[rna_data["id"]])
-            for index, rna_data in enumerate(sim_data.process.transcription.rna_data)
-            if rna_data["id"] in sim_data.genetic_perturbations
-        ]
-
-        genetic_perturbations = {
-            "fixedRnaIdxs": [pair[0] for pair in probability_indexes],
-            "fixedSynthProbs": [pair[1] for pair in probability_indexes],
-        }
+    genetic_perturbations = inputs["genetic_perturbations"]
 
     # ID Groups
-    idx_rRNA = np.where(sim_data.process.transcription.rna_data["is_rRNA"])[0]
-    idx_mRNA = np.where(sim_data.process.transcription.rna_data["is_mRNA"])[0]
-    idx_tRNA = np.where(sim_data.process.transcription.rna_data["is_tRNA"])[0]
-    idx_rprotein = np.where(
-        sim_data.process.transcription.rna_data["includes_ribosomal_protein"]
-    )[0]
-    idx_rnap = np.where(sim_data.process.transcription.rna_data["includes_RNAP"])[0]
+    idx_mRNA = inputs["idx_mRNA"]
 
     # Calculate probabilities of the RNAP binding to the promoters
     promoter_init_probs = basal_prob[TU_index] + ppgpp_scale * np.multiply(
@@ -1057,15 +1586,13 @@ def initialize_transcription(
         raise Exception("Have negative RNA synthesis probabilities")
 
     # Adjust synthesis probabilities depending on environment
-    synth_prob_fractions = rna_synth_prob_fractions[current_media_id]
+    synth_prob_fractions = inputs["synth_prob_fractions"]
 
     # Create masks for different types of RNAs
-    is_mRNA = np.isin(TU_index, idx_mRNA)
-    is_tRNA = np.isin(TU_index, idx_tRNA)
-    is_rRNA = np.isin(TU_index, idx_rRNA)
-    is_rprotein = np.isin(TU_index, idx_rprotein)
-    is_rnap = np.isin(TU_index, idx_rnap)
-    is_fixed = is_tRNA | is_rRNA | is_rprotein | is_rnap
+    is_mRNA = inputs["is_mRNA"][TU_index]
+    is_tRNA = inputs["is_tRNA"][TU_index]
+    is_rRNA = inputs["is_rRNA"][TU_index]
+    is_fixed = inputs["is_fixed"][TU_index]
 
     # Rescale initiation probabilities based on type of RNA
     promoter_init_probs[is_mRNA] *= (
@@ -1082,32 +1609,15 @@ def initialize_transcription(
     rescale_initiation_probs(
         promoter_init_probs,
         TU_index,
-        np.concatenate(
-            (
-                rna_synth_prob_R_protein[current_media_id],
-                rna_synth_prob_rna_polymerase[current_media_id],
-            )
-        ),
-        np.concatenate((idx_rprotein, idx_rnap)),
+        inputs["fixed_synth_probs"],
+        inputs["fixed_TU_indexes"],
     )
 
     assert promoter_init_probs[is_fixed].sum() < 1.0
 
     # Adjust for attenuation that will stop transcription after initiation
     if trna_attenuation:
-        attenuation_readthrough = {
-            idx: prob
-            for idx, prob in zip(
-                sim_data.process.transcription.attenuated_rna_indices,
-                sim_data.process.transcription.attenuation_readthrough[
-                    sim_data.condition
-                ],
-            )
-        }
-        readthrough_adjustment = np.array(
-            [attenuation_readthrough.get(idx, 1) for idx in TU_index]
-        )
-        promoter_init_probs *= readthrough_adjustment
+        promoter_init_probs *= inputs["readthrough_adjustment"][TU_index]
 
     scale_the_rest_by = (
         1.0 - promoter_init_probs[is_fixed].sum()
@@ -1168,7 +1678,7 @@ def initialize_transcription(
     added_RNA_mass = added_mass.copy()
     added_mRNA_mass = added_mass.copy()
 
-    is_mRNA_partial_RNAs = np.isin(TU_index_partial_RNAs, idx_mRNA)
+    is_mRNA_partial_RNAs = inputs["is_mRNA"][TU_index_partial_RNAs]
     added_RNA_mass[is_mRNA_partial_RNAs] = 0
     added_mRNA_mass[np.logical_not(is_mRNA_partial_RNAs)] = 0
 
@@ -1184,8 +1694,7 @@ def initialize_transcription(
     )
 
     # Decrement counts of bulk inactive RNAPs
-    rnap_idx = bulk_name_to_idx(sim_data.molecule_ids.full_RNAP, bulk_state["id"])
-    bulk_state["count"][rnap_idx] = inactive_RNAP_counts - n_RNAPs_to_activate
+    bulk_state["count"][inactive_rnap_idx] = inactive_RNAP_counts - n_RNAPs_to_activate
 
     # Add partially transcribed RNAs
     partial_rnas = create_new_unique_molecules(
@@ -1204,10 +1713,7 @@ def initialize_transcription(
     )
 
     # Get counts of mRNAs initialized as bulk molecules
-    mRNA_ids = sim_data.process.transcription.rna_data["id"][
-        sim_data.process.transcription.rna_data["is_mRNA"]
-    ]
-    mRNA_idx = bulk_name_to_idx(mRNA_ids, bulk_state["id"])
+    mRNA_idx = inputs["mRNA_idx"]
     mRNA_counts = bulk_state["count"][mRNA_idx]
 
     # Subtract number of partially transcribed mRNAs that were initialized.
@@ -1453,7 +1959,12 @@ def initialize_chromosomal_segments(unique_molecules, sim_data, unique_id_rng):
 
 
 def initialize_translation(
-    bulk_state, unique_molecules, sim_data, random_state, unique_id_rng
+    bulk_state,
+    unique_molecules,
+    sim_data,
+    random_state,
+    unique_id_rng,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Activate ribosomes as unique molecules, and distribute them along lengths
@@ -1462,27 +1973,21 @@ def initialize_translation(
 
     Ribosomes are placed randomly across the lengths of each mRNA.
     """
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.translation_inputs()
+
     # Load translation parameters
-    current_nutrients = sim_data.conditions[sim_data.condition]["nutrients"]
-    frac_active_ribosome = sim_data.process.translation.ribosomeFractionActiveDict[
-        current_nutrients
-    ]
+    frac_active_ribosome = inputs["frac_active_ribosome"]
     protein_sequences = sim_data.process.translation.translation_sequences
-    protein_lengths = sim_data.process.translation.monomer_data["length"].asNumber()
-    translation_efficiencies = normalize(
-        sim_data.process.translation.translation_efficiencies_by_monomer
-    )
+    protein_lengths = inputs["protein_lengths"]
+    translation_efficiencies = inputs["translation_efficiencies"]
     aa_weights_incorporated = sim_data.process.translation.translation_monomer_weights
     end_weight = sim_data.process.translation.translation_end_weight
-    cistron_lengths = sim_data.process.transcription.cistron_data["length"].asNumber(
-        units.nt
-    )
-    TU_ids = sim_data.process.transcription.rna_data["id"]
+    cistron_lengths = inputs["cistron_lengths"]
+    TU_cistron_starts = inputs["TU_cistron_starts"]
     monomer_index_to_tu_indexes = sim_data.relation.monomer_index_to_tu_indexes
-    monomer_index_to_cistron_index = {
-        i: sim_data.process.transcription._cistron_id_to_index[monomer["cistron_id"]]
-        for (i, monomer) in enumerate(sim_data.process.translation.monomer_data)
-    }
+    monomer_index_to_cistron_index = inputs["monomer_index_to_cistron_index"]
 
     # Get attributes of RNAs
     (
@@ -1509,7 +2014,9 @@ def initialize_translation(
     # Calculate available template lengths of each mRNA cistron from fully
     # transcribed mRNA transcription units
     TU_index_full_mRNAs = TU_index_mRNAs[is_full_transcript_mRNAs]
-    TU_counts_full_mRNAs = np.bincount(TU_index_full_mRNAs, minlength=len(TU_ids))
+    TU_counts_full_mRNAs = np.bincount(
+        TU_index_full_mRNAs, minlength=len(TU_cistron_starts)
+    )
     cistron_counts_full_mRNAs = (
         sim_data.process.transcription.cistron_tu_mapping_matrix.dot(
             TU_counts_full_mRNAs
@@ -1526,17 +2033,7 @@ def initialize_translation(
         TU_index_to_mRNA_lengths.setdefault(TU_index, []).append(length)
 
     for TU_index, available_lengths in TU_index_to_mRNA_lengths.items():
-        cistron_indexes = sim_data.process.transcription.rna_id_to_cistron_indexes(
-            TU_ids[TU_index]
-        )
-        cistron_start_positions = np.array(
-            [
-                sim_data.process.transcription.cistron_start_end_pos_in_tu[
-                    (cistron_index, TU_index)
-                ][0]
-                for cistron_index in cistron_indexes
-            ]
-        )
+        cistron_indexes, cistron_start_positions = TU_cistron_starts[TU_index]
 
         for length in available_lengths:
             available_cistron_lengths[cistron_indexes] += np.clip(
@@ -1544,13 +2041,9 @@ def initialize_translation(
             )
 
     # Find number of ribosomes to activate
-    ribosome30S_idx = bulk_name_to_idx(
-        sim_data.molecule_ids.s30_full_complex, bulk_state["id"]
-    )
+    ribosome30S_idx = inputs["ribosome30S_idx"]
     ribosome30S = bulk_state["count"][ribosome30S_idx]
-    ribosome50S_idx = bulk_name_to_idx(
-        sim_data.molecule_ids.s50_full_complex, bulk_state["id"]
-    )
+    ribosome50S_idx = inputs["ribosome50S_idx"]
     ribosome50S = bulk_state["count"][ribosome50S_idx]
     inactive_ribosome_count = np.minimum(ribosome30S, ribosome50S)
     n_ribosomes_to_activate = np.int64(frac_active_ribosome * inactive_ribosome_count)
@@ -1909,6 +2402,7 @@ def initialize_trna_charging(
     unique_molecules: dict[str, np.ndarray],
     sim_data: Any,
     variable_elongation: bool,
+    cache: Optional[InitialStateCache] = None,
 ):
     """
     Initializes charged tRNA from uncharged tRNA and amino acids
@@ -1919,6 +2413,7 @@ def initialize_trna_charging(
             arrays of their current simulation states
         sim_data: Simulation data loaded from pickle generated by ParCa
         variable_elongation: Sets max elongation higher if True
+        cache: Seed-independent values derived from ``sim_data``
 
     .. note::
         Does not adjust for mass of amino acids on charged tRNA (~0.01% of cell mass)
@@ -1931,24 +2426,18 @@ def initialize_trna_charging(
     counts_to_molar = 1 / (sim_data.constants.n_avogadro * cell_volume)
 
     # Get molecule views and concentrations
+    if cache is None:
+        cache = InitialStateCache(sim_data)
+    inputs = cache.trna_charging_inputs()
     transcription = sim_data.process.transcription
     aa_from_synthetase = transcription.aa_from_synthetase
     aa_from_trna = transcription.aa_from_trna
-    synthetases = counts(
-        bulk_state, bulk_name_to_idx(transcription.synthetase_names, bulk_state["id"])
-    )
-    uncharged_trna_idx = bulk_name_to_idx(
-        transcription.uncharged_trna_names, bulk_state["id"]
-    )
+    synthetases = counts(bulk_state, inputs["synthetase_idx"])
+    uncharged_trna_idx = inputs["uncharged_trna_idx"]
     uncharged_trna = counts(bulk_state, uncharged_trna_idx)
-    charged_trna_idx = bulk_name_to_idx(
-        transcription.charged_trna_names, bulk_state["id"]
-    )
+    charged_trna_idx = inputs["charged_trna_idx"]
     charged_trna = counts(bulk_state, charged_trna_idx)
-    aas = counts(
-        bulk_state,
-        bulk_name_to_idx(sim_data.molecule_groups.amino_acids, bulk_state["id"]),
-    )
+    aas = counts(bulk_state, inputs["aa_idx"])
 
     ribosome_counts = unique_molecules["active_ribosome"]["_entryState"].sum()
 
@@ -1958,11 +2447,8 @@ def initialize_trna_charging(
     aa_conc = counts_to_molar * aas
     ribosome_conc = counts_to_molar * ribosome_counts
 
-    # Estimate fraction of amino acids from sequences, excluding first index for padding of -1
-    _, aas_in_sequences = np.unique(
-        sim_data.process.translation.translation_sequences, return_counts=True
-    )
-    f = aas_in_sequences[1:] / np.sum(aas_in_sequences[1:])
+    # Estimate fraction of amino acids from sequences
+    f = inputs["aa_fractions"]
 
     # Estimate initial charging state
     constants = sim_data.constants
@@ -2010,3 +2496,38 @@ def initialize_trna_charging(
     uncharged_trna_counts = total_trna_counts - charged_trna_counts
     bulk_state["count"][charged_trna_idx] = charged_trna_counts
     bulk_state["count"][uncharged_trna_idx] = uncharged_trna_counts
+
+
+def test_initial_state_cache(tmp_path):
+    from types import SimpleNamespace
+
+    sim_data = SimpleNamespace(condition="basal")
+    cache = InitialStateCache(sim_data)
+    n_calls = []
+
+    def compute():
+        n_calls.append(sim_data.condition)
+        return np.arange(3)
+
+    # Values are only computed once per condition
+    assert cache.get("key", compute) is cache.get("key", compute)
+    sim_data.condition = "with_aa"
+    cache.get("key", compute)
+    assert n_calls == ["basal", "with_aa"]
+
+    # Saved caches do not include sim_data and are only loaded for the same
+    # condition
+    path = str(tmp_path / "initial_state.pkl")
+    cache.save(path)
+    other_sim_data = SimpleNamespace(condition="with_aa")
+    loaded = InitialStateCache.load(path, other_sim_data)
+    assert loaded.sim_data is other_sim_data
+    np.testing.assert_array_equal(loaded.get("key", compute), np.arange(3))
+    assert len(n_calls) == 2
+    other_sim_data.condition = "basal"
+    try:
+        InitialStateCache.load(path, other_sim_data)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Loaded cache built for a different condition.")
@@ -43,6 +43,35 @@ def get_bin_site(location, n_bins, bounds):
     return bin_site
 
 
+def get_bin_sites(locations, n_bins, bounds):
+    """Get the indices of the bins containing many locations at once
+
+    Parameters:
+        locations (list): A list of locations, each a list of 2 floats
+            with units that specify the x and y coordinates of a point.
+        n_bins (list): A list of 2 ints that specify the number of bins
+            along the x and y axes, respectively.
+        bounds (list): A list of 2 floats that define the dimensions of
+            the lattice environment along the x and y axes,
+            respectively.
+
+    Returns:
+        tuple: A 2-tuple of arrays with the x and y indices of the bin
+        containing each location, same as :py:func:`~.get_bin_site`.
+    """
+    locations = np.array(
+        [
+            [coordinate.to(UNITS_UM).magnitude for coordinate in location]
+            for location in locations
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    bounds = np.array([bound.to(UNITS_UM).magnitude for bound in bounds])
+    n_bins = np.asarray(n_bins)
+    bin_sites = np.floor(locations * n_bins / bounds).astype(int) % n_bins
+    return bin_sites[:, 0], bin_sites[:, 1]
+
+
 def get_bin_volume(n_bins, bounds, depth):
     """Get a bin's volume
 
@@ -269,35 +298,105 @@ def gaussian(deviation, distance):
 def apply_exchanges(
     agents, fields, exchanges_path, location_path, n_bins, bounds, bin_volume
 ):
-    # apply exchanges from each agent
+    """Add the exchanges of all agents to the bins of the fields they are in
+
+    Parameters:
+        agents (dict): Mapping of agent IDs to agent states
+        fields (dict): Mapping of molecule IDs to 2D arrays of
+            concentrations (in mM), updated in place
+        exchanges_path (tuple): Path from agent state to mapping of
+            molecule IDs to exchanged counts
+        location_path (tuple): Path from agent state to agent location
+        n_bins (list): Number of bins along the x and y axes
+        bounds (list): Dimensions of the lattice along the x and y axes
+        bin_volume (float): Volume of each bin, with units
+
+    Returns:
+        tuple: The updated fields and an update for each agent that resets
+        its exchanges.
+    """
+    # gather exchanges and locations of all agents
     agent_updates = {}
-    for agent_id, agent_state in agents.items():
+    locations = []
+    exchange_agents = {}
+    exchange_values = {}
+    for agent_index, (agent_id, agent_state) in enumerate(agents.items()):
         exchanges = get_in(agent_state, exchanges_path)
         assert exchanges is not None
         location = get_in(agent_state, location_path)
         assert location is not None
-        bin_site = get_bin_site(location, n_bins, bounds)
+        locations.append(location)
 
         reset_exchanges = {}
         for mol_id, value in exchanges.items():
-            # delta concentration
-            exchange = value
-            concentration = (
-                count_to_concentration(exchange, bin_volume).to(UNITS_MM).magnitude
-            )
-
-            delta_field = np.zeros((n_bins[0], n_bins[1]), dtype=np.float64)
-            delta_field[bin_site[0], bin_site[1]] += concentration
-            fields[mol_id] += delta_field
+            exchange_agents.setdefault(mol_id, []).append(agent_index)
+            exchange_values.setdefault(mol_id, []).append(value)
 
             # reset the exchange value
             reset_exchanges[mol_id] = {"_value": -value, "_updater": "accumulate"}
 
         assoc_path(agent_updates, (agent_id,) + exchanges_path, reset_exchanges)
 
+    if not locations:
+        return fields, agent_updates
+
+    # delta concentration of every exchange, added to the bin of each agent
+    bin_x, bin_y = get_bin_sites(locations, n_bins, bounds)
+    count_to_mM = count_to_concentration(1, bin_volume).to(UNITS_MM).magnitude
+    for mol_id, agent_indices in exchange_agents.items():
+        agent_indices = np.array(agent_indices)
+        np.add.at(
+            fields[mol_id],
+            (bin_x[agent_indices], bin_y[agent_indices]),
+            np.array(exchange_values[mol_id], dtype=np.float64) * count_to_mM,
+        )
+
     return fields, agent_updates
 
 
+def test_apply_exchanges():
+    n_bins = [4, 3]
+    bounds = [8 * units.um, 6 * units.um]
+    bin_volume = get_bin_volume(n_bins, bounds, 1 * units.um)
+    locations = [[1, 1], [1.5, 1.9], [7.9, 5.9], [9, 1], [300, 200]]
+    agents = {
+        str(i): {
+            "boundary": {
+                "location": [x * units.um, y * units.um],
+                "exchanges": {"A": 10 * (i + 1), "B": -i},
+            }
+        }
+        for i, (x, y) in enumerate(locations)
+    }
+    agents["5"] = {"boundary": {"location": [3 * units.um, 3 * units.um]}}
+    agents["5"]["boundary"]["exchanges"] = {"B": 7}
+
+    fields = {"A": np.ones(n_bins), "B": np.zeros(n_bins)}
+    fields, agent_updates = apply_exchanges(
+        agents,
+        fields,
+        ("boundary", "exchanges"),
+        ("boundary", "location"),
+        n_bins,
+        bounds,
+        bin_volume,
+    )
+
+    expected = {"A": np.ones(n_bins), "B": np.zeros(n_bins)}
+    for agent_id, agent in agents.items():
+        x, y = get_bin_site(agent["boundary"]["location"], n_bins, bounds)
+        for mol_id, value in agent["boundary"]["exchanges"].items():
+            expected[mol_id][x, y] += (
+                count_to_concentration(value, bin_volume).to(UNITS_MM).magnitude
+            )
+            reset = agent_updates[agent_id]["boundary"]["exchanges"][mol_id]
+            assert reset == {"_value": -value, "_updater": "accumulate"}
+    for mol_id in expected:
+        np.testing.assert_allclose(fields[mol_id], expected[mol_id], rtol=1e-12)
+    # Agents 0 and 1 share a bin, agents 3 and 4 wrap around
+    assert np.count_nonzero(fields["A"] != 1) == 3
+
+
 class ExchangeAgent(Process):
     defaults = {
         "mol_ids": [],
@@ -0,0 +1,161 @@
+"""
+==============
+Layer Executor
+==============
+
+Steps in the same execution layer (see :ref:`implementation`) only read the
+simulation state as it was at the start of the layer and their updates are
+applied after every step in the layer has finished. Vivarium computes their
+updates one after another, but a lot of that time is spent in NumPy, SciPy,
+and solver code that releases the GIL, so independent steps can make progress
+at the same time on a thread pool.
+
+:py:func:`~.make_threaded_step` wraps a :py:class:`~vivarium.core.process.Step`
+class such that :py:meth:`~vivarium.core.engine.Engine.run_steps` only submits
+its ``next_update`` to a shared thread pool when it visits the step. The
+results are collected when the Engine applies the updates of the layer,
+which it does in the same fixed order as it would in a serial simulation.
+Because steps may still be reading the simulation state while they run, no
+update is returned until every step submitted so far has finished. The
+simulation output therefore does not depend on the number of threads.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+from vivarium.core.engine import Engine
+from vivarium.core.process import Step
+
+_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+_PENDING_FUTURES: list[Future] = []
+
+
+def get_layer_executor(n_threads: int) -> ThreadPoolExecutor:
+    """
+    Get the thread pool with ``n_threads`` workers that is shared by all
+    threaded steps (including those of daughter cells) in this process.
+    """
+    if n_threads not in _EXECUTORS:
+        _EXECUTORS[n_threads] = ThreadPoolExecutor(
+            n_threads, thread_name_prefix="layer_executor"
+        )
+    return _EXECUTORS[n_threads]
+
+
+def make_threaded_step(step_class: type[Step], n_threads: int) -> type[Step]:
+    """
+    Create a subclass of ``step_class`` that computes ``next_update`` on a
+    thread pool with ``n_threads`` workers (see module docstring).
+
+    Args:
+        step_class: Step class to wrap
+        n_threads: Number of worker threads in the shared thread pool
+
+    Returns:
+        Subclass of ``step_class`` whose updates are computed concurrently
+        with those of other threaded steps in the same execution layer
+    """
+
+    class ThreadedStep(step_class):  # type: ignore[valid-type, misc]
+        _command_future: Optional[Future] = None
+
+        def send_command(
+            self,
+            command: str,
+            args: Optional[tuple] = None,
+            kwargs: Optional[dict] = None,
+            run_pre_check: bool = True,
+        ) -> None:
+            if command != "next_update":
+                return super().send_command(command, args, kwargs, run_pre_check)
+            if run_pre_check:
+                self.pre_send_command(command, args, kwargs)
+            self._command_future = get_layer_executor(n_threads).submit(
+                self.next_update, *(args or ()), **(kwargs or {})
+            )
+            _PENDING_FUTURES.append(self._command_future)
+
+        def get_command_result(self) -> Any:
+            if self._command_future is None:
+                return super().get_command_result()
+            # Other steps in this layer must be done reading the state
+            # before the Engine applies any update
+            if _PENDING_FUTURES:
+                wait(_PENDING_FUTURES)
+                _PENDING_FUTURES.clear()
+            future = self._command_future
+            self._command_future = None
+            self._pending_command = None
+            # Re-raises any exception from next_update in the main thread
+            return future.result()
+
+    ThreadedStep.__name__ = f"Threaded_{step_class.__name__}"
+    return ThreadedStep
+
+
+def test_threaded_layer():
+    import threading
+    import time
+
+    import numpy as np
+
+    def inplace_add(current, update):
+        current += update
+        return current
+
+    class Square(Step):
+        defaults = {"port": "a", "delay": 0.0}
+
+        def ports_schema(self):
+            return {
+                "x": {"_default": np.zeros(1), "_updater": inplace_add},
+                "out": {"_default": [], "_updater": "accumulate", "_emit": True},
+            }
+
+        def next_update(self, timestep, states):
+            time.sleep(self.parameters["delay"])
+            return {
+                "x": np.ones(1, dtype=int),
+                "out": [
+                    (
+                        self.parameters["port"],
+                        states["x"][0] ** 2,
+                        threading.current_thread().name,
+                    )
+                ],
+            }
+
+    def run(step_class):
+        delays = [0.0, 0.1, 0.2]
+        steps = {
+            name: step_class({"port": name, "delay": delay})
+            for name, delay in zip("abc", delays)
+        }
+        engine = Engine(
+            steps=steps,
+            flow={name: [] for name in steps},
+            topology={name: {"x": ("x",), "out": ("out",)} for name in steps},
+            initial_state={"x": np.full(1, 3)},
+            progress_bar=False,
+        )
+        return engine.state.get_value()["out"]
+
+    serial = run(Square)
+    threaded = run(make_threaded_step(Square, 3))
+    # Every step reads the state as it was at the start of the layer even
+    # though the update of step a is ready while b and c are still running
+    assert [entry[:2] for entry in serial] == [entry[:2] for entry in threaded]
+    assert [entry[:2] for entry in threaded] == [("a", 9), ("b", 9), ("c", 9)]
+    assert all(entry[2].startswith("layer_executor") for entry in threaded)
+
+    # Exceptions are raised when the Engine collects the update
+    class Fail(Square):
+        def next_update(self, timestep, states):
+            raise ValueError("fail")
+
+    try:
+        run(make_threaded_step(Fail, 2))
+    except ValueError as e:
+        assert str(e) == "fail"
+    else:
+        raise AssertionError("Exception in threaded step was not raised.")
@@ -0,0 +1,295 @@
+"""
+==============
+Lazy Listeners
+==============
+
+Listener Steps (see :py:mod:`ecoli.processes.listeners`) often do a fair amount
+of work every timestep (e.g. dot products with complexation stoichiometries
+or ``np.bincount`` over all RNAs) purely to populate stores that are emitted.
+When the emitter only writes every ``emit_step`` seconds or a listener's
+outputs are never emitted at all, most of that work is thrown away.
+
+Listeners that are pure functions of the current simulation state (i.e. do
+not keep anything between timesteps) can declare this by setting the class
+attribute ``pure = True`` and calling :py:func:`~.listener_is_due` in their
+``update_condition``. :py:func:`~.schedule_lazy_listeners` then attaches an
+:py:class:`~.EmitSchedule` to each such listener whose outputs are not read by
+any other Process or Step, so that the listener only runs right before the
+:py:class:`~vivarium.core.engine.Engine` emits. Listeners whose outputs are
+neither read nor emitted never run.
+"""
+
+import math
+from typing import Any, Optional
+
+from vivarium.core.process import Process
+
+
+class EmitSchedule:
+    """
+    Mirrors the times at which :py:meth:`~vivarium.core.engine.Engine.run_for`
+    emits data: once when the Engine is created at ``initial_global_time``,
+    then whenever the global time reaches or passes the next multiple of
+    ``emit_step`` after that.
+
+    Args:
+        emit_step: ``emit_step`` option of the Engine. Use ``math.inf`` for
+            listeners whose outputs are never emitted.
+        initial_global_time: Global time at which the Engine was created
+    """
+
+    def __init__(self, emit_step: float, initial_global_time: float = 0.0):
+        self.emit_step = emit_step
+        self.reset(initial_global_time)
+
+    def reset(self, initial_global_time: float):
+        """Start over for a new Engine created at ``initial_global_time``."""
+        self.next_emit_time = initial_global_time
+        self.last_emit_time: Optional[float] = None
+        if self.emit_step == math.inf:
+            self.next_emit_time = math.inf
+
+    def is_emit_time(self, global_time: float) -> bool:
+        """
+        Whether the Engine will emit after running Steps at ``global_time``.
+        Can be called more than once for the same ``global_time``.
+        """
+        if global_time == self.last_emit_time:
+            return True
+        if global_time < self.next_emit_time:
+            return False
+        while self.next_emit_time <= global_time:
+            self.next_emit_time += self.emit_step
+        self.last_emit_time = global_time
+        return True
+
+
+def listener_is_due(listener: Process, global_time: float) -> bool:
+    """
+    Whether a listener with ``pure = True`` has to run at ``global_time``.
+    Always true for listeners that were not given an :py:class:`~.EmitSchedule`
+    by :py:func:`~.schedule_lazy_listeners`.
+    """
+    schedule = getattr(listener, "emit_schedule", None)
+    return schedule is None or schedule.is_emit_time(global_time)
+
+
+def _resolve_path(path: tuple) -> tuple:
+    resolved: list = []
+    for node in path:
+        if node == "..":
+            if resolved:
+                resolved.pop()
+        else:
+            resolved.append(node)
+    return tuple(resolved)
+
+
+def _declared_paths(
+    schema: dict[str, Any], topology: dict[str, Any], prefix: tuple = ()
+) -> list[tuple[tuple, dict[str, Any]]]:
+    """
+    Resolve the ports schema of a Process or Step into tuples of
+    (agent-relative path, leaf schema) for every store it declares.
+    """
+    paths = []
+    for port, port_schema in schema.items():
+        if port.startswith("_"):
+            continue
+        target = topology.get(port, (port,))
+        sub_topology: dict[str, Any] = {}
+        if isinstance(target, dict):
+            sub_topology = {k: v for k, v in target.items() if k != "_path"}
+            target = target.get("_path", (port,))
+        path = _resolve_path(prefix + tuple(target))
+        if not isinstance(port_schema, dict) or port == "*":
+            paths.append((path, {}))
+        elif any(key.startswith("_") for key in port_schema):
+            paths.append((path, port_schema))
+        else:
+            paths.extend(_declared_paths(port_schema, sub_topology, path))
+    return paths
+
+
+def _overlaps(path: tuple, other: tuple) -> bool:
+    n = min(len(path), len(other))
+    return path[:n] == other[:n]
+
+
+def schedule_lazy_listeners(
+    processes: dict[str, Process],
+    steps: dict[str, Process],
+    topology: dict[str, dict[str, Any]],
+    emit_step: float = 1,
+    initial_global_time: float = 0.0,
+    emit_paths: Optional[list[tuple]] = None,
+) -> list[str]:
+    """
+    Give every Step with ``pure = True`` whose outputs (stores under
+    ``('listeners',)``) are not declared in the ports schema of any other
+    Process or Step an :py:class:`~.EmitSchedule`. Listeners whose outputs
+    are emitted run every ``emit_step`` seconds, those whose outputs are not
+    emitted (``_emit`` is false or path not in ``emit_paths``) never run.
+
+    Args:
+        processes: Mapping of process names to Processes in one cell
+        steps: Mapping of step names to Steps in the same cell
+        topology: Topology for all of the above
+        emit_step: ``emit_step`` option of the Engine
+        initial_global_time: Global time at which the Engine is created
+        emit_paths: If not empty, only these paths (relative to the root of
+            the cell or prefixed by ``('agents', agent_id)``) are emitted
+
+    Returns:
+        Names of the listeners that were given an :py:class:`~.EmitSchedule`
+    """
+    all_procs = {**processes, **steps}
+    declared = {
+        name: _declared_paths(proc.ports_schema(), topology.get(name, {}))
+        for name, proc in all_procs.items()
+    }
+    if emit_paths:
+        emit_paths = [
+            tuple(path[2:]) if tuple(path[:1]) == ("agents",) else tuple(path)
+            for path in emit_paths
+        ]
+
+    scheduled = []
+    for name, step in steps.items():
+        if not getattr(step, "pure", False):
+            continue
+        outputs = [
+            (path, schema)
+            for path, schema in declared[name]
+            if path[:1] == ("listeners",)
+        ]
+        consumed = any(
+            _overlaps(path, other_path)
+            for other, other_declared in declared.items()
+            if other != name
+            for other_path, _ in other_declared
+            for path, _ in outputs
+        )
+        if consumed:
+            continue
+        emitted = any(
+            schema.get("_emit", False)
+            and (not emit_paths or any(_overlaps(path, p) for p in emit_paths))
+            for path, schema in outputs
+        )
+        step.emit_schedule = EmitSchedule(
+            emit_step if emitted else math.inf, initial_global_time
+        )
+        scheduled.append(name)
+    return scheduled
+
+
+def reset_emit_schedules(steps: dict[str, Process], initial_global_time: float):
+    """
+    Restart the :py:class:`~.EmitSchedule` of every lazy listener in ``steps``
+    for a new Engine created at ``initial_global_time``.
+    """
+    for step in steps.values():
+        schedule = getattr(step, "emit_schedule", None)
+        if schedule is not None:
+            schedule.reset(initial_global_time)
+
+
+def test_emit_schedule():
+    schedule = EmitSchedule(5, initial_global_time=3)
+    times = [3, 3, 4, 5, 8, 8, 9, 12, 14, 18]
+    assert [schedule.is_emit_time(t) for t in times] == [
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+    ]
+    never = EmitSchedule(math.inf)
+    assert not any(never.is_emit_time(t) for t in range(10))
+
+
+def test_schedule_lazy_listeners():
+    from vivarium.core.engine import Engine
+    from vivarium.core.process import Step
+
+    class Counter(Process):
+        def ports_schema(self):
+            return {"count": {"_default": 0, "_updater": "accumulate"}}
+
+        def next_update(self, timestep, states):
+            return {"count": 1}
+
+    class Listener(Step):
+        pure = True
+        defaults = {"key": "a", "emit": True}
+
+        def __init__(self, parameters=None):
+            super().__init__(parameters)
+            self.n_runs = 0
+
+        def ports_schema(self):
+            return {
+                "count": {"_default": 0},
+                "listeners": {
+                    self.parameters["key"]: {
+                        "_default": -1,
+                        "_updater": "set",
+                        "_emit": self.parameters["emit"],
+                    }
+                },
+            }
+
+        def update_condition(self, timestep, states):
+            return listener_is_due(self, states["count"])
+
+        def next_update(self, timestep, states):
+            self.n_runs += 1
+            return {"listeners": {self.parameters["key"]: states["count"]}}
+
+    class Reader(Step):
+        def ports_schema(self):
+            return {"listeners": {"b": {"_default": -1}}}
+
+        def next_update(self, timestep, states):
+            return {}
+
+    processes = {"counter": Counter()}
+    steps = {
+        "emitted": Listener({"key": "a"}),
+        "read": Listener({"key": "b"}),
+        "hidden": Listener({"key": "c", "emit": False}),
+        "reader": Reader(),
+    }
+    topology = {
+        "counter": {"count": ("count",)},
+        "emitted": {"count": ("count",), "listeners": ("listeners",)},
+        "read": {"count": ("count",), "listeners": ("listeners",)},
+        "hidden": {"count": ("count",), "listeners": ("listeners",)},
+        "reader": {"listeners": ("listeners",)},
+    }
+    scheduled = schedule_lazy_listeners(processes, steps, topology, emit_step=4)
+    assert scheduled == ["emitted", "hidden"]
+
+    engine = Engine(
+        processes=processes,
+        steps=steps,
+        flow={name: [] for name in steps},
+        topology=topology,
+        emit_step=4,
+        progress_bar=False,
+    )
+    engine.update(10)
+    # Listener values are up to date at every emit
+    data = engine.emitter.get_data()
+    assert sorted(data) == [0, 4, 8]
+    for time, state in data.items():
+        assert state["listeners"]["a"] == time
+    assert steps["emitted"].n_runs == 3
+    assert steps["read"].n_runs == 11
+    assert steps["hidden"].n_runs == 0
@@ -1,10 +1,11 @@
 import atexit
+import inspect
 import os
 import pathlib
 from itertools import pairwise
 import tempfile
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable, cast, Mapping, Optional
+from typing import Any, Callable, cast, Mapping, Optional, TYPE_CHECKING
 from urllib import parse
 
 import duckdb
@@ -19,6 +20,9 @@ from tqdm import tqdm
 from vivarium.core.emitter import Emitter
 from vivarium.core.serialize import make_fallback_serializer_function
 
+if TYPE_CHECKING:
+    from ecoli.library.sim_data import LoadSimData
+
 METADATA_PREFIX = "output_metadata__"
 """
 In the config dataset, user-defined metadata for each store
@@ -65,9 +69,17 @@ USE_UINT32 = {
     "listeners__rna_counts__mRNA_counts",
     "listeners__rna_counts__full_mRNA_counts",
     "listeners__fba_results__catalyst_counts",
+    "bulk_delta__idx",
 }
 """uint32 is 2x smaller than int64 for values between 0 - 4,294,967,295."""
 
+BULK_DELTA_COLUMNS = ("bulk_delta__idx", "bulk_delta__val")
+"""
+Columns holding the indices and new counts of bulk molecules whose counts
+differ from the most recent keyframe when ``bulk_keyframe_interval`` is set
+for :py:class:`~.ParquetEmitter` (see :py:func:`~.bulk_delta_sql`).
+"""
+
 
 def json_to_parquet(
     ndjson: str,
@@ -563,8 +575,8 @@ def read_stacked_columns(
         sql_query = f"""
             SELECT * FROM ({sql_query})
             ANTI JOIN (
-                SELECT (experiment_id, variant, lineage_seed, generation,
-                    agent_id, MIN(time))
+                SELECT experiment_id, variant, lineage_seed, generation,
+                    agent_id, MIN(time) AS time
                 FROM ({history_sql.replace("COLNAMEHERE", "time")})
                 GROUP BY experiment_id, variant, lineage_seed, generation,
                     agent_id
@@ -603,6 +615,277 @@ def read_stacked_columns(
     return conn.sql(query).arrow()
 
 
+def apply_bulk_delta(
+    keyframe: pa.ChunkedArray, idx: pa.ChunkedArray, val: pa.ChunkedArray
+) -> pa.ListArray:
+    """
+    Reconstruct dense bulk counts from keyframes and sparse deltas. Registered
+    as the DuckDB function ``apply_bulk_delta`` by
+    :py:func:`~.register_bulk_delta_function` and used by
+    :py:func:`~.bulk_delta_sql`.
+
+    Args:
+        keyframe: Bulk counts from the most recent keyframe for each row
+        idx: Indices of bulk molecules whose counts differ from the keyframe
+            (NULL for keyframe rows)
+        val: New counts for the molecules in ``idx`` (NULL for keyframe rows)
+
+    Returns:
+        Dense bulk counts for each row
+    """
+    keyframe = keyframe.combine_chunks()
+    idx = idx.combine_chunks()
+    val = val.combine_chunks()
+    dense = ndlist_to_ndarray(keyframe).copy()
+    n_changed = pc.fill_null(pc.list_value_length(idx), 0).to_numpy()
+    rows = np.repeat(np.arange(len(dense)), n_changed)
+    dense[rows, pc.list_flatten(idx).to_numpy()] = pc.list_flatten(val).to_numpy()
+    offsets = np.arange(0, dense.size + 1, dense.shape[1], dtype=np.int32)
+    return pa.ListArray.from_arrays(pa.array(offsets), pa.array(dense.ravel()))
+
+
+def register_bulk_delta_function(conn: duckdb.DuckDBPyConnection):
+    """
+    Register :py:func:`~.apply_bulk_delta` as a DuckDB function so that
+    queries built with :py:func:`~.bulk_delta_sql` can run on ``conn``.
+    Connections created by :py:mod:`runscripts.analysis` already have
+    this function registered.
+    """
+    conn.create_function(
+        "apply_bulk_delta",
+        apply_bulk_delta,
+        [list[int], list[int], list[int]],
+        list[int],
+        type="arrow",
+        null_handling="special",
+    )
+
+
+def bulk_delta_sql(history_sql: str) -> str:
+    """
+    Wraps a DuckDB SQL query for sim output that was emitted with the
+    ``bulk_keyframe_interval`` option of :py:class:`~.ParquetEmitter` so that
+    the ``bulk`` column contains dense counts for every time step again. The
+    returned query can be used wherever ``history_sql`` is accepted (e.g.
+    :py:func:`~.read_stacked_columns`) as long as the DuckDB connection that
+    runs it was passed to :py:func:`~.register_bulk_delta_function`::
+
+        history_sql, config_sql, _ = get_dataset_sql('out/', ['exp_id'])
+        conn = duckdb.connect()
+        register_bulk_delta_function(conn)
+        bulk = read_stacked_columns(
+            bulk_delta_sql(history_sql), ["bulk"], conn=conn)
+
+    Args:
+        history_sql: DuckDB SQL string from :py:func:`~.get_dataset_sql`,
+            potentially with filters appended in ``WHERE`` clause
+
+    Returns:
+        DuckDB SQL string with the same columns as ``history_sql`` minus
+        :py:data:`~.BULK_DELTA_COLUMNS`
+    """
+    idx_col, val_col = BULK_DELTA_COLUMNS
+    return f"""
+        SELECT * EXCLUDE ({idx_col}, {val_col}) REPLACE (
+            apply_bulk_delta(
+                last_value(bulk IGNORE NULLS) OVER (
+                    PARTITION BY experiment_id, variant, lineage_seed,
+                        generation, agent_id
+                    ORDER BY time
+                ),
+                {idx_col},
+                {val_col}
+            ) AS bulk
+        ) FROM ({history_sql})
+        """
+
+
+def _monomer_counts_maps(sim_data: "LoadSimData", bulk_ids: list[str]) -> list:
+    from ecoli.processes.listeners.monomer_counts import MonomerCounts
+
+    listener = MonomerCounts(sim_data.get_monomer_counts_listener_config())
+    A, B = listener.linear_map(np.array(bulk_ids))
+    return [A, B[:, 0], B[:, 1], B[:, 2]]
+
+
+def _rna_cistron_counts_maps(output: str, inputs: list[str]):
+    def build(sim_data: "LoadSimData", bulk_ids: list[str]) -> list:
+        from ecoli.processes.listeners.RNA_counts import RNACounts
+
+        listener = RNACounts(sim_data.get_rna_counts_listener_config())
+        maps = listener.linear_maps()[output]
+        return [maps[name] for name in inputs]
+
+    return build
+
+
+DERIVED_COLUMNS: dict[str, dict[str, Any]] = {
+    "listeners__monomer_counts": {
+        "inputs": [
+            "bulk",
+            "listeners__unique_molecule_counts__active_ribosome",
+            "listeners__unique_molecule_counts__active_RNAP",
+            "listeners__unique_molecule_counts__active_replisome",
+        ],
+        "build": _monomer_counts_maps,
+    },
+}
+"""
+Registry of listener columns that are linear functions of other emitted
+columns and can therefore be computed at query time instead of being
+emitted (e.g. by turning off their listeners or setting ``emit_paths``).
+Maps column names to dictionaries with the following keys:
+
+- ``inputs``: Names of emitted list or scalar columns that the column
+  depends on
+- ``build``: Function that takes a :py:class:`~ecoli.library.sim_data.LoadSimData`
+  instance and the bulk molecule IDs in emitted order and returns one
+  matrix (list inputs) or vector (scalar inputs) per input, such that the
+  column is the sum over all inputs of ``matrix @ input`` or
+  ``vector * input``
+
+Add entries with :py:func:`~.register_derived_column`. Entries are turned
+into DuckDB functions by :py:func:`~.register_derived_functions` that can be
+called with the expressions returned by :py:func:`~.derived_column_sql`.
+"""
+
+
+def register_derived_column(
+    column: str,
+    inputs: list[str],
+    build: Callable[["LoadSimData", list[str]], list],
+):
+    """
+    Add an entry to :py:data:`~.DERIVED_COLUMNS`.
+
+    Args:
+        column: Name of column to derive (e.g. ``listeners__monomer_counts``)
+        inputs: Names of emitted columns that ``column`` depends on
+        build: See :py:data:`~.DERIVED_COLUMNS`
+    """
+    DERIVED_COLUMNS[column] = {"inputs": inputs, "build": build}
+
+
+for _output, _inputs in {
+    "mRNA_cistron_counts": ["mRNA_counts", "partial_rRNA_counts"],
+    "full_mRNA_cistron_counts": ["full_mRNA_counts"],
+    "partial_mRNA_cistron_counts": ["partial_mRNA_counts", "partial_rRNA_counts"],
+    "partial_rRNA_cistron_counts": ["mRNA_counts", "partial_rRNA_counts"],
+}.items():
+    register_derived_column(
+        f"listeners__rna_counts__{_output}",
+        [f"listeners__rna_counts__{name}" for name in _inputs],
+        _rna_cistron_counts_maps(_output, _inputs),
+    )
+
+
+def linear_combination(matrices: list) -> Callable[..., pa.ListArray]:
+    """
+    Create a DuckDB Arrow function that multiplies each of its arguments
+    by the matrix (list columns) or vector (scalar columns) at the same
+    position in ``matrices`` and returns the rounded sum as a list column.
+
+    Args:
+        matrices: Dense or sparse matrices and 1D arrays that all have the
+            same number of rows
+    """
+
+    def func(*columns: pa.ChunkedArray) -> pa.ListArray:
+        total = None
+        for matrix, column in zip(matrices, columns):
+            column = column.combine_chunks()
+            if len(matrix.shape) == 1:
+                values = column.to_numpy(zero_copy_only=False)
+                product = np.outer(values, matrix)
+            else:
+                # (matrix @ values.T).T without densifying sparse matrices
+                values = ndlist_to_ndarray(column)
+                product = np.asarray((matrix @ values.T).T)
+            total = product if total is None else total + product
+        total = np.rint(total).astype(np.int64)
+        offsets = np.arange(0, total.size + 1, total.shape[1], dtype=np.int32)
+        return pa.ListArray.from_arrays(pa.array(offsets), pa.array(total.ravel()))
+
+    # DuckDB checks the number of parameters that the function takes
+    func.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(f"column_{i}", inspect.Parameter.POSITIONAL_ONLY)
+            for i in range(len(matrices))
+        ]
+    )
+    return func
+
+
+def _derived_function_name(column: str) -> str:
+    return f"derive__{column}"
+
+
+def register_derived_functions(
+    conn: duckdb.DuckDBPyConnection,
+    config_sql: str,
+    sim_data_path: str,
+    columns: Optional[list[str]] = None,
+):
+    """
+    Register DuckDB functions to compute columns in
+    :py:data:`~.DERIVED_COLUMNS` from the columns that they depend on. Use
+    :py:func:`~.derived_column_sql` to call them. For example, to read
+    monomer counts for sims that did not emit the monomer counts listener::
+
+        history_sql, config_sql, _ = get_dataset_sql('out/', ['exp_id'])
+        conn = duckdb.connect()
+        register_derived_functions(
+            conn, config_sql, sim_data_path, ["listeners__monomer_counts"])
+        monomer_counts = read_stacked_columns(
+            history_sql,
+            [derived_column_sql("listeners__monomer_counts")],
+            conn=conn,
+        )
+
+    Args:
+        conn: DuckDB connection to register functions with
+        config_sql: DuckDB SQL string from :py:func:`~.get_dataset_sql`
+            used to get bulk molecule IDs (sims from one variant only)
+        sim_data_path: Path to simulation data pickle of the variant
+        columns: Columns to register functions for (all if not given)
+    """
+    from ecoli.library.sim_data import LoadSimData
+
+    sim_data = LoadSimData(sim_data_path=sim_data_path)
+    bulk_ids = get_field_metadata(conn, config_sql, "bulk")
+    for column in columns or DERIVED_COLUMNS:
+        matrices = DERIVED_COLUMNS[column]["build"](sim_data, bulk_ids)
+        register_derived_function(conn, column, matrices)
+
+
+def register_derived_function(
+    conn: duckdb.DuckDBPyConnection, column: str, matrices: list
+):
+    """
+    Register the DuckDB function called by :py:func:`~.derived_column_sql`
+    for ``column`` given the output of its ``build`` function (see
+    :py:data:`~.DERIVED_COLUMNS`). Prefer :py:func:`~.register_derived_functions`.
+    """
+    conn.create_function(
+        _derived_function_name(column),
+        linear_combination(matrices),
+        [int if len(matrix.shape) == 1 else list[int] for matrix in matrices],
+        list[int],
+        type="arrow",
+    )
+
+
+def derived_column_sql(column: str) -> str:
+    """
+    DuckDB SQL expression for a column in :py:data:`~.DERIVED_COLUMNS`
+    that can be passed to :py:func:`~.read_stacked_columns`. The connection
+    running the query must have been passed to
+    :py:func:`~.register_derived_functions`.
+    """
+    inputs = ", ".join(DERIVED_COLUMNS[column]["inputs"])
+    return f"{_derived_function_name(column)}({inputs}) AS {column}"
+
+
 def get_encoding(
     val: Any, field_name: str, use_uint16: bool = False, use_uint32: bool = False
 ) -> tuple[Any, str, str, bool]:
@@ -685,6 +968,11 @@ class ParquetEmitter(Emitter):
                     'type': 'parquet',
                     'emits_to_batch': Number of emits per Parquet row
                         group (optional, default: 400),
+                    'bulk_keyframe_interval': If given, only emit full
+                        bulk counts every this many emits and at the start
+                        of each Parquet file. Other emits only store the
+                        bulk molecules whose counts differ from the last
+                        full emit (see :py:func:`~.bulk_delta_sql`),
                     # One of the following is REQUIRED
                     'out_dir': local output directory (absolute/relative),
                     'out_uri': Google Cloud storage bucket URI
@@ -706,6 +994,9 @@ class ParquetEmitter(Emitter):
         self.schema = pa.schema([])
         self.non_null_keys: set[str] = set()
         self.num_emits = 0
+        self.bulk_keyframe_interval = config.get("bulk_keyframe_interval")
+        self.bulk_keyframe: Optional[np.ndarray] = None
+        self.bulk_keyframe_emit = 0
         # Wait until next batch of emits to check whether last batch
         # was successfully written to Parquet in order to avoid blocking
         self.last_batch_future: Future = Future()
@@ -738,6 +1029,7 @@ class ParquetEmitter(Emitter):
             f"{self.num_emits}.pq",
         )
         if self.filesystem.get_file_info(outfile).type == 0:
+            self.temp_data.close()
             json_to_parquet(
                 self.temp_data.name,
                 self.encodings,
@@ -811,6 +1103,31 @@ class ParquetEmitter(Emitter):
                 write_statistics=False,
             )
 
+    def _delta_encode_bulk(self, agent_data: dict[str, Any]):
+        """
+        Replace dense bulk counts with indices and counts of molecules that
+        changed since the last keyframe (:py:data:`~.BULK_DELTA_COLUMNS`).
+        Keyframes are written at the start of every Parquet file so that
+        each file can be decoded on its own.
+        """
+        bulk = np.asarray(agent_data["bulk"])
+        idx_col, val_col = BULK_DELTA_COLUMNS
+        if (
+            self.bulk_keyframe is None
+            or self.num_emits % self.batch_size == 0
+            or self.num_emits - self.bulk_keyframe_emit >= self.bulk_keyframe_interval
+            or bulk.shape != self.bulk_keyframe.shape
+        ):
+            self.bulk_keyframe = bulk.copy()
+            self.bulk_keyframe_emit = self.num_emits
+            agent_data[idx_col] = None
+            agent_data[val_col] = None
+            return
+        changed = np.flatnonzero(bulk != self.bulk_keyframe)
+        agent_data["bulk"] = None
+        agent_data[idx_col] = changed
+        agent_data[val_col] = bulk[changed]
+
     def emit(self, data: dict[str, Any]):
         """
         Flattens emit dictionary by concatenating nested key names with double
@@ -894,6 +1211,8 @@ class ParquetEmitter(Emitter):
             except (FileNotFoundError, OSError):
                 pass
             self.filesystem.create_dir(os.path.dirname(outfile))
+            # Flush buffered config data before converting it in another thread
+            self.temp_data.close()
             self.last_batch_future = self.executor.submit(
                 json_to_parquet,
                 self.temp_data.name,
@@ -923,6 +1242,8 @@ class ParquetEmitter(Emitter):
         for agent_data in data["data"]["agents"].values():
             agent_data["time"] = float(data["data"]["time"])
             agent_data = flatten_dict(agent_data)
+            if self.bulk_keyframe_interval is not None and "bulk" in agent_data:
+                self._delta_encode_bulk(agent_data)
             # If we encounter columns that have, up until this point,
             # been NULL, serialize/deserialize them and update their
             # type in our cached Parquet schema
@@ -978,3 +1299,76 @@ class ParquetEmitter(Emitter):
                 self.filesystem,
             )
             self.temp_data = tempfile.NamedTemporaryFile(delete=False)
+
+
+def test_bulk_delta_encoding():
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        emitter = ParquetEmitter(
+            {"out_dir": tmp, "batch_size": 4, "bulk_keyframe_interval": 3}
+        )
+        # Avoid writing output after temporary directory is deleted
+        atexit.unregister(emitter._finalize)
+        emitter.emit(
+            {
+                "table": "configuration",
+                "data": {"metadata": {"experiment_id": "delta"}},
+            }
+        )
+        bulk = rng.integers(0, 100, 20)
+        expected = []
+        for t in range(10):
+            bulk = bulk.copy()
+            changed = rng.choice(20, 2, replace=False)
+            bulk[changed] += 1
+            expected.append(bulk)
+            emitter.emit(
+                {
+                    "table": "history",
+                    "data": {"time": t, "agents": {"1": {"bulk": bulk}}},
+                }
+            )
+        emitter.last_batch_future.result()
+        emitter._finalize()
+        history_sql, _, _ = get_dataset_sql(tmp, ["delta"])
+        conn = duckdb.connect()
+        raw = conn.sql(f"SELECT bulk FROM ({history_sql}) ORDER BY time").arrow()
+        # Only keyframes (start of each file and every 3 emits) are dense
+        assert raw["bulk"].null_count == 5
+        register_bulk_delta_function(conn)
+        dense = read_stacked_columns(bulk_delta_sql(history_sql), ["bulk"], conn=conn)
+        np.testing.assert_array_equal(
+            ndlist_to_ndarray(dense["bulk"].combine_chunks()), np.array(expected)
+        )
+
+
+def test_derived_columns():
+    import scipy.sparse
+
+    conn = duckdb.connect()
+    conn.sql("""
+        CREATE TABLE history AS SELECT * FROM (VALUES
+            (0, [1, 2, 3], 1), (1, [4, 5, 6], 0), (2, [7, 8, 9], 2)
+        ) AS t(time, listeners__a, listeners__b)
+        """)
+    register_derived_column(
+        "listeners__c",
+        ["listeners__a", "listeners__b"],
+        lambda sim_data, bulk_ids: [],
+    )
+    try:
+        a_matrix = scipy.sparse.csr_matrix([[1, 0, 1], [0, 2, 0]])
+        b_vector = np.array([10, -1])
+        register_derived_function(conn, "listeners__c", [a_matrix, b_vector])
+        derived = read_stacked_columns(
+            "SELECT *, 'exp' AS experiment_id, 0 AS variant, 0 AS lineage_seed, "
+            "1 AS generation, '0' AS agent_id FROM history",
+            [derived_column_sql("listeners__c")],
+            conn=conn,
+        )
+    finally:
+        DERIVED_COLUMNS.pop("listeners__c")
+    np.testing.assert_array_equal(
+        ndlist_to_ndarray(derived["listeners__c"].combine_chunks()),
+        [[14, 3], [10, 10], [36, 14]],
+    )
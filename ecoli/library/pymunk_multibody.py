@@ -129,59 +129,98 @@ class PymunkMultibody(object):
             print("timestep skipped by pymunk_multibody: {}".format(timestep))
             return
 
+        n_steps = 0
         time = 0
         while time < timestep:
             time += self.physics_dt
+            n_steps += 1
 
+        bodies = list(self.space.bodies)
+        if bodies:
+            impulses, angular_impulses = self.get_impulses(bodies, n_steps)
+
+        for step in range(n_steps):
             # apply forces
-            for body in self.space.bodies:
-                self.apply_jitter_force(body)
-                self.apply_motile_force(body)
-                self.apply_viscous_force(body)
+            if bodies:
+                self.apply_impulses(bodies, impulses[step], angular_impulses[step])
 
             # run for a physics timestep
             self.space.step(self.physics_dt)
 
         self.screen.update_screen()
 
-    def apply_motile_force(self, body):
-        width, length = body.dimensions
-        motile_location = (width / 2, 0)  # apply force at back end of body
-        thrust = 0.0
-        torque = 0.0
-        motile_force = [thrust, torque]
-
-        if hasattr(body, "thrust"):
-            thrust = body.thrust
-            torque = body.torque
-            motile_force = [thrust, 0.0]
-
-            # add to angular velocity
-            body.angular_velocity += torque
+    def get_impulses(self, bodies, n_steps):
+        """
+        Sum the jitter and motile impulses on every body for ``n_steps``
+        physics timesteps, drawing all random numbers at once.
 
-        scaled_motile_force = [force * self.force_scaling for force in motile_force]
-        body.apply_impulse_at_local_point(scaled_motile_force, motile_location)
+        Returns:
+            Tuple of the impulses on each body in local coordinates (array
+            of shape ``(n_steps, len(bodies), 2)``) and the change in angular
+            velocity they cause (shape ``(n_steps, len(bodies))``).
+        """
+        n_bodies = len(bodies)
+        width, length = np.array([body.dimensions for body in bodies]).T
+        center_of_gravity = np.array([tuple(body.center_of_gravity) for body in bodies])
+        moment = np.array([body.moment for body in bodies])
+        thrust = np.array([getattr(body, "thrust", 0.0) for body in bodies])
+
+        # jitter force at a random point along the boundary of each body,
+        # see random_body_position
+        on_ends = self.rng.integers(0, 2, (n_steps, n_bodies)) == 0
+        far_side = self.rng.integers(0, 2, (n_steps, n_bodies)) == 1
+        along = self.rng.uniform(0, 1, (n_steps, n_bodies))
+        jitter_x = np.where(on_ends, along * width, far_side * width)
+        jitter_y = np.where(on_ends, far_side * length, along * length)
+        jitter_force = self.rng.normal(0, self.jitter_force, (n_steps, n_bodies, 2))
+        jitter_impulse = jitter_force * self.force_scaling
+
+        # motile force at back end of body, (width / 2, 0)
+        motile_impulse = thrust * self.force_scaling
+
+        # torque about the center of gravity
+        angular_impulse = (
+            (jitter_x - center_of_gravity[:, 0]) * jitter_impulse[..., 1]
+            - (jitter_y - center_of_gravity[:, 1]) * jitter_impulse[..., 0]
+            + center_of_gravity[:, 1] * motile_impulse
+        )
+        jitter_impulse[..., 0] += motile_impulse
+        return jitter_impulse, angular_impulse / moment
 
-    def apply_jitter_force(self, body):
-        jitter_location = random_body_position(body, self.rng)
-        jitter_force = [
-            self.rng.normal(0, self.jitter_force),
-            self.rng.normal(0, self.jitter_force),
-        ]
-        scaled_jitter_force = [force * self.force_scaling for force in jitter_force]
-        body.apply_impulse_at_local_point(scaled_jitter_force, jitter_location)
+    def apply_impulses(self, bodies, impulses, angular_impulses):
+        """
+        Apply the impulses from :py:meth:`~.get_impulses` for one physics
+        timestep, add the torque of motile bodies to their angular velocity,
+        and dampen velocities.
+        """
+        angle = np.array([body.angle for body in bodies])
+        velocity = np.array([tuple(body.velocity) for body in bodies])
+        angular_velocity = np.array([body.angular_velocity for body in bodies])
+        force = np.array([tuple(body.force) for body in bodies])
+        torque = np.array([body.torque for body in bodies])
+        mass = np.array([body.mass for body in bodies])
+        moment = np.array([body.moment for body in bodies])
+        motile = np.array([hasattr(body, "thrust") for body in bodies])
+
+        # rotate impulses to world coordinates
+        cos = np.cos(angle)
+        sin = np.sin(angle)
+        velocity[:, 0] += (impulses[:, 0] * cos - impulses[:, 1] * sin) / mass
+        velocity[:, 1] += (impulses[:, 0] * sin + impulses[:, 1] * cos) / mass
+        angular_velocity += angular_impulses + np.where(motile, torque, 0.0)
 
-    def apply_viscous_force(self, body):
         # dampen velocity
-        body.velocity = (
-            body.velocity * self.damping + (body.force / body.mass) * self.physics_dt
+        velocity = velocity * self.damping + (force / mass[:, None]) * self.physics_dt
+        angular_velocity = (
+            angular_velocity * self.angular_damping
+            + (torque / moment) * self.physics_dt
         )
 
-        # dampen angular velocity
-        body.angular_velocity = (
-            body.angular_velocity * self.angular_damping
-            + (body.torque / body.moment) * self.physics_dt
-        )
+        for body, body_velocity, body_angular_velocity in zip(
+            bodies, velocity.tolist(), angular_velocity.tolist()
+        ):
+            body.velocity = body_velocity
+            body.angular_velocity = body_angular_velocity
 
     def add_barriers(self, bounds, barriers):
         """Create static barriers"""
@@ -382,6 +421,19 @@ class PymunkMultibody(object):
             "angle": body.angle,
         }
 
+    def get_body_arrays(self):
+        """
+        Returns:
+            Tuple of the IDs of all bodies, their locations (array of shape
+            ``(n_bodies, 2)``), and their angles.
+        """
+        body_ids = list(self.bodies.keys())
+        locations = np.array(
+            [tuple(body.position) for body, _ in self.bodies.values()]
+        ).reshape(-1, 2)
+        angles = [body.angle for body, _ in self.bodies.values()]
+        return body_ids, locations, angles
+
     def get_body_positions(self):
         return {
             body_id: {"boundary": self.get_body_position(body_id)}
@@ -427,5 +479,82 @@ def test_multibody(
         multibody.run(time_step)
 
 
+def test_apply_impulses():
+    agents = {
+        str(agent_idx): {
+            "boundary": {
+                "location": [10 * agent_idx, 10],
+                "angle": agent_idx,
+                "length": 3 + agent_idx,
+                "width": 1,
+                "mass": 1 + agent_idx,
+                "thrust": 1e-2 * agent_idx,
+                "torque": 0.1 * agent_idx,
+            }
+        }
+        for agent_idx in range(4)
+    }
+    config = {
+        "bounds": [50, 50],
+        "jitter_force": 1e-2,
+        "seed": 3,
+        "initial_agents": agents,
+    }
+    vectorized = PymunkMultibody(config)
+    reference = PymunkMultibody(config)
+    for multibody in (vectorized, reference):
+        # updated bodies get thrust and torque
+        multibody.update_bodies(agents)
+        # new body without thrust or torque
+        multibody.add_body_from_center("4", agents["1"])
+        multibody.bodies["2"][0].center_of_gravity = (0.2, -0.1)
+        for idx, (body, _) in enumerate(multibody.bodies.values()):
+            body.velocity = (idx, -idx)
+            body.angular_velocity = 0.1 * idx
+
+    # impulses from one set of random draws
+    bodies = list(vectorized.space.bodies)
+    impulses, angular_impulses = vectorized.get_impulses(bodies, 1)
+    vectorized.apply_impulses(bodies, impulses[0], angular_impulses[0])
+
+    # the same draws applied to each body with pymunk
+    rng = reference.rng
+    bodies = list(reference.space.bodies)
+    on_ends = rng.integers(0, 2, len(bodies)) == 0
+    far_side = rng.integers(0, 2, len(bodies)) == 1
+    along = rng.uniform(0, 1, len(bodies))
+    jitter_forces = rng.normal(0, reference.jitter_force, (len(bodies), 2))
+    for idx, body in enumerate(bodies):
+        width, length = body.dimensions
+        if on_ends[idx]:
+            location = (along[idx] * width, far_side[idx] * length)
+        else:
+            location = (far_side[idx] * width, along[idx] * length)
+        body.apply_impulse_at_local_point(
+            tuple(jitter_forces[idx] * reference.force_scaling), location
+        )
+        if hasattr(body, "thrust"):
+            body.angular_velocity += body.torque
+            body.apply_impulse_at_local_point(
+                (body.thrust * reference.force_scaling, 0), (width / 2, 0)
+            )
+        body.velocity = (
+            body.velocity * reference.damping
+            + (body.force / body.mass) * reference.physics_dt
+        )
+        body.angular_velocity = (
+            body.angular_velocity * reference.angular_damping
+            + (body.torque / body.moment) * reference.physics_dt
+        )
+
+    for body_id in reference.bodies:
+        expected = reference.bodies[body_id][0]
+        actual = vectorized.bodies[body_id][0]
+        np.testing.assert_allclose(actual.velocity, expected.velocity, rtol=1e-12)
+        np.testing.assert_allclose(
+            actual.angular_velocity, expected.angular_velocity, rtol=1e-12
+        )
+
+
 if __name__ == "__main__":
     test_multibody(10)
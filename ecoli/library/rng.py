@@ -0,0 +1,158 @@
+"""
+========================
+Random Number Generators
+========================
+
+Every stochastic process owns a random number generator seeded from its own
+substream of the simulation seed (see
+:py:meth:`~ecoli.library.sim_data.LoadSimData._seedFromName`). By default,
+these are :py:class:`numpy.random.Generator` instances backed by PCG64, which
+are faster to seed and draw from than the legacy
+:py:class:`numpy.random.RandomState` (Mersenne Twister) and whose seeds are
+derived with :py:class:`numpy.random.SeedSequence` so that substreams are
+statistically independent.
+
+Setting the ``legacy_rng`` option of
+:py:class:`~ecoli.library.sim_data.LoadSimData` restores the original
+``RandomState`` streams and seeds, which the migration tests need to
+reproduce the draws made by wcEcoli.
+
+Processes should only call the methods shared by both generator types (e.g.
+``random``, ``choice``, ``multinomial``, ``binomial``, ``poisson``, and
+``normal``) or use the helpers in this module.
+"""
+
+import binascii
+from typing import Optional, Union
+
+import numpy as np
+
+#: Random number generator given to a process
+RNG = Union[np.random.Generator, np.random.RandomState]
+
+
+def spawn_seed(seed: int, name: str) -> int:
+    """
+    Get the seed of the independent substream called ``name`` of ``seed``.
+    Equivalent to :py:meth:`numpy.random.SeedSequence.spawn` except that
+    children are keyed by name instead of by the order in which they are
+    spawned, so adding or removing a process does not change the streams of
+    the others.
+
+    Args:
+        seed: Parent seed (e.g. the simulation seed)
+        name: Name of the substream (e.g. a process or agent name)
+
+    Returns:
+        Seed that can be given to :py:func:`~.make_rng`, below ``2**31``
+    """
+    key = binascii.crc32(name.encode("utf-8"))
+    child = np.random.SeedSequence(seed, spawn_key=(key,))
+    return int(child.generate_state(1)[0] >> 1)
+
+
+def make_rng(seed: int, legacy: bool = False) -> RNG:
+    """
+    Create the random number generator for a process.
+
+    Args:
+        seed: Seed of the generator
+        legacy: Create a :py:class:`numpy.random.RandomState` instead of a
+            PCG64 :py:class:`numpy.random.Generator`
+    """
+    if legacy:
+        return np.random.RandomState(seed=seed)
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed)))
+
+
+def integers(
+    rng: RNG,
+    low: int,
+    high: Optional[int] = None,
+    size: Optional[Union[int, tuple[int, ...]]] = None,
+) -> Union[int, np.ndarray]:
+    """
+    Draw integers from ``[low, high)`` (or ``[0, low)`` if ``high`` is None)
+    with either type of generator, drawing the same values as
+    :py:meth:`numpy.random.RandomState.randint` for legacy generators.
+    """
+    if isinstance(rng, np.random.RandomState):
+        return rng.randint(low, high, size)
+    return rng.integers(low, high, size)
+
+
+def choose_rows(rng: RNG, weights: np.ndarray, n_chosen: np.ndarray) -> np.ndarray:
+    """
+    For each row of ``weights``, choose ``n_chosen`` columns without
+    replacement with probabilities proportional to the weights, like calling
+    ``rng.choice(n_columns, n_chosen[i], replace=False, p=weights[i] /
+    weights[i].sum())`` for every row ``i`` but with the uniform variates for
+    all rows drawn in one batch (exponential keys of Efraimidis and Spirakis,
+    2006). Rows must have at least ``n_chosen`` positive weights.
+
+    Args:
+        rng: Random number generator
+        weights: 2D array of non-negative weights
+        n_chosen: Number of columns to choose for each row
+
+    Returns:
+        Boolean array with the same shape as ``weights`` that is True for
+        chosen columns
+    """
+    with np.errstate(divide="ignore"):
+        keys = np.log(rng.random(weights.shape)) / weights
+    order = np.argsort(-keys, axis=1, kind="stable")
+    chosen = np.zeros(weights.shape, dtype=np.bool_)
+    np.put_along_axis(
+        chosen,
+        order,
+        np.arange(weights.shape[1]) < np.asarray(n_chosen)[:, np.newaxis],
+        axis=1,
+    )
+    return chosen
+
+
+def test_make_rng():
+    # Legacy generators reproduce the original streams
+    legacy = make_rng(5, legacy=True)
+    np.testing.assert_array_equal(
+        legacy.random(5), np.random.RandomState(seed=5).rand(5)
+    )
+    assert integers(make_rng(5, legacy=True), 100) == np.random.RandomState(
+        seed=5
+    ).randint(100)
+
+    rng = make_rng(5)
+    assert isinstance(rng, np.random.Generator)
+    np.testing.assert_array_equal(rng.random(5), make_rng(5).random(5))
+    assert 0 <= integers(rng, 10, 20) < 20
+
+    # Substreams are reproducible, distinct, and independent of one another
+    assert spawn_seed(0, "a") == spawn_seed(0, "a")
+    assert len({spawn_seed(0, "a"), spawn_seed(0, "b"), spawn_seed(1, "a")}) == 3
+    assert 0 <= spawn_seed(2**40, "a") < 2**31
+
+
+def test_choose_rows():
+    rng = make_rng(0)
+    weights = np.array([[0.5, 0.0, 0.3, 0.2], [0.0, 0.0, 0.7, 0.0]])
+    chosen = choose_rows(rng, weights, np.array([2, 1]))
+    np.testing.assert_array_equal(chosen.sum(axis=1), [2, 1])
+    assert not chosen[weights == 0].any()
+    assert chosen[1, 2]
+
+    # Frequency of each column being chosen matches successive sampling
+    # without replacement (e.g. numpy.random.Generator.choice)
+    n_rows = 20000
+    chosen = choose_rows(rng, np.tile(weights[0], (n_rows, 1)), np.ones(n_rows, int))
+    np.testing.assert_allclose(chosen.mean(axis=0), weights[0], atol=0.02)
+    chosen = choose_rows(
+        rng, np.tile(weights[0], (n_rows, 1)), np.full(n_rows, 2)
+    ).mean(axis=0)
+    expected = np.zeros(4)
+    for first, p_first in enumerate(weights[0]):
+        expected[first] += p_first
+        rest = weights[0].copy()
+        rest[first] = 0
+        expected += p_first * rest / rest.sum()
+    np.testing.assert_allclose(chosen, expected, atol=0.02)
@@ -6,7 +6,10 @@ Simulation Helper Functions
 This is a collection of helper functions used thoughout our code base.
 """
 
-from typing import List, Tuple, Dict, Any
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, List, Tuple, Dict, Any, Optional
 
 import numpy as np
 from vivarium.core.store import Store
@@ -277,30 +280,169 @@ def numpy_schema(name: str, emit: bool = True) -> Dict[str, Any]:
     return schema
 
 
+class MissingBulkNamesError(KeyError):
+    """Raised when names cannot be found by :py:func:`~.bulk_name_to_idx`."""
+
+    def __init__(self, missing: List[Any]):
+        self.missing = missing
+        shown = ", ".join(repr(name) for name in missing[:10])
+        if len(missing) > 10:
+            shown += f", ... ({len(missing) - 10} more)"
+        super().__init__(f"{len(missing)} name(s) not found: {shown}")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class BulkIndex:
+    """Sorted copy of an array of names (usually the ``id`` field of the bulk
+    structured array) for finding the indices of many names at once. Use
+    :py:func:`~.get_bulk_index` to share instances between processes.
+
+    Args:
+        bulk_names: List or array of things to search
+    """
+
+    def __init__(self, bulk_names: List | np.ndarray):
+        bulk_names = np.array(bulk_names)
+        self.sorter = np.argsort(bulk_names, kind="stable")
+        self.sorted_names = bulk_names[self.sorter]
+
+    def __len__(self) -> int:
+        return len(self.sorter)
+
+    def lookup(self, names: List | np.ndarray, missing: str = "raise") -> np.ndarray:
+        """
+        Args:
+            names: List or array of things to find
+            missing: What to do with names that are not in ``bulk_names``.
+                ``'raise'`` raises :py:class:`~.MissingBulkNamesError` with
+                all missing names, ``'clip'`` returns arbitrary indices for
+                them (mask with ``bulk_names[indices] == names``).
+
+        Returns:
+            Indices such that ``bulk_names[indices] == names``
+        """
+        names = np.asarray(names)
+        if names.size == 0:
+            return np.zeros(names.shape, dtype=np.intp)
+        pos = np.searchsorted(self.sorted_names, names).clip(max=len(self) - 1)
+        if missing == "raise":
+            found = self.sorted_names[pos] == names
+            if not np.all(found):
+                raise MissingBulkNamesError(names[~found].tolist())
+        elif missing != "clip":
+            raise ValueError(f"Invalid value for missing: {missing}")
+        return self.sorter[pos]
+
+    def lookup_groups(
+        self, *name_groups: List | np.ndarray, missing: str = "raise"
+    ) -> List[np.ndarray]:
+        """
+        Find the indices of several groups of names with a single call to
+        :py:meth:`~.lookup`, reporting all missing names at once.
+
+        Returns:
+            List with indices of each group of names
+        """
+        name_groups = [np.asarray(names).ravel() for names in name_groups]
+        # Empty groups default to float arrays that cannot be concatenated
+        # with names
+        all_names = [names for names in name_groups if len(names) > 0]
+        if not all_names:
+            return [np.zeros(0, dtype=np.intp) for _ in name_groups]
+        indices = self.lookup(np.concatenate(all_names), missing=missing)
+        return np.split(indices, np.cumsum([len(g) for g in name_groups])[:-1])
+
+
+# Bulk indices by the array they were built from. The first level is keyed on
+# the identity of the array that owns the (string) names, which is the same
+# for all processes in a cell. The second level is keyed on the contents of
+# the names, which stay the same after division.
+_BULK_INDEX_BY_OWNER: Dict[int, Tuple[Any, tuple, BulkIndex]] = {}
+_BULK_INDEX_BY_CONTENT: "OrderedDict[tuple, BulkIndex]" = OrderedDict()
+_BULK_INDEX_CACHE_SIZE = 16
+
+
+def _array_owner(array: np.ndarray) -> np.ndarray:
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def get_bulk_index(bulk_names: List | np.ndarray) -> BulkIndex:
+    """Get a shared :py:class:`~.BulkIndex` for ``bulk_names``, only sorting
+    ``bulk_names`` if no index was built for an array with the same contents.
+
+    Args:
+        bulk_names: List or array of things to search
+
+    Returns:
+        Index that can find names in ``bulk_names``
+    """
+    owner_key: Optional[tuple] = None
+    if isinstance(bulk_names, np.ndarray) and bulk_names.dtype.kind in "US":
+        # Names are never modified in place so the identity of the array
+        # that owns them is enough
+        owner = _array_owner(bulk_names)
+        owner_key = (
+            bulk_names.__array_interface__["data"][0],
+            bulk_names.shape,
+            bulk_names.strides,
+            bulk_names.dtype.str,
+        )
+        cached = _BULK_INDEX_BY_OWNER.get(id(owner))
+        if cached is not None and cached[0]() is owner and cached[1] == owner_key:
+            return cached[2]
+
+    names = np.ascontiguousarray(bulk_names)
+    if names.dtype.hasobject:
+        # Bytes of object arrays are pointers, not contents
+        return BulkIndex(names)
+    content_key = (names.dtype.str, names.shape, names.tobytes())
+    index = _BULK_INDEX_BY_CONTENT.get(content_key)
+    if index is None:
+        index = BulkIndex(names)
+        _BULK_INDEX_BY_CONTENT[content_key] = index
+        if len(_BULK_INDEX_BY_CONTENT) > _BULK_INDEX_CACHE_SIZE:
+            _BULK_INDEX_BY_CONTENT.popitem(last=False)
+    else:
+        _BULK_INDEX_BY_CONTENT.move_to_end(content_key)
+
+    if owner_key is not None:
+        owner_id = id(owner)
+        _BULK_INDEX_BY_OWNER[owner_id] = (
+            weakref.ref(owner, lambda _: _BULK_INDEX_BY_OWNER.pop(owner_id, None)),
+            owner_key,
+            index,
+        )
+    return index
+
+
 def bulk_name_to_idx(
-    names: str | (List | np.ndarray), bulk_names: List | np.ndarray
+    names: str | (List | np.ndarray),
+    bulk_names: List | np.ndarray,
+    missing: str = "raise",
 ) -> int | np.ndarray:
     """Primarily used to retrieve indices for groups of bulk molecules (e.g. NTPs)
-    in the first run of a process and cache for future runs
+    in the first run of a process and cache for future runs. ``bulk_names``
+    is only sorted once for all calls with the same names (see
+    :py:func:`~.get_bulk_index`).
 
     Args:
         names: List or array of things to find. Can also be single string.
         bulk_names: List of array of things to search
+        missing: See :py:meth:`~.BulkIndex.lookup`
 
     Returns:
         Index or indices such that ``bulk_names[indices] == names``
     """
+    index = get_bulk_index(bulk_names)
     # Convert from string names to indices in bulk array
     if isinstance(names, np.ndarray) or isinstance(names, list):
-        # Big brain solution from https://stackoverflow.com/a/32191125
-        # One downside: all values in names MUST be in bulk_names
-        # Can mask missing values with bulk_names[return value] == names
-        sorter = np.argsort(bulk_names)
-        return np.take(
-            sorter, np.searchsorted(bulk_names, names, sorter=sorter), mode="clip"
-        )
+        return index.lookup(names, missing=missing)
     else:
-        return np.where(np.array(bulk_names) == names)[0][0]
+        return index.lookup([names], missing=missing)[0]
 
 
 def bulk_numpy_updater(
@@ -642,6 +784,89 @@ def divide_bulk(state: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
 # TODO: Create a store for growth rate noise simulation parameter
 
 
+# Intermediate results shared by the dividers of one cell while a
+# division_cache() context is active
+_DIVISION_CACHE: Optional[Dict[str, Any]] = None
+
+
+@contextmanager
+def division_cache():
+    """Context manager that lets the unique molecule dividers of a cell share
+    how chromosome domains, active RNAPs, and RNAs were divided instead of
+    recomputing them for every unique molecule store. Only use around the
+    division of a single cell (e.g. :py:meth:`vivarium.core.store.Store.divide_value`
+    in :py:class:`~ecoli.processes.engine_process.EngineProcess`) whose
+    unique molecule states are not modified during division.
+    """
+    global _DIVISION_CACHE
+    previous = _DIVISION_CACHE
+    _DIVISION_CACHE = {}
+    try:
+        yield
+    finally:
+        _DIVISION_CACHE = previous
+
+
+def _division_cached(key: str, compute: Callable[[], Any]) -> Any:
+    if _DIVISION_CACHE is None:
+        return compute()
+    if key not in _DIVISION_CACHE:
+        _DIVISION_CACHE[key] = compute()
+    return _DIVISION_CACHE[key]
+
+
+# Largest range of keys to find daughters of with a table (4 MB)
+_MAX_DAUGHTER_TABLE_SIZE = 2**22
+
+
+def _daughter_lookup(
+    keys: np.ndarray, daughters: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sort unique ``keys`` (e.g. domain or unique indexes) and the daughter
+    cell (0 or 1) each key went to for :py:func:`~._find_daughters`."""
+    order = np.argsort(keys, kind="stable")
+    return keys[order], daughters[order]
+
+
+def _find_daughters(
+    values: np.ndarray, lookup: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """Get the daughter cell (0 or 1) that each of ``values`` went to
+    according to a lookup made by :py:func:`~._daughter_lookup`, or -1 for
+    values that did not go to either daughter."""
+    keys, daughters = lookup
+    result = np.full(len(values), -1, dtype=np.int8)
+    if len(keys) == 0 or len(values) == 0:
+        return result
+    # Unique and domain indexes are counters so a table spanning all keys
+    # is usually small and much faster to index than a binary search
+    low = int(keys[0])
+    span = int(keys[-1]) - low + 1
+    if span <= _MAX_DAUGHTER_TABLE_SIZE:
+        table = np.full(span, -1, dtype=np.int8)
+        table[keys - low] = daughters
+        in_range = (values >= low) & (values < low + span)
+        result[in_range] = table[values[in_range] - low]
+        return result
+    pos = np.searchsorted(keys, values).clip(max=len(keys) - 1)
+    found = keys[pos] == values
+    result[found] = daughters[pos[found]]
+    return result
+
+
+def _split_by_daughter(
+    values: np.ndarray, daughters: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split the active molecules in ``values`` by the daughter cell (0 or 1)
+    each one goes to, dropping molecules that go to neither."""
+    active_rows = np.flatnonzero(values["_entryState"])
+    # np.take copies rows of structured arrays much faster than indexing
+    return (
+        np.take(values, active_rows[daughters == 0]),
+        np.take(values, active_rows[daughters == 1]),
+    )
+
+
 def divide_ribosomes_by_RNA(
     values: MetadataArray, state: Dict[str, Any]
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -664,16 +889,14 @@ def divide_ribosomes_by_RNA(
     n_molecules = len(mRNA_index)
     if n_molecules > 0:
         # Divide ribosomes based on their mRNA index
-        d1_rnas, d2_rnas = divide_RNAs_by_domain(state["RNA"], state)
-        d1_bool = np.isin(mRNA_index, d1_rnas["unique_index"])
-        d2_bool = np.isin(mRNA_index, d2_rnas["unique_index"])
+        daughters = _find_daughters(mRNA_index, _RNA_lookup(state))
 
         # Binomially divide indexes of mRNAs that are degraded but still
         # has bound ribosomes. This happens because mRNA degradation does
         # not abort ongoing translation of the mRNA
-        degraded_mRNA_indexes = np.unique(
-            mRNA_index[np.logical_not(np.logical_or(d1_bool, d2_bool))]
-        )
+        lost_ribosomes = daughters == -1
+        lost_mRNA_index = mRNA_index[lost_ribosomes]
+        degraded_mRNA_indexes = np.unique(lost_mRNA_index)
         n_degraded_mRNA = len(degraded_mRNA_indexes)
 
         if n_degraded_mRNA > 0:
@@ -683,25 +906,13 @@ def divide_ribosomes_by_RNA(
             degraded_mRNA_indexes_d1 = random_state.choice(
                 degraded_mRNA_indexes, size=n_degraded_mRNA_d1, replace=False
             )
-            degraded_mRNA_indexes_d2 = np.setdiff1d(
-                degraded_mRNA_indexes, degraded_mRNA_indexes_d1
-            )
 
             # Divide "lost" ribosomes based on how these mRNAs were divided
-            lost_ribosomes_d1 = np.isin(mRNA_index, degraded_mRNA_indexes_d1)
-            lost_ribosomes_d2 = np.isin(mRNA_index, degraded_mRNA_indexes_d2)
-
-            d1_bool[lost_ribosomes_d1] = True
-            d2_bool[lost_ribosomes_d2] = True
-
-        n_d1 = np.count_nonzero(d1_bool)
-        n_d2 = np.count_nonzero(d2_bool)
-
-        assert n_molecules == n_d1 + n_d2
-        assert np.count_nonzero(np.logical_and(d1_bool, d2_bool)) == 0
+            daughters[lost_ribosomes] = np.where(
+                np.isin(lost_mRNA_index, degraded_mRNA_indexes_d1), 0, 1
+            )
 
-        ribosomes = values[values["_entryState"].view(np.bool_)]
-        return ribosomes[d1_bool], ribosomes[d2_bool]
+        return _split_by_daughter(values, daughters)
 
     return np.zeros(0, dtype=values.dtype), np.zeros(0, dtype=values.dtype)
 
@@ -719,6 +930,10 @@ def divide_domains(state: dict[str, MetadataArray]) -> dict[str, np.ndarray]:
         List of two structured Numpy arrays, each containing the chromosome
         domain unique molecule state for a daughter cell.
     """
+    return _division_cached("domains", lambda: _divide_domains(state))
+
+
+def _divide_domains(state: dict[str, MetadataArray]) -> dict[str, np.ndarray]:
     (domain_index_full_chroms,) = attrs(state["full_chromosome"], ["domain_index"])
     domain_index_domains, child_domains = attrs(
         state["chromosome_domain"], ["domain_index", "child_domains"]
@@ -748,6 +963,24 @@ def divide_domains(state: dict[str, MetadataArray]) -> dict[str, np.ndarray]:
     }
 
 
+def _domain_lookup(state: Dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Daughter cell that each chromosome domain goes to (see
+    :py:func:`~._find_daughters`)."""
+
+    def compute():
+        domain_division = divide_domains(state)
+        d1_domains = domain_division["d1_all_domain_indexes"]
+        d2_domains = domain_division["d2_all_domain_indexes"]
+        return _daughter_lookup(
+            np.concatenate([d1_domains, d2_domains]).astype(np.int64),
+            np.repeat(
+                np.array([0, 1], dtype=np.int8), [len(d1_domains), len(d2_domains)]
+            ),
+        )
+
+    return _division_cached("domain_lookup", compute)
+
+
 def divide_by_domain(
     values: np.ndarray, state: Dict[str, Any]
 ) -> tuple[np.ndarray, np.ndarray]:
@@ -766,16 +999,14 @@ def divide_by_domain(
         List of two structured Numpy arrays, each containing the
         unique molecule state of a daughter cell.
     """
-    domain_division = divide_domains(state)
-    values = values[values["_entryState"].view(np.bool_)]
-    d1_bool = np.isin(values["domain_index"], domain_division["d1_all_domain_indexes"])
-    d2_bool = np.isin(values["domain_index"], domain_division["d2_all_domain_indexes"])
+    (domain_index,) = attrs(values, ["domain_index"])
+    daughters = _find_daughters(domain_index, _domain_lookup(state))
     # Some chromosome domains may be left behind because
     # they no longer exist after chromosome division. Skip
     # this assert when checking division of domains
     if "child_domains" not in values.dtype.names:
-        assert d1_bool.sum() + d2_bool.sum() == len(values)
-    return values[d1_bool], values[d2_bool]
+        assert np.all(daughters >= 0)
+    return _split_by_daughter(values, daughters)
 
 
 def divide_RNAs_by_domain(
@@ -795,68 +1026,63 @@ def divide_RNAs_by_domain(
         List of two structured Numpy arrays, each containing the RNA
         unique molecule state of a daughter cell.
     """
+    daughters = _division_cached("RNAs", lambda: _divide_RNAs(values, state))
+    if len(daughters) > 0:
+        return _split_by_daughter(values, daughters)
+
+    return np.zeros(0, dtype=values.dtype), np.zeros(0, dtype=values.dtype)
+
+
+def _divide_RNAs(values: MetadataArray, state: Dict[str, Any]) -> np.ndarray:
+    """Get the daughter cell (0 or 1) that each active RNA goes to."""
     is_full_transcript, RNAP_index = attrs(values, ["is_full_transcript", "RNAP_index"])
 
     n_molecules = len(is_full_transcript)
+    daughters = np.full(n_molecules, -1, dtype=np.int8)
 
     if n_molecules > 0:
-        # Figure out which RNAPs went to each daughter cell
-        domain_division = divide_domains(state)
-        rnaps = state["active_RNAP"]
-        rnaps = rnaps[rnaps["_entryState"].view(np.bool_)]
-        d1_rnap_bool = np.isin(
-            rnaps["domain_index"], domain_division["d1_all_domain_indexes"]
-        )
-        d2_rnap_bool = np.isin(
-            rnaps["domain_index"], domain_division["d2_all_domain_indexes"]
-        )
-        d1_rnap_indexes = rnaps["unique_index"][d1_rnap_bool]
-        d2_rnap_indexes = rnaps["unique_index"][d2_rnap_bool]
-
-        d1_bool = np.zeros(n_molecules, dtype=np.bool_)
-        d2_bool = np.zeros(n_molecules, dtype=np.bool_)
-
         # Divide full transcripts binomially
         full_transcript_indexes = np.where(is_full_transcript)[0]
         if len(full_transcript_indexes) > 0:
             # TODO: Random state/seed in store?
             random_state = np.random.RandomState(seed=n_molecules)
-            n_full_d1 = random_state.binomial(
-                np.count_nonzero(is_full_transcript), p=0.5
-            )
+            n_full_d1 = random_state.binomial(len(full_transcript_indexes), p=0.5)
             full_d1_indexes = random_state.choice(
                 full_transcript_indexes, size=n_full_d1, replace=False
             )
-            full_d2_indexes = np.setdiff1d(full_transcript_indexes, full_d1_indexes)
-
-            d1_bool[full_d1_indexes] = True
-            d2_bool[full_d2_indexes] = True
+            daughters[full_transcript_indexes] = 1
+            daughters[full_d1_indexes] = 0
 
         # Divide partial transcripts based on how their associated
-        # RNAPs were divided
-        partial_transcript_indexes = np.where(np.logical_not(is_full_transcript))[0]
-        RNAP_index_partial_transcripts = RNAP_index[partial_transcript_indexes]
+        # RNAPs were divided (which follow the chromosome domains)
+        RNAP_unique_index, RNAP_domain_index = attrs(
+            state["active_RNAP"], ["unique_index", "domain_index"]
+        )
+        RNAP_lookup = _daughter_lookup(
+            RNAP_unique_index,
+            _find_daughters(RNAP_domain_index, _domain_lookup(state)),
+        )
+        is_partial_transcript = np.logical_not(is_full_transcript)
+        daughters[is_partial_transcript] = _find_daughters(
+            RNAP_index[is_partial_transcript], RNAP_lookup
+        )
 
-        partial_d1_indexes = partial_transcript_indexes[
-            np.isin(RNAP_index_partial_transcripts, d1_rnap_indexes)
-        ]
-        partial_d2_indexes = partial_transcript_indexes[
-            np.isin(RNAP_index_partial_transcripts, d2_rnap_indexes)
-        ]
+        assert np.all(daughters >= 0)
 
-        d1_bool[partial_d1_indexes] = True
-        d2_bool[partial_d2_indexes] = True
+    return daughters
 
-        n_d1 = np.count_nonzero(d1_bool)
-        n_d2 = np.count_nonzero(d2_bool)
 
-        assert n_molecules == n_d1 + n_d2
-        assert np.count_nonzero(np.logical_and(d1_bool, d2_bool)) == 0
+def _RNA_lookup(state: Dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Daughter cell that each RNA goes to by unique index (see
+    :py:func:`~._find_daughters`)."""
 
-        rnas = values[values["_entryState"].view(np.bool_)]
-        return rnas[d1_bool], rnas[d2_bool]
+    def compute():
+        rnas = state["RNA"]
+        daughters = _division_cached("RNAs", lambda: _divide_RNAs(rnas, state))
+        (unique_index,) = attrs(rnas, ["unique_index"])
+        return _daughter_lookup(unique_index, daughters)
 
-    return np.zeros(0, dtype=values.dtype), np.zeros(0, dtype=values.dtype)
+    return _division_cached("RNA_lookup", compute)
 
 
 def empty_dict_divider(values):
@@ -955,3 +1181,113 @@ def get_descendent_domains(root_domains, domain_index, child_domains, place_hold
             ]
         )
     )
+
+
+def test_bulk_name_to_idx():
+    bulk = np.zeros(5, dtype=[("id", "U10"), ("count", int)])
+    bulk["id"] = ["D", "B", "A", "C", "B"]
+    bulk_ids = bulk["id"]
+    assert bulk_name_to_idx("C", bulk_ids) == 3
+    # First occurrence of duplicates like np.where
+    assert bulk_name_to_idx("B", bulk_ids) == 1
+    np.testing.assert_array_equal(
+        bulk_name_to_idx(["A", "D", "B"], bulk_ids), [2, 0, 1]
+    )
+    np.testing.assert_array_equal(
+        bulk_name_to_idx(np.array([["A", "C"], ["C", "D"]]), bulk_ids),
+        [[2, 3], [3, 0]],
+    )
+    assert len(bulk_name_to_idx([], bulk_ids)) == 0
+
+    # Views of the same array and arrays with the same names share an index
+    index = get_bulk_index(bulk_ids)
+    assert get_bulk_index(bulk["id"]) is index
+    assert get_bulk_index(bulk["id"].copy()) is index
+    assert get_bulk_index(bulk_ids[::-1]) is not index
+
+    try:
+        bulk_name_to_idx(["A", "E", "F", "B"], bulk_ids)
+    except MissingBulkNamesError as e:
+        assert e.missing == ["E", "F"]
+    else:
+        raise AssertionError("Missing names were not reported.")
+    assert len(bulk_name_to_idx(["E", "A"], bulk_ids, missing="clip")) == 2
+
+    groups = index.lookup_groups(["A"], [], np.array(["C", "B"]))
+    assert [group.tolist() for group in groups] == [[2], [], [3, 1]]
+
+
+def test_divide_unique_molecules():
+    def unique_array(**fields):
+        # Start with an inactive row to check that it is not divided
+        n = len(fields["unique_index"])
+        dtype = [("_entryState", np.int8)] + [
+            (name, np.asarray(values).dtype, np.shape(values)[1:])
+            for name, values in fields.items()
+        ]
+        array = np.zeros(n + 1, dtype=dtype)
+        array["_entryState"][1:] = 1
+        for name, values in fields.items():
+            array[name][1:] = values
+        return MetadataArray(array, n)
+
+    # Domain 0 replicated into full chromosomes with domains 1 and 2, and
+    # domain 1 replicated again into domains 3 and 4
+    state = {
+        "full_chromosome": unique_array(unique_index=[0, 1], domain_index=[1, 2]),
+        "chromosome_domain": unique_array(
+            unique_index=np.arange(5),
+            domain_index=np.arange(5),
+            child_domains=[[1, 2], [3, 4], [-1, -1], [-1, -1], [-1, -1]],
+        ),
+        "active_RNAP": unique_array(unique_index=[10, 11, 12], domain_index=[3, 2, 4]),
+        "RNA": unique_array(
+            unique_index=np.arange(20, 26),
+            is_full_transcript=[False, False, False, True, True, True],
+            RNAP_index=[10, 11, 12, -1, -1, -1],
+        ),
+        # Ribosomes 35 and 36 are bound to a degraded mRNA
+        "active_ribosome": unique_array(
+            unique_index=np.arange(30, 37), mRNA_index=[20, 21, 23, 24, 25, 99, 99]
+        ),
+    }
+
+    def divide():
+        return {
+            "chromosome_domain": divide_by_domain(state["chromosome_domain"], state),
+            "active_RNAP": divide_by_domain(state["active_RNAP"], state),
+            "RNA": divide_RNAs_by_domain(state["RNA"], state),
+            "active_ribosome": divide_ribosomes_by_RNA(state["active_ribosome"], state),
+        }
+
+    uncached = divide()
+    with division_cache():
+        cached = divide()
+    for name, daughters in uncached.items():
+        for daughter, cached_daughter in zip(daughters, cached[name]):
+            np.testing.assert_array_equal(daughter, cached_daughter)
+            assert daughter["_entryState"].all()
+
+    d1, d2 = uncached["chromosome_domain"]
+    assert d1["domain_index"].tolist() == [1, 3, 4]
+    assert d2["domain_index"].tolist() == [2]
+    d1, d2 = uncached["active_RNAP"]
+    assert d1["unique_index"].tolist() == [10, 12]
+    assert d2["unique_index"].tolist() == [11]
+
+    # Partial transcripts follow their RNAPs
+    rnas = uncached["RNA"]
+    assert {20, 22} <= set(rnas[0]["unique_index"])
+    assert 21 in rnas[1]["unique_index"]
+    assert len(rnas[0]) + len(rnas[1]) == 6
+
+    # Ribosomes follow their mRNAs and those on the same degraded mRNA
+    # go to the same daughter
+    ribosomes = uncached["active_ribosome"]
+    assert len(ribosomes[0]) + len(ribosomes[1]) == 7
+    for rna_daughter, ribosome_daughter in zip(rnas, ribosomes):
+        mRNA_index = ribosome_daughter["mRNA_index"]
+        assert np.all(
+            np.isin(mRNA_index, rna_daughter["unique_index"]) | (mRNA_index == 99)
+        )
+    assert np.count_nonzero(ribosomes[0]["mRNA_index"] == 99) in (0, 2)
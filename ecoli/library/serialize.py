@@ -1,3 +1,4 @@
+import json
 import numpy as np
 import orjson
 import re
@@ -86,6 +87,33 @@ class NumpyRandomStateSerializer(Serializer):
         return rng
 
 
+class NumpyGeneratorSerializer(Serializer):
+    def __init__(self):
+        super().__init__()
+        self.regex_for_serialized = re.compile("!GeneratorSerializer\\[(.*)\\]")
+
+    python_type = np.random.Generator
+
+    def serialize(self, value):
+        # State of PCG64 has 128-bit integers that orjson cannot handle
+        rng_state = json.dumps(value.bit_generator.state)
+        return f"!GeneratorSerializer[{rng_state}]"
+
+    def can_deserialize(self, data):
+        if not isinstance(data, str):
+            return False
+        return bool(self.regex_for_serialized.fullmatch(data))
+
+    def deserialize(self, data):
+        matched_regex = self.regex_for_serialized.fullmatch(data)
+        if matched_regex:
+            data = matched_regex.group(1)
+        data = json.loads(data)
+        bit_generator = getattr(np.random, data["bit_generator"])()
+        bit_generator.state = data
+        return np.random.Generator(bit_generator)
+
+
 class MethodSerializer(Serializer):
     """Serializer for bound method objects."""
 
@@ -1,12 +1,14 @@
 import os
 import re
 import binascii
+import hashlib
+import multiprocessing as mp
 from itertools import chain
 import numpy as np
 import pickle
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Iterable, Iterator, Optional, TYPE_CHECKING
 from vivarium.library.units import units as vivunits
-from wholecell.utils import units
+from wholecell.utils import parallelization, units
 from wholecell.utils.unit_struct_array import UnitStructArray
 from wholecell.utils.fitting import normalize
 from wholecell.utils.filepath import ROOT_PATH
@@ -14,7 +16,11 @@ from wholecell.utils.filepath import ROOT_PATH
 from ecoli.analysis.antibiotics_colony import DE_GENES
 from ecoli.processes.polypeptide_elongation import MICROMOLAR_UNITS
 from ecoli.library.parameters import param_store
+from ecoli.library.rng import spawn_seed
+from ecoli.library import initial_conditions
 from ecoli.library.initial_conditions import (
+    INITIAL_STATE_CACHE_VERSION,
+    InitialStateCache,
     calculate_cell_mass,
     initialize_bulk_counts,
     initialize_trna_charging,
@@ -67,6 +73,8 @@ class LoadSimData:
         update_time_step_freq: int = 5,
         max_time_step: int = MAX_TIME_STEP,
         emit_unique: bool = False,
+        initial_state_cache_dir: Optional[str] = None,
+        legacy_rng: bool = False,
         **kwargs,
     ):
         """
@@ -144,8 +152,21 @@ class LoadSimData:
             disable_ppgpp_elongation_inhibition: Turn off ppGpp-mediated
                 inhibition in :py:class:`~ecoli.processes.polypeptide_elongation.PolypeptideElongation`
                 when ``trna_charging`` is ``True``
+            initial_state_cache_dir: If given, the seed-independent values
+                used to generate initial states (see
+                :py:class:`~ecoli.library.initial_conditions.InitialStateCache`)
+                are saved to and loaded from this directory, keyed by the
+                contents of ``sim_data_path`` and the relevant options. Not
+                used if sim_data is modified after loading (e.g. by
+                ``mar_regulon``).
+            legacy_rng: Give processes :py:class:`numpy.random.RandomState`
+                instances seeded as in wcEcoli instead of PCG64
+                :py:class:`numpy.random.Generator` substreams of ``seed``
+                (see :py:mod:`ecoli.library.rng`). Needed to reproduce wcEcoli
+                in the migration tests.
         """
         self.seed = seed
+        self.legacy_rng = legacy_rng
         self.total_time = total_time
         self.random_state = np.random.RandomState(seed=seed)
         # Iterable of tuples with the format (time, media_id)
@@ -173,6 +194,9 @@ class LoadSimData:
         self.disable_ppgpp_elongation_inhibition = disable_ppgpp_elongation_inhibition
         self.recycle_stalled_elongation = recycle_stalled_elongation
         self.emit_unique = emit_unique
+        self.sim_data_path = sim_data_path
+        self.initial_state_cache_dir = initial_state_cache_dir
+        self._initial_state_cache: Optional[InitialStateCache] = None
 
         # NEW to vivarium-ecoli: Whether to lump miscRNA with mRNAs
         # when calculating degradation
@@ -191,6 +215,9 @@ class LoadSimData:
             for submass, idx in self.sim_data.submass_name_to_index.items()
         }
 
+        # Whether sim_data differs from the contents of sim_data_path
+        self.sim_data_modified = False
+
         # Logic to handle internal shifts
         if "agent_id" in kwargs and hasattr(self.sim_data, "internal_shift_dict"):
             generation = len(kwargs["agent_id"])
@@ -205,6 +232,7 @@ class LoadSimData:
                     func_params = shift_params
             if func_to_apply is not None:
                 func_to_apply(self.sim_data, *func_params)
+                self.sim_data_modified = True
 
         # NEW to vivarium-ecoli
         # Changes gene expression upon tetracycline exposure
@@ -212,6 +240,7 @@ class LoadSimData:
         # that are part of the same operon but have different changes
         # in expression under tetracycline exposure (e.g. marRAB)
         if mar_regulon:
+            self.sim_data_modified = True
             # Define aliases to reduce code verbosity
             treg_alias = self.sim_data.process.transcription_regulation
             bulk_mol_alias = self.sim_data.internal_state.bulk_molecules
@@ -355,6 +384,7 @@ class LoadSimData:
         if isinstance(process_configs, dict):
             rnai_data = process_configs.get("ecoli-rna-interference", False)
             if rnai_data:
+                self.sim_data_modified = True
                 # Define aliases to reduce code verbosity
                 ts_alias = self.sim_data.process.transcription
                 bulk_mol_alias = self.sim_data.internal_state.bulk_molecules
@@ -500,6 +530,7 @@ class LoadSimData:
         # NEW to vivarium-ecoli
         # Add ampicillin to bulk molecules
         if amp_lysis:
+            self.sim_data_modified = True
             bulk_mol_alias = self.sim_data.internal_state.bulk_molecules
             # Add mass data for ampicillin and hydrolyzed ampicillin
             bulk_data = bulk_mol_alias.bulk_data.fullArray()
@@ -555,7 +586,9 @@ class LoadSimData:
         return [int(np.where(rna_ids == name)[0][0]) for name in names]
 
     def _seedFromName(self, name):
-        return binascii.crc32(name.encode("utf-8"), self.seed) & 0xFFFFFFFF
+        if self.legacy_rng:
+            return binascii.crc32(name.encode("utf-8"), self.seed) & 0xFFFFFFFF
+        return spawn_seed(self.seed, name)
 
     def get_config_by_name(self, name, time_step=1):
         name_config_mapping = {
@@ -653,6 +686,7 @@ class LoadSimData:
             "ppi": [self.sim_data.molecule_ids.ppi],
             # random state
             "seed": self._seedFromName("ChromosomeReplication"),
+            "legacy_rng": self.legacy_rng,
             "submass_indices": self.submass_indices,
         }
 
@@ -678,6 +712,7 @@ class LoadSimData:
                 "mass"
             ],
             "seed": self._seedFromName("TfBinding"),
+            "legacy_rng": self.legacy_rng,
             "submass_indices": self.submass_indices,
             "emit_unique": self.emit_unique,
         }
@@ -738,6 +773,7 @@ class LoadSimData:
             "attenuation_adjustments": self.sim_data.process.transcription.attenuation_basal_prob_adjustments,
             # random seed
             "seed": self._seedFromName("TranscriptInitiation"),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
 
@@ -775,6 +811,7 @@ class LoadSimData:
             "recycle_stalled_elongation": self.recycle_stalled_elongation,
             # random seed
             "seed": self._seedFromName("TranscriptElongation"),
+            "legacy_rng": self.legacy_rng,
             "submass_indices": self.submass_indices,
             "emit_unique": self.emit_unique,
         }
@@ -891,6 +928,7 @@ class LoadSimData:
                 )
             ),
             "seed": self._seedFromName("RnaDegradation"),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
 
@@ -927,6 +965,7 @@ class LoadSimData:
             "ribosome30S": self.sim_data.molecule_ids.s30_full_complex,
             "ribosome50S": self.sim_data.molecule_ids.s50_full_complex,
             "seed": self._seedFromName("PolypeptideInitiation"),
+            "legacy_rng": self.legacy_rng,
             "monomer_ids": self.sim_data.process.translation.monomer_data["id"],
             "emit_unique": self.emit_unique,
         }
@@ -1044,6 +1083,7 @@ class LoadSimData:
             "get_pathway_enzyme_counts_per_aa": metabolism.get_pathway_enzyme_counts_per_aa,
             "import_constraint_threshold": self.sim_data.external_state.import_constraint_threshold,
             "seed": self._seedFromName("PolypeptideElongation"),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
 
@@ -1058,6 +1098,7 @@ class LoadSimData:
             "rates": self.sim_data.process.complexation.rates,
             "molecule_names": self.sim_data.process.complexation.molecule_names,
             "seed": self._seedFromName("Complexation"),
+            "legacy_rng": self.legacy_rng,
             "reaction_ids": self.sim_data.process.complexation.ids_reactions,
             "complex_ids": self.sim_data.process.complexation.ids_complexes,
             "emit_unique": self.emit_unique,
@@ -1077,6 +1118,7 @@ class LoadSimData:
             "moleculesToNextTimeStep": self.sim_data.process.two_component_system.molecules_to_next_time_step,
             "moleculeNames": self.sim_data.process.two_component_system.molecule_names,
             "seed": self._seedFromName("TwoComponentSystem"),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
 
@@ -1097,6 +1139,7 @@ class LoadSimData:
             "fluxesAndMoleculesToSS": self.sim_data.process.equilibrium.fluxes_and_molecules_to_SS,
             "moleculeNames": self.sim_data.process.equilibrium.molecule_names,
             "seed": self._seedFromName("Equilibrium"),
+            "legacy_rng": self.legacy_rng,
             "complex_ids": self.sim_data.process.equilibrium.ids_complexes,
             "reaction_ids": self.sim_data.process.equilibrium.rxn_ids,
             "emit_unique": self.emit_unique,
@@ -1120,6 +1163,7 @@ class LoadSimData:
                 "length"
             ].asNumber(),
             "seed": self._seedFromName("ProteinDegradation"),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
 
@@ -1309,6 +1353,7 @@ class LoadSimData:
                 self.sim_data.amino_acid_code_to_id_ordered.values()
             ),
             "seed": self._seedFromName("Metabolism"),
+            "legacy_rng": self.legacy_rng,
             "linked_metabolites": metabolism.concentration_updates.linked_metabolites,
             "aa_exchange_names": aa_exchange_names,
             "removed_aa_uptake": np.array(
@@ -1500,6 +1545,7 @@ class LoadSimData:
             ],
             # Allocator is built into BulkMolecules container in wcEcoli
             "seed": self._seedFromName("BulkMolecules"),
+            "legacy_rng": self.legacy_rng,
             "process_names": process_names,
             "custom_priorities": {
                 "ecoli-rna-degradation": 10,
@@ -1568,6 +1614,7 @@ class LoadSimData:
             "ribosome30S": self.sim_data.molecule_ids.s30_full_complex,
             "ribosome50S": self.sim_data.molecule_ids.s50_full_complex,
             "seed": self.random_state.randint(RAND_MAX),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
         return rna_interference_config
@@ -1582,6 +1629,7 @@ class LoadSimData:
             "trna_ids": rna_ids[is_trna],
             # Ensure that a new seed is set upon division
             "seed": self.random_state.randint(RAND_MAX),
+            "legacy_rng": self.legacy_rng,
             "emit_unique": self.emit_unique,
         }
         return tetracycline_ribosome_equilibrium_config
@@ -1771,15 +1819,12 @@ class LoadSimData:
             },
         }
 
-    def generate_initial_state(self):
+    def _initial_media(self) -> tuple[str, dict[str, float], dict[str, Any]]:
         """
-        Calculate the initial conditions for a new cell without inherited state
-        from a parent cell.
+        Returns:
+            Tuple of the initial media ID, the concentrations of molecules in
+            that media, and the exchange data calculated from them
         """
-        mass_coeff = 1.0
-        if self.initial_state_gaussian:
-            mass_coeff = self.random_state.normal(loc=1.0, scale=0.1)
-
         # if current_timeline_id is specified by a variant in sim_data,
         # look it up in saved_timelines.
         if self.sim_data.external_state.current_timeline_id:
@@ -1792,6 +1837,154 @@ class LoadSimData:
         current_concentrations = self.sim_data.external_state.saved_media[media_id]
         exch_from_conc = self.sim_data.external_state.exchange_data_from_concentrations
         exchange_data = exch_from_conc(current_concentrations)
+        return media_id, current_concentrations, exchange_data
+
+    def _initial_state_cache_path(self, media_id, import_molecules) -> str:
+        """
+        Path of the saved :py:class:`~ecoli.library.initial_conditions.InitialStateCache`
+        for the current sim_data and options in ``initial_state_cache_dir``.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    INITIAL_STATE_CACHE_VERSION,
+                    self.sim_data.condition,
+                    media_id,
+                    sorted(import_molecules),
+                    self.ppgpp_regulation,
+                    self.trna_attenuation,
+                )
+            ).encode("utf-8")
+        )
+        # Stale caches are never loaded if the code that fills them changes
+        for path in (self.sim_data_path, initial_conditions.__file__):
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hasher.update(chunk)
+        return os.path.join(
+            self.initial_state_cache_dir,
+            f"initial_state_{hasher.hexdigest()[:16]}.pkl",
+        )
+
+    def get_initial_state_cache(self) -> InitialStateCache:
+        """
+        Get the seed-independent values used to generate initial states.
+        If ``initial_state_cache_dir`` is set, they are loaded from there if
+        a matching cache was saved, otherwise they are computed all at once
+        and saved for other simulations to reuse.
+        """
+        if self._initial_state_cache is not None:
+            return self._initial_state_cache
+        cache_path = None
+        if self.initial_state_cache_dir and not self.sim_data_modified:
+            media_id, _, exchange_data = self._initial_media()
+            import_molecules = set(
+                exchange_data["importUnconstrainedExchangeMolecules"]
+            ) | set(exchange_data["importConstrainedExchangeMolecules"])
+            cache_path = self._initial_state_cache_path(media_id, import_molecules)
+            if os.path.exists(cache_path):
+                self._initial_state_cache = InitialStateCache.load(
+                    cache_path, self.sim_data
+                )
+                return self._initial_state_cache
+        cache = InitialStateCache(self.sim_data)
+        if cache_path is not None:
+            cache.precompute(
+                media_id,
+                import_molecules,
+                self.ppgpp_regulation,
+                self.trna_attenuation,
+            )
+            os.makedirs(self.initial_state_cache_dir, exist_ok=True)
+            cache.save(cache_path)
+        self._initial_state_cache = cache
+        return cache
+
+    def generate_initial_state(self):
+        """
+        Calculate the initial conditions for a new cell without inherited state
+        from a parent cell.
+        """
+        bulk_state, unique_molecules = self._generate_cell_state(
+            self.random_state, self.seed
+        )
+        return self._complete_initial_state(bulk_state, unique_molecules)
+
+    def generate_initial_states(
+        self, seeds: Iterable[int], n_workers: int = 1
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Calculate the initial conditions for new cells with many seeds,
+        sharing all seed-independent work (see
+        :py:class:`~ecoli.library.initial_conditions.InitialStateCache`).
+        The state generated for each seed is the same as that returned by
+        :py:meth:`~.generate_initial_state` for an instance of this class
+        with that seed and otherwise identical options (assuming no random
+        numbers were drawn from its ``random_state`` beforehand).
+
+        States are yielded one at a time in the order of ``seeds`` so they
+        can be saved or used without keeping all of them in memory.
+
+        Args:
+            seeds: Seeds to generate initial states for
+            n_workers: Number of processes used to generate states in
+                parallel. Workers are forked from the current process so
+                they share sim_data and the precomputed cache.
+
+        Returns:
+            Iterator of tuples of seed and initial state
+        """
+        media_id, _, exchange_data = self._initial_media()
+        import_molecules = set(
+            exchange_data["importUnconstrainedExchangeMolecules"]
+        ) | set(exchange_data["importConstrainedExchangeMolecules"])
+        # Fill the cache once so forked workers do not have to
+        self.get_initial_state_cache().precompute(
+            media_id, import_molecules, self.ppgpp_regulation, self.trna_attenuation
+        )
+
+        if parallelization.cpus(n_workers) == 1:
+            for seed in seeds:
+                bulk_state, unique_molecules = self._generate_cell_state(
+                    np.random.RandomState(seed=seed), seed
+                )
+                yield seed, self._complete_initial_state(bulk_state, unique_molecules)
+            return
+
+        with mp.get_context("fork").Pool(
+            parallelization.cpus(n_workers),
+            initializer=_set_worker_sim_data,
+            initargs=(self,),
+        ) as pool:
+            for seed, bulk_state, unique_molecules, next_indices in pool.imap(
+                _generate_cell_state_in_worker, seeds
+            ):
+                # Array subclass attributes do not survive pickling
+                for name, next_index in next_indices.items():
+                    unique_molecules[name].metadata = next_index
+                yield seed, self._complete_initial_state(bulk_state, unique_molecules)
+
+    def _generate_cell_state(
+        self, random_state: np.random.RandomState, seed: int
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Calculate the bulk and unique molecule states of a new cell.
+
+        Args:
+            random_state: Random number generator used for all sampling
+            seed: Seed used to generate unique molecule IDs
+
+        Returns:
+            Tuple of bulk molecule structured array and mapping of unique
+            molecule names to structured arrays
+        """
+        cache = self.get_initial_state_cache()
+        mass_coeff = 1.0
+        if self.initial_state_gaussian:
+            mass_coeff = random_state.normal(loc=1.0, scale=0.1)
+
+        media_id, _, exchange_data = self._initial_media()
         unconstrained = exchange_data["importUnconstrainedExchangeMolecules"]
         constrained = exchange_data["importConstrainedExchangeMolecules"]
         import_molecules = set(unconstrained) | set(constrained)
@@ -1800,25 +1993,27 @@ class LoadSimData:
             self.sim_data,
             media_id,
             import_molecules,
-            self.random_state,
+            random_state,
             mass_coeff,
             self.ppgpp_regulation,
             self.trna_attenuation,
+            cache=cache,
         )
         cell_mass = calculate_cell_mass(bulk_state, {}, self.sim_data)
-        # Create new PRNG for unique ID generation so self.random_state
+        # Create new PRNG for unique ID generation so random_state
         # can be used to faithfully replicate wcEcoli behavior
-        unique_id_rng = np.random.RandomState(seed=self.seed + 100)
+        unique_id_rng = np.random.RandomState(seed=seed + 100)
         unique_molecules = initialize_unique_molecules(
             bulk_state,
             self.sim_data,
             cell_mass,
-            self.random_state,
+            random_state,
             unique_id_rng,
             self.superhelical_density,
             self.ppgpp_regulation,
             self.trna_attenuation,
             self.mechanistic_replisome,
+            cache=cache,
         )
 
         if self.trna_charging:
@@ -1827,6 +2022,7 @@ class LoadSimData:
                 unique_molecules,
                 self.sim_data,
                 self.variable_elongation_translation,
+                cache=cache,
             )
 
         cell_mass = calculate_cell_mass(bulk_state, unique_molecules, self.sim_data)
@@ -1837,7 +2033,20 @@ class LoadSimData:
             import_molecules,
             mass_coeff,
             cell_mass,
+            cache=cache,
         )
+        return bulk_state, unique_molecules
+
+    def _complete_initial_state(
+        self, bulk_state: np.ndarray, unique_molecules: dict[str, np.ndarray]
+    ) -> dict[str, Any]:
+        """
+        Add the (seed-independent) environment and boundary states to the
+        bulk and unique molecule states of a new cell.
+        """
+        media_id, current_concentrations, exchange_data = self._initial_media()
+        unconstrained = exchange_data["importUnconstrainedExchangeMolecules"]
+        constrained = exchange_data["importConstrainedExchangeMolecules"]
 
         # Numpy arrays are read-only outside of updaters for safety
         bulk_state.flags.writeable = False
@@ -1862,3 +2071,26 @@ class LoadSimData:
                 }
             },
         }
+
+
+_WORKER_SIM_DATA: Optional[LoadSimData] = None
+
+
+def _set_worker_sim_data(sim_data: LoadSimData):
+    global _WORKER_SIM_DATA
+    _WORKER_SIM_DATA = sim_data
+
+
+def _generate_cell_state_in_worker(seed: int):
+    """
+    Generate the bulk and unique molecule states for ``seed`` in a worker
+    started by :py:meth:`~.LoadSimData.generate_initial_states`.
+    """
+    assert _WORKER_SIM_DATA is not None
+    bulk_state, unique_molecules = _WORKER_SIM_DATA._generate_cell_state(
+        np.random.RandomState(seed=seed), seed
+    )
+    next_indices = {
+        name: unique_state.metadata for name, unique_state in unique_molecules.items()
+    }
+    return seed, bulk_state, unique_molecules, next_indices
@@ -34,6 +34,15 @@ update needed to get from the initial state to the final state. The
 function SHOULD have a name that matches its associated updater
 function, only prefixed with ``inverse_``. Inverse updaters MUST return
 an empty dictionary only if the update can be ignored.
+
+-----------------
+Composing Updates
+-----------------
+
+:py:func:`~.compose_updates` combines a sequence of updates applied to the
+same store into one update. Unlike inverse updaters, it only needs the
+updates, not the initial and final states, so its cost does not grow with
+the size of the store.
 """
 
 import numpy as np
@@ -104,3 +113,64 @@ def inverse_update_bulk_numpy(initial_state, final_state):
 
 def inverse_update_unique_numpy(initial_state, final_state):
     return {"set": {field: final_state[field] for field in final_state.dtype.names}}
+
+
+def compose_updates(updates):
+    """
+    Combine updates that were applied one after another to the same store
+    into a single update with the same effect. Only updates for the
+    ``set``, ``accumulate``, ``bulk_numpy``, and ``null`` updaters can be
+    combined. ``nonnegative_accumulate`` updates cannot because the result
+    depends on whether intermediate values were clipped.
+
+    Args:
+        updates: List of tuples ``(updater name, update)`` in the order
+            they were applied
+
+    Returns:
+        Tuple ``(updater name, update)`` for the combined update, or None if
+        the updates cannot be combined. The updater name is ``null`` if the
+        updates have no effect.
+    """
+    composed = ["null", None]
+    for updater_name, update in updates:
+        if updater_name == "null":
+            continue
+        if updater_name == "set":
+            composed = ["set", update]
+        elif updater_name == "accumulate":
+            if composed[0] == "null":
+                composed = ["accumulate", update]
+            elif composed[0] in ("set", "accumulate"):
+                composed[1] = composed[1] + update
+            else:
+                return None
+        elif updater_name == "bulk_numpy":
+            if composed[0] == "null":
+                composed = ["bulk_numpy", list(update)]
+            elif composed[0] == "bulk_numpy":
+                composed[1].extend(update)
+            else:
+                return None
+        else:
+            return None
+    return tuple(composed)
+
+
+def test_compose_updates():
+    assert compose_updates([]) == ("null", None)
+    assert compose_updates([("accumulate", 1), ("null", 5), ("accumulate", 2)]) == (
+        "accumulate",
+        3,
+    )
+    assert compose_updates([("accumulate", 1), ("set", 4), ("accumulate", 2)]) == (
+        "set",
+        6,
+    )
+    idx = np.array([0, 2])
+    assert compose_updates([("bulk_numpy", [(idx, 1)]), ("bulk_numpy", [(1, -1)])]) == (
+        "bulk_numpy",
+        [(idx, 1), (1, -1)],
+    )
+    assert compose_updates([("set", 1), ("bulk_numpy", [(1, -1)])]) is None
+    assert compose_updates([("nonnegative_accumulate", 1)]) is None
@@ -13,6 +13,7 @@ from typing import Any
 
 from ecoli.processes.registries import topology_registry
 from ecoli.library.schema import counts, numpy_schema, bulk_name_to_idx, listener_schema
+from ecoli.library.rng import choose_rows, make_rng
 
 # Register default topology for this process, associating it with process name
 NAME = "allocator"
@@ -43,7 +44,7 @@ class Allocator(Step):
     name = NAME
     topology = TOPOLOGY
 
-    defaults: dict[str, Any] = {}
+    defaults: dict[str, Any] = {"legacy_rng": False}
 
     processes: dict[str, Any] = {}
 
@@ -115,7 +116,9 @@ class Allocator(Step):
                     }
                 )
             },
-            "allocator_rng": {"_default": np.random.RandomState(seed=self.seed)},
+            "allocator_rng": {
+                "_default": make_rng(self.seed, self.parameters["legacy_rng"])
+            },
         }
         return ports
 
@@ -240,15 +243,23 @@ def calculatePartition(
         # Distribute fractional counts to ensure full allocation of excess
         # request molecules
         remainders = fractional_requests % 1
-        options = np.arange(remainders.shape[1])
-        for idx, remainder in enumerate(remainders):
-            total_remainder = remainder.sum()
-            count = int(np.round(total_remainder))
-            if count > 0:
-                allocated_indices = random_state.choice(
-                    options, size=count, p=remainder / total_remainder, replace=False
-                )
-                fractional_requests[idx, allocated_indices] += 1
+        if isinstance(random_state, np.random.RandomState):
+            # Draw one molecule at a time to reproduce legacy streams
+            options = np.arange(remainders.shape[1])
+            for idx, remainder in enumerate(remainders):
+                total_remainder = remainder.sum()
+                count = int(np.round(total_remainder))
+                if count > 0:
+                    allocated_indices = random_state.choice(
+                        options,
+                        size=count,
+                        p=remainder / total_remainder,
+                        replace=False,
+                    )
+                    fractional_requests[idx, allocated_indices] += 1
+        else:
+            n_allocated = np.round(remainders.sum(axis=1)).astype(int)
+            fractional_requests += choose_rows(random_state, remainders, n_allocated)
         requests[excess_request_mask, :] = fractional_requests
 
         allocations = requests.astype(np.int64)
@@ -54,7 +54,7 @@ from ecoli.library.cell_wall.column_sampler import (
     geom_sampler,
     sample_column,
 )
-from ecoli.library.cell_wall.hole_detection import detect_holes_skimage
+from ecoli.library.cell_wall.hole_detection import HoleTracker
 from ecoli.library.cell_wall.lattice import (
     calculate_lattice_size,
     get_length_distributions,
@@ -110,6 +110,9 @@ class CellWall(Process):
         # Simulation parameters
         "seed": 0,
         "time_step": 10,
+        # Whether to update the holes of the lattice as columns are inserted
+        # instead of detecting all holes again every time step
+        "incremental_hole_detection": True,
     }
 
     def __init__(self, parameters=None):
@@ -137,6 +140,10 @@ class CellWall(Process):
         # Create pseudorandom number generator
         self.rng = np.random.default_rng(self.parameters["seed"])
 
+        # Holes of the lattice from the last update (see HoleTracker)
+        self.incremental_hole_detection = self.parameters["incremental_hole_detection"]
+        self.hole_tracker = None
+
         # Helper indices for Numpy arrays
         self.pbp_ids = list(self.parameters["PBP"].values())
         self.pbp_idx = None
@@ -263,6 +270,15 @@ class CellWall(Process):
         if states["wall_state"]["cracked"]:
             return update
 
+        # Only detect all holes again if the lattice is not the one from the
+        # last update of this process (e.g. after division)
+        if (
+            not self.incremental_hole_detection
+            or self.hole_tracker is None
+            or self.hole_tracker.lattice is not lattice
+        ):
+            self.hole_tracker = HoleTracker(lattice)
+
         # Get number of synthesis sites
         n_sites = int(
             remove_units(
@@ -317,6 +333,7 @@ class CellWall(Process):
             new_unincorporated_monomers,
             new_incorporated_monomers,
             attempted_shrinkage,
+            old_columns,
         ) = self.update_murein(
             lattice,
             unincorporated_monomers,
@@ -327,8 +344,10 @@ class CellWall(Process):
         )
 
         # Crack detection (cracking is irreversible)
-        hole_sizes, _ = detect_holes_skimage(new_lattice)
-        max_size = hole_sizes.max() * self.peptidoglycan_unit_area * extension_factor
+        holes = self.update_holes(new_lattice, old_columns)
+        max_size = (
+            holes.max_hole_size() * self.peptidoglycan_unit_area * extension_factor
+        )
 
         # See if stretching will save from cracking
         will_crack = max_size > self.critical_area
@@ -368,6 +387,7 @@ class CellWall(Process):
                 new_unincorporated_monomers,
                 new_incorporated_monomers,
                 attempted_shrinkage,
+                old_columns,
             ) = self.update_murein(
                 lattice,
                 unincorporated_monomers,
@@ -378,15 +398,16 @@ class CellWall(Process):
             )
 
             # Crack detection (cracking is irreversible)
-            hole_sizes, _ = detect_holes_skimage(new_lattice)
+            holes = self.update_holes(new_lattice, old_columns)
             max_size = (
-                hole_sizes.max() * self.peptidoglycan_unit_area * extension_factor
+                holes.max_hole_size() * self.peptidoglycan_unit_area * extension_factor
             )
 
             will_crack = max_size > self.critical_area
 
         # Accept proposed new lattice
         lattice = new_lattice
+        self.hole_tracker = holes
 
         # Form updates
         update["wall_state"] = {
@@ -403,7 +424,7 @@ class CellWall(Process):
         }
         update["listeners"] = {
             "porosity": 1 - (lattice.sum() / lattice.size),
-            "hole_size_distribution": np.bincount(hole_sizes),
+            "hole_size_distribution": np.bincount(holes.hole_sizes()),
             "strand_length_distribution": np.bincount(
                 get_length_distributions(lattice)[1]
             ),
@@ -414,6 +435,16 @@ class CellWall(Process):
 
         return update
 
+    def update_holes(self, new_lattice, old_columns):
+        """
+        Get the holes of ``new_lattice``, which was made by inserting columns
+        into the lattice of :py:attr:`hole_tracker` (see
+        :py:meth:`~.update_murein`).
+        """
+        if old_columns is None:
+            return self.hole_tracker
+        return self.hole_tracker.insert_columns(new_lattice, old_columns)
+
     def update_murein(
         self,
         lattice,
@@ -435,6 +466,7 @@ class CellWall(Process):
                 unincorporated_monomers,
                 incorporated_monomers,
                 attempted_shrinkage,
+                None,
             )
 
         if d_columns < 0:
@@ -447,6 +479,7 @@ class CellWall(Process):
                 unincorporated_monomers,
                 incorporated_monomers,
                 attempted_shrinkage,
+                None,
             )
 
         # Create new lattice
@@ -499,6 +532,8 @@ class CellWall(Process):
             ).T
 
         # Combine insertions and old material into new lattice
+        # (keeping track of where each old column ends up)
+        old_columns = np.empty(columns, dtype=int)
         index_new = 0
         index_old = 0
         gaps_between_insertions = np.diff(insertion_points, prepend=0)
@@ -509,6 +544,9 @@ class CellWall(Process):
             new_lattice[:, index_new : (index_new + gap)] = lattice[
                 :, index_old : (index_old + gap)
             ]
+            old_columns[index_old : (index_old + gap)] = np.arange(
+                index_new, index_new + gap
+            )
             # Do insertion
             new_lattice[:, (index_new + gap) : (index_new + gap + insert_size)] = (
                 insertions[insert_i]
@@ -520,6 +558,7 @@ class CellWall(Process):
 
         # Copy from last insertion to end
         new_lattice[:, index_new:] = lattice[:, index_old:]
+        old_columns[index_old:] = np.arange(index_new, new_columns)
 
         total_real_monomers = unincorporated_monomers + incorporated_monomers
         new_incorporated_monomers = new_lattice.sum()
@@ -529,4 +568,5 @@ class CellWall(Process):
             new_unincorporated_monomers,
             new_incorporated_monomers,
             attempted_shrinkage,
+            old_columns,
         )
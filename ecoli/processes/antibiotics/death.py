@@ -44,11 +44,12 @@ from vivarium.core.composition import (
 )
 from vivarium.core.process import Process
 from vivarium.core.composer import Composer
-from vivarium.core.registry import process_registry
 from vivarium.processes.injector import Injector
 from vivarium.plots.simulation_output import plot_simulation_output
 from vivarium.library.units import units
 
+from ecoli.processes.registries import process_registry
+
 TOY_ANTIBIOTIC_THRESHOLD = 5.0 * units.mM
 TOY_INJECTION_RATE = 2.0 * units.mM  # implicitly per second
 
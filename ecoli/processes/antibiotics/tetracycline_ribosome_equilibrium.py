@@ -5,6 +5,7 @@ from vivarium.core.process import Step
 from vivarium.library.units import units
 
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts
+from ecoli.library.rng import make_rng
 
 
 AVOGADRO = N_A / units.mol
@@ -37,12 +38,15 @@ class TetracyclineRibosomeEquilibrium(Step):
         # is even lower than the K for non-enzymatic binding
         "K_tRNA": 4.5e6,
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
     }
 
     def __init__(self, parameters=None):
         super().__init__(parameters)
-        self.random_state = np.random.RandomState(seed=self.parameters["seed"])
+        self.random_state = make_rng(
+            self.parameters["seed"], self.parameters["legacy_rng"]
+        )
         # Helper indices for Numpy indexing
         self.trna_idx = None
 
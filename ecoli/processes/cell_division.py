@@ -10,6 +10,7 @@ import binascii
 import numpy as np
 from vivarium.core.process import Step
 
+from ecoli.library.rng import integers, make_rng, spawn_seed
 from ecoli.library.sim_data import RAND_MAX
 from ecoli.library.schema import attrs
 from wholecell.utils import units
@@ -75,6 +76,7 @@ class Division(Step):
         "daughter_ids_function": daughter_phylogeny_id,
         "threshold": None,
         "seed": 0,
+        "legacy_rng": False,
     }
 
     def __init__(self, parameters=None):
@@ -84,14 +86,21 @@ class Division(Step):
         self.agent_id = self.parameters["agent_id"]
         self.composer = self.parameters["composer"]
         self.composer_config = self.parameters["composer_config"]
-        self.random_state = np.random.RandomState(seed=self.parameters["seed"])
+        self.legacy_rng = self.parameters["legacy_rng"]
+        self.random_state = make_rng(self.parameters["seed"], self.legacy_rng)
 
         self.division_mass_multiplier = 1
         if self.parameters["division_threshold"] == "mass_distribution":
-            division_random_seed = (
-                binascii.crc32(b"CellDivision", self.parameters["seed"]) & 0xFFFFFFFF
-            )
-            division_random_state = np.random.RandomState(seed=division_random_seed)
+            if self.legacy_rng:
+                division_random_seed = (
+                    binascii.crc32(b"CellDivision", self.parameters["seed"])
+                    & 0xFFFFFFFF
+                )
+            else:
+                division_random_seed = spawn_seed(
+                    self.parameters["seed"], "CellDivision"
+                )
+            division_random_state = make_rng(division_random_seed, self.legacy_rng)
             self.division_mass_multiplier = division_random_state.normal(
                 loc=1.0, scale=0.1
             )
@@ -136,7 +145,11 @@ class Division(Step):
             for daughter_id in daughter_ids:
                 config = dict(self.composer_config)
                 config["agent_id"] = daughter_id
-                config["seed"] = self.random_state.randint(0, RAND_MAX)
+                if self.legacy_rng:
+                    config["seed"] = integers(self.random_state, 0, RAND_MAX)
+                else:
+                    # Daughter simulations get independent substreams
+                    config["seed"] = spawn_seed(self.parameters["seed"], daughter_id)
                 # Regenerate composite to avoid unforeseen shared states
                 composite = self.composer(config).generate()
                 # Get shared process instances for partitioned processes
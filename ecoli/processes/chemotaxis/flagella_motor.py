@@ -202,35 +202,35 @@ class FlagellaMotor(Process):
 
         ## Update flagella subcompartments
         # check number of flagella proteins, compare with sub-compartments add/delete accordingly
+        flagella_ids = list(flagella.keys())
+        motor_states = np.fromiter(flagella.values(), dtype=int, count=len(flagella))
         flagella_update = {}
         new_flagella = int(n_flagella) - len(flagella)
         if new_flagella < 0:
-            flagella_update["_delete"] = []
-            remove = random.sample(list(flagella.keys()), abs(new_flagella))
-            for flagella_id in remove:
-                flagella_update["_delete"].append((flagella_id,))
+            remove = self.random_state.choice(
+                len(flagella_ids), abs(new_flagella), replace=False
+            )
+            flagella_update["_delete"] = [(flagella_ids[idx],) for idx in remove]
 
         elif new_flagella > 0:
-            flagella_update["_add"] = []
-            new_flagella_indexes = [
-                num for num in self.random_state.randint(0, 2**63, new_flagella)
-            ]
-            for index in range(new_flagella):
-                flagella_id = new_flagella_indexes[index]
-                flagella_update["_add"].append(
-                    {"key": str(flagella_id), "state": random.choice([-1, 1])}
+            new_flagella_indexes = self.random_state.randint(0, 2**63, new_flagella)
+            new_motor_states = self.random_state.choice([-1, 1], new_flagella)
+            flagella_update["_add"] = [
+                {"key": str(flagella_id), "state": int(motor_state)}
+                for flagella_id, motor_state in zip(
+                    new_flagella_indexes, new_motor_states
                 )
+            ]
 
         # update individual flagella states
-        for flagella_id, motor_state in flagella.items():
-            new_motor_state = self.update_flagellum(motor_state, CheY_P, timestep)
-            flagella_update.update({flagella_id: new_motor_state})
+        new_motor_states = self.update_flagella(motor_states, CheY_P, timestep)
+        flagella_update.update(zip(flagella_ids, new_motor_states.tolist()))
 
         ## get cell motile state.
         # if any flagella is rotating CW, the cell tumbles.
         # flagella motor state: -1 for CCW, 1 for CW
         # motile state: -1 for run, 1 for tumble, 0 for no state
-        if any(state == 1 for state in flagella_update.values()):
+        if (new_motor_states == 1).any():
             motile_state = 1
             [thrust, torque] = self.tumble(n_flagella, PMF)
         elif len(flagella_update) > 0:
@@ -247,12 +247,13 @@ class FlagellaMotor(Process):
             "boundary": {"thrust": thrust, "torque": torque},
         }
 
-    def update_flagellum(self, motor_state, CheY_P, timestep):
+    def switch_probabilities(self, CheY_P, timestep):
         """
-        calculate the rotational state of a individual flagellum
+        calculate the probabilities that a flagellum switches from CCW to CW
+        and from CW to CCW rotation within a timestep
 
-        .. note::
-            TODO -- normal, semi, curly states from Sneddon
+        Returns:
+            Tuple of the CCW-->CW and CW-->CCW switch probabilities
         """
         g_0 = self.parameters["g_0"]  # (k_B*T) free energy barrier for CCW-->CW
         g_1 = self.parameters["g_1"]  # (k_B*T) free energy barrier for CW-->CCW
@@ -272,26 +273,31 @@ class FlagellaMotor(Process):
         if CW_bias < self.parameters["ccw_to_cw_leak"]:
             CW_bias = self.parameters["ccw_to_cw_leak"]
 
-        # flagella motor state: -1 for CCW, 1 for CW
-        if motor_state == -1:
-            # switch probability as function of the time step
-            switch_rate = -math.log(1 - CW_bias)
-            prob_switch = 1 - math.exp(-switch_rate * timestep)
-            if np.random.random(1)[0] <= prob_switch:
-                new_motor_state = 1
-            else:
-                new_motor_state = -1
-
-        elif motor_state == 1:
-            # switch probability as function of the time step
-            switch_rate = -math.log(1 - CCW_bias)
-            prob_switch = 1 - math.exp(-switch_rate * timestep)
-            if np.random.random(1)[0] <= prob_switch:
-                new_motor_state = -1
-            else:
-                new_motor_state = 1
-
-        return new_motor_state
+        # switch probabilities as function of the time step
+        prob_ccw_to_cw = 1 - math.exp(math.log(1 - CW_bias) * timestep)
+        prob_cw_to_ccw = 1 - math.exp(math.log(1 - CCW_bias) * timestep)
+        return prob_ccw_to_cw, prob_cw_to_ccw
+
+    def update_flagella(self, motor_states, CheY_P, timestep):
+        """
+        calculate the rotational states of all flagella, drawing one random
+        number per flagellum
+
+        Args:
+            motor_states: Array of flagella motor states (-1 for CCW, 1 for CW)
+            CheY_P: Concentration of CheY-P (uM)
+            timestep: Length of timestep (s)
+
+        Returns:
+            Array of new flagella motor states
+
+        .. note::
+            TODO -- normal, semi, curly states from Sneddon
+        """
+        prob_ccw_to_cw, prob_cw_to_ccw = self.switch_probabilities(CheY_P, timestep)
+        prob_switch = np.where(motor_states == -1, prob_ccw_to_cw, prob_cw_to_ccw)
+        switch = self.random_state.random_sample(len(motor_states)) <= prob_switch
+        return np.where(switch, -motor_states, motor_states)
 
     def tumble(self, n_flagella, PMF):
         """
@@ -321,6 +327,43 @@ class FlagellaMotor(Process):
 
 
 # test functions
+def test_update_flagella():
+    process = FlagellaMotor()
+    CheY_P = 2.0
+    timestep = 0.01
+    prob_ccw_to_cw, prob_cw_to_ccw = process.switch_probabilities(CheY_P, timestep)
+    assert 0 < prob_ccw_to_cw < 1
+    assert 0 < prob_cw_to_ccw < 1
+
+    # Fraction of flagella that switch matches switch probability for each state
+    n_flagella = 100000
+    motor_states = np.repeat([-1, 1], n_flagella)
+    new_motor_states = process.update_flagella(motor_states, CheY_P, timestep)
+    assert set(np.unique(new_motor_states)) <= {-1, 1}
+    switched = new_motor_states != motor_states
+    np.testing.assert_allclose(
+        [switched[:n_flagella].mean(), switched[n_flagella:].mean()],
+        [prob_ccw_to_cw, prob_cw_to_ccw],
+        atol=0.005,
+    )
+
+    # Flagella are added and removed by ID to match flagella counts
+    states = {
+        "flagella": {"a": -1, "b": 1},
+        "internal_counts": {"flagella": 4},
+        "membrane": {"PMF": FlagellaMotor.expected_pmf},
+        "internal": FlagellaMotor.defaults["initial_state"]["internal"],
+    }
+    update = process.next_update(timestep, states)
+    assert set(update["flagella"]) == {"a", "b", "_add"}
+    assert len(update["flagella"]["_add"]) == 2
+    assert all(added["state"] in (-1, 1) for added in update["flagella"]["_add"])
+    states["internal_counts"]["flagella"] = 1
+    update = process.next_update(timestep, states)
+    assert len(update["flagella"]["_delete"]) == 1
+    assert update["flagella"]["_delete"][0][0] in ("a", "b")
+
+
 def get_chemoreceptor_activity_timeline(
     total_time=2, time_step=0.01, rate=1.0, initial_value=1.0 / 3.0
 ):
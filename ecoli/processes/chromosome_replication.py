@@ -25,6 +25,7 @@ from ecoli.library.schema import (
     bulk_name_to_idx,
     listener_schema,
 )
+from ecoli.library.rng import make_rng
 
 from wholecell.utils import units
 from wholecell.utils.polymerize import buildSequences, polymerize, computeMassIncrease
@@ -77,6 +78,7 @@ class ChromosomeReplication(PartitionedProcess):
         "ppi": [],
         # random seed
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
     }
 
@@ -104,7 +106,7 @@ class ChromosomeReplication(PartitionedProcess):
 
         # random state
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         self.emit_unique = self.parameters.get("emit_unique", True)
 
@@ -308,73 +308,71 @@ class ChromosomeStructure(Step):
             states["DnaA_boxes"], ["domain_index", "coordinates", "DnaA_bound"]
         )
 
-        # Build dictionary of replisome coordinates with domain indexes as keys
-        replisome_coordinates_from_domains = {
-            domain_index: replisome_coordinates[
-                replisome_domain_indexes == domain_index
-            ]
-            for domain_index in np.unique(replisome_domain_indexes)
-        }
+        # Build table of the range of coordinates spanned by the replication
+        # forks of each domain with active replisomes
+        fork_domain_indexes, fork_inverse = np.unique(
+            replisome_domain_indexes, return_inverse=True
+        )
+        fork_min_coordinates = np.full(len(fork_domain_indexes), np.iinfo(np.int64).max)
+        fork_max_coordinates = np.full(len(fork_domain_indexes), np.iinfo(np.int64).min)
+        np.minimum.at(fork_min_coordinates, fork_inverse, replisome_coordinates)
+        np.maximum.at(fork_max_coordinates, fork_inverse, replisome_coordinates)
+
+        # Domains whose child domains are not all full chromosomes have either
+        # not started replication or had replication interrupted
+        unfinished_domain_indexes = all_chromosome_domain_indexes[
+            ~np.isin(child_domains, mother_domain_indexes).all(axis=1)
+        ]
 
-        def get_removed_molecules_mask(domain_indexes, coordinates):
+        def get_removed_molecules_mask(index):
             """
             Computes the boolean mask of unique molecules that should be
-            removed based on the progression of the replication forks.
+            removed based on the progression of the replication forks, using
+            a single range query over all domains of a
+            :py:class:`~.DomainCoordinateIndex`.
             """
-            mask = np.zeros_like(domain_indexes, dtype=np.bool_)
-
-            # Loop through all domains
-            for domain_index in np.unique(domain_indexes):
-                # Domain has active replisomes
-                if domain_index in replisome_coordinates_from_domains:
-                    domain_replisome_coordinates = replisome_coordinates_from_domains[
-                        domain_index
-                    ]
-
-                    # Get mask for molecules on this domain that are out of range
-                    # It's rare but we have to remove molecules at the exact same
-                    # coordinates as the replisomes as well so that they do not break
-                    # the chromosome segment calculations if they are removed by a
-                    # different process (hence, >= and <= instead of > and <)
-                    domain_mask = np.logical_and.reduce(
-                        (
-                            domain_indexes == domain_index,
-                            coordinates >= domain_replisome_coordinates.min(),
-                            coordinates <= domain_replisome_coordinates.max(),
-                        )
-                    )
-
-                # Domain has no active replisomes
-                else:
-                    children_of_domain = child_domains[
-                        all_chromosome_domain_indexes == domain_index
-                    ]
-                    # Child domains are full chromosomes (domain has finished replicating)
-                    if np.all(np.isin(children_of_domain, mother_domain_indexes)):
-                        # Remove all molecules on this domain
-                        domain_mask = domain_indexes == domain_index
-                    # Domain has not started replication or replication was interrupted
-                    else:
-                        continue
-
-                mask[domain_mask] = True
-
-            return mask
-
-        # Build mask for molecules that should be removed
-        removed_RNAPs_mask = get_removed_molecules_mask(
-            RNAP_domain_indexes, RNAP_coordinates
-        )
-        removed_promoters_mask = get_removed_molecules_mask(
+            domains = index.domains
+            # Default to empty ranges (no molecules removed)
+            lower = np.full(len(domains), np.iinfo(np.int64).max)
+            upper = np.full(len(domains), np.iinfo(np.int64).min)
+
+            # Domains with active replisomes: remove molecules that are in
+            # between the forks. It's rare but we have to remove molecules at
+            # the exact same coordinates as the replisomes as well so that they
+            # do not break the chromosome segment calculations if they are
+            # removed by a different process (hence, inclusive bounds)
+            fork_positions = np.searchsorted(fork_domain_indexes, domains)
+            fork_positions[fork_positions == len(fork_domain_indexes)] = 0
+            has_forks = np.zeros(len(domains), dtype=np.bool_)
+            if len(fork_domain_indexes) > 0:
+                has_forks = fork_domain_indexes[fork_positions] == domains
+            lower[has_forks] = fork_min_coordinates[fork_positions[has_forks]]
+            upper[has_forks] = fork_max_coordinates[fork_positions[has_forks]]
+
+            # Domains with no active replisomes whose child domains are full
+            # chromosomes have finished replicating: remove all molecules
+            finished = ~has_forks & ~np.isin(domains, unfinished_domain_indexes)
+            lower[finished] = np.iinfo(np.int64).min
+            upper[finished] = np.iinfo(np.int64).max
+
+            return index.range_mask(lower, upper)
+
+        # Index chromosome-bound molecules by domain and coordinate
+        RNAP_index = DomainCoordinateIndex(RNAP_domain_indexes, RNAP_coordinates)
+        promoter_index = DomainCoordinateIndex(
             promoter_domain_indexes, promoter_coordinates
         )
-        removed_genes_mask = get_removed_molecules_mask(
-            gene_domain_indexes, gene_coordinates
-        )
-        removed_DnaA_boxes_mask = get_removed_molecules_mask(
+        gene_index = DomainCoordinateIndex(gene_domain_indexes, gene_coordinates)
+        DnaA_box_index = DomainCoordinateIndex(
             DnaA_box_domain_indexes, DnaA_box_coordinates
         )
 
+        # Build mask for molecules that should be removed
+        removed_RNAPs_mask = get_removed_molecules_mask(RNAP_index)
+        removed_promoters_mask = get_removed_molecules_mask(promoter_index)
+        removed_genes_mask = get_removed_molecules_mask(gene_index)
+        removed_DnaA_boxes_mask = get_removed_molecules_mask(DnaA_box_index)
+
         # Build masks for head-on and co-directional collisions between RNAPs
         # and replication forks
         RNAP_headon_collision_mask = np.logical_and(
@@ -434,11 +432,18 @@ class ChromosomeStructure(Step):
                 ],
             )
 
-            # Initialize new attributes of chromosomal segments
-            all_new_boundary_molecule_indexes = np.empty((0, 2), dtype=np.int64)
-            all_new_boundary_coordinates = np.empty((0, 2), dtype=np.int64)
-            all_new_segment_domain_indexes = np.array([], dtype=np.int32)
-            all_new_linking_numbers = np.array([], dtype=np.float64)
+            segment_index = DomainCoordinateIndex(
+                segment_domain_indexes, boundary_coordinates[:, 0]
+            )
+
+            # Collect the molecules bound to each domain that will form the
+            # boundaries of the new segments
+            new_molecule_domain_indexes = []
+            new_molecule_coordinates = []
+            new_molecule_indexes = []
+            domains_with_molecules = []
+            domains_span_oriC = []
+            domains_span_terC = []
 
             # Iteratively tally RNAPs that were removed due to collisions with
             # replication forks with or without replisomes on each domain
@@ -452,20 +457,19 @@ class ChromosomeStructure(Step):
                 domain_spans_terC = domain_index in mother_domain_indexes
 
                 # Parse attributes of remaining RNAPs in this domain
-                RNAPs_domain_mask = RNAP_domain_indexes == domain_index
-                RNAP_coordinates_this_domain = RNAP_coordinates[RNAPs_domain_mask]
-                RNAP_unique_indexes_this_domain = RNAP_unique_indexes[RNAPs_domain_mask]
-                domain_remaining_RNAPs_mask = ~removed_RNAPs_mask[RNAPs_domain_mask]
+                RNAPs_domain_idx = RNAP_index.domain_members(domain_index)
+                RNAP_coordinates_this_domain = RNAP_coordinates[RNAPs_domain_idx]
+                RNAP_unique_indexes_this_domain = RNAP_unique_indexes[RNAPs_domain_idx]
+                domain_remaining_RNAPs_mask = ~removed_RNAPs_mask[RNAPs_domain_idx]
 
                 # Parse attributes of segments in this domain
-                segments_domain_mask = segment_domain_indexes == domain_index
+                segments_domain_mask = segment_index.domain_members(domain_index)
                 boundary_molecule_indexes_this_domain = boundary_molecule_indexes[
                     segments_domain_mask, :
                 ]
                 boundary_coordinates_this_domain = boundary_coordinates[
                     segments_domain_mask, :
                 ]
-                linking_numbers_this_domain = linking_numbers[segments_domain_mask]
 
                 new_molecule_coordinates_this_domain = np.array([], dtype=np.int64)
                 new_molecule_indexes_this_domain = np.array([], dtype=np.int64)
@@ -505,7 +509,7 @@ class ChromosomeStructure(Step):
                         full_removed_RNAPs_mask = np.full_like(
                             removed_RNAPs_mask, False
                         )
-                        full_removed_RNAPs_mask[RNAPs_domain_mask] = RNAPs_on_forks
+                        full_removed_RNAPs_mask[RNAPs_domain_idx] = RNAPs_on_forks
                         removed_RNAP_masks_all_domains = np.logical_or(
                             removed_RNAP_masks_all_domains, full_removed_RNAPs_mask
                         )
@@ -544,8 +548,8 @@ class ChromosomeStructure(Step):
                     if len(replisome_molecule_indexes_parent_domain) != 2:
                         assert len(replisome_molecule_indexes_parent_domain) < 2
                         # Parse attributes of segments in parent domain
-                        parent_segments_domain_mask = (
-                            segment_domain_indexes == parent_domain_index
+                        parent_segments_domain_mask = segment_index.domain_members(
+                            parent_domain_index
                         )
                         boundary_molecule_indexes_parent_domain = (
                             boundary_molecule_indexes[parent_segments_domain_mask, :]
@@ -574,7 +578,7 @@ class ChromosomeStructure(Step):
                         full_removed_RNAPs_mask = np.full_like(
                             removed_RNAPs_mask, False
                         )
-                        full_removed_RNAPs_mask[RNAPs_domain_mask] = RNAPs_on_forks
+                        full_removed_RNAPs_mask[RNAPs_domain_idx] = RNAPs_on_forks
                         removed_RNAP_masks_all_domains = np.logical_or(
                             removed_RNAP_masks_all_domains, full_removed_RNAPs_mask
                         )
@@ -611,43 +615,40 @@ class ChromosomeStructure(Step):
                 if len(new_molecule_indexes_this_domain) == 0:
                     continue
 
-                # Calculate attributes of new segments
-                new_segment_attrs = self._compute_new_segment_attributes(
-                    boundary_molecule_indexes_this_domain,
-                    boundary_coordinates_this_domain,
-                    linking_numbers_this_domain,
-                    new_molecule_indexes_this_domain,
-                    new_molecule_coordinates_this_domain,
-                    domain_spans_oriC,
-                    domain_spans_terC,
-                )
-
-                # Append to existing array of new segment attributes
-                all_new_boundary_molecule_indexes = np.vstack(
-                    (
-                        all_new_boundary_molecule_indexes,
-                        new_segment_attrs["boundary_molecule_indexes"],
-                    )
-                )
-                all_new_boundary_coordinates = np.vstack(
-                    (
-                        all_new_boundary_coordinates,
-                        new_segment_attrs["boundary_coordinates"],
+                new_molecule_domain_indexes.append(
+                    np.full(
+                        len(new_molecule_indexes_this_domain),
+                        domain_index,
+                        dtype=np.int32,
                     )
                 )
-                all_new_segment_domain_indexes = np.concatenate(
-                    (
-                        all_new_segment_domain_indexes,
-                        np.full(
-                            len(new_segment_attrs["linking_numbers"]),
-                            domain_index,
-                            dtype=np.int32,
-                        ),
-                    )
-                )
-                all_new_linking_numbers = np.concatenate(
-                    (all_new_linking_numbers, new_segment_attrs["linking_numbers"])
+                new_molecule_coordinates.append(new_molecule_coordinates_this_domain)
+                new_molecule_indexes.append(new_molecule_indexes_this_domain)
+                domains_with_molecules.append(domain_index)
+                domains_span_oriC.append(domain_spans_oriC)
+                domains_span_terC.append(domain_spans_terC)
+
+            # Calculate attributes of new segments on all domains at once
+            if len(domains_with_molecules) > 0:
+                new_segment_attrs = self._compute_new_segment_attributes(
+                    boundary_molecule_indexes,
+                    boundary_coordinates,
+                    segment_domain_indexes,
+                    linking_numbers,
+                    np.concatenate(new_molecule_indexes).astype(np.int64),
+                    np.concatenate(new_molecule_coordinates).astype(np.int64),
+                    np.concatenate(new_molecule_domain_indexes),
+                    np.array(domains_with_molecules),
+                    np.array(domains_span_oriC),
+                    np.array(domains_span_terC),
                 )
+            else:
+                new_segment_attrs = {
+                    "boundary_molecule_indexes": np.empty((0, 2), dtype=np.int64),
+                    "boundary_coordinates": np.empty((0, 2), dtype=np.int64),
+                    "domain_indexes": np.array([], dtype=np.int32),
+                    "linking_numbers": np.array([], dtype=np.float64),
+                }
 
             # Delete all existing chromosomal segments
             if len(boundary_molecule_indexes) > 0:
@@ -659,10 +660,14 @@ class ChromosomeStructure(Step):
             update["chromosomal_segments"].update(
                 {
                     "add": {
-                        "boundary_molecule_indexes": all_new_boundary_molecule_indexes,
-                        "boundary_coordinates": all_new_boundary_coordinates,
-                        "domain_index": all_new_segment_domain_indexes,
-                        "linking_number": all_new_linking_numbers,
+                        "boundary_molecule_indexes": new_segment_attrs[
+                            "boundary_molecule_indexes"
+                        ],
+                        "boundary_coordinates": new_segment_attrs[
+                            "boundary_coordinates"
+                        ],
+                        "domain_index": new_segment_attrs["domain_indexes"],
+                        "linking_number": new_segment_attrs["linking_numbers"],
                     }
                 }
             )
@@ -962,17 +967,26 @@ class ChromosomeStructure(Step):
         self,
         old_boundary_molecule_indexes: npt.NDArray[np.int64],
         old_boundary_coordinates: npt.NDArray[np.int64],
-        old_linking_numbers: npt.NDArray[np.int64],
+        old_segment_domain_indexes: npt.NDArray[np.int32],
+        old_linking_numbers: npt.NDArray[np.float64],
         new_molecule_indexes: npt.NDArray[np.int64],
         new_molecule_coordinates: npt.NDArray[np.int64],
-        spans_oriC: bool,
-        spans_terC: bool,
+        new_molecule_domain_indexes: npt.NDArray[np.int32],
+        domain_indexes: npt.NDArray[np.int32],
+        spans_oriC: npt.NDArray[np.bool_],
+        spans_terC: npt.NDArray[np.bool_],
     ) -> dict[str, npt.NDArray[np.int64 | np.float64]]:
         """
         Calculates the updated attributes of chromosomal segments belonging to
-        a specific chromosomal domain, given the previous and current
+        the given chromosomal domains, given the previous and current
         coordinates of molecules bound to the chromosome.
 
+        The boundaries of all domains are handled together as single arrays
+        sorted by domain and then by coordinate, with the segments of each
+        domain occupying a contiguous block. Linking numbers are updated with
+        segmented reductions over these blocks instead of a loop over domains
+        and segments.
+
         Args:
             old_boundary_molecule_indexes: (N, 2) array of unique
                 indexes of molecules that formed the boundaries of each
@@ -980,272 +994,344 @@ class ChromosomeStructure(Step):
             old_boundary_coordinates: (N, 2) array of chromosomal
                 coordinates of molecules that formed the boundaries of each
                 chromosomal segment in the previous timestep.
+            old_segment_domain_indexes: (N,) array of domain indexes of each
+                chromosomal segment in the previous timestep. Segments on
+                domains not in ``domain_indexes`` are ignored.
             old_linking_numbers: (N,) array of linking numbers of each
                 chromosomal segment in the previous timestep.
-            new_molecule_indexes: (N,) array of unique indexes of all
-                molecules bound to the domain at the current timestep.
-            new_molecule_coordinates: (N,) array of chromosomal
-                coordinates of all molecules bound to the domain at the current
-                timestep.
-            spans_oriC: True if the domain spans the origin.
-            spans_terC: True if the domain spans the terminus.
+            new_molecule_indexes: (M,) array of unique indexes of all
+                molecules bound to the domains at the current timestep.
+            new_molecule_coordinates: (M,) array of chromosomal
+                coordinates of all molecules bound to the domains at the
+                current timestep.
+            new_molecule_domain_indexes: (M,) array of domain indexes of all
+                molecules bound to the domains at the current timestep.
+            domain_indexes: (D,) sorted array of indexes of the domains to
+                calculate new segments for. Each domain must have at least
+                one molecule in ``new_molecule_domain_indexes``.
+            spans_oriC: (D,) boolean array, True if the domain spans the
+                origin.
+            spans_terC: (D,) boolean array, True if the domain spans the
+                terminus.
 
         Returns:
             Dictionary of the following format::
 
                 {
-                    'boundary_molecule_indexes': (M, 2) array of unique
+                    'boundary_molecule_indexes': (K, 2) array of unique
                         indexes of molecules that form the boundaries of new
                         chromosomal segments,
-                    'boundary_coordinates': (M, 2) array of chromosomal
+                    'boundary_coordinates': (K, 2) array of chromosomal
                         coordinates of molecules that form the boundaries of
                         new chromosomal segments,
-                    'linking_numbers': (M,) array of linking numbers of new
+                    'domain_indexes': (K,) array of domain indexes of new
+                        chromosomal segments,
+                    'linking_numbers': (K,) array of linking numbers of new
                         chromosomal segments
                 }
 
         """
-        # Sort old segment arrays by coordinates of left boundary
-        old_coordinates_argsort = np.argsort(old_boundary_coordinates[:, 0])
-        old_boundary_coordinates_sorted = old_boundary_coordinates[
-            old_coordinates_argsort, :
-        ]
-        old_boundary_molecule_indexes_sorted = old_boundary_molecule_indexes[
-            old_coordinates_argsort, :
-        ]
-        old_linking_numbers_sorted = old_linking_numbers[old_coordinates_argsort]
-
-        # Sort new segment arrays by molecular coordinates
-        new_coordinates_argsort = np.argsort(new_molecule_coordinates)
-        new_molecule_coordinates_sorted = new_molecule_coordinates[
-            new_coordinates_argsort
-        ]
-        new_molecule_indexes_sorted = new_molecule_indexes[new_coordinates_argsort]
-
-        # Domain does not span the origin
-        if not spans_oriC:
-            # A fragment spans oriC if two boundaries have opposite signs,
-            # or both are equal to zero
-            oriC_fragment_counts = np.count_nonzero(
-                np.logical_not(
-                    np.logical_xor(
-                        old_boundary_coordinates_sorted[:, 0] < 0,
-                        old_boundary_coordinates_sorted[:, 1] > 0,
-                    )
-                )
-            )
-
-            # if oriC fragment did not exist in the domain in the previous
-            # timestep, add a dummy fragment that covers the origin with
-            # linking number zero. This is done to generalize the
-            # implementation of this method.
-            if oriC_fragment_counts == 0:
-                # Index of first segment where left boundary is nonnegative
-                oriC_fragment_index = np.argmax(
-                    old_boundary_coordinates_sorted[:, 0] >= 0
-                )
-
-                # Get indexes of boundary molecules for this dummy segment
-                oriC_fragment_boundary_molecule_indexes = np.array(
-                    [
-                        old_boundary_molecule_indexes_sorted[
-                            oriC_fragment_index - 1, 1
-                        ],
-                        old_boundary_molecule_indexes_sorted[oriC_fragment_index, 0],
-                    ]
-                )
-
-                # Insert dummy segment to array
-                old_boundary_molecule_indexes_sorted = np.insert(
-                    old_boundary_molecule_indexes_sorted,
-                    oriC_fragment_index,
-                    oriC_fragment_boundary_molecule_indexes,
-                    axis=0,
-                )
-                old_linking_numbers_sorted = np.insert(
-                    old_linking_numbers_sorted, oriC_fragment_index, 0
-                )
-            else:
-                # There should not be more than one fragment that spans oriC
-                assert oriC_fragment_counts == 1
-
-        # Domain spans the terminus
-        if spans_terC:
-            # If the domain spans the terminus, dummy molecules are added to
-            # each end of the chromosome s.t. the segment that spans terC is
-            # split to two segments and we can maintain a linear representation
-            # for the circular chromosome. These two segments are later
-            # adjusted to have the same superhelical densities.
-            new_molecule_coordinates_sorted = np.insert(
-                new_molecule_coordinates_sorted,
-                [0, len(new_molecule_coordinates_sorted)],
-                [self.min_coordinates, self.max_coordinates],
-            )
-
-            new_molecule_indexes_sorted = np.insert(
-                new_molecule_indexes_sorted,
-                [0, len(new_molecule_indexes_sorted)],
-                self.terC_index,
+        n_domains = len(domain_indexes)
+        domain_ranks = np.arange(n_domains)
+
+        # Sort old segments on the given domains by domain and then by
+        # coordinates of left boundary
+        old_mask = np.isin(old_segment_domain_indexes, domain_indexes)
+        old_ranks = np.searchsorted(
+            domain_indexes, old_segment_domain_indexes[old_mask]
+        )
+        old_order = np.lexsort((old_boundary_coordinates[old_mask, 0], old_ranks))
+        old_ranks = old_ranks[old_order]
+        old_left_coordinates = old_boundary_coordinates[old_mask, 0][old_order]
+        old_right_coordinates = old_boundary_coordinates[old_mask, 1][old_order]
+        old_indexes = old_boundary_molecule_indexes[old_mask][old_order]
+        old_lns = old_linking_numbers[old_mask][old_order]
+        n_old = len(old_ranks)
+        old_starts = np.searchsorted(old_ranks, domain_ranks)
+        old_ends = np.searchsorted(old_ranks, domain_ranks, side="right")
+
+        # Sort new molecules by domain and then by coordinates
+        new_ranks = np.searchsorted(domain_indexes, new_molecule_domain_indexes)
+        new_order = np.lexsort((new_molecule_coordinates, new_ranks))
+        new_ranks = new_ranks[new_order]
+        new_coordinates = new_molecule_coordinates[new_order]
+        new_indexes = new_molecule_indexes[new_order]
+        new_starts = np.searchsorted(new_ranks, domain_ranks)
+        new_ends = np.searchsorted(new_ranks, domain_ranks, side="right")
+
+        # Dummy segments are inserted into the sorted old segments by giving
+        # every row a sort key: existing segment i has key 4*i + 2, and dummy
+        # segments get keys that place them right before or after an
+        # existing segment of the same domain.
+        inserted_keys = [4 * np.arange(n_old) + 2]
+        inserted_indexes = [old_indexes]
+        inserted_lns = [old_lns]
+        inserted_ranks = [old_ranks]
+
+        # For domains that do not span the origin, if an oriC fragment did not
+        # exist in the domain in the previous timestep, add a dummy fragment
+        # that covers the origin with linking number zero. This is done to
+        # generalize the implementation of this method. A fragment spans oriC
+        # if two boundaries have opposite signs, or both are equal to zero.
+        oriC_fragment_counts = np.bincount(
+            old_ranks[
+                ~np.logical_xor(old_left_coordinates < 0, old_right_coordinates > 0)
+            ],
+            minlength=n_domains,
+        )
+        # There should not be more than one fragment that spans oriC
+        assert np.all(oriC_fragment_counts[~spans_oriC] <= 1)
+        needs_oriC_dummy = ~spans_oriC & (oriC_fragment_counts == 0)
+        assert np.all(old_ends[needs_oriC_dummy] > old_starts[needs_oriC_dummy])
+
+        # Index of first segment in each domain where left boundary is
+        # nonnegative (first segment of domain if there is none)
+        first_nonnegative = np.full(n_domains, n_old)
+        np.minimum.at(
+            first_nonnegative,
+            old_ranks,
+            np.where(old_left_coordinates >= 0, np.arange(n_old), n_old),
+        )
+        first_nonnegative = np.where(
+            first_nonnegative == n_old, old_starts, first_nonnegative
+        )
+        oriC_insert_at = first_nonnegative[needs_oriC_dummy]
+        # Segment before insertion point wraps around to end of the domain
+        oriC_insert_after = np.where(
+            oriC_insert_at == old_starts[needs_oriC_dummy],
+            old_ends[needs_oriC_dummy] - 1,
+            oriC_insert_at - 1,
+        )
+        inserted_keys.append(4 * oriC_insert_at + 1)
+        inserted_indexes.append(
+            np.column_stack(
+                (old_indexes[oriC_insert_after, 1], old_indexes[oriC_insert_at, 0])
             )
-
-            # Add dummy molecule to old segments if they do not already exist
-            if old_boundary_molecule_indexes_sorted[0, 0] != self.terC_index:
-                old_boundary_molecule_indexes_sorted = np.vstack(
+        )
+        inserted_lns.append(np.zeros(len(oriC_insert_at)))
+        inserted_ranks.append(domain_ranks[needs_oriC_dummy])
+
+        # If the domain spans the terminus, dummy molecules are added to
+        # each end of the chromosome s.t. the segment that spans terC is
+        # split to two segments and we can maintain a linear representation
+        # for the circular chromosome. These two segments are later
+        # adjusted to have the same superhelical densities.
+        assert np.all(old_ends[spans_terC] > old_starts[spans_terC])
+        terC_domains = domain_ranks[spans_terC]
+        terC_starts = old_starts[spans_terC]
+        terC_ends = old_ends[spans_terC]
+        # Left boundary of first segment in domain after inserting oriC dummy
+        first_left_indexes = np.where(
+            needs_oriC_dummy[spans_terC]
+            & (first_nonnegative[spans_terC] == terC_starts),
+            old_indexes[terC_ends - 1, 1],
+            old_indexes[terC_starts, 0],
+        )
+        # Add dummy molecule to old segments if they do not already exist
+        needs_terC_dummy = first_left_indexes != self.terC_index
+        terC_domains = terC_domains[needs_terC_dummy]
+        terC_starts = terC_starts[needs_terC_dummy]
+        terC_ends = terC_ends[needs_terC_dummy]
+        inserted_keys.extend([4 * terC_starts, 4 * (terC_ends - 1) + 3])
+        inserted_indexes.extend(
+            [
+                np.column_stack(
                     (
-                        np.array(
-                            [
-                                self.terC_index,
-                                old_boundary_molecule_indexes_sorted[0, 0],
-                            ]
-                        ),
-                        old_boundary_molecule_indexes_sorted,
-                        np.array(
-                            [
-                                old_boundary_molecule_indexes_sorted[-1, 1],
-                                self.terC_index,
-                            ]
-                        ),
+                        np.full(len(terC_domains), self.terC_index),
+                        first_left_indexes[needs_terC_dummy],
                     )
+                ),
+                np.column_stack(
+                    (
+                        old_indexes[terC_ends - 1, 1],
+                        np.full(len(terC_domains), self.terC_index),
+                    )
+                ),
+            ]
+        )
+        inserted_lns.extend([np.zeros(len(terC_domains))] * 2)
+        inserted_ranks.extend([terC_domains] * 2)
+
+        insert_order = np.argsort(np.concatenate(inserted_keys), kind="stable")
+        old_indexes = np.vstack(inserted_indexes)[insert_order]
+        old_lns = np.concatenate(inserted_lns)[insert_order]
+        old_ranks = np.concatenate(inserted_ranks)[insert_order]
+        old_starts = np.searchsorted(old_ranks, domain_ranks)
+
+        # Add terC dummy molecules to each end of new molecules in domains
+        # that span the terminus
+        terC_new_starts = new_starts[spans_terC]
+        terC_new_ends = new_ends[spans_terC]
+        insert_order = np.argsort(
+            np.concatenate(
+                (
+                    3 * np.arange(len(new_ranks)) + 1,
+                    3 * terC_new_starts,
+                    3 * (terC_new_ends - 1) + 2,
                 )
-                old_linking_numbers_sorted = np.insert(
-                    old_linking_numbers_sorted, [0, len(old_linking_numbers_sorted)], 0
-                )
-
-        # Recalculate linking numbers of each segment after accounting for
-        # boundary molecules that were removed in the current timestep
-        linking_numbers_after_removal = []
-        right_boundaries_retained = np.isin(
-            old_boundary_molecule_indexes_sorted[:, 1], new_molecule_indexes_sorted
+            ),
+            kind="stable",
         )
+        new_coordinates = np.concatenate(
+            (
+                new_coordinates,
+                np.full(len(terC_new_starts), self.min_coordinates),
+                np.full(len(terC_new_ends), self.max_coordinates),
+            )
+        )[insert_order]
+        new_indexes = np.concatenate(
+            (new_indexes, np.full(2 * len(terC_new_starts), self.terC_index))
+        )[insert_order]
+        new_ranks = np.concatenate(
+            (new_ranks, domain_ranks[spans_terC], domain_ranks[spans_terC])
+        )[insert_order]
+        new_starts = np.searchsorted(new_ranks, domain_ranks)
+
+        # Molecule indexes are only compared within the same domain, so
+        # encode (domain, molecule index) pairs as single integer keys
+        unique_molecule_indexes, molecule_codes = np.unique(
+            np.concatenate((old_indexes.ravel(), new_indexes)), return_inverse=True
+        )
+        n_codes = len(unique_molecule_indexes)
+        old_keys = old_ranks[:, np.newaxis] * n_codes + molecule_codes[
+            : old_indexes.size
+        ].reshape(old_indexes.shape)
+        new_keys = new_ranks * n_codes + molecule_codes[old_indexes.size :]
 
-        # Add up linking numbers of each segment until each retained boundary
-        ln_this_fragment = 0.0
-        for retained, ln in zip(right_boundaries_retained, old_linking_numbers_sorted):
-            ln_this_fragment += ln
-
-            if retained:
-                linking_numbers_after_removal.append(ln_this_fragment)
-                ln_this_fragment = 0.0
-
-        # Number of segments should be equal to number of retained boundaries
-        assert len(linking_numbers_after_removal) == right_boundaries_retained.sum()
+        # Recalculate linking numbers of each segment after accounting for
+        # boundary molecules that were removed in the current timestep by
+        # adding up linking numbers of each segment until each retained
+        # boundary. Segments after the last retained boundary are dropped.
+        retained_indexes = np.flatnonzero(np.isin(old_keys[:, 1], new_keys))
+        group_ranks = old_ranks[retained_indexes]
+        group_starts = old_starts[group_ranks]
+        same_domain = group_ranks[1:] == group_ranks[:-1]
+        group_starts[1:][same_domain] = retained_indexes[:-1][same_domain] + 1
+        if len(retained_indexes) > 0:
+            linking_numbers_after_removal = np.add.reduceat(
+                np.append(old_lns, 0),
+                np.ravel((group_starts, retained_indexes + 1), order="F"),
+            )[::2]
+        else:
+            linking_numbers_after_removal = np.array([], dtype=np.float64)
+        n_groups = np.bincount(group_ranks, minlength=n_domains)
+        first_groups = np.searchsorted(group_ranks, domain_ranks)
 
         # Redistribute linking numbers of the two terC segments such that the
         # segments have same superhelical densities
-        if spans_terC and np.count_nonzero(right_boundaries_retained) > 1:
+        redistributed = spans_terC & (n_groups > 1)
+        if np.any(redistributed):
+            left_groups = first_groups[redistributed]
+            right_groups = left_groups + n_groups[redistributed] - 1
+
             # Get molecule indexes of the boundaries of the two terC segments
-            # left and right of terC
-            retained_boundary_indexes = np.where(right_boundaries_retained)[0]
-            left_segment_boundary_index = old_boundary_molecule_indexes_sorted[
-                retained_boundary_indexes[0], 1
-            ]
-            right_segment_boundary_index = old_boundary_molecule_indexes_sorted[
-                retained_boundary_indexes[-2], 1
-            ]
+            # left and right of terC and look up their coordinates
+            new_keys_order = np.argsort(new_keys, kind="stable")
+            new_keys_sorted = new_keys[new_keys_order]
 
-            # Get mapping from molecule index to chromosomal coordinates
-            molecule_index_to_coordinates = {
-                index: coordinates
-                for index, coordinates in zip(
-                    new_molecule_indexes_sorted, new_molecule_coordinates_sorted
-                )
-            }
+            def boundary_coordinates(group_indexes):
+                keys = old_keys[retained_indexes[group_indexes], 1]
+                positions = np.searchsorted(new_keys_sorted, keys, side="right") - 1
+                return new_coordinates[new_keys_order[positions]]
 
             # Distribute linking number between two segments proportional to
             # the length of each segment
-            left_segment_length = (
-                molecule_index_to_coordinates[left_segment_boundary_index]
-                - self.min_coordinates
+            left_segment_lengths = (
+                boundary_coordinates(left_groups) - self.min_coordinates
             )
-            right_segment_length = (
-                self.max_coordinates
-                - molecule_index_to_coordinates[right_segment_boundary_index]
+            right_segment_lengths = self.max_coordinates - boundary_coordinates(
+                right_groups - 1
             )
-            full_segment_length = left_segment_length + right_segment_length
-            full_linking_number = (
-                linking_numbers_after_removal[0] + linking_numbers_after_removal[-1]
+            full_segment_lengths = left_segment_lengths + right_segment_lengths
+            full_linking_numbers = (
+                linking_numbers_after_removal[left_groups]
+                + linking_numbers_after_removal[right_groups]
             )
-
-            linking_numbers_after_removal[0] = (
-                full_linking_number * left_segment_length / full_segment_length
+            linking_numbers_after_removal[left_groups] = (
+                full_linking_numbers * left_segment_lengths / full_segment_lengths
             )
-            linking_numbers_after_removal[-1] = (
-                full_linking_number * right_segment_length / full_segment_length
+            linking_numbers_after_removal[right_groups] = (
+                full_linking_numbers * right_segment_lengths / full_segment_lengths
             )
 
-        # Get mask for molecules that already existed in the previous timestep
-        existing_molecules_mask = np.isin(
-            new_molecule_indexes_sorted, old_boundary_molecule_indexes_sorted
+        # New segments are formed between consecutive molecules on the same
+        # domain
+        segment_starts = np.flatnonzero(new_ranks[1:] == new_ranks[:-1])
+        segment_ranks = new_ranks[segment_starts]
+        new_boundary_molecule_indexes = np.column_stack(
+            (new_indexes[segment_starts], new_indexes[segment_starts + 1])
         )
-
-        # Get numbers and lengths of new segments that each segment will be
-        # split into
-        segment_split_sizes = np.diff(np.where(existing_molecules_mask)[0])
-        segment_lengths = np.diff(new_molecule_coordinates_sorted)
-
-        assert len(segment_split_sizes) == len(linking_numbers_after_removal)
+        new_boundary_coordinates = np.column_stack(
+            (new_coordinates[segment_starts], new_coordinates[segment_starts + 1])
+        )
+        segment_lengths = np.diff(new_boundary_coordinates, axis=1)[:, 0]
+
+        # Each segment in between two consecutive molecules that already
+        # existed in the previous timestep belongs to the group of the
+        # retained segment that spanned those two molecules
+        existing_molecules_mask = np.isin(new_keys, old_keys)
+        n_existing_molecules = np.bincount(
+            new_ranks[existing_molecules_mask], minlength=n_domains
+        )
+        assert np.array_equal(np.maximum(n_existing_molecules - 1, 0), n_groups)
+        existing_molecules_cumsum = np.cumsum(existing_molecules_mask)
+        n_existing_before_domain = np.append(0, existing_molecules_cumsum)[new_starts]
+        segment_groups = (
+            existing_molecules_cumsum[segment_starts]
+            - n_existing_before_domain[segment_ranks]
+            - 1
+        )
+        # Segments outside of existing molecules only occur on domains that
+        # were just initialized with two replisomes bound to the origin.
+        # Their linking numbers are set to zero.
+        valid_segments = (segment_groups >= 0) & (
+            segment_groups < n_groups[segment_ranks]
+        )
+        segment_groups = first_groups[segment_ranks] + segment_groups
 
         # Calculate linking numbers of each segment after accounting for new
-        # boundaries that were added
-        new_linking_numbers = []
-        i = 0
-
-        for ln, size in zip(linking_numbers_after_removal, segment_split_sizes):
-            if size == 1:
-                new_linking_numbers.append(ln)
-            else:
-                # Split linking number proportional to length of segment
-                total_length = segment_lengths[i : i + size].sum()
-                new_linking_numbers.extend(
-                    list(ln * segment_lengths[i : i + size] / total_length)
-                )
-            i += size
-
-        # Handle edge case where a domain was just initialized, and two
-        # replisomes are bound to the origin
-        if len(new_linking_numbers) == 0:
-            new_linking_numbers = [np.float64(0)]
-
-        # Build Mx2 array for boundary indexes and coordinates
-        new_boundary_molecule_indexes = np.hstack(
-            (
-                new_molecule_indexes_sorted[:-1, np.newaxis],
-                new_molecule_indexes_sorted[1:, np.newaxis],
-            )
+        # boundaries that were added by splitting the linking number of each
+        # group proportional to length of segment
+        new_linking_numbers = np.zeros(len(segment_starts))
+        valid_groups = segment_groups[valid_segments]
+        group_sizes = np.bincount(valid_groups, minlength=len(retained_indexes))
+        group_lengths = np.bincount(
+            valid_groups,
+            weights=segment_lengths[valid_segments],
+            minlength=len(retained_indexes),
         )
-        new_boundary_coordinates = np.hstack(
-            (
-                new_molecule_coordinates_sorted[:-1, np.newaxis],
-                new_molecule_coordinates_sorted[1:, np.newaxis],
-            )
+        valid_lns = linking_numbers_after_removal[valid_groups]
+        split = group_sizes[valid_groups] > 1
+        valid_lns[split] = (
+            valid_lns[split]
+            * segment_lengths[valid_segments][split]
+            / group_lengths[valid_groups[split]]
         )
-        new_linking_numbers = np.array(new_linking_numbers)
+        new_linking_numbers[valid_segments] = valid_lns
 
         # If domain does not span oriC, remove new segment that spans origin
-        if not spans_oriC:
-            oriC_fragment_mask = np.logical_not(
-                np.logical_xor(
-                    new_boundary_coordinates[:, 0] < 0,
-                    new_boundary_coordinates[:, 1] > 0,
-                )
+        oriC_fragment_mask = (
+            ~np.logical_xor(
+                new_boundary_coordinates[:, 0] < 0, new_boundary_coordinates[:, 1] > 0
             )
-
-            assert oriC_fragment_mask.sum() == 1
-
-            new_boundary_molecule_indexes = new_boundary_molecule_indexes[
-                np.logical_not(oriC_fragment_mask), :
-            ]
-            new_boundary_coordinates = new_boundary_coordinates[
-                np.logical_not(oriC_fragment_mask), :
-            ]
-            new_linking_numbers = new_linking_numbers[
-                np.logical_not(oriC_fragment_mask)
+            & ~spans_oriC[segment_ranks]
+        )
+        assert np.all(
+            np.bincount(segment_ranks[oriC_fragment_mask], minlength=n_domains)[
+                ~spans_oriC
             ]
+            == 1
+        )
 
         return {
-            "boundary_molecule_indexes": new_boundary_molecule_indexes,
-            "boundary_coordinates": new_boundary_coordinates,
-            "linking_numbers": new_linking_numbers,
+            "boundary_molecule_indexes": new_boundary_molecule_indexes[
+                ~oriC_fragment_mask, :
+            ],
+            "boundary_coordinates": new_boundary_coordinates[~oriC_fragment_mask, :],
+            "domain_indexes": domain_indexes[segment_ranks[~oriC_fragment_mask]].astype(
+                np.int32
+            ),
+            "linking_numbers": new_linking_numbers[~oriC_fragment_mask],
         }
 
 
@@ -1327,6 +1413,112 @@ def get_last_known_replisome_data(
     return replisome_coordinates, replisome_molecule_indexes
 
 
+class DomainCoordinateIndex:
+    """
+    Index of chromosome-bound unique molecules sorted by domain index and then
+    by coordinate. Built once per time step so that looking up the molecules on
+    a domain, or the molecules within a coordinate range on every domain at
+    once, takes binary searches instead of a boolean mask over all molecules
+    per domain.
+
+    Args:
+        domain_indexes: (N,) array of domain indexes of molecules
+        coordinates: (N,) array of chromosomal coordinates of molecules
+    """
+
+    def __init__(self, domain_indexes: np.ndarray, coordinates: np.ndarray):
+        self.n_molecules = len(domain_indexes)
+        self.order = np.lexsort((coordinates, domain_indexes))
+        sorted_domain_indexes = domain_indexes[self.order]
+        self.sorted_coordinates = coordinates[self.order].astype(np.int64)
+        self.domains, self.domain_starts = np.unique(
+            sorted_domain_indexes, return_index=True
+        )
+        self.domain_ends = np.append(self.domain_starts[1:], self.n_molecules)
+
+        # Encode (domain rank, coordinate) pairs as monotonically increasing
+        # integer keys so that ranges on all domains can be searched at once
+        if self.n_molecules > 0:
+            self.min_coordinate = self.sorted_coordinates.min()
+            max_coordinate = self.sorted_coordinates.max()
+        else:
+            self.min_coordinate = max_coordinate = 0
+        # Leave room for clipped bounds one below the min and one above the max
+        self.key_span = max_coordinate - self.min_coordinate + 3
+        domain_ranks = np.repeat(
+            np.arange(len(self.domains)), self.domain_ends - self.domain_starts
+        )
+        self.sorted_keys = self._keys(domain_ranks, self.sorted_coordinates)
+
+    def _keys(self, domain_ranks: np.ndarray, coordinates: np.ndarray) -> np.ndarray:
+        clipped = np.clip(
+            coordinates,
+            self.min_coordinate - 1,
+            self.min_coordinate + self.key_span - 2,
+        )
+        return domain_ranks * self.key_span + (clipped - self.min_coordinate + 1)
+
+    def domain_members(self, domain_index: int) -> np.ndarray:
+        """
+        Returns the indexes (in the original arrays, in ascending order) of
+        all molecules on the given domain.
+        """
+        i = np.searchsorted(self.domains, domain_index)
+        if i == len(self.domains) or self.domains[i] != domain_index:
+            return np.array([], dtype=np.int64)
+        return np.sort(self.order[self.domain_starts[i] : self.domain_ends[i]])
+
+    def range_mask(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """
+        Returns the boolean mask (in the order of the original arrays) of
+        molecules whose coordinates are within the inclusive range
+        ``[lower[i], upper[i]]`` on domain ``self.domains[i]`` for all ``i``.
+        Ranges where ``lower[i] > upper[i]`` are empty.
+        """
+        domain_ranks = np.arange(len(self.domains))
+        starts = np.searchsorted(
+            self.sorted_keys, self._keys(domain_ranks, lower), side="left"
+        )
+        ends = np.searchsorted(
+            self.sorted_keys, self._keys(domain_ranks, upper), side="right"
+        )
+        nonempty = (lower <= upper) & (ends > starts)
+        # Mark ranges in sorted order with a difference array
+        boundaries = np.zeros(self.n_molecules + 1, dtype=np.int64)
+        np.add.at(boundaries, starts[nonempty], 1)
+        np.add.at(boundaries, ends[nonempty], -1)
+        mask = np.zeros(self.n_molecules, dtype=np.bool_)
+        mask[self.order] = np.cumsum(boundaries[:-1]) > 0
+        return mask
+
+
+def test_domain_coordinate_index():
+    rng = np.random.default_rng(0)
+    domain_indexes = rng.integers(0, 7, 200)
+    coordinates = rng.integers(-1000, 1000, 200)
+    index = DomainCoordinateIndex(domain_indexes, coordinates)
+    assert np.array_equal(index.domains, np.unique(domain_indexes))
+    for domain in range(8):
+        assert np.array_equal(
+            index.domain_members(domain), np.where(domain_indexes == domain)[0]
+        )
+    lower = rng.integers(-1500, 500, len(index.domains))
+    upper = lower + rng.integers(-100, 1500, len(index.domains))
+    # Unbounded ranges must include every molecule on the domain
+    lower[0] = np.iinfo(np.int64).min
+    upper[0] = np.iinfo(np.int64).max
+    expected = np.zeros(len(domain_indexes), dtype=np.bool_)
+    for domain, lo, hi in zip(index.domains, lower, upper):
+        expected |= (
+            (domain_indexes == domain) & (coordinates >= lo) & (coordinates <= hi)
+        )
+    assert np.array_equal(index.range_mask(lower, upper), expected)
+    empty_index = DomainCoordinateIndex(
+        np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    )
+    assert len(empty_index.range_mask(np.array([]), np.array([]))) == 0
+
+
 def test_superhelical_removal_sim():
     """
     Run a single time step simulation of :py:class:`~.ChromosomeStructure`
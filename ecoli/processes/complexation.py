@@ -23,6 +23,7 @@ from stochastic_arrow import StochasticSystem
 from vivarium.core.composition import simulate_process
 
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts, listener_schema
+from ecoli.library.rng import integers, make_rng
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
 
@@ -42,6 +43,7 @@ class Complexation(PartitionedProcess):
         "rates": np.array([]),
         "molecule_names": [],
         "seed": 0,
+        "legacy_rng": False,
         "reaction_ids": [],
         "complex_ids": [],
         "time_step": 1,
@@ -57,8 +59,10 @@ class Complexation(PartitionedProcess):
         self.reaction_ids = self.parameters["reaction_ids"]
         self.complex_ids = self.parameters["complex_ids"]
 
-        self.randomState = np.random.RandomState(seed=self.parameters["seed"])
-        self.seed = self.randomState.randint(2**31)
+        self.randomState = make_rng(
+            self.parameters["seed"], self.parameters["legacy_rng"]
+        )
+        self.seed = int(integers(self.randomState, 2**31))
         self.system = StochasticSystem(self.stoichiometry, random_seed=self.seed)
 
     def ports_schema(self):
@@ -78,6 +78,23 @@ EngineProcess.
 
 These tunnels are the only way that the EngineProcess exchanges
 information with the outside simulation.
+
+Update Logs
+===========
+
+By default, the update that EngineProcess returns for each tunnel is
+calculated by comparing the values of the tunneled store before and after
+running the inner simulation (see :py:func:`~._inverse_update`), which
+touches every value in the store (e.g. the entire bulk array) every
+timestep. With the ``tunnel_update_log`` option, every update applied to a
+tunneled store in the inner simulation is recorded instead, and the update
+for the outer simulation is built by combining the recorded updates (see
+:py:func:`~._logged_update`). Stores that are not updated cost nothing.
+
+Unless the EngineProcess runs in parallel, the inner and outer simulations
+hold the same objects for tunneled values (e.g. the same bulk array), so
+updates that modify a value in place are already visible to the outer
+simulation and are not returned again.
 """
 
 import copy
@@ -95,8 +112,13 @@ from vivarium.library.topology import get_in
 
 from ecoli.library.parquet_emitter import ParquetEmitter
 from ecoli.library.sim_data import RAND_MAX
-from ecoli.library.schema import remove_properties, empty_dict_divider, not_a_process
-from ecoli.library.updaters import inverse_updater_registry
+from ecoli.library.schema import (
+    division_cache,
+    remove_properties,
+    empty_dict_divider,
+    not_a_process,
+)
+from ecoli.library.updaters import compose_updates, inverse_updater_registry
 from ecoli.processes.cell_division import daughter_phylogeny_id
 
 
@@ -217,6 +239,8 @@ class EngineProcess(Process):
         "start_time": 0,
         "experiment_id": "",
         "inner_same_timestep": False,
+        # Build tunnel updates from logs of inner updates (see module docs)
+        "tunnel_update_log": False,
     }
     # TODO: Handle name clashes between tunnels.
 
@@ -249,6 +273,10 @@ class EngineProcess(Process):
         - ``tunnel_out_schemas``: a mapping from names of ports for tunnels out
           to schemas to use for the stores that those ports point to. Helpful
           for ensuring consistency in schemas specified for these stores.
+        - ``tunnel_update_log``: whether to build the updates for tunnels from
+          logs of the updates applied to tunneled stores in the inner
+          simulation instead of by comparing their values before and after
+          each timestep (see "Update Logs" in the module docstring).
 
         These options allow EngineProcess to create a full inner simulation,
         increment it in sync with the process time step and the rest of the
@@ -323,6 +351,11 @@ class EngineProcess(Process):
         self.updater_registry_reverse = {
             updater_registry.access(key): key for key in updater_registry.main_keys
         }
+        if self.parameters["tunnel_update_log"]:
+            for path in self.tunnels_in.values():
+                _log_updates(self.sim.state.get_path(path))
+            for tunnel in self.tunnels_out.values():
+                _log_updates(self.sim.state.get_path((tunnel,)))
 
     def create_emitter(self):
         """
@@ -523,7 +556,9 @@ class EngineProcess(Process):
                 self.emitter._finalize()
             # Perform division.
             daughters = []
-            daughter_states = self.sim.state.divide_value()
+            # Divide chromosome domains and RNAs once for all unique molecules
+            with division_cache():
+                daughter_states = self.sim.state.divide_value()
             daughter_ids = daughter_phylogeny_id(self.parameters["agent_id"])
             for daughter_id, inner_state in zip(daughter_ids, daughter_states):
                 emitter_config = dict(self.emitter_config)
@@ -565,26 +600,36 @@ class EngineProcess(Process):
         # Craft an update to pass data back out through the tunnels.
         for tunnel, path in self.tunnels_in.items():
             store = self.sim.state.get_path(path)
-            inverted_update = _inverse_update(
-                states[tunnel],
-                store.get_value(),
-                store,
-                self.updater_registry_reverse,
-            )
+            inverted_update = self.tunnel_update(states[tunnel], store)
             if not (isinstance(inverted_update, dict) and inverted_update == {}):
                 update[tunnel] = inverted_update
         for tunnel in self.tunnels_out.values():
             store = self.sim.state.get_path((tunnel,))
-            inverted_update = _inverse_update(
-                states[tunnel],
-                store.get_value(),
-                store,
-                self.updater_registry_reverse,
-            )
+            inverted_update = self.tunnel_update(states[tunnel], store)
             if not (isinstance(inverted_update, dict) and inverted_update == {}):
                 update[tunnel] = inverted_update
         return update
 
+    def tunnel_update(self, initial_state: Any, store: Store) -> Any:
+        """
+        Calculate the update for the outer simulation store of a tunnel
+        given its value at the start of :py:meth:`~.next_update` and the
+        tunneled store in the inner simulation.
+        """
+        if self.parameters["tunnel_update_log"]:
+            return _logged_update(
+                initial_state,
+                store,
+                self.updater_registry_reverse,
+                shared=not self.parallel,
+            )
+        return _inverse_update(
+            initial_state,
+            store.get_value(),
+            store,
+            self.updater_registry_reverse,
+        )
+
 
 def _inverse_update(
     initial_state: Any,
@@ -640,6 +685,128 @@ def _inverse_update(
     return update
 
 
+class _UpdateLog:
+    """
+    Replaces the ``apply_update`` method of a leaf store to record every
+    update applied to it. Used instead of a closure so that stores (and the
+    EngineProcess) can still be pickled for parallel processes.
+    """
+
+    def __init__(self, store: Store):
+        self.apply_update = store.apply_update
+        self.updates: list[Any] = []
+
+    def __call__(self, update, state=None):
+        self.updates.append(update)
+        return self.apply_update(update, state)
+
+    def pop(self) -> list[Any]:
+        """Return the updates recorded so far and start a new log."""
+        updates = self.updates
+        self.updates = []
+        return updates
+
+
+def _log_updates(store: Store):
+    """Start recording the updates applied to every leaf of ``store``."""
+    for _, node in store.depth():
+        if not node.inner and not isinstance(
+            vars(node).get("apply_update"), _UpdateLog
+        ):
+            node.apply_update = _UpdateLog(node)
+
+
+def _resolve_update(
+    store: Store, update: Any, updater_registry_reverse: dict[Callable, str]
+) -> tuple[str, Any] | None:
+    """
+    Get the name of the updater that a leaf store applies ``update`` with
+    and the value that the updater receives, mirroring
+    :py:meth:`vivarium.core.store.Store.apply_update`. Returns None for
+    updates that cannot be resolved (e.g. reductions or unnamed updaters).
+    """
+    if isinstance(update, dict) and "_reduce" in update:
+        return None
+    updater_name = updater_registry_reverse.get(store._get_updater(update))
+    if updater_name is None:
+        return None
+    if (
+        isinstance(update, dict)
+        and store.schema_keys & set(update.keys())
+        and "_updater" in update
+    ):
+        update = update.get("_value", store.default)
+    return updater_name, update
+
+
+def _logged_update(
+    initial_state: Any,
+    store: Store,
+    updater_registry_reverse: dict[Callable, str],
+    shared: bool,
+):
+    """
+    Same as :py:func:`~._inverse_update` but combines the updates recorded
+    for each leaf of ``store`` by :py:func:`~._log_updates` (see
+    :py:func:`~ecoli.library.updaters.compose_updates`) instead of comparing
+    initial and final values. Falls back to :py:func:`~._inverse_update`
+    for leaves that were not logged or whose updates cannot be combined,
+    and starts logging the former.
+
+    Args:
+        initial_state: Current values (potentially nested) in the outer store
+        store: Store (potentially nested) in the inner simulation
+        updater_registry_reverse: A mapping from updater functions to the string
+            names they are registered as in :py:data:`~vivarium.core.registry.updater_registry`
+        shared: Whether the outer store holds the same objects as ``store``.
+            If so, leaves whose final value is the object in ``initial_state``
+            were only modified in place and need no update.
+
+    Returns:
+        Update dictionary that when used to update the outer store causes its
+        values to match those in ``store``
+    """
+    if not store.inner:
+        update_log = vars(store).get("apply_update")
+        if not isinstance(update_log, _UpdateLog):
+            _log_updates(store)
+            return _inverse_update(
+                initial_state, store.get_value(), store, updater_registry_reverse
+            )
+        updates = update_log.pop()
+        if not updates or (shared and store.value is initial_state):
+            return {}
+        resolved = [
+            _resolve_update(store, update, updater_registry_reverse)
+            for update in updates
+        ]
+        composed = None
+        if all(resolved):
+            composed = compose_updates(resolved)
+        if composed is None:
+            return _inverse_update(
+                initial_state, store.get_value(), store, updater_registry_reverse
+            )
+        updater_name, update = composed
+        if updater_name == "null":
+            return {}
+        if updater_name == updater_registry_reverse.get(store._get_updater(None)):
+            return update
+        return {"_updater": updater_name, "_value": update}
+
+    update = {}
+    for key in initial_state.keys():
+        sub_update = _logged_update(
+            initial_state[key],
+            store.inner[key],
+            updater_registry_reverse,
+            shared,
+        )
+        if not (isinstance(sub_update, (dict, list)) and not sub_update):
+            update[key] = sub_update
+    return update
+
+
 class _ProcA(Process):
     def ports_schema(self):
         return {
@@ -751,6 +918,7 @@ class _OuterComposer(Composer):
                 "inner_emitter": config["inner_emitter"],
                 "start_time": config["start_time"],
                 "experiment_id": config["experiment_id"],
+                "tunnel_update_log": config.get("tunnel_update_log", False),
             }
         )
         return {
@@ -805,6 +973,18 @@ def test_engine_process():
     inner store `c`, and ``b_tunnel`` is a tunnel out from inner process
     ``B`` to outer store ``b``.
     """
+    _check_engine_process(tunnel_update_log=False)
+
+
+def test_engine_process_update_log():
+    """
+    Same as :py:func:`~.test_engine_process` but with tunnel updates built
+    from logs of inner updates, which must not change the simulation.
+    """
+    _check_engine_process(tunnel_update_log=True)
+
+
+def _check_engine_process(tunnel_update_log):
     experiment_id = "test_experiment_id"
 
     # Clear the emitter's data in case it has been filled by another
@@ -822,6 +1002,7 @@ def test_engine_process():
                 "type": "shared_ram",
                 "embed_path": agent_path,
             },
+            "tunnel_update_log": tunnel_update_log,
         }
     )
     outer_composite = outer_composer.generate(path=agent_path)
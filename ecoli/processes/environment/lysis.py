@@ -358,6 +358,7 @@ def test_lysis(
                     ("beta-lactam", 0),
                     ("hydrolyzed-beta-lactam", 0),
                     ("EG10040-MONOMER[p]", 0),
+                    ("GLC", 0),
                 ],
                 dtype=[("id", "U40"), ("count", int)],
             ),
@@ -226,30 +226,30 @@ class Multibody(Process):
         self.physics.run(timestep)
 
         # get new agent positions
-        agent_positions = self.physics.get_body_positions()
-        update = {"agents": agent_positions}
+        agent_ids, locations, angles = self.physics.get_body_arrays()
 
         # for mother machine configurations, remove agents above the channel height
+        keep = np.ones(len(agent_ids), dtype=bool)
         if self.mother_machine:
             channel_height = self.mother_machine["channel_height"]
-            delete_agents = []
-            for agent_id, position in agent_positions.items():
-                location = position["boundary"]["location"]
-                y_loc = location[1]
-                if y_loc > channel_height:
-                    # cell has moved past the channels
-                    delete_agents.append(agent_id)
-            if delete_agents:
-                update["agents"] = {
-                    agent_id: position
-                    for agent_id, position in agent_positions.items()
-                    if agent_id not in delete_agents
+            keep = locations[:, 1] <= channel_height
+
+        # add units to all locations at once
+        locations = locations * units.um
+        update = {
+            "agents": {
+                agent_id: {
+                    "boundary": {"location": locations[index], "angle": angles[index]}
                 }
-
-                update["agents"]["_delete"] = [agent_id for agent_id in delete_agents]
-
-        for agent in update["agents"].values():
-            agent["boundary"]["location"] *= units.um
+                for index, agent_id in enumerate(agent_ids)
+                if keep[index]
+            }
+        }
+        if not keep.all():
+            # cells that have moved past the channels
+            update["agents"]["_delete"] = [
+                agent_id for agent_id, kept in zip(agent_ids, keep) if not kept
+            ]
 
         return update
 
@@ -11,6 +11,7 @@ that maintains equilibrium.
 import numpy as np
 
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts, listener_schema
+from ecoli.library.rng import make_rng
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
 
@@ -42,6 +43,7 @@ class Equilibrium(PartitionedProcess):
         ),
         "moleculeNames": [],
         "seed": 0,
+        "legacy_rng": False,
         "complex_ids": [],
         "reaction_ids": [],
     }
@@ -76,7 +78,7 @@ class Equilibrium(PartitionedProcess):
         self.molecule_idx = None
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         self.complex_ids = self.parameters["complex_ids"]
         self.reaction_ids = self.parameters["reaction_ids"]
@@ -8,6 +8,7 @@ import numpy as np
 from ecoli.library.schema import numpy_schema, attrs, listener_schema
 from vivarium.core.process import Step
 
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 
@@ -29,6 +30,7 @@ class RNACounts(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {
         "rna_ids": [],
@@ -79,7 +81,9 @@ class RNACounts(Step):
         }
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         # Get attributes of mRNAs
@@ -133,6 +137,41 @@ class RNACounts(Step):
         }
         return update
 
+    def linear_maps(self) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Express the cistron counts emitted by this listener as linear
+        functions of the transcription unit counts that it emits. This relies
+        on all RNAs counted here being either mRNAs or rRNAs and on rRNAs
+        never being full transcripts. Used to reconstruct the cistron counts
+        from emitted data (see
+        :py:data:`~ecoli.library.parquet_emitter.DERIVED_COLUMNS`).
+
+        Returns:
+            Mapping of names of cistron count listeners to mappings of
+            the names of the transcription unit count listeners that they
+            depend on to the matrices by which to multiply them
+        """
+        mapping = self.cistron_tu_mapping_matrix
+        mRNA_from_mRNA = mapping[self.cistron_is_mRNA][:, self.mRNA_indexes]
+        mRNA_from_rRNA = mapping[self.cistron_is_mRNA][:, self.rRNA_indexes]
+        rRNA_from_mRNA = mapping[self.cistron_is_rRNA][:, self.mRNA_indexes]
+        rRNA_from_rRNA = mapping[self.cistron_is_rRNA][:, self.rRNA_indexes]
+        return {
+            "mRNA_cistron_counts": {
+                "mRNA_counts": mRNA_from_mRNA,
+                "partial_rRNA_counts": mRNA_from_rRNA,
+            },
+            "full_mRNA_cistron_counts": {"full_mRNA_counts": mRNA_from_mRNA},
+            "partial_mRNA_cistron_counts": {
+                "partial_mRNA_counts": mRNA_from_mRNA,
+                "partial_rRNA_counts": mRNA_from_rRNA,
+            },
+            "partial_rRNA_cistron_counts": {
+                "mRNA_counts": rRNA_from_mRNA,
+                "partial_rRNA_counts": rRNA_from_rRNA,
+            },
+        }
+
 
 def test_rna_counts_listener():
     from ecoli.experiments.ecoli_master_sim import EcoliSim
@@ -147,5 +186,63 @@ def test_rna_counts_listener():
     assert isinstance(listeners["rna_counts"]["mRNA_counts"][1], list)
 
 
+def test_rna_counts_linear_maps():
+    import scipy.sparse
+
+    # TUs 0 and 1 are mRNAs, TU 2 is an rRNA, and TU 3 is a tRNA
+    all_TU_ids = np.array(["tu0", "tu1", "tu2", "tu3"])
+    all_cistron_ids = np.array(["c0", "c1", "c2", "c3", "c4"])
+    cistron_is_mRNA = np.array([True, True, True, False, False])
+    cistron_is_rRNA = np.array([False, False, False, True, False])
+    mRNA_indexes = np.array([0, 1])
+    rRNA_indexes = np.array([2])
+    listener = RNACounts(
+        {
+            "all_TU_ids": all_TU_ids,
+            "mRNA_indexes": mRNA_indexes,
+            "mRNA_TU_ids": all_TU_ids[mRNA_indexes],
+            "rRNA_indexes": rRNA_indexes,
+            "rRNA_TU_ids": all_TU_ids[rRNA_indexes],
+            "all_cistron_ids": all_cistron_ids,
+            "cistron_is_mRNA": cistron_is_mRNA,
+            "mRNA_cistron_ids": all_cistron_ids[cistron_is_mRNA],
+            "cistron_is_rRNA": cistron_is_rRNA,
+            "rRNA_cistron_ids": all_cistron_ids[cistron_is_rRNA],
+            "cistron_tu_mapping_matrix": scipy.sparse.csr_matrix(
+                [
+                    [1, 0, 0, 0],
+                    [1, 1, 0, 0],
+                    [0, 1, 1, 0],
+                    [0, 0, 1, 0],
+                    [0, 0, 0, 1],
+                ]
+            ),
+        }
+    )
+    rng = np.random.default_rng(0)
+    n_RNAs = 50
+    RNAs = np.zeros(
+        n_RNAs,
+        dtype=[
+            ("TU_index", int),
+            ("can_translate", bool),
+            ("is_full_transcript", bool),
+            ("_entryState", np.int8),
+        ],
+    )
+    RNAs["TU_index"] = rng.integers(0, 4, n_RNAs)
+    RNAs["can_translate"] = RNAs["TU_index"] < 2
+    RNAs["is_full_transcript"] = (RNAs["TU_index"] != 2) & rng.choice(
+        [True, False], n_RNAs
+    )
+    RNAs["_entryState"] = rng.choice([0, 1], n_RNAs)
+    rna_counts = listener.next_update(1, {"RNAs": RNAs})["listeners"]["rna_counts"]
+    for cistron_counts, maps in listener.linear_maps().items():
+        np.testing.assert_array_equal(
+            sum(matrix @ rna_counts[name] for name, matrix in maps.items()),
+            rna_counts[cistron_counts],
+        )
+
+
 if __name__ == "__main__":
     test_rna_counts_listener()
@@ -8,6 +8,7 @@ import numpy as np
 from ecoli.library.schema import numpy_schema, listener_schema, attrs
 from vivarium.core.process import Step
 
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 
@@ -28,6 +29,7 @@ class DnaSupercoiling(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {
         "relaxed_DNA_base_pairs_per_turn": 0,
@@ -61,7 +63,9 @@ class DnaSupercoiling(Step):
         }
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         boundary_coordinates, domain_indexes, linking_numbers = attrs(
@@ -5,9 +5,16 @@ Monomer Counts Listener
 """
 
 import numpy as np
-from ecoli.library.schema import numpy_schema, counts, bulk_name_to_idx
+import scipy.sparse
+from ecoli.library.schema import (
+    numpy_schema,
+    counts,
+    bulk_name_to_idx,
+    get_bulk_index,
+)
 from vivarium.core.process import Step
 
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 
@@ -29,6 +36,7 @@ class MonomerCounts(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {
         "bulk_molecule_ids": [],
@@ -144,37 +152,36 @@ class MonomerCounts(Step):
         }
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         if self.monomer_idx is None:
-            bulk_ids = states["bulk"]["id"]
-            self.bulk_molecule_idx = bulk_name_to_idx(self.bulk_molecule_ids, bulk_ids)
-            self.monomer_idx = bulk_name_to_idx(self.monomer_ids, bulk_ids)
-            self.complexation_molecule_idx = bulk_name_to_idx(
-                self.complexation_molecule_ids, bulk_ids
-            )
-            self.complexation_complex_idx = bulk_name_to_idx(
-                self.complexation_complex_ids, bulk_ids
-            )
-            self.equilibrium_molecule_idx = bulk_name_to_idx(
-                self.equilibrium_molecule_ids, bulk_ids
-            )
-            self.equilibrium_complex_idx = bulk_name_to_idx(
-                self.equilibrium_complex_ids, bulk_ids
-            )
-            self.two_component_system_molecule_idx = bulk_name_to_idx(
-                self.two_component_system_molecule_ids, bulk_ids
-            )
-            self.two_component_system_complex_idx = bulk_name_to_idx(
-                self.two_component_system_complex_ids, bulk_ids
-            )
-            self.ribosome_subunit_idx = bulk_name_to_idx(
-                self.ribosome_subunit_ids, bulk_ids
-            )
-            self.rnap_subunit_idx = bulk_name_to_idx(self.rnap_subunit_ids, bulk_ids)
-            self.replisome_subunit_idx = bulk_name_to_idx(
-                self.replisome_subunit_ids, bulk_ids
+            (
+                self.bulk_molecule_idx,
+                self.monomer_idx,
+                self.complexation_molecule_idx,
+                self.complexation_complex_idx,
+                self.equilibrium_molecule_idx,
+                self.equilibrium_complex_idx,
+                self.two_component_system_molecule_idx,
+                self.two_component_system_complex_idx,
+                self.ribosome_subunit_idx,
+                self.rnap_subunit_idx,
+                self.replisome_subunit_idx,
+            ) = get_bulk_index(states["bulk"]["id"]).lookup_groups(
+                self.bulk_molecule_ids,
+                self.monomer_ids,
+                self.complexation_molecule_ids,
+                self.complexation_complex_ids,
+                self.equilibrium_molecule_ids,
+                self.equilibrium_complex_ids,
+                self.two_component_system_molecule_ids,
+                self.two_component_system_complex_ids,
+                self.ribosome_subunit_ids,
+                self.rnap_subunit_ids,
+                self.replisome_subunit_ids,
             )
 
         # Get current counts of bulk and unique molecules
@@ -225,6 +232,66 @@ class MonomerCounts(Step):
         update = {"listeners": {"monomer_counts": monomer_counts}}
         return update
 
+    def linear_map(
+        self, bulk_ids: np.ndarray
+    ) -> tuple[scipy.sparse.csr_matrix, np.ndarray]:
+        """
+        Express the output of this listener as a linear function of the bulk
+        counts and the counts of active ribosomes, RNA polymerases, and
+        replisomes such that ``monomer_counts = A @ bulk_counts + B @ n_active``
+        where ``n_active = [n_active_ribosome, n_active_RNAP, n_active_replisome]``.
+        Used to reconstruct this listener from emitted data (see
+        :py:data:`~ecoli.library.parquet_emitter.DERIVED_COLUMNS`).
+
+        Args:
+            bulk_ids: IDs of bulk molecules in the order that they are emitted
+
+        Returns:
+            Tuple of sparse matrix ``A`` (monomers x bulk molecules) and
+            dense matrix ``B`` (monomers x 3)
+        """
+        n_bulk = len(bulk_ids)
+        A = scipy.sparse.identity(n_bulk, format="csr")
+        for molecule_ids, complex_ids, stoich in [
+            (
+                self.complexation_molecule_ids,
+                self.complexation_complex_ids,
+                self.complexation_stoich,
+            ),
+            (
+                self.equilibrium_molecule_ids,
+                self.equilibrium_complex_ids,
+                self.equilibrium_stoich,
+            ),
+            (
+                self.two_component_system_molecule_ids,
+                self.two_component_system_complex_ids,
+                self.two_component_system_stoich,
+            ),
+        ]:
+            molecule_idx = bulk_name_to_idx(molecule_ids, bulk_ids)
+            complex_idx = bulk_name_to_idx(complex_ids, bulk_ids)
+            # Monomers in complexes: molecule_idx += stoich @ -bulk[complex_idx]
+            stoich = scipy.sparse.coo_matrix(stoich)
+            A = A + scipy.sparse.csr_matrix(
+                (
+                    -stoich.data,
+                    (molecule_idx[stoich.row], complex_idx[stoich.col]),
+                ),
+                shape=(n_bulk, n_bulk),
+            )
+        B = np.zeros((n_bulk, 3))
+        for i, (subunit_ids, subunit_stoich) in enumerate(
+            [
+                (self.ribosome_subunit_ids, self.ribosome_stoich),
+                (self.rnap_subunit_ids, self.rnap_stoich),
+                (self.replisome_subunit_ids, self.replisome_stoich),
+            ]
+        ):
+            B[bulk_name_to_idx(subunit_ids, bulk_ids), i] = subunit_stoich
+        monomer_idx = bulk_name_to_idx(self.monomer_ids, bulk_ids)
+        return A[monomer_idx], B[monomer_idx]
+
 
 def test_monomer_counts_listener():
     from ecoli.experiments.ecoli_master_sim import EcoliSim
@@ -239,6 +306,56 @@ def test_monomer_counts_listener():
     assert isinstance(listeners["monomer_counts"][1], list)
 
 
+def test_monomer_counts_linear_map():
+    bulk_ids = np.array(["m1", "m2", "m3", "c1", "c2", "r1", "r2", "p1", "t1", "t2"])
+    listener = MonomerCounts(
+        {
+            "bulk_molecule_ids": bulk_ids,
+            "monomer_ids": ["m1", "m2", "m3", "r1", "r2", "p1", "t1", "t2"],
+            "complexation_molecule_ids": ["m1", "m2"],
+            "complexation_complex_ids": ["c1"],
+            "complexation_stoich": np.array([[-2], [-1]]),
+            "equilibrium_molecule_ids": ["m3"],
+            "equilibrium_complex_ids": ["c2"],
+            "equilibrium_stoich": np.array([[-1]]),
+            "two_component_system_molecule_ids": ["m2"],
+            "two_component_system_complex_ids": ["c2"],
+            "two_component_system_stoich": np.array([[-3]]),
+            "ribosome_50s_subunits": {
+                "subunitIds": np.array(["r1"]),
+                "subunitStoich": np.array([1]),
+            },
+            "ribosome_30s_subunits": {
+                "subunitIds": np.array(["r2"]),
+                "subunitStoich": np.array([2]),
+            },
+            "rnap_subunits": {
+                "subunitIds": np.array(["p1"]),
+                "subunitStoich": np.array([2]),
+            },
+            "replisome_trimer_subunits": ["t1"],
+            "replisome_monomer_subunits": ["t2"],
+        }
+    )
+    bulk_counts = np.arange(10, 20)
+    bulk = np.zeros(10, dtype=[("id", "U2"), ("count", int)])
+    bulk["id"] = bulk_ids
+    bulk["count"] = bulk_counts
+    n_active = np.array([3, 2, 1])
+    states = {
+        "bulk": bulk,
+        "unique": {
+            name: {"_entryState": np.ones(n, dtype=bool)}
+            for name, n in zip(
+                ["active_ribosome", "active_RNAP", "active_replisome"], n_active
+            )
+        },
+    }
+    expected = listener.next_update(1, states)["listeners"]["monomer_counts"]
+    A, B = listener.linear_map(bulk_ids)
+    np.testing.assert_array_equal(A @ bulk_counts + B @ n_active, expected)
+
+
 # uvenv ecoli/processes/listeners/monomer_counts.py
 if __name__ == "__main__":
     test_monomer_counts_listener()
@@ -8,6 +8,7 @@ import numpy as np
 from ecoli.library.schema import numpy_schema, listener_schema, attrs
 from vivarium.core.process import Step
 
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 
@@ -30,6 +31,7 @@ class ReplicationData(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {"time_step": 1, "emit_unique": False}
 
@@ -59,7 +61,9 @@ class ReplicationData(Step):
         }
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         fork_coordinates, fork_domains, fork_unique_index = attrs(
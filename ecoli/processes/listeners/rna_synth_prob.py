@@ -8,6 +8,7 @@ import numpy as np
 from ecoli.library.schema import numpy_schema, listener_schema, attrs
 from vivarium.core.process import Step
 
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 
@@ -29,6 +30,7 @@ class RnaSynthProb(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {
         "time_step": 1,
@@ -81,7 +83,9 @@ class RnaSynthProb(Step):
         }
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         TU_indexes, all_coordinates, all_domains, bound_TFs = attrs(
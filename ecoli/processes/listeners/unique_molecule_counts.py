@@ -8,6 +8,7 @@ Counts unique molecules
 
 from vivarium.core.process import Step
 from ecoli.library.schema import numpy_schema, listener_schema
+from ecoli.library.lazy_listeners import listener_is_due
 from ecoli.processes.registries import topology_registry
 
 # Register default topology for this process, associating it with process name
@@ -26,6 +27,7 @@ class UniqueMoleculeCounts(Step):
 
     name = NAME
     topology = TOPOLOGY
+    pure = True
 
     defaults = {
         "time_step": 1,
@@ -66,7 +68,9 @@ class UniqueMoleculeCounts(Step):
         return ports
 
     def update_condition(self, timestep, states):
-        return (states["global_time"] % states["timestep"]) == 0
+        return (states["global_time"] % states["timestep"]) == 0 and listener_is_due(
+            self, states["global_time"]
+        )
 
     def next_update(self, timestep, states):
         return {
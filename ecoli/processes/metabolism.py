@@ -25,6 +25,7 @@ from vivarium.library.units import units as vivunits
 
 from ecoli.processes.registries import topology_registry
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts, listener_schema
+from ecoli.library.rng import make_rng
 from wholecell.utils import units
 from wholecell.utils.random import stochasticRound
 from wholecell.utils.modular_fba import FluxBalanceAnalysis
@@ -96,6 +97,7 @@ class Metabolism(Step):
         "aa_exchange_names": [],
         "removed_aa_uptake": [],
         "seed": 0,
+        "legacy_rng": False,
         # TODO: For testing, remove later (perhaps after modifying sim data)
         "reduce_murein_objective": False,
         "base_reaction_ids": [],
@@ -130,6 +132,19 @@ class Metabolism(Step):
         self.nAvogadro = self.parameters["avogadro"]
         self.cellDensity = self.parameters["cell_density"]
 
+        # Unit conversions done with floats in next_update (counts_to_molar
+        # for a cell mass of 1 fg, cell density, and conversion from
+        # CONC_UNITS / CONVERSION_UNITS to GDCW_BASIS)
+        self.counts_to_molar_per_fg = units.conversion_factor(
+            self.cellDensity / (self.nAvogadro * units.fg), CONC_UNITS
+        )
+        self.cell_density_value = units.conversion_factor(
+            self.cellDensity, MASS_UNITS / VOLUME_UNITS
+        )
+        self.gdcw_basis_factor = units.conversion_factor(
+            CONC_UNITS / CONVERSION_UNITS, GDCW_BASIS
+        )
+
         # Track updated AA concentration targets with tRNA charging
         self.aa_targets = {}
         self.aa_targets_not_updated = self.parameters["aa_targets_not_updated"]
@@ -162,7 +177,7 @@ class Metabolism(Step):
         self.aa_environment_names = [aa[:-3] for aa in self.aa_exchange_names]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # TODO: For testing, remove later (perhaps after modifying sim data)
         self.reduce_murein_objective = self.parameters["reduce_murein_objective"]
@@ -420,16 +435,29 @@ class Metabolism(Step):
         kinetic_substrate_counts = counts(states["bulk"], self.kinetics_substrates_idx)
 
         translation_gtp = states["polypeptide_elongation"]["gtp_to_hydrolyze"]
-        cell_mass = states["listeners"]["mass"]["cell_mass"] * units.fg
-        dry_mass = states["listeners"]["mass"]["dry_mass"] * units.fg
+        cell_mass = states["listeners"]["mass"]["cell_mass"]
+        dry_mass = states["listeners"]["mass"]["dry_mass"]
 
-        # Calculate state values
-        cellVolume = cell_mass / self.cellDensity
-        counts_to_molar = (1 / (self.nAvogadro * cellVolume)).asUnit(CONC_UNITS)
+        # Calculate state values (unit-free, see __init__)
+        counts_to_molar_value = self.counts_to_molar_per_fg / cell_mass
+        counts_to_molar = counts_to_molar_value * CONC_UNITS
 
         # Coefficient to convert between flux (mol/g DCW/hr) basis and
         # concentration (M) basis
-        coefficient = dry_mass / cell_mass * self.cellDensity * timestep * units.s
+        coefficient_value = dry_mass / cell_mass * self.cell_density_value * timestep
+        coefficient = coefficient_value * CONVERSION_UNITS
+
+        if units.UNIT_CHECKS:
+            units.check_unit_free(
+                counts_to_molar_value,
+                1 / (self.nAvogadro * cell_mass * units.fg / self.cellDensity),
+                CONC_UNITS,
+            )
+            units.check_unit_free(
+                coefficient_value,
+                dry_mass / cell_mass * self.cellDensity * timestep * units.s,
+                CONVERSION_UNITS,
+            )
 
         # Get exchange constraints
         unconstrained = set(states["environment"]["exchange_data"]["unconstrained"])
@@ -528,24 +556,31 @@ class Metabolism(Step):
         fba = self.model.fba
         fba.solve(n_retries)
 
-        # Internal molecule changes
-        delta_metabolites = (1 / counts_to_molar) * (
-            CONC_UNITS * fba.getOutputMoleculeLevelsChange()
-        )
+        # Internal molecule changes (FBA output is in CONC_UNITS)
+        delta_metabolites = (
+            1 / counts_to_molar_value
+        ) * fba.getOutputMoleculeLevelsChange()
         metabolite_counts_final = np.fmax(
             stochasticRound(
-                self.random_state, metabolite_counts_init + delta_metabolites.asNumber()
+                self.random_state, metabolite_counts_init + delta_metabolites
             ),
             0,
         ).astype(np.int64)
         delta_metabolites_final = metabolite_counts_final - metabolite_counts_init
 
         # Environmental changes
-        exchange_fluxes = CONC_UNITS * fba.getExternalExchangeFluxes()
-        converted_exchange_fluxes = (exchange_fluxes / coefficient).asNumber(GDCW_BASIS)
-        delta_nutrients = (
-            ((1 / counts_to_molar) * exchange_fluxes).asNumber().astype(int)
+        exchange_fluxes = fba.getExternalExchangeFluxes()
+        converted_exchange_fluxes = (
+            exchange_fluxes / coefficient_value * self.gdcw_basis_factor
         )
+        delta_nutrients = ((1 / counts_to_molar_value) * exchange_fluxes).astype(int)
+
+        if units.UNIT_CHECKS:
+            units.check_unit_free(
+                converted_exchange_fluxes,
+                CONC_UNITS * exchange_fluxes / coefficient,
+                GDCW_BASIS,
+            )
 
         # Write outputs to listeners
         unconstrained, constrained, uptake_constraints = self.get_import_constraints(
@@ -602,7 +637,7 @@ class Metabolism(Step):
                     ],
                     "catalyst_counts": catalyst_counts,
                     "translation_gtp": translation_gtp,
-                    "coefficient": coefficient.asNumber(CONVERSION_UNITS),
+                    "coefficient": coefficient_value,
                     "unconstrained_molecules": unconstrained,
                     "constrained_molecules": constrained,
                     "uptake_constraints": uptake_constraints,
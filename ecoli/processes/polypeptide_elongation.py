@@ -38,6 +38,7 @@ from ecoli.library.schema import (
     attrs,
     bulk_name_to_idx,
 )
+from ecoli.library.rng import RNG, make_rng
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
 
@@ -177,6 +178,7 @@ class PolypeptideElongation(PartitionedProcess):
         "KI_SpoT": 20.0,
         "aa_supply_scaling": lambda aa_conc, aa_in_media: 0,
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
     }
 
@@ -272,7 +274,7 @@ class PolypeptideElongation(PartitionedProcess):
         self.synthetase_names = self.parameters["synthetase_names"]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         self.zero_aa_exchange_rates = (
             MICROMOLAR_UNITS / units.s * np.zeros(len(self.amino_acids))
@@ -843,6 +845,11 @@ class SteadyStateElongationModel(TranslationSupplyElongationModel):
 
         # Cell parameters
         self.cellDensity = self.parameters["cellDensity"]
+        # Counts to molar conversion for a cell mass of 1 fg so it can be
+        # calculated without units every timestep
+        self.counts_to_molar_per_fg = units.conversion_factor(
+            self.cellDensity / (self.process.n_avogadro * units.fg), MICROMOLAR_UNITS
+        )
 
         # Names of molecules associated with tRNA charging
         self.charged_trna_names = self.parameters["charged_trna_names"]
@@ -917,14 +924,28 @@ class SteadyStateElongationModel(TranslationSupplyElongationModel):
             self.parameters["import_constraint_threshold"] * vivunits.mM
         )
 
+    def get_counts_to_molar(self, cell_mass: float) -> Unum:
+        """
+        Conversion from counts to molar (in MICROMOLAR_UNITS) for a cell mass
+        in fg, calculated without units.
+        """
+        counts_to_micromolar = self.counts_to_molar_per_fg / cell_mass
+        if units.UNIT_CHECKS:
+            units.check_unit_free(
+                counts_to_micromolar,
+                1 / (self.process.n_avogadro * cell_mass * units.fg / self.cellDensity),
+                MICROMOLAR_UNITS,
+            )
+        return counts_to_micromolar * MICROMOLAR_UNITS
+
     def elongation_rate(self, states):
         if (
             self.process.ppgpp_regulation
             and not self.process.disable_ppgpp_elongation_inhibition
         ):
-            cell_mass = states["listeners"]["mass"]["cell_mass"] * units.fg
-            cell_volume = cell_mass / self.cellDensity
-            counts_to_molar = 1 / (self.process.n_avogadro * cell_volume)
+            counts_to_molar = self.get_counts_to_molar(
+                states["listeners"]["mass"]["cell_mass"]
+            )
             ppgpp_count = counts(states["bulk"], self.process.ppgpp_idx)
             ppgpp_conc = ppgpp_count * counts_to_molar
             rate = self.elong_rate_by_ppgpp(
@@ -942,10 +963,10 @@ class SteadyStateElongationModel(TranslationSupplyElongationModel):
         )
 
         # Conversion from counts to molarity
-        cell_mass = states["listeners"]["mass"]["cell_mass"] * units.fg
         dry_mass = states["listeners"]["mass"]["dry_mass"] * units.fg
-        cell_volume = cell_mass / self.cellDensity
-        self.counts_to_molar = 1 / (self.process.n_avogadro * cell_volume)
+        self.counts_to_molar = self.get_counts_to_molar(
+            states["listeners"]["mass"]["cell_mass"]
+        )
 
         # ppGpp related concentrations
         ppgpp_conc = self.counts_to_molar * counts(
@@ -1465,7 +1486,7 @@ def ppgpp_metabolite_changes(
     time_step: float,
     request: bool = False,
     limits: Optional[npt.NDArray[np.float64]] = None,
-    random_state: Optional[np.random.RandomState] = None,
+    random_state: Optional[RNG] = None,
 ) -> tuple[npt.NDArray[np.int64], int, int, Unum, Unum, Unum, Unum]:
     """
     Calculates the changes in metabolite counts based on ppGpp synthesis and
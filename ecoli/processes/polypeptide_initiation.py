@@ -22,6 +22,7 @@ from ecoli.library.schema import (
     listener_schema,
     zero_listener,
 )
+from ecoli.library.rng import make_rng
 
 from wholecell.utils import units
 from wholecell.utils.fitting import normalize
@@ -65,6 +66,7 @@ class PolypeptideInitiation(PartitionedProcess):
         "ribosome30S": "ribosome30S",
         "ribosome50S": "ribosome50S",
         "seed": 0,
+        "legacy_rng": False,
         "monomer_ids": [],
         "emit_unique": False,
         "time_step": 1,
@@ -105,7 +107,7 @@ class PolypeptideInitiation(PartitionedProcess):
         self.ribosome50S = self.parameters["ribosome50S"]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         self.empty_update = {
             "listeners": {
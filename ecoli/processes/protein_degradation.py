@@ -21,6 +21,7 @@ from ecoli.library.data_predicates import (
     all_nonnegative,
 )
 from ecoli.library.schema import numpy_schema, counts, bulk_name_to_idx
+from ecoli.library.rng import make_rng
 
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
@@ -45,6 +46,7 @@ class ProteinDegradation(PartitionedProcess):
         "protein_ids": [],
         "protein_lengths": [],
         "seed": 0,
+        "legacy_rng": False,
         "time_step": 1,
     }
 
@@ -67,7 +69,7 @@ class ProteinDegradation(PartitionedProcess):
         self.protein_lengths = self.parameters["protein_lengths"]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         self.metabolite_idx = None
 
@@ -1,4 +1,86 @@
+import importlib
+from typing import Any
+
 from vivarium.core.registry import Registry
+from vivarium.core.registry import process_registry as vivarium_process_registry
 
 #: Maps process names to topology
 topology_registry = Registry()
+
+
+class ProcessRegistry(Registry):
+    """
+    View of :py:data:`vivarium.core.registry.process_registry` that also
+    contains processes listed in a manifest of process names to the modules
+    and classes that implement them. A module in the manifest is only
+    imported when one of its processes is first accessed, so simulations do
+    not pay for importing processes (and their dependencies, e.g. cvxpy) that
+    they do not use. Importing the module also registers the topology of the
+    process in :py:data:`~.topology_registry`.
+
+    Args:
+        registry: Registry to add processes to when they are first accessed
+    """
+
+    def __init__(self, registry: Registry):
+        self.registry = registry.registry
+        self.main_keys = registry.main_keys
+        self.manifest: dict[str, tuple[str, str]] = {}
+
+    def register_lazy(self, key: str, module: str, class_name: str):
+        """
+        Add a process to the manifest without importing its module.
+
+        Args:
+            key: Process name
+            module: Fully qualified name of the module defining the process
+            class_name: Name of the process class in ``module``
+        """
+        self.manifest[key] = (module, class_name)
+
+    def access(self, key: str) -> Any:
+        """Get a process class by name, importing its module if necessary."""
+        item = self.registry.get(key)
+        if item is None and key in self.manifest:
+            module, class_name = self.manifest[key]
+            item = getattr(importlib.import_module(module), class_name)
+            self.register(key, item)
+        return item
+
+    def list(self) -> list[str]:
+        return self.main_keys + [
+            key for key in self.manifest if key not in self.registry
+        ]
+
+
+#: Maps process names to process classes. Includes all processes in
+#: :py:data:`vivarium.core.registry.process_registry`.
+process_registry = ProcessRegistry(vivarium_process_registry)
+
+
+def test_process_manifest():
+    import subprocess
+    import sys
+
+    from ecoli.processes import PROCESS_MANIFEST
+
+    # Importing the registry does not import any process modules
+    imported = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, ecoli.processes; "
+            "print('ecoli.processes.metabolism_redux' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert imported == "False"
+
+    for name in PROCESS_MANIFEST:
+        process_class = process_registry.access(name)
+        assert process_class.name == name
+        assert vivarium_process_registry.access(name) is process_class
+    assert set(PROCESS_MANIFEST) <= set(process_registry.list())
+    assert process_registry.access("not-a-process") is None
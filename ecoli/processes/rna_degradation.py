@@ -41,6 +41,7 @@ from ecoli.library.schema import (
     numpy_schema,
     listener_schema,
 )
+from ecoli.library.rng import make_rng
 
 from wholecell.utils import units
 
@@ -101,6 +102,7 @@ class RnaDegradation(PartitionedProcess):
         "ribosome50S": "ribosome50S",
         "Kms": np.array([]) * units.mol / units.L,
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
     }
 
@@ -174,7 +176,7 @@ class RnaDegradation(PartitionedProcess):
         self.Kms = self.parameters["Kms"]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # Numpy indices for bulk molecules
         self.water_idx = None
@@ -13,6 +13,7 @@ from vivarium.core.process import Process
 from vivarium.core.engine import Engine
 
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts, attrs
+from ecoli.library.rng import make_rng
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.unique_update import UniqueUpdate
 
@@ -37,6 +38,7 @@ class RnaInterference(Process):
         "ribosome50S": "ribosome50S",
         "duplex_ids": [],
         "seed": 0,
+        "legacy_rng": False,
         "time_step": 2,
         "emit_unique": False,
     }
@@ -54,7 +56,9 @@ class RnaInterference(Process):
         self.ribosome50S = self.parameters["ribosome50S"]
         self.duplex_ids = list(self.parameters["duplex_ids"])
         self.bulk_rna_ids = self.srna_ids + self.duplex_ids
-        self.random_state = np.random.RandomState(seed=self.parameters["seed"])
+        self.random_state = make_rng(
+            self.parameters["seed"], self.parameters["legacy_rng"]
+        )
 
         self.srna_idx = None
 
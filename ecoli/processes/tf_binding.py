@@ -18,6 +18,7 @@ from ecoli.library.schema import (
     bulk_name_to_idx,
     counts,
 )
+from ecoli.library.rng import make_rng
 
 from wholecell.utils.random import stochasticRound
 from wholecell.utils import units
@@ -60,6 +61,7 @@ class TfBinding(Step):
         "bulk_molecule_ids": [],
         "bulk_mass_data": np.array([[]]) * units.g / units.mol,
         "seed": 0,
+        "legacy_rng": False,
         "submass_to_idx": {
             "rRNA": 0,
             "tRNA": 1,
@@ -135,7 +137,7 @@ class TfBinding(Step):
         ).asNumber(units.fg)
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # Helper indices for Numpy indexing
         self.active_tf_idx = None
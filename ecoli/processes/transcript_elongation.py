@@ -29,6 +29,7 @@ from ecoli.library.schema import (
     bulk_name_to_idx,
     listener_schema,
 )
+from ecoli.library.rng import make_rng
 from ecoli.library.data_predicates import monotonically_increasing
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
@@ -120,6 +121,7 @@ class TranscriptElongation(PartitionedProcess):
         "attenuated_rna_indices": np.array([], dtype=int),
         "location_lookup": {},
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
         "time_step": 1,
     }
@@ -161,6 +163,11 @@ class TranscriptElongation(PartitionedProcess):
         self.trna_attenuation = self.parameters["trna_attenuation"]
         self.cell_density = self.parameters["cell_density"]
         self.n_avogadro = self.parameters["n_avogadro"]
+        # Counts to molar conversion for a cell mass of 1 fg so it can be
+        # calculated without units every timestep
+        self.counts_to_molar_per_fg = units.conversion_factor(
+            self.cell_density / (self.n_avogadro * units.fg), units.mol / units.L
+        )
         self.stop_probabilities = self.parameters["get_attenuation_stop_probabilities"]
         self.attenuated_rna_indices = self.parameters["attenuated_rna_indices"]
         self.attenuated_rna_indices_lookup = {
@@ -171,7 +178,7 @@ class TranscriptElongation(PartitionedProcess):
 
         # random seed
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # Helper indices for Numpy indexing
         self.bulk_RNA_idx = None
@@ -351,8 +358,14 @@ class TranscriptElongation(PartitionedProcess):
 
         if self.trna_attenuation:
             cell_mass = states["listeners"]["mass"]["cell_mass"]
-            cellVolume = cell_mass * units.fg / self.cell_density
-            counts_to_molar = 1 / (self.n_avogadro * cellVolume)
+            counts_to_molar = self.counts_to_molar_per_fg / cell_mass
+            if units.UNIT_CHECKS:
+                units.check_unit_free(
+                    counts_to_molar,
+                    1 / (self.n_avogadro * cell_mass * units.fg / self.cell_density),
+                    units.mol / units.L,
+                )
+            counts_to_molar *= units.mol / units.L
             attenuation_probability = self.stop_probabilities(
                 counts_to_molar * counts(states["bulk_total"], self.charged_trnas_idx)
             )
@@ -31,13 +31,13 @@ from ecoli.library.schema import (
     bulk_name_to_idx,
     MetadataArray,
 )
+from ecoli.library.rng import make_rng
 
 from wholecell.utils import units
 from wholecell.utils.random import stochasticRound
 from wholecell.utils.unit_struct_array import UnitStructArray
 
 from ecoli.library.data_predicates import monotonically_decreasing, all_nonnegative
-from scipy.stats import chisquare
 
 from ecoli.processes.registries import topology_registry
 from ecoli.processes.partition import PartitionedProcess
@@ -181,6 +181,7 @@ class TranscriptInitiation(PartitionedProcess):
         "attenuation_adjustments": np.array([]),
         # random seed
         "seed": 0,
+        "legacy_rng": False,
         "emit_unique": False,
     }
 
@@ -269,7 +270,7 @@ class TranscriptInitiation(PartitionedProcess):
         ]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # Helper indices for Numpy indexing
         self.ppgpp_idx = None
@@ -665,6 +666,8 @@ class TranscriptInitiation(PartitionedProcess):
 
 
 def test_transcript_initiation(return_data=False):
+    from scipy.stats import chisquare
+
     def make_elongation_rates(random, base, time_step, variable_elongation=False):
         size = 9  # number of TUs
         lengths = time_step * np.full(size, base, dtype=np.int64)
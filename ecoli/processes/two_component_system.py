@@ -9,9 +9,8 @@ Specifically, phosphate groups are transferred from histidine kinases to respons
 and back in response to counts of ligand stimulants.
 """
 
-import numpy as np
-
 from ecoli.library.schema import numpy_schema, bulk_name_to_idx, counts
+from ecoli.library.rng import make_rng
 
 from wholecell.utils import units
 from ecoli.processes.registries import topology_registry
@@ -45,6 +44,7 @@ class TwoComponentSystem(PartitionedProcess):
         ),
         "moleculeNames": [],
         "seed": 0,
+        "legacy_rng": False,
     }
 
     # Constructor
@@ -65,7 +65,7 @@ class TwoComponentSystem(PartitionedProcess):
         self.moleculeNames = self.parameters["moleculeNames"]
 
         self.seed = self.parameters["seed"]
-        self.random_state = np.random.RandomState(seed=self.seed)
+        self.random_state = make_rng(self.seed, self.parameters["legacy_rng"])
 
         # Helper indices for Numpy indexing
         self.molecule_idx = None
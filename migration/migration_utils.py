@@ -168,12 +168,14 @@ def run_partitioned_process(
     return actual_requests, actual_update
 
 
-def run_and_compare(
-    init_time, process_class, partition=True, layer=0, post=False, operons=True
-):
-    # Set time parameters
-    init_time = init_time
+def load_process_and_state(init_time, process_class, layer=0, post=False, operons=True):
+    """Create a process from sim_data and load the saved wcEcoli state that
+    it sees at ``init_time`` (right before execution layer ``layer``, or
+    right before listeners are run if ``post`` is True).
 
+    Returns:
+        Tuple of process, initial state, and prefix of migration data files
+    """
     # Create process, experiment, loading in initial state from file.
     if process_class.name == "replication_data_listener":
         config = {"time_step": 1}
@@ -281,6 +283,16 @@ def run_and_compare(
             "rna_init_event": wc_listeners["rnap_data"]["rna_init_event"]
         }
 
+    return process, initial_state, data_prefix
+
+
+def run_and_compare(
+    init_time, process_class, partition=True, layer=0, post=False, operons=True
+):
+    process, initial_state, data_prefix = load_process_and_state(
+        init_time, process_class, layer=layer, post=post, operons=operons
+    )
+
     if partition:
         # run the process and get an update
         actual_request, actual_update = run_partitioned_process(
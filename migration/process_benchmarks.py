@@ -0,0 +1,234 @@
+"""
+Microbenchmarks of single process updates. Each process is created from
+sim_data and given the saved wcEcoli state it sees at a fixed time in the
+migration data (see :py:func:`~migration.migration_utils.load_process_and_state`).
+``calculate_request`` and ``evolve_state`` (partitioned processes) or
+``next_update`` (all others) are then called repeatedly on that state in
+isolation, reporting the median and minimum wall-clock time per call and
+the peak memory allocated during one call.
+
+These are not run with the rest of the tests. To run them:
+
+.. code-block:: console
+
+    $ pytest -m benchmark -s migration/process_benchmarks.py
+
+To save results and compare them to results saved before a change:
+
+.. code-block:: console
+
+    $ python -m migration.process_benchmarks --out before.json
+    $ python -m migration.process_benchmarks --compare before.json
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from ecoli.processes.chromosome_replication import ChromosomeReplication
+from ecoli.processes.chromosome_structure import ChromosomeStructure
+from ecoli.processes.complexation import Complexation
+from ecoli.processes.equilibrium import Equilibrium
+from ecoli.processes.listeners.dna_supercoiling import DnaSupercoiling
+from ecoli.processes.listeners.mass_listener import MassListener
+from ecoli.processes.listeners.monomer_counts import MonomerCounts
+from ecoli.processes.listeners.replication_data import ReplicationData
+from ecoli.processes.listeners.ribosome_data import RibosomeData
+from ecoli.processes.listeners.RNA_counts import RNACounts
+from ecoli.processes.listeners.rna_synth_prob import RnaSynthProb
+from ecoli.processes.listeners.rnap_data import RnapData
+from ecoli.processes.listeners.unique_molecule_counts import UniqueMoleculeCounts
+from ecoli.processes.metabolism import Metabolism
+from ecoli.processes.polypeptide_elongation import PolypeptideElongation
+from ecoli.processes.polypeptide_initiation import PolypeptideInitiation
+from ecoli.processes.protein_degradation import ProteinDegradation
+from ecoli.processes.rna_degradation import RnaDegradation
+from ecoli.processes.rna_maturation import RnaMaturation
+from ecoli.processes.tf_binding import TfBinding
+from ecoli.processes.transcript_elongation import TranscriptElongation
+from ecoli.processes.transcript_initiation import TranscriptInitiation
+from ecoli.processes.two_component_system import TwoComponentSystem
+from migration.migration_utils import get_process_state, load_process_and_state
+
+#: Options for :py:func:`~migration.migration_utils.load_process_and_state`
+#: and whether the process is partitioned, same as in the migration tests
+PROCESS_OPTIONS = {
+    Equilibrium: {"partition": True, "layer": 1},
+    TwoComponentSystem: {"partition": True, "layer": 1},
+    RnaMaturation: {"partition": True, "layer": 1},
+    TfBinding: {"partition": False, "layer": 2},
+    TranscriptInitiation: {"partition": True, "layer": 3},
+    PolypeptideInitiation: {"partition": True, "layer": 3},
+    ChromosomeReplication: {"partition": True, "layer": 3},
+    ProteinDegradation: {"partition": True, "layer": 3},
+    RnaDegradation: {"partition": True, "layer": 3},
+    Complexation: {"partition": True, "layer": 3},
+    TranscriptElongation: {"partition": True, "layer": 4},
+    PolypeptideElongation: {"partition": True, "layer": 4},
+    ChromosomeStructure: {"partition": False, "layer": 5},
+    Metabolism: {"partition": False, "layer": 6},
+    MassListener: {"partition": False, "post": True},
+    MonomerCounts: {"partition": False, "post": True},
+    RNACounts: {"partition": False, "post": True},
+    UniqueMoleculeCounts: {"partition": False, "post": True},
+    ReplicationData: {"partition": False, "post": True},
+    RibosomeData: {"partition": False, "post": True},
+    RnapData: {"partition": False, "post": True},
+    RnaSynthProb: {"partition": False, "post": True},
+    DnaSupercoiling: {"partition": False, "post": True},
+}
+
+
+def time_calls(func, repeats=20, warmup=1):
+    """
+    Call ``func`` ``warmup`` times, then ``repeats`` times while timing each
+    call, then once more while tracing memory allocations.
+
+    Returns:
+        Dictionary with median and minimum time per call in milliseconds and
+        peak memory allocated during one call in megabytes
+    """
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "median_ms": float(np.median(times)) * 1000,
+        "min_ms": float(np.min(times)) * 1000,
+        "peak_alloc_mb": peak / 1e6,
+    }
+
+
+def benchmark_process(process_class, init_time=0, repeats=20, operons=True):
+    """
+    Time the methods of a process on the migration state at ``init_time``.
+
+    Returns:
+        Mapping of method names to results of :py:func:`~.time_calls`
+    """
+    options = dict(PROCESS_OPTIONS[process_class])
+    partition = options.pop("partition")
+    process, initial_state, data_prefix = load_process_and_state(
+        init_time, process_class, operons=operons, **options
+    )
+    states, _ = get_process_state(process, process_class.topology, initial_state)
+    timestep = 1
+
+    if not partition:
+        return {
+            "next_update": time_calls(
+                lambda: process.next_update(timestep, states), repeats
+            )
+        }
+
+    results = {
+        "calculate_request": time_calls(
+            lambda: process.calculate_request(timestep, states), repeats
+        )
+    }
+    # Make process see wcEcoli partitioned molecule counts
+    with open(f"{data_prefix}/bulk_partitioned_t{init_time}.json") as f:
+        bulk_partitioned = json.load(f)
+    evolve_states = dict(states)
+    evolve_states["bulk_total"] = states["bulk"]["count"].copy()
+    evolve_states["bulk"] = states["bulk"].copy()
+    evolve_states["bulk"]["count"] = bulk_partitioned[process_class.__name__]
+    evolve_states["bulk"].flags.writeable = False
+    results["evolve_state"] = time_calls(
+        lambda: process.evolve_state(timestep, evolve_states), repeats
+    )
+    return results
+
+
+def format_results(results, baseline=None):
+    """
+    Format results keyed by process name and method name as a table,
+    including the speedup over ``baseline`` (same format) if given.
+    """
+    lines = [
+        f"{'process':<32} {'method':<18} {'median (ms)':>12} {'min (ms)':>10}"
+        f" {'peak (MB)':>10}" + (f" {'speedup':>8}" if baseline else "")
+    ]
+    for process_name, methods in results.items():
+        for method, result in methods.items():
+            line = (
+                f"{process_name:<32} {method:<18} {result['median_ms']:>12.3f}"
+                f" {result['min_ms']:>10.3f} {result['peak_alloc_mb']:>10.2f}"
+            )
+            if baseline:
+                before = baseline.get(process_name, {}).get(method)
+                if before is not None:
+                    line += f" {before['median_ms'] / result['median_ms']:>7.2f}x"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "process_class", list(PROCESS_OPTIONS), ids=lambda cls: cls.name
+)
+def test_process_benchmark(process_class):
+    results = benchmark_process(process_class)
+    print("\n" + format_results({process_class.name: results}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--processes",
+        nargs="+",
+        help="Names of processes to benchmark (default: all).",
+    )
+    parser.add_argument(
+        "--time",
+        type=int,
+        default=0,
+        help="Time of migration state to load (0 or 1870).",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=20, help="Number of timed calls per method."
+    )
+    parser.add_argument(
+        "--no_operons",
+        action="store_true",
+        help="Use sim_data and migration states without operons.",
+    )
+    parser.add_argument("--out", help="Path to save results to as JSON.")
+    parser.add_argument(
+        "--compare", help="Path to JSON with results to compare against."
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for process_class in PROCESS_OPTIONS:
+        if args.processes and process_class.name not in args.processes:
+            continue
+        results[process_class.name] = benchmark_process(
+            process_class, args.time, args.repeats, not args.no_operons
+        )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print(format_results(results, baseline))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,11 @@ SimulationData getter functions
 import itertools
 import re
 
+from Bio.Data.IUPACData import ambiguous_dna_complement
 from Bio.Seq import Seq
 import numpy as np
 import numpy.typing as npt
+from scipy import sparse
 
 from reconstruction.ecoli.dataclasses.molecule_groups import POLYMERIZED_FRAGMENT_PREFIX
 from wholecell.utils import units
@@ -37,6 +39,65 @@ IGNORED_DNA_SITE_TYPES = {
 }
 
 
+# Byte translation tables to transcribe slices of the genome sequence on the
+# forward (+) and reverse (-) strand (same as Bio.Seq.transcribe() and
+# Bio.Seq.reverse_complement().transcribe() for DNA sequences)
+_DNA_COMPLEMENT = {
+    **ambiguous_dna_complement,
+    **{k.lower(): v.lower() for k, v in ambiguous_dna_complement.items()},
+}
+_TRANSCRIBE_FORWARD = bytes.maketrans(b"Tt", b"Uu")
+_TRANSCRIBE_REVERSE = bytes.maketrans(
+    "".join(_DNA_COMPLEMENT).encode("ascii"),
+    "".join(_DNA_COMPLEMENT.values())
+    .replace("T", "U")
+    .replace("t", "u")
+    .encode("ascii"),
+)
+
+
+def _transcribe_genome_slices(
+    genome: bytes,
+    left_end_pos: npt.NDArray[np.int64],
+    right_end_pos: npt.NDArray[np.int64],
+    is_forward: npt.NDArray[np.bool_],
+) -> list[Seq]:
+    """
+    Get the RNA sequences transcribed from the given slices of the genome.
+    Left and right end positions are 1-indexed and inclusive.
+    """
+    return [
+        Seq(
+            genome[left - 1 : right].translate(_TRANSCRIBE_FORWARD)
+            if forward
+            else genome[left - 1 : right][::-1].translate(_TRANSCRIBE_REVERSE)
+        )
+        for left, right, forward in zip(
+            left_end_pos.tolist(), right_end_pos.tolist(), is_forward.tolist()
+        )
+    ]
+
+
+def _count_letters(sequences: list, letters: list[str]) -> npt.NDArray[np.int64]:
+    """
+    Count the occurrences of each single-character letter in each sequence.
+    Returns an array of shape (number of sequences, number of letters).
+    """
+    letter_index = np.full(256, len(letters), dtype=np.int64)
+    for i, letter in enumerate(letters):
+        letter_index[ord(letter)] = i
+    lengths = np.fromiter(map(len, sequences), np.int64, len(sequences))
+    joined = np.frombuffer("".join(map(str, sequences)).encode("ascii"), dtype=np.uint8)
+    # Letters that are not counted go to an extra column that is dropped
+    flat_index = (
+        np.repeat(np.arange(len(sequences)) * (len(letters) + 1), lengths)
+        + letter_index[joined]
+    )
+    return np.bincount(
+        flat_index, minlength=len(sequences) * (len(letters) + 1)
+    ).reshape(len(sequences), len(letters) + 1)[:, :-1]
+
+
 class TranscriptionDirectionError(Exception):
     pass
 
@@ -180,27 +241,22 @@ class GetterFunctions(object):
         Builds nucleotide sequences of each transcription unit using the genome
         sequence and the left and right end positions.
         """
-        genome_sequence = raw_data.genome_sequence
-
-        def parse_sequence(tu_id, left_end_pos, right_end_pos, direction):
-            """
-            Parses genome sequence to get transcription unit sequence, given
-            left and right end positions and transcription direction (Note:
-            the left and right end positions in the raw data files are given as
-            1-indexed coordinates)
-            """
-            if direction == "+":
-                return genome_sequence[left_end_pos - 1 : right_end_pos].transcribe()
-            elif direction == "-":
-                return (
-                    genome_sequence[left_end_pos - 1 : right_end_pos]
-                    .reverse_complement()
-                    .transcribe()
-                )
-            else:
+        # IDs, 1-indexed left and right end positions, and directions of
+        # each sequence to parse from the genome
+        seq_ids = []
+        left_end_positions = []
+        right_end_positions = []
+        directions = []
+
+        def add_sequence(seq_id, left_end_pos, right_end_pos, direction):
+            if direction not in ("+", "-"):
                 raise TranscriptionDirectionError(
-                    f"Unidentified transcription direction given for {tu_id}"
+                    f"Unidentified transcription direction given for {seq_id}"
                 )
+            seq_ids.append(seq_id)
+            left_end_positions.append(left_end_pos)
+            right_end_positions.append(right_end_pos)
+            directions.append(direction)
 
         # Get set of valid gene IDs that have positions on the chromosome, and
         # is not a pseudogene or a phantom gene
@@ -280,7 +336,7 @@ class GetterFunctions(object):
                     gene_id_to_rna_id[gene_tuple[0]]
                 ] = tu["id"]
 
-            self._sequences[tu["id"]] = parse_sequence(
+            add_sequence(
                 tu["id"], tu["left_end_pos"], tu["right_end_pos"], tu["direction"]
             )
 
@@ -308,10 +364,24 @@ class GetterFunctions(object):
             left_end_pos = gene_id_to_left_end_pos[gene_id]
             right_end_pos = gene_id_to_right_end_pos[gene_id]
 
-            self._sequences[rna_id] = parse_sequence(
+            add_sequence(
                 rna_id, left_end_pos, right_end_pos, gene_id_to_direction[gene_id]
             )
 
+        # Slice all sequences out of the genome at once
+        genome = str(raw_data.genome_sequence).encode("ascii")
+        self._sequences.update(
+            zip(
+                seq_ids,
+                _transcribe_genome_slices(
+                    genome,
+                    np.array(left_end_positions, dtype=np.int64),
+                    np.array(right_end_positions, dtype=np.int64),
+                    np.array(directions) == "+",
+                ),
+            )
+        )
+
     def _build_protein_sequences(self, raw_data):
         """
         Builds the amino acid sequences of each protein monomer using sequences
@@ -435,13 +505,10 @@ class GetterFunctions(object):
         ]
 
         # Get RNA nucleotide compositions
-        rna_seqs = self.get_sequences(rnas_with_seqs)
-        nt_counts = []
-        for seq in rna_seqs:
-            nt_counts.append(
-                [seq.count(letter) for letter in sim_data.ntp_code_to_id_ordered.keys()]
-            )
-        nt_counts = np.array(nt_counts)
+        nt_counts = _count_letters(
+            self.get_sequences(rnas_with_seqs),
+            list(sim_data.ntp_code_to_id_ordered.keys()),
+        )
 
         # Calculate molecular weights
         ppi_mw = self._all_submass_arrays[sim_data.molecule_ids.ppi[:-3]].sum()
@@ -501,16 +568,10 @@ class GetterFunctions(object):
         ]
 
         # Get protein amino acid compositions
-        protein_seqs = self.get_sequences(proteins_with_seqs)
-        aa_counts = []
-        for seq in protein_seqs:
-            aa_counts.append(
-                [
-                    seq.count(letter)
-                    for letter in sim_data.amino_acid_code_to_id_ordered.keys()
-                ]
-            )
-        aa_counts = np.array(aa_counts)
+        aa_counts = _count_letters(
+            self.get_sequences(proteins_with_seqs),
+            list(sim_data.amino_acid_code_to_id_ordered.keys()),
+        )
 
         # Calculate molecular weights
         water_mw = self._all_submass_arrays[sim_data.molecule_ids.water[:-3]].sum()
@@ -533,16 +594,18 @@ class GetterFunctions(object):
         weigths of polymerized dNTPs.
         """
         # Get chromosome dNTP compositions
-        chromosome_seq = raw_data.genome_sequence
+        chromosome_seq = str(raw_data.genome_sequence)
         forward_strand_nt_counts = np.array(
             [
                 chromosome_seq.count(letter)
                 for letter in sim_data.dntp_code_to_id_ordered.keys()
             ]
         )
+        # Each nucleotide on the reverse strand pairs with its complement on
+        # the forward strand
         reverse_strand_nt_counts = np.array(
             [
-                chromosome_seq.reverse_complement().count(letter)
+                chromosome_seq.count(_DNA_COMPLEMENT[letter])
                 for letter in sim_data.dntp_code_to_id_ordered.keys()
             ]
         )
@@ -622,9 +685,10 @@ class GetterFunctions(object):
         """
         Builds dictionary of molecular weights of protein complexes keyed with
         the molecule IDs. Molecular weights are calculated from the
-        stoichiometries of the complexation/equilibrium reactions. For
+        stoichiometries of the complexation/equilibrium reactions, using a
+        sparse matrix of the subunit stoichiometries of each complex. For
         complexes whose subunits are also complexes, the molecular weights are
-        calculated recursively.
+        accumulated one level of nesting at a time.
         """
         protein_complex_masses = {}
 
@@ -669,38 +733,73 @@ class GetterFunctions(object):
 
             complex_id_to_stoich[complex_ids[0]] = subunit_stoich
 
-        def get_mw(mol_id):
-            """
-            Recursive function that returns the molecular weight given a
-            molecule ID.
-            """
-            # Look for molecule ID in existing dictionaries, and return
-            # molecular weight array if found
-            if mol_id in self._all_submass_arrays:
-                return self._all_submass_arrays[mol_id]
-            elif mol_id in protein_complex_masses:
-                return protein_complex_masses[mol_id]
-
-            # If molecule ID does not exist, recursively add up the molecular
-            # weights of the molecule's subunits
-            else:
-                # Each complex molecule should have a corresponding subunit
-                # stoichiometry
-                if mol_id not in complex_id_to_stoich:
+        # Build sparse matrices of subunit stoichiometries of each complex
+        # for subunits that are complexes themselves and subunits with known
+        # molecular weights
+        complex_ids = list(complex_id_to_stoich.keys())
+        complex_index = {complex_id: i for i, complex_id in enumerate(complex_ids)}
+        known_ids: list[str] = []
+        known_index: dict[str, int] = {}
+        complex_rows, complex_cols, complex_coeffs = [], [], []
+        known_rows, known_cols, known_coeffs = [], [], []
+
+        def add_known(row, mol_id, coeff):
+            if mol_id not in known_index:
+                known_index[mol_id] = len(known_ids)
+                known_ids.append(mol_id)
+            known_rows.append(row)
+            known_cols.append(known_index[mol_id])
+            known_coeffs.append(coeff)
+
+        for i, complex_id in enumerate(complex_ids):
+            # Existing molecular weights take precedence over stoichiometries
+            if complex_id in self._all_submass_arrays:
+                add_known(i, complex_id, 1)
+                continue
+            for subunit_id, coeff in complex_id_to_stoich[complex_id].items():
+                if subunit_id in self._all_submass_arrays:
+                    add_known(i, subunit_id, coeff)
+                elif subunit_id in complex_index:
+                    complex_rows.append(i)
+                    complex_cols.append(complex_index[subunit_id])
+                    complex_coeffs.append(coeff)
+                else:
+                    # Each complex molecule should have a corresponding
+                    # subunit stoichiometry
                     raise InvalidProteinComplexError(
                         "Complex %s is not being produced by any complexation or equilibrium reaction."
-                        % (mol_id,)
+                        % (subunit_id,)
                     )
-                mw_sum = np.zeros(self._n_submass_indexes)
 
-                for subunit_id, coeff in complex_id_to_stoich[mol_id].items():
-                    mw_sum += coeff * get_mw(subunit_id)
-
-                return mw_sum
+        n_complexes = len(complex_ids)
+        complex_stoich = sparse.csr_matrix(
+            (complex_coeffs, (complex_rows, complex_cols)),
+            shape=(n_complexes, n_complexes),
+        )
+        known_stoich = sparse.csr_matrix(
+            (known_coeffs, (known_rows, known_cols)),
+            shape=(n_complexes, len(known_ids)),
+        )
+        known_masses = np.array(
+            [self._all_submass_arrays[mol_id] for mol_id in known_ids]
+        ).reshape(len(known_ids), self._n_submass_indexes)
+
+        # Add the masses of subunits that are complexes one level of nesting
+        # at a time. Complexes nested n levels deep have their final masses
+        # after n iterations.
+        base_masses = known_stoich @ known_masses
+        complex_masses = base_masses
+        for _ in range(n_complexes + 1):
+            updated_masses = base_masses + complex_stoich @ complex_masses
+            if np.array_equal(updated_masses, complex_masses):
+                break
+            complex_masses = updated_masses
+        else:
+            raise InvalidProteinComplexError(
+                "Complexation and equilibrium reactions contain a cycle of complexes."
+            )
 
-        # Get molecular weights of each protein complex
-        for complex_id in complex_id_to_stoich.keys():
-            protein_complex_masses.update({complex_id: get_mw(complex_id)})
+        protein_complex_masses.update(zip(complex_ids, complex_masses))
 
         return protein_complex_masses
 
@@ -731,42 +830,61 @@ class GetterFunctions(object):
 
         all_2cs_systems = [sys["molecules"] for sys in raw_data.two_component_systems]
 
+        # Build sparse matrix of the stoichiometries of the phosphorylation
+        # reactions of each modified protein over molecules with known masses
+        modified_protein_ids = []
+        modified_protein_coeffs = []
+        mol_ids: list[str] = []
+        mol_index: dict[str, int] = {}
+        rows, cols, coeffs = [], [], []
+
         for system in all_2cs_systems:
             for mol_type, mol_id in system.items():
                 # Skip molecules that are not modified proteins
                 if mol_type not in PROTEIN_TYPE_TO_PHOSPHORYLATION_RXN_ID:
                     continue
-                else:
-                    # Get reaction stoichiometry of phosphorylation reaction
-                    phosphorylation_reaction = PROTEIN_TYPE_TO_PHOSPHORYLATION_RXN_ID[
-                        mol_type
-                    ]
-                    reaction_stoich = all_2cs_reaction_stoichs[phosphorylation_reaction]
-
-                    # Initialize submass array
-                    mw = np.zeros(self._n_submass_indexes)
-                    coeff_modified_protein = None
-
-                    # Calculate mass such that reaction is mass balanced
-                    for mol, coeff in reaction_stoich.items():
-                        if mol == mol_type:
-                            coeff_modified_protein = coeff
-                            continue
-                        elif mol in ALL_2CS_METABOLITES:
-                            mw += -coeff * self._all_submass_arrays[mol]
-                        else:
-                            mw += -coeff * self._all_submass_arrays[system[mol]]
-
-                    mw = mw / coeff_modified_protein
-
-                    # Remove water submass and add to metabolite submass
-                    if mw[sim_data.submass_name_to_index["water"]] != 0:
-                        mw[sim_data.submass_name_to_index["metabolite"]] += mw[
-                            sim_data.submass_name_to_index["water"]
-                        ]
-                        mw[sim_data.submass_name_to_index["water"]] = 0
-
-                    modified_protein_masses[mol_id] = mw
+
+                # Get reaction stoichiometry of phosphorylation reaction
+                phosphorylation_reaction = PROTEIN_TYPE_TO_PHOSPHORYLATION_RXN_ID[
+                    mol_type
+                ]
+                reaction_stoich = all_2cs_reaction_stoichs[phosphorylation_reaction]
+
+                row = len(modified_protein_ids)
+                modified_protein_ids.append(mol_id)
+                modified_protein_coeffs.append(None)
+                for mol, coeff in reaction_stoich.items():
+                    if mol == mol_type:
+                        modified_protein_coeffs[row] = coeff
+                        continue
+                    elif mol not in ALL_2CS_METABOLITES:
+                        mol = system[mol]
+                    if mol not in mol_index:
+                        mol_index[mol] = len(mol_ids)
+                        mol_ids.append(mol)
+                    rows.append(row)
+                    cols.append(mol_index[mol])
+                    coeffs.append(-coeff)
+
+        stoich = sparse.csr_matrix(
+            (coeffs, (rows, cols)), shape=(len(modified_protein_ids), len(mol_ids))
+        )
+        mol_masses = np.array(
+            [self._all_submass_arrays[mol_id] for mol_id in mol_ids]
+        ).reshape(len(mol_ids), self._n_submass_indexes)
+
+        # Calculate masses such that reactions are mass balanced
+        masses = (stoich @ mol_masses) / np.array(
+            modified_protein_coeffs, dtype=np.float64
+        ).reshape(-1, 1)
+
+        # Remove water submass and add to metabolite submass
+        water_index = sim_data.submass_name_to_index["water"]
+        metabolite_index = sim_data.submass_name_to_index["metabolite"]
+        masses[:, metabolite_index] += masses[:, water_index]
+        masses[:, water_index] = 0
+
+        modified_protein_masses.update(zip(modified_protein_ids, masses))
 
         return modified_protein_masses
 
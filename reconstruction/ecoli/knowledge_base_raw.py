@@ -5,10 +5,12 @@ directly from CSV flat files.
 
 """
 
+import hashlib
 import io
 import os
 import json
-from typing import List, Dict
+import pickle
+from typing import Any, List, Dict, Optional
 import warnings
 
 from reconstruction.spreadsheets import read_tsv
@@ -165,11 +167,91 @@ ADDED_DATA = {
 }
 
 
+# Increment to invalidate existing knowledge base caches if the way they are
+# stored changes
+KB_CACHE_VERSION = 1
+# Source files whose changes should also invalidate knowledge base caches
+KB_CACHE_SOURCES = [
+    __file__,
+    os.path.join(os.path.dirname(__file__), "..", "spreadsheets.py"),
+]
+
+
 class DataStore(object):
     def __init__(self):
         pass
 
 
+class _ColumnarTable(object):
+    """
+    Serialized form of a table loaded from a flat file (list of dicts with
+    the same keys) that stores one list of values per column instead of
+    one dict per row.
+    """
+
+    def __init__(self, rows: List[dict]):
+        self.columns = list(rows[0].keys())
+        self.values = [[row[col] for row in rows] for col in self.columns]
+
+    @staticmethod
+    def is_table(value: Any) -> bool:
+        if not isinstance(value, list) or len(value) == 0:
+            return False
+        if not all(type(row) is dict for row in value):
+            return False
+        columns = list(value[0].keys())
+        return all(list(row.keys()) == columns for row in value)
+
+    def to_rows(self) -> List[dict]:
+        return [dict(zip(self.columns, row)) for row in zip(*self.values)]
+
+
+def _encode_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    encoded: Dict[str, Any] = {}
+    for name, value in attrs.items():
+        if isinstance(value, DataStore):
+            sub_store = DataStore()
+            sub_store.__dict__ = _encode_attrs(vars(value))
+            value = sub_store
+        elif _ColumnarTable.is_table(value):
+            value = _ColumnarTable(value)
+        encoded[name] = value
+    return encoded
+
+
+def _decode_attrs(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    decoded: Dict[str, Any] = {}
+    for name, value in attrs.items():
+        if isinstance(value, DataStore):
+            value.__dict__ = _decode_attrs(vars(value))
+        elif isinstance(value, _ColumnarTable):
+            value = value.to_rows()
+        decoded[name] = value
+    return decoded
+
+
+def knowledge_base_cache_key(options: Dict[str, Any]) -> str:
+    """
+    Hash of every file in :py:data:`FLAT_DIR`, the code used to parse them,
+    and the options used to build a :py:class:`~.KnowledgeBaseEcoli`.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        json.dumps(
+            {"version": KB_CACHE_VERSION, "options": options}, sort_keys=True
+        ).encode()
+    )
+    paths = [os.path.abspath(path) for path in KB_CACHE_SOURCES]
+    for root, dirs, files in os.walk(FLAT_DIR):
+        dirs.sort()
+        paths.extend(os.path.join(root, f) for f in sorted(files))
+    for path in paths:
+        hasher.update(os.path.relpath(path, FLAT_DIR).encode())
+        with open(path, "rb") as f:
+            hasher.update(hashlib.sha256(f.read()).digest())
+    return hasher.hexdigest()
+
+
 class KnowledgeBaseEcoli(object):
     """KnowledgeBaseEcoli"""
 
@@ -180,6 +262,65 @@ class KnowledgeBaseEcoli(object):
         remove_rrff: bool,
         stable_rrna: bool,
         new_genes_option: str = "off",
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            operons_on: Whether to include polycistronic transcription units
+            remove_rrna_operons: Whether to use the alternative set of rRNA
+                transcription units (only has an effect with operons on)
+            remove_rrff: Whether to remove the rrfF gene
+            stable_rrna: Whether rRNAs are not degraded
+            new_genes_option: Subdirectory of ``flat/new_gene_data`` with
+                new genes to insert or ``"off"``
+            cache_dir: If given, load the parsed knowledge base from a cache
+                file in this directory if one exists for the current flat
+                files and options, or create one after parsing the flat files
+        """
+        cache_file = None
+        if cache_dir is not None:
+            options = {
+                "operons_on": operons_on,
+                "remove_rrna_operons": remove_rrna_operons,
+                "remove_rrff": remove_rrff,
+                "stable_rrna": stable_rrna,
+                "new_genes_option": new_genes_option,
+            }
+            cache_file = os.path.join(
+                cache_dir,
+                f"knowledge_base_{knowledge_base_cache_key(options)[:16]}.pkl",
+            )
+            if os.path.exists(cache_file):
+                with open(cache_file, "rb") as f:
+                    self.__dict__.update(_decode_attrs(pickle.load(f)))
+                return
+
+        self._load_flat_files(
+            operons_on,
+            remove_rrna_operons,
+            remove_rrff,
+            stable_rrna,
+            new_genes_option,
+        )
+
+        if cache_file is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent ParCa runs never
+            # load a partially written cache
+            tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, "wb") as f:
+                pickle.dump(
+                    _encode_attrs(vars(self)), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_file, cache_file)
+
+    def _load_flat_files(
+        self,
+        operons_on: bool,
+        remove_rrna_operons: bool,
+        remove_rrff: bool,
+        stable_rrna: bool,
+        new_genes_option: str,
     ):
         self.operons_on = operons_on
         self.stable_rrna = stable_rrna
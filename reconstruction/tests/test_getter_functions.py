@@ -0,0 +1,46 @@
+"""Unit test for the array helpers used by GetterFunctions."""
+
+import unittest
+
+from Bio.Seq import Seq
+import numpy as np
+
+from reconstruction.ecoli.dataclasses.getter_functions import (
+    _count_letters,
+    _transcribe_genome_slices,
+)
+
+# Silence Sphinx autodoc warning
+unittest.TestCase.__module__ = "unittest"
+
+
+class Test_GetterFunctions(unittest.TestCase):
+    def test_transcribe_genome_slices(self):
+        """Slices match transcribing the same Bio.Seq slices."""
+        genome = "ATGCGTTAGCNNRYacgt"
+        left = np.array([1, 3, 10, 1, 15])
+        right = np.array([6, 12, 18, 18, 15])
+        forward = np.array([True, False, False, True, True])
+
+        sequences = _transcribe_genome_slices(
+            genome.encode("ascii"), left, right, forward
+        )
+        for seq, start, end, is_forward in zip(sequences, left, right, forward):
+            expected = Seq(genome)[start - 1 : end]
+            if not is_forward:
+                expected = expected.reverse_complement()
+            self.assertEqual(str(expected.transcribe()), str(seq))
+
+    def test_count_letters(self):
+        """Counts match str.count() for each sequence and letter."""
+        sequences = [Seq("ACGUUA"), Seq(""), Seq("GGNUC"), "MKV*"]
+        letters = ["A", "C", "G", "U", "M"]
+        np.testing.assert_array_equal(
+            _count_letters(sequences, letters),
+            [[str(seq).count(letter) for letter in letters] for seq in sequences],
+        )
+        self.assertEqual(_count_letters([], letters).shape, (0, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
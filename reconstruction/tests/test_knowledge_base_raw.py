@@ -0,0 +1,65 @@
+"""Unit test for the knowledge base cache."""
+
+import pickle
+import unittest
+
+from reconstruction.ecoli.knowledge_base_raw import (
+    DataStore,
+    _ColumnarTable,
+    _decode_attrs,
+    _encode_attrs,
+    knowledge_base_cache_key,
+)
+from wholecell.utils import units
+
+# Silence Sphinx autodoc warning
+unittest.TestCase.__module__ = "unittest"
+
+
+class Test_KnowledgeBaseCache(unittest.TestCase):
+    def test_columnar_round_trip(self):
+        """Tables are stored by column and restored to lists of dicts."""
+        genes = [
+            {"id": "EG10001", "length": 1200, "synonyms": ["a", "b"]},
+            {"id": "EG10002", "length": 300, "synonyms": []},
+        ]
+        store = DataStore()
+        store.ion_fractions = [{"id": "K+[c]", "fraction": 0.5 * units.g}]
+        attrs = {
+            "genes": genes,
+            "mass_fractions": store,
+            "parameters": {"cellDensity": 1100 * units.g / units.L},
+            "empty": [],
+            "names": ["genes.tsv", "rnas.tsv"],
+            "operons_on": True,
+        }
+
+        encoded = _encode_attrs(attrs)
+        self.assertIsInstance(encoded["genes"], _ColumnarTable)
+        self.assertEqual(encoded["genes"].values[0], ["EG10001", "EG10002"])
+        self.assertIsInstance(encoded["mass_fractions"].ion_fractions, _ColumnarTable)
+        self.assertEqual(encoded["names"], ["genes.tsv", "rnas.tsv"])
+        # Encoding does not modify the knowledge base itself
+        self.assertIsInstance(store.ion_fractions, list)
+
+        decoded = _decode_attrs(pickle.loads(pickle.dumps(encoded)))
+        self.assertEqual(decoded["genes"], genes)
+        self.assertEqual(decoded["mass_fractions"].ion_fractions, store.ion_fractions)
+        self.assertEqual(decoded["parameters"], attrs["parameters"])
+        self.assertEqual(decoded["empty"], [])
+        self.assertTrue(decoded["operons_on"])
+
+    def test_cache_key(self):
+        """Cache keys depend on the options used to build the knowledge base."""
+        options = {"operons_on": True, "new_genes_option": "off"}
+        self.assertEqual(
+            knowledge_base_cache_key(options), knowledge_base_cache_key(dict(options))
+        )
+        self.assertNotEqual(
+            knowledge_base_cache_key(options),
+            knowledge_base_cache_key({**options, "operons_on": False}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
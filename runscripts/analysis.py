@@ -13,7 +13,11 @@ from pyarrow import fs
 
 from ecoli.composites.ecoli_configs import CONFIG_DIR_PATH
 from ecoli.experiments.ecoli_master_sim import SimConfig
-from ecoli.library.parquet_emitter import get_dataset_sql, open_output_file
+from ecoli.library.parquet_emitter import (
+    get_dataset_sql,
+    open_output_file,
+    register_bulk_delta_function,
+)
 
 FILTERS = {
     "experiment_id": str,
@@ -96,6 +100,8 @@ def create_duckdb_conn(out_uri, gcs_bucket, cpus=None):
     # Set number of threads for DuckDB
     if cpus is not None:
         conn.execute(f"SET threads = {cpus}")
+    # Allow analyses to reconstruct delta-encoded bulk counts
+    register_bulk_delta_function(conn)
     return conn
 
 
@@ -0,0 +1,378 @@
+"""
+Measure how colony simulations run with
+:py:func:`~ecoli.experiments.ecoli_engine_process.run_simulation` scale with
+the number of agents and the size of the lattice. Every colony is started
+from the first agent of a saved colony state (see
+:py:func:`~ecoli.experiments.ecoli_engine_process.colony_save_states`),
+copied into as many agents as requested and scattered across the lattice.
+If the saved state does not exist, it is first created by simulating a
+single cell, which only requires the ``sim_data`` pickle. Colonies do not
+divide so the number of agents is constant for the whole run.
+
+The time spent in each subsystem is the time spent in the methods listed in
+:py:data:`~.SUBSYSTEMS`, excluding time spent in nested calls to other
+subsystems (e.g. inner simulation emits are counted under ``emit``, not
+``tunnel_sync``). Anything else (e.g. building the simulation) is reported
+as ``other``. Results are written to a Parquet file with one row per colony
+size, lattice size, and subsystem so runs from different commits can be
+compared with ``--compare``.
+
+Usage:
+    python runscripts/debug/benchmark_colony.py [--config CONFIG]
+        [--colony_file NAME] [--agents N [N ...]] [--bounds UM [UM ...]]
+        [--total_time SECONDS] [--out_dir DIR] [--compare PARQUET]
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+import polars as pl
+from vivarium.core.emitter import Emitter
+from vivarium.core.engine import Engine
+from vivarium.core.serialize import serialize_value
+from vivarium.library.units import units
+
+import ecoli.library.parquet_emitter  # noqa: F401 (register emitter subclass)
+from ecoli.composites.ecoli_configs import CONFIG_DIR_PATH
+from ecoli.experiments.ecoli_engine_process import run_simulation
+from ecoli.experiments.ecoli_master_sim import SimConfig, get_git_revision_hash
+from ecoli.library.logging_tools import write_json
+from ecoli.processes.engine_process import EngineProcess
+from ecoli.processes.environment.lysis import Lysis
+from ecoli.processes.environment.multibody_physics import Multibody
+from ecoli.processes.environment.reaction_diffusion_field import ReactionDiffusion
+
+#: Maps subsystem names to the methods whose time is attributed to them.
+#: Calls to :py:meth:`~vivarium.core.engine.Engine.run_for` are counted as
+#: ``inner_sims`` when made by an EngineProcess and ``engine`` otherwise.
+SUBSYSTEMS = {
+    "tunnel_sync": (EngineProcess, "next_update"),
+    "physics": (Multibody, "next_update"),
+    "diffusion": (ReactionDiffusion, "next_update"),
+    "lysis": (Lysis, "next_update"),
+    "engine": (Engine, "run_for"),
+}
+
+#: Directory in ``data`` that colony states made for benchmarks are saved to
+COLONY_DIR = "benchmarks"
+
+
+class SubsystemTimer:
+    """
+    Context manager that wraps the methods in ``subsystems`` and all
+    :py:class:`~vivarium.core.emitter.Emitter` subclasses to accumulate the
+    wall-clock time spent in each subsystem, exclusive of nested subsystems.
+
+    Args:
+        subsystems: Mapping of subsystem names to (class, method name)
+    """
+
+    def __init__(self, subsystems: dict[str, tuple[type, str]]):
+        self.subsystems = dict(subsystems)
+        emitter_classes = [Emitter]
+        while emitter_classes:
+            emitter_class = emitter_classes.pop()
+            emitter_classes.extend(emitter_class.__subclasses__())
+            if "emit" in vars(emitter_class):
+                self.subsystems[f"emit:{emitter_class.__name__}"] = (
+                    emitter_class,
+                    "emit",
+                )
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        # Name and time spent in nested subsystems of each running call
+        self._stack: list[list] = []
+        self._originals: list[tuple[type, str, object]] = []
+
+    def _subsystem(self, name: str) -> str:
+        if name.startswith("emit:"):
+            return "emit"
+        if name == "engine" and self._stack and self._stack[-1][0] == "tunnel_sync":
+            return "inner_sims"
+        return name
+
+    def _wrap(self, name: str, method):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            subsystem = self._subsystem(name)
+            self._stack.append([subsystem, 0.0])
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                _, nested = self._stack.pop()
+                self.seconds[subsystem] += elapsed - nested
+                self.calls[subsystem] += 1
+                if self._stack:
+                    self._stack[-1][1] += elapsed
+
+        return timed
+
+    def __enter__(self):
+        for name, (owner, method_name) in self.subsystems.items():
+            method = vars(owner)[method_name]
+            self._originals.append((owner, method_name, method))
+            setattr(owner, method_name, self._wrap(name, method))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, method_name, method in reversed(self._originals):
+            setattr(owner, method_name, method)
+        self._originals.clear()
+
+
+def agent_ids(n_agents: int) -> list[str]:
+    """Distinct binary agent IDs (``run_simulation`` seeds agents with them)."""
+    width = max(1, (n_agents - 1).bit_length())
+    return [format(i, f"0{width}b") for i in range(n_agents)]
+
+
+def make_colony_file(
+    colony_file: str, n_agents: int, bounds: float, rng: np.random.Generator
+) -> str:
+    """
+    Copy the first agent in ``data/{colony_file}.json`` into ``n_agents``
+    agents at random locations in a square lattice with sides of ``bounds``
+    micrometers. Unique molecules keep the same unique indices in every copy.
+
+    Returns:
+        Name of the new colony file to pass as ``initial_colony_file``
+    """
+    with open(os.path.join("data", colony_file + ".json")) as f:
+        agents = json.load(f)["agents"]
+    agent = next(iter(agents.values()))
+    colony = {}
+    for agent_id in agent_ids(n_agents):
+        agent_copy = dict(agent)
+        agent_copy["boundary"] = {
+            **agent["boundary"],
+            "location": serialize_value(rng.uniform(0, bounds, 2).tolist() * units.um),
+        }
+        colony[agent_id] = agent_copy
+    save_time = colony_file.rsplit("_t", 1)[-1]
+    name = os.path.join(
+        COLONY_DIR, f"colony_{n_agents}_agents_{bounds:g}_um_t{save_time}"
+    )
+    os.makedirs(os.path.join("data", COLONY_DIR), exist_ok=True)
+    write_json(os.path.join("data", name + ".json"), {"agents": colony})
+    return name
+
+
+def save_single_cell_colony(config: SimConfig, save_time: int) -> str:
+    """
+    Simulate one cell in the colony environment for ``save_time`` seconds
+    and save the colony state with :py:func:`~.colony_save_states`.
+
+    Returns:
+        Name of the saved colony file
+    """
+    config = SimConfig(config.to_dict())
+    config.update_from_dict(
+        {
+            "save": True,
+            "save_times": [save_time],
+            "total_time": save_time,
+            "colony_save_prefix": os.path.join(COLONY_DIR, "single_cell"),
+            "divide": False,
+            "emitter": "null",
+            "parallel": False,
+            "progress_bar": False,
+        }
+    )
+    os.makedirs(os.path.join("data", COLONY_DIR), exist_ok=True)
+    run_simulation(config)
+    return os.path.join(
+        COLONY_DIR, f"single_cell_seed_{config['seed']}_colony_t{save_time}"
+    )
+
+
+def benchmark(
+    config: SimConfig, colony_file: str, n_agents: int, bounds: float, bin_size: float
+) -> tuple[dict[str, float], dict[str, int], float]:
+    """
+    Run a colony of ``n_agents`` agents on a square lattice with sides of
+    ``bounds`` micrometers and bins of ``bin_size`` micrometers.
+
+    Returns:
+        Seconds spent in and number of calls to each subsystem, and total
+        wall-clock time
+    """
+    rng = np.random.default_rng(config["seed"])
+    n_bins = max(1, math.ceil(bounds / bin_size))
+    config = SimConfig(config.to_dict())
+    config.update_from_dict(
+        {
+            "initial_colony_file": make_colony_file(colony_file, n_agents, bounds, rng),
+            "spatial_environment_config": {
+                "multibody": {"bounds": [bounds * units.um] * 2},
+                "reaction_diffusion": {
+                    "bounds": [bounds * units.um] * 2,
+                    "n_bins": [n_bins, n_bins],
+                },
+                "field_timeline": {"bins": [n_bins, n_bins]},
+            },
+            "divide": False,
+            "parallel": False,
+            "progress_bar": False,
+            "save": False,
+        }
+    )
+    start = time.perf_counter()
+    with SubsystemTimer(SUBSYSTEMS) as timer:
+        run_simulation(config)
+    wall_time = time.perf_counter() - start
+    return dict(timer.seconds), dict(timer.calls), wall_time
+
+
+def compare(results: pl.DataFrame, other_path: str):
+    """Print the time per step of each subsystem next to that in another run."""
+    keys = ["n_agents", "bounds_um", "subsystem"]
+    other = pl.read_parquet(other_path).select(
+        keys + [pl.col("ms_per_step").alias("other_ms_per_step")]
+    )
+    joined = results.join(other, on=keys, how="inner").with_columns(
+        (pl.col("other_ms_per_step") / pl.col("ms_per_step")).alias("speedup")
+    )
+    with pl.Config(tbl_rows=-1):
+        print(joined.select(keys + ["other_ms_per_step", "ms_per_step", "speedup"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--config",
+        default=os.path.join(CONFIG_DIR_PATH, "spatial.json"),
+        help="Path to colony simulation config JSON.",
+    )
+    parser.add_argument(
+        "--colony_file",
+        help="Name of saved colony state in data folder (without .json) to "
+        "copy the first agent from. By default, one is made by simulating a "
+        "single cell for --save_time seconds and reused on later runs.",
+    )
+    parser.add_argument(
+        "--save_time",
+        type=int,
+        default=10,
+        help="Seconds to simulate a single cell for when making a colony state.",
+    )
+    parser.add_argument(
+        "--agents",
+        type=int,
+        nargs="+",
+        default=[1, 8, 64, 256],
+        help="Number of agents in each benchmarked colony.",
+    )
+    parser.add_argument(
+        "--bounds",
+        type=float,
+        nargs="+",
+        help="Side lengths of the lattice in micrometers. By default, the "
+        "lattice is scaled so each agent has --area_per_agent of space.",
+    )
+    parser.add_argument(
+        "--area_per_agent",
+        type=float,
+        default=25,
+        help="Square micrometers of lattice per agent if --bounds not given.",
+    )
+    parser.add_argument(
+        "--bin_size",
+        type=float,
+        default=5,
+        help="Side length of each diffusion lattice bin in micrometers.",
+    )
+    parser.add_argument(
+        "--total_time",
+        type=float,
+        default=10,
+        help="Seconds to simulate each colony for.",
+    )
+    parser.add_argument(
+        "--emitter",
+        default="timeseries",
+        help="Emitter to use for the colony (and all inner simulations).",
+    )
+    parser.add_argument(
+        "--out_dir",
+        default=os.path.join("out", "benchmarks", "colony"),
+        help="Directory to write Parquet file with results to.",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Parquet file from an earlier run to compare against.",
+    )
+    args = parser.parse_args()
+
+    config = SimConfig()
+    config.update_from_json(args.config)
+    config.update_from_dict({"emitter": args.emitter})
+
+    colony_file = args.colony_file
+    if colony_file is None:
+        colony_file = os.path.join(
+            COLONY_DIR,
+            f"single_cell_seed_{config['seed']}_colony_t{args.save_time}",
+        )
+        if not os.path.exists(os.path.join("data", colony_file + ".json")):
+            colony_file = save_single_cell_colony(config, args.save_time)
+    config.update_from_dict({"total_time": args.total_time})
+    n_steps = args.total_time / config["time_step"]
+
+    git_hash = get_git_revision_hash()
+    timestamp = datetime.now(timezone.utc)
+    rows = []
+    for n_agents in args.agents:
+        all_bounds = args.bounds or [math.sqrt(n_agents * args.area_per_agent)]
+        for bounds in all_bounds:
+            seconds, calls, wall_time = benchmark(
+                config, colony_file, n_agents, bounds, args.bin_size
+            )
+            seconds["other"] = wall_time - sum(seconds.values())
+            print(
+                f"{n_agents} agents, {bounds:g} um lattice: {wall_time:.2f} s "
+                f"({wall_time / n_steps * 1000:.1f} ms/step)"
+            )
+            for subsystem, subsystem_seconds in sorted(seconds.items()):
+                print(
+                    f"  {subsystem:>12}: {subsystem_seconds / n_steps * 1000:>10.2f}"
+                    " ms/step"
+                )
+                rows.append(
+                    {
+                        "git_hash": git_hash,
+                        "timestamp": timestamp,
+                        "n_agents": n_agents,
+                        "bounds_um": bounds,
+                        "n_bins": max(1, math.ceil(bounds / args.bin_size)),
+                        "total_time": args.total_time,
+                        "subsystem": subsystem,
+                        "seconds": subsystem_seconds,
+                        "calls": calls.get(subsystem, 0),
+                        "ms_per_step": subsystem_seconds / n_steps * 1000,
+                    }
+                )
+
+    results = pl.DataFrame(rows)
+    os.makedirs(args.out_dir, exist_ok=True)
+    out_path = os.path.join(
+        args.out_dir,
+        f"colony_{git_hash[:10]}_{timestamp.strftime('%Y%m%d-%H%M%S')}.parquet",
+    )
+    results.write_parquet(out_path)
+    print(f"Wrote results to {out_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
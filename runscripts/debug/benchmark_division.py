@@ -0,0 +1,228 @@
+"""
+Measure the wall-clock time of dividing the bulk and unique molecule state
+of a cell. A synthetic cell state is generated with as many molecules of each
+type as a cell has right before division (two full chromosomes, each with
+two replicated domains), and the divider of each store, as configured in
+:py:func:`~ecoli.library.schema.numpy_schema`, is called the same way as by
+:py:meth:`vivarium.core.store.Store.divide_value`. Like in
+:py:class:`~ecoli.processes.engine_process.EngineProcess`, the dividers share
+intermediate results through :py:func:`~ecoli.library.schema.division_cache`
+unless ``--no_cache`` is given, so shared work is counted towards the first
+store that needs it.
+
+Usage:
+    python runscripts/debug/benchmark_division.py [--scale SCALE]
+        [--repeats REPEATS] [--seed SEED] [--no_cache]
+"""
+
+import argparse
+import contextlib
+import time
+
+import numpy as np
+from vivarium.core.registry import divider_registry
+
+import ecoli  # noqa: F401 (register dividers)
+from ecoli.library.schema import MetadataArray, division_cache, numpy_schema
+
+#: Number of active molecules of each unique molecule type in a cell about
+#: to divide, multiplied by ``--scale``
+N_UNIQUE = {
+    "active_RNAP": 2000,
+    "RNA": 10000,
+    "active_ribosome": 20000,
+    "promoter": 8000,
+    "gene": 9000,
+    "DnaA_box": 1000,
+    "chromosomal_segment": 100,
+    "oriC": 4,
+    "active_replisome": 4,
+}
+#: Number of bulk molecule species
+N_BULK = 16000
+#: Names of unique molecule stores and their keys in ``UNIQUE_DIVIDERS``
+UNIQUE_NAMES = {
+    "active_ribosome": "active_ribosome",
+    "full_chromosome": "full_chromosomes",
+    "chromosome_domain": "chromosome_domains",
+    "active_replisome": "active_replisomes",
+    "oriC": "oriCs",
+    "promoter": "promoters",
+    "chromosomal_segment": "chromosomal_segments",
+    "DnaA_box": "DnaA_boxes",
+    "active_RNAP": "active_RNAPs",
+    "RNA": "RNAs",
+    "gene": "genes",
+}
+
+
+def make_unique(fields: dict[str, np.ndarray], rng: np.random.Generator):
+    """
+    Make a unique molecule array with the given fields, a few extra float
+    fields, and as many inactive rows as active ones.
+    """
+    n_active = len(fields["unique_index"])
+    dtype = [("_entryState", np.int8)] + [
+        (name, values.dtype, values.shape[1:]) for name, values in fields.items()
+    ]
+    dtype += [(f"submass_{i}", np.float64) for i in range(4)]
+    array = np.zeros(2 * n_active, dtype=dtype)
+    active = np.sort(rng.choice(2 * n_active, n_active, replace=False))
+    array["_entryState"][active] = 1
+    for name, values in fields.items():
+        array[name][active] = values
+    return MetadataArray(array, 2 * n_active)
+
+
+def make_state(scale: float, rng: np.random.Generator) -> dict:
+    """Make the bulk and unique molecule state of a cell about to divide."""
+    n = {name: max(int(count * scale), 1) for name, count in N_UNIQUE.items()}
+    next_index = iter(range(10**9))
+
+    def unique_indices(count):
+        return np.array([next(next_index) for _ in range(count)])
+
+    # Domain 0 replicated into 1 and 2, each of which replicated again
+    domain_index = np.arange(7)
+    child_domains = np.array(
+        [[1, 2], [3, 4], [5, 6], [-1, -1], [-1, -1]] + [[-1, -1]] * 2
+    )
+    # Leaf domains of each full chromosome
+    leaves = np.array([3, 4, 5, 6])
+
+    def domains(count):
+        return rng.choice(leaves, count)
+
+    unique = {
+        "full_chromosome": make_unique(
+            {"unique_index": unique_indices(2), "domain_index": np.array([1, 2])},
+            rng,
+        ),
+        "chromosome_domain": make_unique(
+            {
+                "unique_index": unique_indices(7),
+                "domain_index": domain_index,
+                "child_domains": child_domains,
+            },
+            rng,
+        ),
+    }
+    for name in (
+        "active_replisome",
+        "oriC",
+        "promoter",
+        "chromosomal_segment",
+        "DnaA_box",
+        "gene",
+        "active_RNAP",
+    ):
+        unique[name] = make_unique(
+            {
+                "unique_index": unique_indices(n[name]),
+                "domain_index": domains(n[name]),
+            },
+            rng,
+        )
+    rnap_indexes = unique["active_RNAP"]["unique_index"][
+        unique["active_RNAP"]["_entryState"].view(np.bool_)
+    ]
+    is_full_transcript = rng.random(n["RNA"]) < 0.8
+    unique["RNA"] = make_unique(
+        {
+            "unique_index": unique_indices(n["RNA"]),
+            "is_full_transcript": is_full_transcript,
+            "RNAP_index": np.where(
+                is_full_transcript, -1, rng.choice(rnap_indexes, n["RNA"])
+            ),
+        },
+        rng,
+    )
+    rna_indexes = unique["RNA"]["unique_index"][
+        unique["RNA"]["_entryState"].view(np.bool_)
+    ]
+    # Some ribosomes are still bound to mRNAs that were degraded
+    mRNA_index = rng.choice(rna_indexes, n["active_ribosome"])
+    degraded = rng.random(n["active_ribosome"]) < 0.01
+    mRNA_index[degraded] = rng.integers(10**8, 10**8 + 100, degraded.sum())
+    unique["active_ribosome"] = make_unique(
+        {
+            "unique_index": unique_indices(n["active_ribosome"]),
+            "mRNA_index": mRNA_index,
+        },
+        rng,
+    )
+
+    bulk_dtype = [("id", "U60"), ("count", int)] + [
+        (f"submass_{i}", np.float64) for i in range(9)
+    ]
+    bulk = np.zeros(N_BULK, dtype=bulk_dtype)
+    bulk["id"] = [f"molecule_{i}[c]" for i in range(N_BULK)]
+    bulk["count"] = rng.integers(0, 1000, N_BULK)
+    bulk.flags.writeable = False
+    return {"bulk": bulk, "unique": unique}
+
+
+def divide(state: dict, cache: bool = True) -> dict[str, float]:
+    """
+    Divide ``state`` with the divider of each store.
+
+    Args:
+        state: State made by :py:func:`~.make_state`
+        cache: Share intermediate results between dividers
+
+    Returns:
+        Seconds spent in the divider of each store
+    """
+    times = {}
+    with division_cache() if cache else contextlib.nullcontext():
+        _divide(state, times)
+    return times
+
+
+def _divide(state: dict, times: dict[str, float]):
+    start = time.perf_counter()
+    divider_registry.access(numpy_schema("bulk")["_divider"])(state["bulk"])
+    times["bulk"] = time.perf_counter() - start
+    for name, divider_name in UNIQUE_NAMES.items():
+        divider = numpy_schema(divider_name)["_divider"]
+        topology_state = {}
+        for key, path in divider["topology"].items():
+            topology_state[key] = state["unique"][path[-1] if path else name]
+        start = time.perf_counter()
+        divider_registry.access(divider["divider"])(
+            state["unique"][name], state=topology_state
+        )
+        times[name] = time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1,
+        help="Factor to multiply number of unique molecules by.",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=10, help="Number of divisions to time."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Do not share intermediate results between dividers.",
+    )
+    args = parser.parse_args()
+
+    state = make_state(args.scale, np.random.default_rng(args.seed))
+    all_times = [divide(state, not args.no_cache) for _ in range(args.repeats)]
+    print(f"{'store':<24} {'median (ms)':>12}")
+    for name in all_times[0]:
+        median = np.median([times[name] for times in all_times])
+        print(f"{name:<24} {median * 1000:>12.3f}")
+    total = np.median([sum(times.values()) for times in all_times])
+    print(f"{'total':<24} {total * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compare the wall-clock time per simulated timestep of a single cell simulated
+with each execution layer run serially versus on a thread pool (see
+:py:mod:`ecoli.library.layer_executor`). Also checks that the bulk and
+listener output of every threaded run is identical to that of the serial run.
+
+Usage:
+    python runscripts/debug/benchmark_layer_threads.py [--config CONFIG]
+        [--total_time SECONDS] [--threads N [N ...]]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from ecoli.experiments.ecoli_master_sim import CONFIG_DIR_PATH, EcoliSim
+
+
+def run_sim(config_path: str, total_time: float, layer_threads: int):
+    """
+    Run a single cell simulation for ``total_time`` seconds without division.
+
+    Returns:
+        Tuple of time to build the composite, time to run the simulation,
+        and emitted data keyed by time
+    """
+    sim = EcoliSim.from_file(config_path)
+    sim.config["layer_threads"] = layer_threads
+    sim.config["total_time"] = total_time
+    sim.config["emitter"] = "timeseries"
+    sim.config["raw_output"] = True
+    sim.config["progress_bar"] = False
+    sim.config["divide"] = False
+    sim.config["generations"] = None
+
+    start = time.perf_counter()
+    sim.build_ecoli()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sim.run()
+    run_time = time.perf_counter() - start
+    return build_time, run_time, sim.query([("bulk",), ("listeners",)])
+
+
+def assert_same_output(expected, actual, path=()):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys(), f"Keys differ at {path}"
+        for key in expected:
+            assert_same_output(expected[key], actual[key], path + (key,))
+    else:
+        np.testing.assert_array_equal(
+            expected, actual, err_msg=f"Output differs at {path}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--config",
+        default=CONFIG_DIR_PATH + "default.json",
+        help="Path to simulation config JSON.",
+    )
+    parser.add_argument(
+        "--total_time",
+        type=float,
+        default=100,
+        help="Number of seconds to simulate for each thread count.",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=[2, 4, 8],
+        help="Thread counts to compare against serial execution.",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    serial_data = None
+    for n_threads in [0] + args.threads:
+        build_time, run_time, data = run_sim(args.config, args.total_time, n_threads)
+        n_steps = len(data) - 1
+        results[n_threads] = run_time / n_steps
+        if serial_data is None:
+            serial_data = data
+        else:
+            assert_same_output(serial_data, data)
+        print(
+            f"layer_threads={n_threads}: built in {build_time:.2f} s, "
+            f"{n_steps} steps in {run_time:.2f} s "
+            f"({results[n_threads] * 1000:.1f} ms/step)"
+        )
+
+    print("\nSpeedup over serial execution:")
+    for n_threads, step_time in results.items():
+        print(f"  {n_threads:>3} threads: {results[0] / step_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure how the wall-clock time of a :py:class:`~ecoli.processes.environment.multibody_physics.Multibody`
+update scales with the number of agents in the colony. Agents of growing
+size are scattered over a lattice whose area grows with the colony so that
+the density of cells stays about the same for every colony size.
+
+Usage:
+    python runscripts/debug/benchmark_multibody.py [--agents N [N ...]]
+        [--steps STEPS] [--timestep SECONDS] [--seed SEED]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from vivarium.library.units import units
+
+from ecoli.processes.environment.multibody_physics import Multibody
+
+#: Area of lattice per agent in square micrometers
+AREA_PER_AGENT = 25
+
+
+def make_agents(n_agents: int, bounds: list[float], rng: np.random.Generator):
+    """Make the ``agents`` store of ``n_agents`` randomly placed cells."""
+    agents = {}
+    for agent_idx in range(n_agents):
+        length = rng.uniform(2, 4)
+        agents[str(agent_idx)] = {
+            "boundary": {
+                "location": [rng.uniform(0, bound) for bound in bounds] * units.um,
+                "angle": rng.uniform(0, 2 * np.pi),
+                "length": length * units.um,
+                "width": 1 * units.um,
+                "mass": 1339 * length / 2 * units.fg,
+                "thrust": rng.uniform(0, 10),
+                "torque": rng.normal(0, 0.1),
+            }
+        }
+    return agents
+
+
+def benchmark(n_agents: int, n_steps: int, timestep: float, seed: int):
+    """
+    Update a colony of ``n_agents`` agents ``n_steps`` times.
+
+    Returns:
+        Median seconds per call to ``next_update`` and to
+        :py:meth:`~ecoli.library.pymunk_multibody.PymunkMultibody.run`
+    """
+    rng = np.random.default_rng(seed)
+    side = float(np.sqrt(n_agents * AREA_PER_AGENT))
+    bounds = [side, side]
+    multibody = Multibody(
+        {"bounds": bounds * units.um, "timestep": timestep, "seed": seed}
+    )
+    agents = make_agents(n_agents, bounds, rng)
+
+    update_times = []
+    run_times = []
+    for _ in range(n_steps):
+        start = time.perf_counter()
+        update = multibody.next_update(timestep, {"agents": agents})
+        update_times.append(time.perf_counter() - start)
+        for agent_id, agent_update in update["agents"].items():
+            agents[agent_id]["boundary"].update(agent_update["boundary"])
+
+        # Time the physics engine alone with the same bodies
+        start = time.perf_counter()
+        multibody.physics.run(timestep)
+        run_times.append(time.perf_counter() - start)
+    return float(np.median(update_times)), float(np.median(run_times))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--agents",
+        type=int,
+        nargs="+",
+        default=[1, 8, 64, 256, 1024],
+        help="Colony sizes to benchmark.",
+    )
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=20,
+        help="Number of updates to time for each colony size.",
+    )
+    parser.add_argument(
+        "--timestep", type=float, default=1, help="Seconds per update."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    args = parser.parse_args()
+
+    print(f"{'agents':>8} {'update (ms)':>12} {'physics (ms)':>13} {'us/agent':>9}")
+    for n_agents in args.agents:
+        update_time, run_time = benchmark(
+            n_agents, args.steps, args.timestep, args.seed
+        )
+        print(
+            f"{n_agents:>8} {update_time * 1000:>12.2f} {run_time * 1000:>13.2f} "
+            f"{update_time / n_agents * 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
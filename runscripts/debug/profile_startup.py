@@ -0,0 +1,99 @@
+"""
+Report how long it takes to import each module when starting a simulation
+with :py:mod:`~ecoli.experiments.ecoli_master_sim`. Imports
+``ecoli_master_sim`` and the process classes requested by a config in a
+fresh interpreter started with ``python -X importtime`` and summarizes the
+output by module and by top-level package.
+
+Usage:
+    python runscripts/debug/profile_startup.py [--config CONFIG]
+        [--top N] [--min_ms MS]
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+from ecoli.composites.ecoli_configs import CONFIG_DIR_PATH
+
+IMPORT_STATEMENT = """
+from ecoli.experiments.ecoli_master_sim import EcoliSim
+sim = EcoliSim.from_file({config!r})
+sim._retrieve_processes(
+    sim.processes, sim.add_processes, sim.exclude_processes, sim.swap_processes
+)
+"""
+
+
+def profile_imports(statement: str) -> list[tuple[str, int, int]]:
+    """
+    Run ``statement`` in a new interpreter with ``-X importtime``.
+
+    Returns:
+        List of (module, self time, cumulative time) in the order the
+        modules finished importing. Times are in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--config",
+        default=CONFIG_DIR_PATH + "default.json",
+        help="Path to simulation config JSON whose processes are imported.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=30,
+        help="Number of modules with the highest cumulative import time to list.",
+    )
+    parser.add_argument(
+        "--min_ms",
+        type=float,
+        default=10,
+        help="Only list packages whose total self time exceeds this.",
+    )
+    args = parser.parse_args()
+
+    imports = profile_imports(IMPORT_STATEMENT.format(config=args.config))
+    total_us = sum(self_us for _, self_us, _ in imports)
+    print(f"Imported {len(imports)} modules in {total_us / 1e6:.2f} s\n")
+
+    print(f"Top {args.top} modules by cumulative import time:")
+    for module, self_us, cumulative_us in sorted(
+        imports, key=lambda x: x[2], reverse=True
+    )[: args.top]:
+        print(
+            f"  {cumulative_us / 1000:>9.1f} ms  (self {self_us / 1000:>7.1f} ms)"
+            f"  {module}"
+        )
+
+    by_package: dict[str, int] = defaultdict(int)
+    for module, self_us, _ in imports:
+        by_package[module.split(".")[0]] += self_us
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(
+        by_package.items(), key=lambda x: x[1], reverse=True
+    ):
+        if self_us / 1000 < args.min_ms:
+            break
+        print(f"  {self_us / 1000:>9.1f} ms  {self_us / total_us:>6.1%}  {package}")
+
+
+if __name__ == "__main__":
+    main()
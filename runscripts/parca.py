@@ -35,6 +35,7 @@ def run_parca(config):
         remove_rrff=config["remove_rrff"],
         stable_rrna=config["stable_rrna"],
         new_genes_option=config["new_genes"],
+        cache_dir=config["cache_dir"],
     )
     print(f"{time.ctime()}: Saving raw_data")
     with open(raw_data_file, "wb") as f:
@@ -2,6 +2,7 @@
 
 import unittest
 
+import numpy as np
 import swiglpk as glp
 
 from wholecell.utils._netflow.nf_glpk import (
@@ -111,3 +112,63 @@ class Test_NetworkFlowGLPK(unittest.TestCase):
         self.assertIn("UNDEF", nf.status_string)
 
         # TODO: How to use the NetworkFlowGLPK interface?
+
+    def _build_problem(self):
+        """A small network: A -> B -> C with uptake of A and secretion of C."""
+        nf = NetworkFlowGLPK()
+        nf.setFlowMaterialCoeff("uptake", "A", 1)
+        nf.setFlowMaterialCoeff("r1", "A", -1)
+        nf.setFlowMaterialCoeff("r1", "B", 1)
+        nf.setFlowMaterialCoeff("r2", "B", -1)
+        nf.setFlowMaterialCoeff("r2", "C", 1)
+        nf.setFlowMaterialCoeff("r3", "B", -1)
+        nf.setFlowMaterialCoeff("r3", "C", 2)
+        nf.setFlowMaterialCoeff("secretion", "C", -1)
+        nf.setFlowObjectiveCoeff("secretion", 1)
+        nf.buildEqConst()
+        return nf
+
+    def test_batched_updates(self):
+        """Batched bound and objective updates match one-at-a-time updates."""
+        flows = ["uptake", "r1", "r2", "r3"]
+        lower = np.array([0, 1, 0, 0.5])
+        upper = np.array([10, 8, np.inf, 2])
+
+        single = self._build_problem()
+        for flow, lb, ub in zip(flows, lower, upper):
+            single.setFlowBounds(flow, lowerBound=lb, upperBound=ub)
+        single.setFlowObjectiveCoeff("r2", -0.1)
+        batched = self._build_problem()
+        batched.setFlowBoundsArray(flows, lowerBounds=lower, upperBounds=upper)
+        batched.setFlowObjectiveCoeffs(["r2", "secretion"], [-0.1, 1])
+
+        self.assertEqual(single.getLowerBounds(), batched.getLowerBounds())
+        self.assertEqual(single.getUpperBounds(), batched.getUpperBounds())
+        self.assertEqual(single.getObjective(), batched.getObjective())
+        np.testing.assert_allclose(
+            single.getFlowRates(flows), batched.getFlowRates(flows)
+        )
+        self.assertAlmostEqual(single.getObjectiveValue(), 9.4)
+
+        # Setting one bound above/below the other moves the other bound too
+        batched.setFlowBoundsArray(["uptake", "r3"], lowerBounds=[12, 3])
+        self.assertEqual(batched.getUpperBounds()["uptake"], 12)
+        self.assertEqual(batched.getUpperBounds()["r3"], 3)
+        batched.setFlowBoundsArray(["r1"], upperBounds=0.5)
+        self.assertEqual(batched.getLowerBounds()["r1"], 0.5)
+        with self.assertRaises(ValueError):
+            batched.setFlowBoundsArray(["r1"], lowerBounds=2, upperBounds=1)
+
+    def test_warm_start(self):
+        """Resolving after small changes reuses the previous basis."""
+        iterations = {}
+        for warm_start in (True, False):
+            nf = self._build_problem()
+            nf.warm_start = warm_start
+            nf.setFlowBoundsArray(["uptake"], upperBounds=10)
+            nf.getObjectiveValue()
+            start = nf.simplex_iterations
+            nf.setFlowBoundsArray(["uptake"], upperBounds=11)
+            self.assertAlmostEqual(nf.getObjectiveValue(), 22)
+            iterations[warm_start] = nf.simplex_iterations - start
+        self.assertLess(iterations[True], iterations[False])
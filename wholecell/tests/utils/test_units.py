@@ -89,4 +89,27 @@ class Test_units(unittest.TestCase):
         np.testing.assert_array_equal(e1, a1)
         np.testing.assert_array_equal(d2, a2.asNumber())
 
+    def test_unit_free(self):
+        """Test conversion_factor() and check_unit_free()."""
+        self.assertEqual(1e-15, units.conversion_factor(units.fg, units.g))
+        self.assertAlmostEqual(
+            3.6, units.conversion_factor(1 * units.mmol / units.s, units.mol / units.h)
+        )
+        with self.assertRaises(Exception):
+            units.conversion_factor(3, units.g)
+        with self.assertRaises(Exception):
+            units.conversion_factor(units.fg, units.s)
+
+        # counts to molar for a 1000 fg cell with a density of 1100 g/L
+        density = 1100 * units.g / units.L
+        n_avogadro = 6.02214076e23 / units.mol
+        per_fg = units.conversion_factor(
+            density / (n_avogadro * units.fg), units.umol / units.L
+        )
+        cell_mass = np.array([1000.0, 2000.0])
+        expected = 1 / (n_avogadro * cell_mass * units.fg / density)
+        units.check_unit_free(per_fg / cell_mass, expected, units.umol / units.L)
+        with self.assertRaises(AssertionError):
+            units.check_unit_free(per_fg / cell_mass, expected, units.mol / units.L)
+
     # TODO(jerry): Test the array functions.
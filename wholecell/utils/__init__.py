@@ -1,4 +1,10 @@
-from .forkedPdb import ForkedPdb
-
-_ = ForkedPdb
 __all__ = ["ForkedPdb"]
+
+
+def __getattr__(name):
+    # Importing IPython takes a while so only do it when ForkedPdb is used
+    if name == "ForkedPdb":
+        from .forkedPdb import ForkedPdb
+
+        return ForkedPdb
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
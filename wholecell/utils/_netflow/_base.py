@@ -3,6 +3,8 @@ Base class for netflow interfaces with different solver backends.
 All functions required for implementation with modular_fba.py are listed.
 """
 
+import numpy as np
+
 
 class NetworkFlowProblemBase(object):
     _maximize = True
@@ -18,6 +20,42 @@ class NetworkFlowProblemBase(object):
     def setFlowObjectiveCoeff(self, flow, coefficient):
         raise NotImplementedError()
 
+    def setFlowBoundsArray(self, flows, lowerBounds=None, upperBounds=None):
+        """
+        Set the lower and upper bounds for many flows in one call. Solver
+        backends can override this with a vectorized implementation.
+        inputs:
+                flows (list[str]) - names of flows to set bounds for
+                lowerBounds (float or array-like) - lower bound for each flow
+                        (None if unchanged)
+                upperBounds (float or array-like) - upper bound for each flow
+                        (None if unchanged)
+        """
+        n_flows = len(flows)
+        if lowerBounds is None:
+            lowerBounds = [None] * n_flows
+        else:
+            lowerBounds = np.broadcast_to(lowerBounds, n_flows).tolist()
+        if upperBounds is None:
+            upperBounds = [None] * n_flows
+        else:
+            upperBounds = np.broadcast_to(upperBounds, n_flows).tolist()
+
+        for flow, lb, ub in zip(flows, lowerBounds, upperBounds):
+            self.setFlowBounds(flow, lowerBound=lb, upperBound=ub)
+
+    def setFlowObjectiveCoeffs(self, flows, coefficients):
+        """
+        Set the objective coefficients for many flows in one call. Solver
+        backends can override this with a vectorized implementation.
+        inputs:
+                flows (list[str]) - names of flows to set coefficients for
+                coefficients (float or array-like) - coefficient for each flow
+        """
+        coefficients = np.broadcast_to(coefficients, len(flows)).tolist()
+        for flow, coefficient in zip(flows, coefficients):
+            self.setFlowObjectiveCoeff(flow, coefficient)
+
     def getFlowObjectiveCoeff(self, flow):
         raise NotImplementedError()
 
@@ -109,7 +109,11 @@ class NetworkFlowGLPK(NetworkFlowProblemBase):
         self._smcp = glp.glp_smcp()  # simplex solver control parameters
         glp.glp_init_smcp(self._smcp)
         self._smcp.msg_lev = glp.GLP_MSG_ERR
+        # The presolver discards the current basis so it must be off for
+        # each solve to be warm-started from the previous optimal basis
+        self._smcp.presolve = glp.GLP_OFF
         self.simplex_iteration_limit = 10000
+        self.warm_start = True
         self._n_vars = 0
         self._n_eq_constraints = 0
 
@@ -164,6 +168,21 @@ class NetworkFlowGLPK(NetworkFlowProblemBase):
         """Set the Simplex iteration limit."""
         self._smcp.it_lim = int(limit)
 
+    @property
+    def warm_start(self):
+        """Whether each solve starts from the basis of the previous solve."""
+        return self._warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start):
+        """If False, start each solve from the standard (all slack) basis."""
+        self._warm_start = bool(warm_start)
+
+    @property
+    def simplex_iterations(self):
+        """The total number of Simplex iterations done for this problem."""
+        return glp.glp_get_it_cnt(self._lp)
+
     @property
     def primal_feasible_tolerance(self):
         """Tolerance used to check if the basic solution is primal feasible."""
@@ -322,6 +341,114 @@ class NetworkFlowGLPK(NetworkFlowProblemBase):
             )
             self._solved = False
 
+    def _getVars(self, flows):
+        """Column indexes (0-indexed) of flows, adding any new flows."""
+        try:
+            return np.fromiter(
+                map(self._flows.__getitem__, flows), np.int64, len(flows)
+            )
+        except KeyError:
+            return np.fromiter(map(self._getVar, flows), np.int64, len(flows))
+
+    def setFlowBoundsArray(self, flows, lowerBounds=None, upperBounds=None):
+        """
+        Set the lower and upper bounds for many flows at once. Bounds are
+        compared and column types are derived with NumPy, so GLPK is only
+        called for columns whose bounds actually changed.
+        inputs:
+                flows (list[str]) - names of flows to set bounds for
+                lowerBounds (float or array-like) - lower bound for each flow
+                        (None if unchanged)
+                upperBounds (float or array-like) - upper bound for each flow
+                        (None if unchanged)
+        """
+
+        if lowerBounds is None and upperBounds is None:
+            return
+        flows = list(flows)
+        n_flows = len(flows)
+        idxs = self._getVars(flows)
+        old_lb = np.fromiter(map(self._lb.__getitem__, flows), np.float64, n_flows)
+        old_ub = np.fromiter(map(self._ub.__getitem__, flows), np.float64, n_flows)
+
+        # Same clamping as setFlowBounds() when only one bound is provided
+        if lowerBounds is None:
+            ub = np.broadcast_to(np.asarray(upperBounds, np.float64), n_flows)
+            lb = np.fmin(old_lb, ub)
+        elif upperBounds is None:
+            lb = np.broadcast_to(np.asarray(lowerBounds, np.float64), n_flows)
+            ub = np.fmax(old_ub, lb)
+        else:
+            lb = np.broadcast_to(np.asarray(lowerBounds, np.float64), n_flows)
+            ub = np.broadcast_to(np.asarray(upperBounds, np.float64), n_flows)
+
+        changed = (lb != old_lb) | (ub != old_ub)
+        if not changed.any():
+            return
+        lb = lb[changed]
+        ub = ub[changed]
+        if (lb > ub).any():
+            raise ValueError("The lower bound must be <= upper bound")
+
+        lb_inf = np.isinf(lb)
+        ub_inf = np.isinf(ub)
+        variable_types = np.select(
+            [lb_inf & ub_inf, lb == ub, ~lb_inf & ~ub_inf, ub_inf],
+            [glp.GLP_FR, glp.GLP_FX, glp.GLP_DB, glp.GLP_LO],
+            glp.GLP_UP,
+        )
+
+        changed_flows = [flows[i] for i in np.flatnonzero(changed)]
+        lb = lb.tolist()
+        ub = ub.tolist()
+        self._lb.update(zip(changed_flows, lb))
+        self._ub.update(zip(changed_flows, ub))
+
+        lp = self._lp
+        set_col_bnds = glp.glp_set_col_bnds
+        for index, variable_type, lower, upper in zip(
+            (idxs[changed] + 1).tolist(),  # GLPK does 1 indexing
+            variable_types.tolist(),
+            lb,
+            ub,
+        ):
+            set_col_bnds(lp, index, variable_type, lower, upper)
+
+        self._solved = False
+
+    def setFlowObjectiveCoeffs(self, flows, coefficients):
+        """
+        Set the objective coefficients for many flows at once. GLPK is only
+        called for columns whose coefficient changed.
+        inputs:
+                flows (list[str]) - names of flows to set coefficients for
+                coefficients (float or array-like) - coefficient for each flow
+        """
+
+        flows = list(flows)
+        n_flows = len(flows)
+        idxs = self._getVars(flows)
+        coefficients = np.broadcast_to(np.asarray(coefficients, np.float64), n_flows)
+        # GLPK columns start with an objective coefficient of 0
+        old_coefficients = np.fromiter(
+            (self._objective.get(flow, 0.0) for flow in flows), np.float64, n_flows
+        )
+        self._objective.update(zip(flows, coefficients.tolist()))
+
+        changed = coefficients != old_coefficients
+        if not changed.any():
+            return
+
+        lp = self._lp
+        set_obj_coef = glp.glp_set_obj_coef
+        for index, coefficient in zip(
+            (idxs[changed] + 1).tolist(),  # GLPK does 1 indexing
+            coefficients[changed].tolist(),
+        ):
+            set_obj_coef(lp, index, coefficient)
+
+        self._solved = False
+
     def setFlowObjectiveCoeff(self, flow, coefficient):
         idx = self._getVar(flow)
         self._objective[flow] = coefficient
@@ -491,6 +618,9 @@ class NetworkFlowGLPK(NetworkFlowProblemBase):
         else:
             glp.glp_set_obj_dir(self._lp, glp.GLP_MIN)
 
+        if not self._warm_start:
+            glp.glp_std_basis(self._lp)
+
         result = glp.glp_simplex(self._lp, self._smcp)
 
         # Adjust solver options for robustness
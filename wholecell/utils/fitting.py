@@ -4,7 +4,6 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 from numpy import typing as npt
-from scipy import stats
 import unum  # Imported here to be used in getCountsFromMassAndExpression assertions
 
 from wholecell.utils import units
@@ -258,6 +257,8 @@ def fit_linearized_transforms(
     if y_fun is None:
         y_fun = list(FUNCTIONS.keys())
 
+    from scipy import stats
+
     # Start with worst case r and p
     best_r = 0
     best_p = 1
@@ -869,52 +869,40 @@ class FluxBalanceAnalysis(object):
             reactions = self._active_kinetic_targets
 
         # Update objective coefficient for each reaction
+        flows = []
+        coefficients = []
         for rxn in reactions:
             if self._solver.quadratic_objective:
-                quadTargetFlux = self._generatedID_quadFluxRelax + rxn
-                self._solver.setFlowObjectiveCoeff(
-                    quadTargetFlux,
-                    self.kineticObjectiveWeight * scaling,
-                )
+                flows.append(self._generatedID_quadFluxRelax + rxn)
+                coefficients.append(self.kineticObjectiveWeight * scaling)
 
-                quad_range_flux = self._generatedID_target_range + rxn
-                self._solver.setFlowObjectiveCoeff(
-                    quad_range_flux,
-                    self.kinetic_objective_weight_in_range * scaling,
-                )
+                flows.append(self._generatedID_target_range + rxn)
+                coefficients.append(self.kinetic_objective_weight_in_range * scaling)
             else:
                 # Objective is to minimize running this relaxation reaction
-                overTargetFlux = self._generatedID_amountOver + rxn
-                self._solver.setFlowObjectiveCoeff(
-                    overTargetFlux,
-                    self.kineticObjectiveWeight * scaling,
-                )
+                flows.append(self._generatedID_amountOver + rxn)
+                coefficients.append(self.kineticObjectiveWeight * scaling)
 
                 # Objective is to minimize running this relaxation reaction
                 # unless this is a one-sided kinetic target, in which case
                 # it's a free relaxation.
-                underTargetFlux = self._generatedID_amountUnder + rxn
                 if rxn not in self._oneSidedReactions:
-                    self._solver.setFlowObjectiveCoeff(
-                        underTargetFlux,
-                        self.kineticObjectiveWeight * scaling,
-                    )
+                    flows.append(self._generatedID_amountUnder + rxn)
+                    coefficients.append(self.kineticObjectiveWeight * scaling)
 
                 # Objective is to minimize running this relaxation reaction
-                upper_range_flux = self._generatedID_high_target_range + rxn
-                self._solver.setFlowObjectiveCoeff(
-                    upper_range_flux,
-                    self.kinetic_objective_weight_in_range * scaling,
-                )
+                flows.append(self._generatedID_high_target_range + rxn)
+                coefficients.append(self.kinetic_objective_weight_in_range * scaling)
 
                 # Objective is to minimize running this relaxation reaction
-                lower_range_flux = self._generatedID_low_target_range + rxn
                 if rxn not in self._oneSidedReactions:
-                    self._solver.setFlowObjectiveCoeff(
-                        lower_range_flux,
-                        self.kinetic_objective_weight_in_range * scaling,
+                    flows.append(self._generatedID_low_target_range + rxn)
+                    coefficients.append(
+                        self.kinetic_objective_weight_in_range * scaling
                     )
 
+        self._solver.setFlowObjectiveCoeffs(flows, coefficients)
+
     def _initInternalExchange(self, internalExchangedMolecules):
         """Create internal (byproduct) exchange reactions."""
 
@@ -1077,31 +1065,37 @@ class FluxBalanceAnalysis(object):
         levels_array = np.empty(len(molecules))
         levels_array[:] = levels
 
-        for moleculeID, level in zip(molecules, levels_array):
-            flowID = self._generatedID_externalExchange + moleculeID
-
-            lb = None
-            ub = None
-            if level < 0:
-                if not allow_export:
-                    print(
-                        "Setting a negative external molecule level for {} - be sure this is intended behavior.".format(
-                            moleculeID
-                        )
+        flowIDs = np.array(
+            [
+                self._generatedID_externalExchange + moleculeID
+                for moleculeID in molecules
+            ]
+        )
+        export = levels_array < 0
+        if not allow_export:
+            for moleculeID in np.array(molecules)[export]:
+                print(
+                    "Setting a negative external molecule level for {} - be sure this is intended behavior.".format(
+                        moleculeID
                     )
+                )
 
-                ub = -level
-                if force:
-                    lb = ub
-            else:
-                lb = -level
-                if force:
-                    ub = lb
-
-            self._solver.setFlowBounds(
-                flowID,
-                lowerBound=lb,
-                upperBound=ub,
+        # Negative levels limit secretion (upper bound) and positive levels
+        # limit uptake (lower bound). Forcing exchange sets both bounds.
+        if force:
+            self._solver.setFlowBoundsArray(
+                flowIDs,
+                lowerBounds=-levels_array,
+                upperBounds=-levels_array,
+            )
+        else:
+            self._solver.setFlowBoundsArray(
+                flowIDs[export],
+                upperBounds=-levels_array[export],
+            )
+            self._solver.setFlowBoundsArray(
+                flowIDs[~export],
+                lowerBounds=-levels_array[~export],
             )
 
     def getInternalMoleculeIDs(self):
@@ -1114,20 +1108,15 @@ class FluxBalanceAnalysis(object):
         if (levels_array < 0).any():
             raise InvalidBoundaryError("Negative molecule levels not allowed")
 
-        for moleculeID, level in zip(self._internalMoleculeIDs, levels_array):
-            flowID = self._generatedID_internalExchange + moleculeID
-
-            if self._forceInternalExchange:
-                self._solver.setFlowBounds(
-                    flowID,
-                    lowerBound=-level,
-                    upperBound=-level,
-                )
-            else:
-                self._solver.setFlowBounds(
-                    flowID,
-                    lowerBound=-level,
-                )
+        flowIDs = [
+            self._generatedID_internalExchange + moleculeID
+            for moleculeID in self._internalMoleculeIDs
+        ]
+        self._solver.setFlowBoundsArray(
+            flowIDs,
+            lowerBounds=-levels_array,
+            upperBounds=-levels_array if self._forceInternalExchange else None,
+        )
 
     def getReactionIDs(self):
         return np.array(self._reactionIDs)
@@ -1156,19 +1145,22 @@ class FluxBalanceAnalysis(object):
                 upperBounds = [upperBounds]
 
         nReactions = len(reactionIDs)
-        if lowerBounds is None:
-            lowerBounds = [None] * nReactions
-        elif np.any(np.array(lowerBounds) < 0):
-            raise InvalidBoundaryError("Minimum reaction flux must be non-negative")
-        if upperBounds is None:
-            upperBounds = [None] * nReactions
-        elif np.any(np.array(upperBounds) < 0):
-            raise InvalidBoundaryError("Maximum reaction flux must be non-negative")
-
-        if nReactions != len(lowerBounds) or nReactions != len(upperBounds):
-            raise Exception(
-                "There must be equal numbers of reactionIDs and bounds to set limits."
-            )
+        if lowerBounds is not None:
+            lowerBounds = np.asarray(lowerBounds, np.float64)
+            if np.any(lowerBounds < 0):
+                raise InvalidBoundaryError("Minimum reaction flux must be non-negative")
+            if lowerBounds.shape != (nReactions,):
+                raise Exception(
+                    "There must be equal numbers of reactionIDs and bounds to set limits."
+                )
+        if upperBounds is not None:
+            upperBounds = np.asarray(upperBounds, np.float64)
+            if np.any(upperBounds < 0):
+                raise InvalidBoundaryError("Maximum reaction flux must be non-negative")
+            if upperBounds.shape != (nReactions,):
+                raise Exception(
+                    "There must be equal numbers of reactionIDs and bounds to set limits."
+                )
 
         if raiseForReversible:
             for reactionID in reactionIDs:
@@ -1183,8 +1175,7 @@ class FluxBalanceAnalysis(object):
                         ).format(reactionID, reactionID, reverseReactionID)
                     )
 
-        # Set reaction flux bounds for each reaction
-        for reactionID, lb, ub in zip(reactionIDs, lowerBounds, upperBounds):
+        for reactionID in reactionIDs:
             if (
                 reactionID not in self._reactionIDsSet
                 and reactionID not in self._specialFluxIDsSet
@@ -1194,11 +1185,12 @@ class FluxBalanceAnalysis(object):
                     % (reactionID,)
                 )
 
-            self._solver.setFlowBounds(
-                reactionID,
-                upperBound=ub,
-                lowerBound=lb,
-            )
+        # Set reaction flux bounds for all reactions at once
+        self._solver.setFlowBoundsArray(
+            reactionIDs,
+            lowerBounds=lowerBounds,
+            upperBounds=upperBounds,
+        )
 
     def update_homeostatic_targets(self, objective):
         """
@@ -1476,6 +1468,9 @@ class FluxBalanceAnalysis(object):
         )
 
         # Change the objective normalization
+        range_fluxes = []
+        range_lower_bounds = []
+        range_upper_bounds = []
         for reactionID, mean, lower, upper in zip(
             reactionIDs, mean_targets, lower_targets, upper_targets
         ):
@@ -1514,27 +1509,27 @@ class FluxBalanceAnalysis(object):
                 )
 
                 if self._solver.quadratic_objective:
-                    range_flux = self._generatedID_target_range + reactionID
-                    self._solver.setFlowBounds(
-                        range_flux,
-                        lowerBound=-(1 - lower / mean),
-                        upperBound=(upper / mean - 1),
-                    )
+                    range_fluxes.append(self._generatedID_target_range + reactionID)
+                    range_lower_bounds.append(-(1 - lower / mean))
+                    range_upper_bounds.append(upper / mean - 1)
                 else:
-                    lower_range_flux = self._generatedID_low_target_range + reactionID
-                    self._solver.setFlowBounds(
-                        lower_range_flux,
-                        upperBound=np.fmax(0, 1 - lower / mean),
-                    )
-                    upper_range_flux = self._generatedID_high_target_range + reactionID
-                    self._solver.setFlowBounds(
-                        upper_range_flux,
-                        upperBound=np.fmax(0, upper / mean - 1),
+                    range_fluxes.append(self._generatedID_low_target_range + reactionID)
+                    range_upper_bounds.append(np.fmax(0, 1 - lower / mean))
+                    range_fluxes.append(
+                        self._generatedID_high_target_range + reactionID
                     )
+                    range_upper_bounds.append(np.fmax(0, upper / mean - 1))
 
             # Record the change
             self._currentKineticTargets[reactionID] = mean
 
+        # Set the bounds of all target range fluxes at once
+        self._solver.setFlowBoundsArray(
+            range_fluxes,
+            lowerBounds=range_lower_bounds if range_lower_bounds else None,
+            upperBounds=range_upper_bounds,
+        )
+
     def enableKineticTargets(self, reactionIDs=None):
         # If a single value is passed in, make a list of length 1 from it
         if isinstance(reactionIDs, str):
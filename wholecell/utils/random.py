@@ -48,7 +48,7 @@ def stochasticRound(randomState, value):
     value = np.array(value)
     valueShape = value.shape
     valueRavel = np.ravel(value)
-    roundUp = randomState.rand(valueRavel.size) < (valueRavel % 1)
+    roundUp = randomState.random(valueRavel.size) < (valueRavel % 1)
     valueRavel[roundUp] = np.ceil(valueRavel[roundUp])
     valueRavel[~roundUp] = np.floor(valueRavel[~roundUp])
     if valueShape != () and len(valueShape) > 1:
@@ -6,6 +6,7 @@ switch to a newer package like Pint or copy and improve the Unum source code
 from its Python package.
 """
 
+import os
 from typing import TypeGuard
 
 import scipy.constants
@@ -20,6 +21,13 @@ count = Unum.unit("count", mol / scipy.constants.Avogadro)
 nt = Unum.unit("nucleotide", count)
 aa = Unum.unit("amino_acid", count)
 
+# Unum arithmetic is much slower than float arithmetic. Processes can resolve
+# unit conversions once at initialization with conversion_factor() and do
+# plain float math every timestep. Set this to True (or set the environment
+# variable VECOLI_UNIT_CHECKS=1) to check those unit-free calculations against
+# the same calculation done with Unum using check_unit_free().
+UNIT_CHECKS = os.environ.get("VECOLI_UNIT_CHECKS", "0") not in ("", "0")
+
 
 def __truediv__(self, other):
     """Replacement Unum method that truly implements true division."""
@@ -197,3 +205,29 @@ def isnan(value):
 
 def isfinite(value):
     return np.isfinite(value._value) if hasUnit(value) else np.isfinite(value)
+
+
+def conversion_factor(value, to_units) -> float:
+    """
+    Resolve a Unum quantity or unit expression into a plain float in units of
+    ``to_units``. For example, ``conversion_factor(units.fg, units.g)`` is the
+    factor that converts a mass in fg to g. Raises if the units are not
+    compatible.
+    """
+    if not hasUnit(value):
+        raise Exception("Only works on Unum!")
+    return float(value.asNumber(to_units))
+
+
+def check_unit_free(value, expected, to_units, rtol=1e-12):
+    """
+    Assert that the result ``value`` of a unit-free calculation is equal (up
+    to floating point rounding) to ``expected``, the Unum result of the same
+    calculation, once converted to ``to_units``. Only call this when
+    ``UNIT_CHECKS`` is True.
+    """
+    expected = np.asarray(expected.asNumber(to_units), dtype=np.float64)
+    if not np.allclose(value, expected, rtol=rtol, atol=0):
+        raise AssertionError(
+            f"Unit-free calculation {value} does not match {expected} {to_units}."
+        )